@@ -0,0 +1,99 @@
+"""Benchmark InMemoryCache hit rates on a replayable Zipfian trace.
+
+Generates a seeded trace of cache keys drawn from a Zipf distribution, with
+bursts of one-off keys mixed in (as agents scanning many distinct queries
+produce), and replays it against LRU and W-TinyLFU caches of several sizes.
+Each miss stores the key, as a search or path lookup would.
+
+Also replays the trace against byte-bounded caches where values range from
+a 1-path result to a 100-hyperedge search result.
+
+Usage:
+    python benchmarks/bench_cache_admission.py [--requests 200000] [--keys 50000]
+    python benchmarks/bench_cache_admission.py --save trace.txt
+    python benchmarks/bench_cache_admission.py --trace trace.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import zlib
+from pathlib import Path
+
+from hyperx.cache import InMemoryCache
+
+
+def zipf_trace(
+    requests: int, keys: int, skew: float, scan_rate: float, scan_length: int, seed: int
+) -> list[str]:
+    """Zipf-distributed keys with bursts of ``scan_length`` never-repeated keys."""
+    rng = random.Random(seed)
+    cum_weights = list(itertools.accumulate(1 / rank**skew for rank in range(1, keys + 1)))
+    ranks = rng.choices(range(keys), cum_weights=cum_weights, k=requests)
+    trace: list[str] = []
+    scans = itertools.count()
+    for rank in ranks:
+        if rng.random() < scan_rate:
+            scan = next(scans)
+            trace.extend(f"scan:{scan}:{i}" for i in range(scan_length))
+        trace.append(f"key:{rank}")
+    return trace[:requests]
+
+
+def value_for(key: str) -> bytes:
+    """A cached body of 300 bytes to ~30 KB, fixed per key."""
+    return b"x" * (300 * (zlib.crc32(key.encode()) % 100 + 1))
+
+
+def hit_rate(cache: InMemoryCache, trace: list[str], sized: bool = False) -> float:
+    hits = 0
+    for key in trace:
+        if cache.get(key) is not None:
+            hits += 1
+        else:
+            cache.set(key, value_for(key) if sized else 1)
+    return hits / len(trace)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=50_000)
+    parser.add_argument("--skew", type=float, default=0.9)
+    parser.add_argument("--scan-rate", type=float, default=0.002)
+    parser.add_argument("--scan-length", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace", type=Path, help="Replay keys from a file, one per line")
+    parser.add_argument("--save", type=Path, help="Write the generated trace to a file")
+    args = parser.parse_args()
+
+    if args.trace:
+        trace = args.trace.read_text().split()
+    else:
+        trace = zipf_trace(
+            args.requests, args.keys, args.skew, args.scan_rate, args.scan_length, args.seed
+        )
+    if args.save:
+        args.save.write_text("\n".join(trace) + "\n")
+    print(f"{len(trace):,} requests, {len(set(trace)):,} distinct keys")
+
+    print(f"{'max_size':>9} {'LRU':>7} {'TinyLFU':>8}")
+    for size in (500, 2_000, 10_000):
+        lru = hit_rate(InMemoryCache(max_size=size, ttl=3600), trace)
+        lfu = hit_rate(InMemoryCache(max_size=size, ttl=3600, admission="tinylfu"), trace)
+        print(f"{size:>9,} {lru:>7.1%} {lfu:>8.1%}")
+
+    print(f"{'max_bytes':>9} {'LRU':>7} {'TinyLFU':>8}")
+    for megabytes in (4, 16, 64):
+        budget = megabytes << 20
+        lru = hit_rate(InMemoryCache(ttl=3600, max_bytes=budget), trace, sized=True)
+        lfu = hit_rate(
+            InMemoryCache(ttl=3600, max_bytes=budget, admission="tinylfu"), trace, sized=True
+        )
+        print(f"{megabytes:>7}MB {lru:>7.1%} {lfu:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark InMemoryCache throughput under thread contention.
+
+Runs a 90% get / 10% set workload over a shared cache from 1, 8 and 32
+threads, comparing a single lock (``shards=1``) with lock-striped caches.
+
+Usage:
+    python benchmarks/bench_cache_contention.py [--ops 200000] [--keys 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import threading
+import time
+
+from hyperx.cache import InMemoryCache
+
+
+def run(cache: InMemoryCache, threads: int, ops: int, keys: int) -> float:
+    """Run ``ops`` operations split across ``threads`` and return ops/second."""
+    per_thread = ops // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        plan = [(rng.random() < 0.1, f"key:{rng.randrange(keys)}") for _ in range(per_thread)]
+        barrier.wait()
+        for is_set, key in plan:
+            if is_set:
+                cache.set(key, key)
+            else:
+                cache.get(key)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'threads':>7} {'shards':>6} {'ops/s':>12}")
+    for threads in (1, 8, 32):
+        for shards in (1, 16, 64):
+            cache = InMemoryCache(max_size=args.keys // 2, ttl=3600, shards=shards)
+            for i in range(args.keys // 2):
+                cache.set(f"key:{i}", i)
+            rate = run(cache, threads, args.ops, args.keys)
+            print(f"{threads:>7} {shards:>6} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark the cache hit and miss paths for a 50 + 50 result search.
+
+Compares two ways of caching a search response in a Redis-style byte store:
+
+- dump/validate: the previous approach. On a miss, ``model_dump`` each
+  entity and hyperedge and JSON-encode the dicts. On a hit, JSON-decode and
+  ``model_validate`` each item.
+- raw bytes: the current approach. On a miss, store the response body as
+  received. On a hit, make one ``model_validate_json`` call on the body.
+
+Usage:
+    python benchmarks/bench_cache_hit.py [--repeat 200] [--results 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from typing import Any
+
+from bench_codec import best_of, make_entity, make_hyperedge
+
+from hyperx.cache import CacheSerializer
+from hyperx.codec import get_codec
+from hyperx.models import Entity, Hyperedge, SearchResult
+from hyperx.resources.search import search_result
+
+
+def dump(result: SearchResult) -> dict[str, Any]:
+    return {
+        "entities": [e.model_dump(mode="json") for e in result.entities],
+        "hyperedges": [h.model_dump(mode="json") for h in result.hyperedges],
+    }
+
+
+def validate(data: dict[str, Any]) -> SearchResult:
+    return SearchResult(
+        entities=[Entity.model_validate(e) for e in data.get("entities", [])],
+        hyperedges=[Hyperedge.model_validate(h) for h in data.get("hyperedges", [])],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--results", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    codec = get_codec()
+    serializer = CacheSerializer(codec=codec)
+    n = args.results
+    body = codec.dumps(
+        {
+            "entities": [make_entity(i) for i in range(n)],
+            "hyperedges": [make_hyperedge(i) for i in range(n)],
+        }
+    )
+    result = search_result(body)
+
+    old_stored = serializer.dumps(dump(result))
+    new_stored = serializer.dumps(body)
+    rows = [
+        (
+            "dump/validate",
+            len(old_stored),
+            best_of(lambda: serializer.dumps(dump(result)), args.repeat),
+            best_of(lambda: validate(serializer.loads(old_stored)), args.repeat),
+        ),
+        (
+            "raw bytes",
+            len(new_stored),
+            # The response body is already in hand; only the prefix is added
+            best_of(lambda: serializer.dumps(body), args.repeat),
+            best_of(lambda: search_result(serializer.loads(new_stored)), args.repeat),
+        ),
+    ]
+
+    print(f"codec: {codec.name}, {n} entities + {n} hyperedges")
+    print(f"{'strategy':<14} {'stored':>10} {'miss store ms':>14} {'hit ms':>8}")
+    for label, size, store, hit in rows:
+        print(f"{label:<14} {size:>10,} {store * 1000:>14.3f} {hit * 1000:>8.3f}")
+    print(f"hit speedup: {rows[0][3] / rows[1][3]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark Redis cache value size for each CacheSerializer setting.
+
+Encodes a search response (raw body, as the resources cache it) and the
+same result as a dict (as custom cache users store it) with each installed
+format and compression, and reports the stored size, compression ratio and
+decode time.
+
+Usage:
+    python benchmarks/bench_cache_size.py [--repeat 200] [--results 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from functools import partial
+
+from bench_codec import best_of, make_entity, make_hyperedge
+
+from hyperx.cache import CacheSerializer
+from hyperx.codec import get_codec
+
+SETTINGS = [
+    ("json", None),
+    ("json", "zstd"),
+    ("json", "lz4"),
+    ("msgpack", None),
+    ("msgpack", "zstd"),
+    ("msgpack", "lz4"),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--results", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    codec = get_codec()
+    n = args.results
+    response = {
+        "entities": [make_entity(i) for i in range(n)],
+        "hyperedges": [make_hyperedge(i) for i in range(n)],
+    }
+    values = {"raw body": codec.dumps(response), "dict": response}
+
+    print(f"codec: {codec.name}, {n} entities + {n} hyperedges")
+    print(f"{'serializer':<14} {'value':<9} {'stored':>9} {'ratio':>6} {'decode ms':>10}")
+    for fmt, compression in SETTINGS:
+        try:
+            serializer = CacheSerializer(format=fmt, compression=compression, codec=codec)
+        except ImportError:
+            print(f"{fmt}{'+' + compression if compression else ''}: not installed")
+            continue
+        for label, value in values.items():
+            stored = serializer.dumps(value)
+            raw = len(CacheSerializer(format=fmt, codec=codec).dumps(value))
+            decode = best_of(partial(serializer.loads, stored), args.repeat)
+            print(
+                f"{serializer.name:<14} {label:<9} {len(stored):>9,} "
+                f"{raw / len(stored):>6.1f} {decode * 1000:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark JSON codecs on representative HyperX payloads.
+
+Measures encode and decode time for each installed codec on:
+- a 1,000-operation batch request with 384-dim embeddings
+- a 50-entity / 50-hyperedge search response
+
+Usage:
+    python benchmarks/bench_codec.py [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from hyperx.codec import JSONCodec, MsgspecCodec, OrjsonCodec, StdlibCodec
+
+
+def make_entity(i: int) -> dict[str, Any]:
+    return {
+        "id": f"e:{i:08x}-0000-4000-8000-000000000000",
+        "name": f"Entity {i}",
+        "entity_type": random.choice(["concept", "library", "person"]),
+        "attributes": {"source": "docs", "rank": i, "tags": ["react", "state"]},
+        "confidence": round(random.random(), 4),
+        "created_at": "2026-01-15T00:00:00Z",
+        "updated_at": "2026-01-15T00:00:00Z",
+        "valid_from": None,
+        "valid_until": None,
+        "state": "active",
+        "version": 1,
+        "predecessor_id": None,
+        "chain_root_id": None,
+    }
+
+
+def make_hyperedge(i: int) -> dict[str, Any]:
+    return {
+        "id": f"h:{i:08x}-0000-4000-8000-000000000000",
+        "description": f"Entity {i} relates to entity {i + 1}",
+        "members": [
+            {"entity_id": f"e:{i:08x}", "role": "subject"},
+            {"entity_id": f"e:{i + 1:08x}", "role": "object"},
+        ],
+        "attributes": {},
+        "confidence": round(random.random(), 4),
+        "created_at": "2026-01-15T00:00:00Z",
+        "updated_at": "2026-01-15T00:00:00Z",
+        "state": "active",
+        "version": 1,
+    }
+
+
+def batch_payload(n: int = 1000, dim: int = 384) -> dict[str, Any]:
+    return {
+        "operations": [
+            {
+                "operation": "create",
+                "resource": "entity",
+                "data": {
+                    "name": f"Entity {i}",
+                    "entity_type": "concept",
+                    "attributes": {"source": "ingest"},
+                    "embedding": [random.uniform(-1, 1) for _ in range(dim)],
+                },
+            }
+            for i in range(n)
+        ],
+        "atomic": True,
+    }
+
+
+def search_response(n: int = 50) -> dict[str, Any]:
+    return {
+        "entities": [make_entity(i) for i in range(n)],
+        "hyperedges": [make_hyperedge(i) for i in range(n)],
+    }
+
+
+def available_codecs() -> list[JSONCodec]:
+    codecs: list[JSONCodec] = [StdlibCodec()]
+    for factory in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(factory())
+        except ImportError:
+            print(f"({factory.__name__} unavailable, skipping)")
+    return codecs
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    payloads = {"batch (1k ops)": batch_payload(), "search (50+50)": search_response()}
+    codecs = available_codecs()
+
+    print(f"{'payload':<16} {'codec':<8} {'size':>10} {'encode ms':>10} {'decode ms':>10}")
+    for label, payload in payloads.items():
+        for codec in codecs:
+            encoded = codec.dumps(payload)
+            encode = best_of(lambda c=codec, p=payload: c.dumps(p), args.repeat)
+            decode = best_of(lambda c=codec, e=encoded: c.loads(e), args.repeat)
+            print(
+                f"{label:<16} {codec.name:<8} {len(encoded):>10,} "
+                f"{encode * 1000:>10.2f} {decode * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,17 +12,30 @@ from hyperx.batch import (
     HyperedgeCreate,
     HyperedgeDelete,
 )
-from hyperx.cache import Cache, InMemoryCache
+from hyperx.cache import (
+    AsyncCache,
+    Cache,
+    CachePolicy,
+    DiskCache,
+    InMemoryCache,
+    ObjectCachePolicy,
+)
+from hyperx.circuit import CircuitBreaker, CircuitStateChange
 from hyperx.client import HyperX
+from hyperx.compression import RequestCompression
+from hyperx.deadline import deadline
 from hyperx.events import Event, EventHandler, EventRegistry, EventType
 from hyperx.exceptions import (
     AuthenticationError,
+    CircuitOpenError,
+    DeadlineExceededError,
     HyperXError,
     NotFoundError,
     RateLimitError,
     ServerError,
     ValidationError,
 )
+from hyperx.hedging import HedgingPolicy, HedgingStats
 from hyperx.models import (
     Entity,
     Hyperedge,
@@ -35,7 +48,10 @@ from hyperx.models import (
     WebhookDelivery,
 )
 from hyperx.query import AsyncQueryExecutor, Query, QueryExecutor, RoleFilter
+from hyperx.ratelimit import RateLimiter
 from hyperx.resources.hyperedges import MemberInput
+from hyperx.retry import RetryEvent, RetryPolicy
+from hyperx.singleflight import SingleFlight, SingleFlightStats
 
 # Type alias for batch operations
 BatchOperation = Union[EntityCreate, HyperedgeCreate, EntityDelete, HyperedgeDelete]
@@ -67,12 +83,33 @@ __all__ = [
     "HyperedgeDelete",
     # Cache
     "Cache",
+    "AsyncCache",
     "InMemoryCache",
+    "DiskCache",
+    "CachePolicy",
+    "ObjectCachePolicy",
     # Query builder
     "Query",
     "QueryExecutor",
     "AsyncQueryExecutor",
     "RoleFilter",
+    # Retries and rate limiting
+    "RetryPolicy",
+    "RetryEvent",
+    "RateLimiter",
+    # Request compression
+    "RequestCompression",
+    # Request coalescing
+    "SingleFlight",
+    "SingleFlightStats",
+    # Circuit breaking
+    "CircuitBreaker",
+    "CircuitStateChange",
+    # Hedging
+    "HedgingPolicy",
+    "HedgingStats",
+    # Deadlines
+    "deadline",
     # Event system
     "Event",
     "EventHandler",
@@ -85,13 +122,15 @@ __all__ = [
     "ValidationError",
     "RateLimitError",
     "ServerError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
 ]
 
 # Conditional export for Redis cache backend
 try:
-    from hyperx.cache import RedisCache
+    from hyperx.cache import AsyncRedisCache, RedisCache
 
-    __all__.append("RedisCache")
+    __all__ += ["RedisCache", "AsyncRedisCache"]
 except ImportError:
     pass  # Redis not installed
 
@@ -106,15 +145,15 @@ def __getattr__(name: str):
         from hyperx import agents
 
         return agents
-    if name == "RedisCache":
-        # Provide helpful error message for RedisCache
+    if name in ("RedisCache", "AsyncRedisCache"):
+        # Provide helpful error message for the Redis backends
         try:
-            from hyperx.cache import RedisCache
+            from hyperx import cache
 
-            return RedisCache
-        except ImportError:
+            return getattr(cache, name)
+        except AttributeError:
             raise ImportError(
-                "RedisCache requires the redis package. "
+                f"{name} requires the redis package. "
                 "Install it with: pip install hyperx[redis]"
             ) from None
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,7 +10,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from hyperx.agents.base import QualitySignals, ToolResult
-from hyperx.exceptions import NotFoundError
+from hyperx.deadline import deadline, expired
+from hyperx.exceptions import DeadlineExceededError, NotFoundError
 
 if TYPE_CHECKING:
     from hyperx import HyperX
@@ -25,7 +26,8 @@ class ExplorerTool:
     about an entity's relationships.
 
     The tool uses multi-hop path finding to discover reachable entities
-    and can filter results by entity type.
+    and can filter results by entity type. With a ``timeout``, exploration
+    stops when the time is up and returns the neighbors found so far.
 
     Attributes:
         name: Unique identifier for the tool ("hyperx_explore").
@@ -53,6 +55,7 @@ class ExplorerTool:
         client: HyperX,
         *,
         default_max_hops: int = 2,
+        timeout: float | None = None,
     ) -> None:
         """Initialize the ExplorerTool.
 
@@ -61,9 +64,12 @@ class ExplorerTool:
             default_max_hops: Default maximum number of hops to explore.
                 Higher values discover more distant neighbors.
                 Defaults to 2.
+            timeout: Default time limit for one exploration in seconds.
+                Defaults to None (no limit beyond the client timeout).
         """
         self._client = client
         self._default_max_hops = default_max_hops
+        self._timeout = timeout
 
     @property
     def name(self) -> str:
@@ -86,6 +92,7 @@ class ExplorerTool:
         *,
         max_hops: int | None = None,
         entity_types: list[str] | None = None,
+        timeout: float | None = None,
     ) -> ToolResult:
         """Execute the explorer tool synchronously.
 
@@ -97,15 +104,30 @@ class ExplorerTool:
             max_hops: Maximum number of hops to explore. Uses default_max_hops if not specified.
             entity_types: Optional list of entity types to filter results.
                 Example: ["concept", "framework"] to only include these types.
+            timeout: Time limit for the whole exploration in seconds. Uses the
+                tool's default timeout if not specified.
 
         Returns:
             ToolResult containing:
                 - success: Whether the exploration completed successfully
-                - data: Dictionary with "entity" (the starting entity) and
+                - data: Dictionary with "entity" (the starting entity),
                     "neighbors" (list of discovered neighbor entities with distance)
+                    and "truncated" (True if the time limit cut exploration short)
                 - quality: QualitySignals for agentic self-correction
                 - explanation: Human-readable summary of results
         """
+        effective_timeout = timeout if timeout is not None else self._timeout
+        with deadline(effective_timeout):
+            return self._explore(entity_id, max_hops=max_hops, entity_types=entity_types)
+
+    def _explore(
+        self,
+        entity_id: str,
+        *,
+        max_hops: int | None,
+        entity_types: list[str] | None,
+    ) -> ToolResult:
+        """Explore within the current deadline scope."""
         try:
             effective_max_hops = max_hops if max_hops is not None else self._default_max_hops
 
@@ -132,9 +154,16 @@ class ExplorerTool:
                     neighbors.append(entity_data)
                     seen_ids.add(entity.id)
 
+            # Set when a call runs out of time; what was found so far is returned
+            stopped = False
+
             # Also explore via hyperedges for additional depth
             for hyperedge in search_result.hyperedges:
+                if stopped:
+                    break
                 for member in hyperedge.members:
+                    if expired():
+                        break
                     if member.entity_id not in seen_ids:
                         try:
                             member_entity = self._client.entities.get(member.entity_id)
@@ -146,12 +175,17 @@ class ExplorerTool:
                         except NotFoundError:
                             # Entity might have been deleted or doesn't exist
                             pass
+                        except DeadlineExceededError:
+                            stopped = True
+                            break
 
             # If we want more hops, use paths.find to discover further neighbors
-            if effective_max_hops > 1 and neighbors:
+            if effective_max_hops > 1 and neighbors and not stopped:
                 # Sample some neighbors to explore further
                 sample_neighbors = neighbors[:5]
                 for neighbor in sample_neighbors:
+                    if expired():
+                        break
                     try:
                         # Find paths from starting entity to this neighbor's neighbors
                         paths = self._client.paths.find(
@@ -164,7 +198,7 @@ class ExplorerTool:
                         for path in paths:
                             for bridge_set in path.bridges:
                                 for bridge_id in bridge_set:
-                                    if bridge_id not in seen_ids:
+                                    if bridge_id not in seen_ids and not expired():
                                         try:
                                             bridge_entity = self._client.entities.get(bridge_id)
                                             bridge_data = bridge_entity.model_dump()
@@ -173,10 +207,15 @@ class ExplorerTool:
                                             seen_ids.add(bridge_id)
                                         except NotFoundError:
                                             pass
+                    except DeadlineExceededError:
+                        stopped = True
+                        break
                     except Exception:
                         # Path finding failed for this pair, continue
                         pass
 
+            truncated = stopped or expired()
+
             # Filter by entity types if specified
             if entity_types:
                 neighbors = [
@@ -189,6 +228,11 @@ class ExplorerTool:
 
             # Compute quality signals
             quality = self._compute_quality_signals(neighbors, entity_id)
+            if truncated:
+                quality.should_retrieve_more = True
+                quality.missing_context_hints.append(
+                    "Exploration stopped early because the time limit was reached"
+                )
 
             # Build explanation
             explanation = self._build_explanation(
@@ -204,6 +248,7 @@ class ExplorerTool:
                 data={
                     "entity": starting_entity_data,
                     "neighbors": neighbors,
+                    "truncated": truncated,
                 },
                 quality=quality,
                 explanation=explanation,
@@ -249,6 +294,7 @@ class ExplorerTool:
         *,
         max_hops: int | None = None,
         entity_types: list[str] | None = None,
+        timeout: float | None = None,
     ) -> ToolResult:
         """Execute the explorer tool asynchronously.
 
@@ -259,11 +305,14 @@ class ExplorerTool:
             entity_id: Starting entity ID (e.g., "e:react").
             max_hops: Maximum number of hops to explore.
             entity_types: Optional list of entity types to filter results.
+            timeout: Time limit for the whole exploration in seconds.
 
         Returns:
             ToolResult containing exploration results and quality signals.
         """
-        return self.run(entity_id=entity_id, max_hops=max_hops, entity_types=entity_types)
+        return self.run(
+            entity_id=entity_id, max_hops=max_hops, entity_types=entity_types, timeout=timeout
+        )
 
     def to_openai_schema(self) -> dict[str, Any]:
         """Export tool definition as OpenAI function schema.
@@ -5,6 +5,13 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+import httpx
+
+from hyperx.cache.adapters import as_async_cache
+from hyperx.cache.invalidation import AsyncCacheInvalidator
+from hyperx.cache.objects import AsyncObjectCache
+from hyperx.cache.refresh import AsyncBackgroundRefresher
+from hyperx.cache.stats import cache_stats_of
 from hyperx.events import Event, EventRegistry
 from hyperx.http import DEFAULT_BASE_URL, AsyncHTTPClient
 from hyperx.resources.async_batch import AsyncBatchAPI
@@ -17,8 +24,19 @@ from hyperx.resources.async_triggers import AsyncTriggersAPI
 from hyperx.resources.async_webhooks import AsyncWebhooksAPI
 
 if TYPE_CHECKING:
-    from hyperx.cache.base import Cache
+    from hyperx.cache.base import AsyncCache, Cache
+    from hyperx.cache.objects import ObjectCachePolicy
+    from hyperx.cache.refresh import CachePolicy
+    from hyperx.cache.semantic import SemanticCache
+    from hyperx.circuit import CircuitBreaker
+    from hyperx.codec import JSONCodec
+    from hyperx.compression import RequestCompression
+    from hyperx.embeddings import EmbeddingFormat
+    from hyperx.hedging import HedgingPolicy
     from hyperx.query import AsyncQueryExecutor, Query
+    from hyperx.ratelimit import RateLimiter
+    from hyperx.retry import RetryPolicy
+    from hyperx.singleflight import SingleFlight
 
 
 class AsyncHyperX:
@@ -45,35 +63,160 @@ class AsyncHyperX:
         self,
         api_key: str,
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = 30.0,
+        timeout: float | httpx.Timeout = 30.0,
         *,
-        cache: Cache | None = None,
+        cache: Cache | AsyncCache | None = None,
+        cache_policy: CachePolicy | None = None,
+        cache_invalidation: bool = False,
+        object_cache: ObjectCachePolicy | None = None,
+        semantic_cache: SemanticCache | None = None,
         server_cache: bool = False,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        codec: JSONCodec | None = None,
+        compression: RequestCompression | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        embedding_format: EmbeddingFormat = "json",
+        single_flight: SingleFlight | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
     ):
         """Initialize AsyncHyperX client.
 
         Args:
             api_key: Your HyperX API key (starts with hx_sk_)
             base_url: API base URL (default: https://api.hyperxdb.dev)
-            timeout: Request timeout in seconds (default: 30)
+            timeout: Request timeout in seconds (default: 30), or an
+                     ``httpx.Timeout`` with separate connect/read/write/pool
+                     timeouts
             cache: Optional cache backend for client-side caching of expensive
-                   operations like path queries and searches.
+                   operations like path queries and searches. ``AsyncCache``
+                   backends are awaited directly; synchronous ``Cache``
+                   backends run in a worker thread so they do not block the
+                   event loop.
+            cache_policy: Optional ``CachePolicy`` for cached search and path
+                          results: serve stale entries within a grace period
+                          and refresh hot entries before they expire, with
+                          refreshes running as tasks.
+            cache_invalidation: Track the entity and hyperedge IDs in each
+                                cached search and path result, and delete
+                                the results containing an entity or
+                                hyperedge when it is changed through this
+                                client. Call ``cache_invalidator.listen(db.events)``
+                                to also react to changes made elsewhere.
+            object_cache: Optional ``ObjectCachePolicy`` to cache entities
+                          and hyperedges by ID in ``cache``: ``get()`` reads
+                          through it, objects returned by writes and searches
+                          refresh it, deletes drop it, and 404s are
+                          remembered for ``negative_ttl`` seconds.
+            semantic_cache: Optional ``SemanticCache`` for ``search.vector()``
+                            and ``search(embedding=...)``: a search whose
+                            embedding is similar enough to a recent one
+                            reuses its result. Works without ``cache``.
             server_cache: Enable server-side cache hints. When True, the server
                           may cache results for improved performance.
+            retry: Optional retry policy for transient failures (429, 5xx,
+                   connection errors). By default requests are not retried.
+            rate_limiter: Optional client-side rate limiter. Requests wait for
+                          capacity instead of being rejected with 429. One
+                          limiter can be shared by several clients.
+            codec: JSON codec for request and response bodies (default: the
+                   fastest installed of orjson, msgspec or stdlib json).
+            compression: Optional gzip/zstd compression of request bodies above
+                         a size threshold, for bulk ingest over slow links.
+            limits: Connection pool limits (``httpx.Limits``): pool size,
+                    keep-alive connections and keep-alive expiry.
+            http2: Enable HTTP/2 multiplexing (requires ``hyperx[http2]``).
+            transport: Pre-built httpx transport. Pass the same transport to
+                       several clients to share one connection pool; the
+                       caller owns it and must close it.
+            embedding_format: Wire format for embeddings in entity creation
+                              and vector search: "json" float lists (default),
+                              or base64 "float32", "float16" or "int8" for
+                              servers that accept binary embeddings.
+            single_flight: Optional ``SingleFlight`` that merges identical
+                           concurrent reads (GETs, search, paths) into one
+                           request and counts merged calls. Calls made
+                           under a deadline are never merged.
+            circuit_breaker: Optional ``CircuitBreaker`` that fails fast with
+                             ``CircuitOpenError`` while an endpoint family
+                             (paths, search, entities, ...) is failing or slow.
+            hedging: Optional ``HedgingPolicy``. Reads slower than the recent
+                     latency percentile are sent a second time and the
+                     first response wins, within a load budget.
         """
         if not api_key.startswith("hx_sk_"):
             raise ValueError("API key must start with 'hx_sk_'")
 
-        self._http = AsyncHTTPClient(api_key, base_url, timeout)
+        self._http = AsyncHTTPClient(
+            api_key,
+            base_url,
+            timeout,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            codec=codec,
+            compression=compression,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            single_flight=single_flight,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+        )
         self._cache = cache
         self._server_cache = server_cache
+        self._cache_policy = cache_policy
+        self._refresher = AsyncBackgroundRefresher() if cache_policy is not None else None
+        objects = (
+            AsyncObjectCache(as_async_cache(cache), object_cache)
+            if object_cache is not None and cache is not None
+            else None
+        )
+        # Set with cache_invalidation=True; drops cached results on writes
+        self.cache_invalidator = (
+            AsyncCacheInvalidator(
+                as_async_cache(cache) if cache is not None else None,
+                objects=objects,
+                semantic=semantic_cache,
+            )
+            if cache_invalidation and (cache is not None or semantic_cache is not None)
+            else None
+        )
+        invalidator = self.cache_invalidator
         self._event_registry = EventRegistry()
 
-        self.entities = AsyncEntitiesAPI(self._http)
-        self.hyperedges = AsyncHyperedgesAPI(self._http)
-        self.paths = AsyncPathsAPI(self._http, cache=cache)
-        self.search = AsyncSearchAPI(self._http, cache=cache)
-        self.batch = AsyncBatchAPI(self._http)
+        self.entities = AsyncEntitiesAPI(
+            self._http,
+            embedding_format=embedding_format,
+            invalidator=invalidator,
+            objects=objects,
+        )
+        self.hyperedges = AsyncHyperedgesAPI(self._http, invalidator=invalidator, objects=objects)
+        self.paths = AsyncPathsAPI(
+            self._http,
+            cache=cache,
+            cache_policy=cache_policy,
+            refresher=self._refresher,
+            invalidator=invalidator,
+        )
+        self.search = AsyncSearchAPI(
+            self._http,
+            cache=cache,
+            embedding_format=embedding_format,
+            cache_policy=cache_policy,
+            refresher=self._refresher,
+            invalidator=invalidator,
+            objects=objects,
+            semantic=semantic_cache,
+        )
+        self.batch = AsyncBatchAPI(
+            self._http,
+            embedding_format=embedding_format,
+            invalidator=invalidator,
+            objects=objects,
+        )
         self.webhooks = AsyncWebhooksAPI(self._http)
         self.events = AsyncEventsAPI(self._http)
         self.triggers = AsyncTriggersAPI(self._http)
@@ -97,7 +240,14 @@ class AsyncHyperX:
         """
         from hyperx.query import AsyncQueryExecutor
 
-        return AsyncQueryExecutor(self._http, query)
+        return AsyncQueryExecutor(
+            self._http,
+            query,
+            self._cache,
+            cache_policy=self._cache_policy,
+            refresher=self._refresher,
+            invalidator=self.cache_invalidator,
+        )
 
     def on(
         self,
@@ -151,8 +301,34 @@ class AsyncHyperX:
         """
         return self._event_registry.dispatch(event)
 
+    def cache_stats(self, hot_keys: int = 10) -> dict[str, Any] | None:
+        """Statistics of the configured cache, e.g. for a metrics exporter.
+
+        Requires a backend created with ``stats=True`` (``InMemoryCache``,
+        ``RedisCache`` or ``AsyncRedisCache``).
+
+        Args:
+            hot_keys: Number of most read keys to include
+
+        Returns:
+            Current size, total and per key prefix ("paths", "search_hybrid",
+            ...) hits, misses, sets, evictions and latencies, and the hottest
+            keys; None if there is no cache or it does not collect statistics
+
+        Example:
+            >>> db = AsyncHyperX(api_key="hx_sk_...", cache=InMemoryCache(stats=True))
+            >>> db.cache_stats()["prefixes"]["paths"]["hit_rate"]
+            0.82
+        """
+        stats = cache_stats_of(self._cache)
+        return stats.snapshot(hot_keys) if stats is not None else None
+
     async def close(self) -> None:
         """Close the client and release resources."""
+        if self._refresher is not None:
+            self._refresher.close()
+        if self.cache_invalidator is not None:
+            self.cache_invalidator.close()
         await self._http.close()
 
     async def __aenter__(self) -> AsyncHyperX:
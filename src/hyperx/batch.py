@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from hyperx.embeddings import EmbeddingFormat, EmbeddingInput, encode_embedding
+
 
 @dataclass
 class EntityCreate:
@@ -15,7 +17,8 @@ class EntityCreate:
         name: The name of the entity.
         entity_type: The type/category of the entity.
         attributes: Optional key-value attributes for the entity.
-        embedding: Optional vector embedding for semantic search.
+        embedding: Optional vector embedding for semantic search (list of
+            floats, NumPy array, ``array('f')`` or memoryview).
         valid_from: Optional start of validity period (bi-temporal).
         valid_until: Optional end of validity period (bi-temporal).
     """
@@ -23,13 +26,18 @@ class EntityCreate:
     name: str
     entity_type: str
     attributes: dict[str, Any] = field(default_factory=dict)
-    embedding: list[float] | None = None
+    embedding: EmbeddingInput | None = None
     valid_from: datetime | None = None
     valid_until: datetime | None = None
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, embedding_format: EmbeddingFormat = "json") -> dict[str, Any]:
         """Convert to dictionary for API serialization.
 
+        Args:
+            embedding_format: Wire format for the embedding: "json" for a
+                float list (default), or "float32", "float16" or "int8"
+                for base64-encoded binary.
+
         Returns:
             Dictionary with operation type, resource, and entity data.
         """
@@ -40,7 +48,7 @@ class EntityCreate:
         }
 
         if self.embedding is not None:
-            data["embedding"] = self.embedding
+            data["embedding"] = encode_embedding(self.embedding, embedding_format)
         if self.valid_from is not None:
             data["valid_from"] = self.valid_from.isoformat()
         if self.valid_until is not None:
@@ -4,9 +4,47 @@ This package provides caching functionality with a protocol-based design
 allowing for different cache backend implementations.
 
 Available backends:
-    - InMemoryCache: LRU cache with TTL support (always available)
+    - InMemoryCache: LRU cache with TTL support, optionally bounded by bytes
+                     and with TinyLFU admission (always available)
+    - DiskCache: SQLite-backed persistent cache for one machine, shared by
+                 threads and processes (always available)
     - RedisCache: Redis-backed cache for distributed environments
                   (requires: pip install hyperx[redis])
+    - AsyncRedisCache: RedisCache counterpart for AsyncHyperX on redis.asyncio
+                       (requires: pip install hyperx[redis])
+    - TieredCache: InMemoryCache in front of RedisCache, with invalidation
+                   over Redis pub/sub (requires: pip install hyperx[redis])
+    - SemanticCache: in-process cache of vector search results keyed by
+                     embedding similarity (requires: pip install hyperx[numpy])
+
+CachePolicy adds stale-while-revalidate and early refresh to cached search
+and path results, with refreshes run by BackgroundRefresher (HyperX) or
+AsyncBackgroundRefresher (AsyncHyperX).
+
+Backends may also implement BulkCache (get_many/set_many/delete_many);
+the get_many(), set_many() and delete_many() helpers use it when present and
+fall back to one call per key otherwise.
+
+Backends created with stats=True collect CacheStats: hits, misses, sets,
+evictions and latency by key prefix, and the most read keys.
+
+CacheInvalidator (HyperX) and AsyncCacheInvalidator (AsyncHyperX) track the
+entity and hyperedge IDs in cached search and path results, and delete the
+results affected by writes and by events from the event stream.
+
+ObjectCachePolicy caches entities and hyperedges by ID for entities.get() and
+hyperedges.get(), including short-lived negative entries for 404s, using
+ObjectCache (HyperX) or AsyncObjectCache (AsyncHyperX).
+
+Cached requests are keyed by request_key(): a versioned digest of every
+request parameter after normalization, such as "search_text:v1:<digest>".
+query_key() keys Query objects the same way for db.query(...).execute().
+
+CacheSerializer sets how Redis-backed caches encode values (JSON or msgpack)
+and whether large values are compressed (zstd or lz4).
+
+AsyncHyperX uses the AsyncCache protocol. Synchronous backends passed to it
+are wrapped with as_async_cache() so they never block the event loop.
 
 Example:
     >>> from hyperx.cache import Cache, InMemoryCache
@@ -23,15 +61,75 @@ Example:
     >>> cache.set("key", {"data": 123})
 """
 
-from hyperx.cache.base import Cache
-from hyperx.cache.memory import InMemoryCache
+from hyperx.cache.adapters import (
+    SyncCacheAdapter,
+    as_async_cache,
+    delete_many,
+    get_many,
+    set_many,
+)
+from hyperx.cache.base import AsyncCache, AsyncLockingCache, BulkCache, Cache, LockingCache
+from hyperx.cache.disk import DiskCache
+from hyperx.cache.invalidation import AsyncCacheInvalidator, CacheInvalidator, InvalidationStats
+from hyperx.cache.keys import KEY_VERSION, query_key, request_key
+from hyperx.cache.memory import InMemoryCache, estimate_size
+from hyperx.cache.objects import AsyncObjectCache, ObjectCache, ObjectCachePolicy
+from hyperx.cache.refresh import (
+    AsyncBackgroundRefresher,
+    BackgroundRefresher,
+    CachePolicy,
+    RefreshStats,
+)
+from hyperx.cache.serializers import CacheSerializer, SerializerStats
+from hyperx.cache.stats import CacheStats, KeyStats
 
-__all__ = ["Cache", "InMemoryCache"]
+__all__ = [
+    "AsyncCache",
+    "Cache",
+    "BulkCache",
+    "LockingCache",
+    "AsyncLockingCache",
+    "InMemoryCache",
+    "DiskCache",
+    "estimate_size",
+    "SyncCacheAdapter",
+    "as_async_cache",
+    "get_many",
+    "set_many",
+    "delete_many",
+    "CachePolicy",
+    "RefreshStats",
+    "BackgroundRefresher",
+    "AsyncBackgroundRefresher",
+    "CacheSerializer",
+    "SerializerStats",
+    "CacheStats",
+    "KeyStats",
+    "CacheInvalidator",
+    "AsyncCacheInvalidator",
+    "InvalidationStats",
+    "ObjectCachePolicy",
+    "ObjectCache",
+    "AsyncObjectCache",
+    "KEY_VERSION",
+    "request_key",
+    "query_key",
+]
 
 # Conditional export for Redis cache backend
 try:
+    from hyperx.cache.async_redis import AsyncRedisCache
     from hyperx.cache.redis import RedisCache
+    from hyperx.cache.tiered import TieredCache, TieredCacheStats
 
-    __all__.append("RedisCache")
+    __all__ += ["RedisCache", "AsyncRedisCache", "TieredCache", "TieredCacheStats"]
 except ImportError:
     pass  # Redis not installed
+
+# Conditional export for the semantic cache
+try:
+    from hyperx.cache.semantic import SemanticCache, SemanticCacheStats
+
+    __all__ += ["SemanticCache", "SemanticCacheStats"]
+except ImportError:
+    pass  # NumPy not installed
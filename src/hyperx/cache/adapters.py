@@ -0,0 +1,127 @@
+"""Adapters between synchronous and asynchronous cache backends."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from hyperx.cache.base import AsyncCache, BulkCache, Cache
+
+
+class SyncCacheAdapter:
+    """Exposes a synchronous ``Cache`` through the ``AsyncCache`` protocol.
+
+    Each call runs in the default thread pool executor so that blocking
+    backends (such as ``RedisCache``) do not stall the event loop. Bulk
+    operations run as a single executor call, using the backend's own bulk
+    methods when it implements ``BulkCache``.
+
+    Args:
+        cache: The synchronous cache to wrap.
+
+    Example:
+        >>> adapter = SyncCacheAdapter(RedisCache())
+        >>> await adapter.aset("key", {"data": 123})
+        >>> await adapter.aget("key")
+        {'data': 123}
+    """
+
+    def __init__(self, cache: Cache) -> None:
+        self.cache = cache
+
+    async def aget(self, key: str) -> Any | None:
+        """Get cached value or None if not found/expired."""
+        return await asyncio.to_thread(self.cache.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Set cached value with optional TTL in seconds."""
+        await asyncio.to_thread(self.cache.set, key, value, ttl)
+
+    async def adelete(self, key: str) -> bool:
+        """Delete cached value."""
+        return await asyncio.to_thread(self.cache.delete, key)
+
+    async def aclear(self) -> None:
+        """Clear all cached values."""
+        await asyncio.to_thread(self.cache.clear)
+
+    async def aget_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Get several cached values at once."""
+        return await asyncio.to_thread(get_many, self.cache, keys)
+
+    async def aset_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Set several cached values with the same TTL."""
+        await asyncio.to_thread(set_many, self.cache, items, ttl)
+
+    async def adelete_many(self, keys: Sequence[str]) -> int:
+        """Delete several cached values."""
+        return await asyncio.to_thread(delete_many, self.cache, keys)
+
+
+def get_many(cache: Cache, keys: Sequence[str]) -> dict[str, Any]:
+    """Get several values from any cache, in one call if it supports it.
+
+    Args:
+        cache: The cache to read from.
+        keys: The cache keys to retrieve.
+
+    Returns:
+        Mapping of the keys that were found to their values.
+    """
+    if isinstance(cache, BulkCache):
+        return cache.get_many(keys)
+    found = {}
+    for key in keys:
+        value = cache.get(key)
+        if value is not None:
+            found[key] = value
+    return found
+
+
+def set_many(cache: Cache, items: Mapping[str, Any], ttl: int | None = None) -> None:
+    """Set several values in any cache, in one call if it supports it.
+
+    Args:
+        cache: The cache to write to.
+        items: Mapping of cache keys to values.
+        ttl: Time-to-live in seconds. If None, uses the cache's default TTL.
+    """
+    if isinstance(cache, BulkCache):
+        cache.set_many(items, ttl)
+        return
+    for key, value in items.items():
+        cache.set(key, value, ttl)
+
+
+def delete_many(cache: Cache, keys: Sequence[str]) -> int:
+    """Delete several values from any cache, in one call if it supports it.
+
+    Args:
+        cache: The cache to delete from.
+        keys: The cache keys to delete.
+
+    Returns:
+        Number of keys that existed and were deleted.
+    """
+    if isinstance(cache, BulkCache):
+        return cache.delete_many(keys)
+    return sum(cache.delete(key) for key in keys)
+
+
+def as_async_cache(cache: Cache | AsyncCache) -> AsyncCache:
+    """Get an ``AsyncCache`` view of a cache backend.
+
+    Backends that already implement ``AsyncCache`` (``InMemoryCache``,
+    ``AsyncRedisCache``) are returned unchanged; other synchronous caches
+    are wrapped in a ``SyncCacheAdapter``.
+
+    Args:
+        cache: A synchronous or asynchronous cache backend.
+
+    Returns:
+        The cache itself, or an adapter around it.
+    """
+    if isinstance(cache, AsyncCache):
+        return cache
+    return SyncCacheAdapter(cache)
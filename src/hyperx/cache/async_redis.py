@@ -0,0 +1,254 @@
+"""Async Redis cache backend.
+
+Requires: pip install hyperx[redis]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any
+
+from hyperx.cache.redis import LOCK_POLL_INTERVAL, RELEASE_LOCK_SCRIPT
+from hyperx.cache.serializers import CacheSerializer
+from hyperx.cache.stats import CacheStats
+from hyperx.codec import JSONCodec
+from hyperx.deadline import remaining
+
+try:
+    import redis.asyncio as aioredis
+except ImportError as e:
+    raise ImportError(
+        "Redis cache requires the redis package. "
+        "Install with: pip install hyperx[redis]"
+    ) from e
+
+
+class AsyncRedisCache:
+    """Redis-backed cache for ``AsyncHyperX``, built on ``redis.asyncio``.
+
+    Implements the ``AsyncCache`` protocol, so cache lookups never block
+    the event loop. Values are stored in the same format as ``RedisCache``,
+    so sync and async clients can share one Redis namespace.
+
+    Args:
+        url: Redis URL (default: redis://localhost:6379)
+        prefix: Key prefix for namespacing (default: "hyperx:")
+        ttl: Default TTL in seconds (default: 300)
+        codec: JSON codec for stored values (default: fastest installed)
+        serializer: Value encoding and compression, as in ``RedisCache``
+            (default: JSON with ``codec``, uncompressed)
+        lock_timeout: Enables stampede protection, as in ``RedisCache``
+            (default: None, off)
+        lock_wait: Seconds to wait for another caller's recompute
+            (default: ``lock_timeout``)
+        stats: Record hits, misses, sets and read latency by key prefix in
+            ``self.stats``, as in ``RedisCache`` (default: False)
+
+    Example:
+        >>> cache = AsyncRedisCache(url="redis://localhost:6379")
+        >>> async with AsyncHyperX(api_key="hx_sk_...", cache=cache) as db:
+        ...     paths = await db.paths.find("e:react", "e:redux")
+        >>> await cache.aclose()
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379",
+        prefix: str = "hyperx:",
+        ttl: int = 300,
+        *,
+        codec: JSONCodec | None = None,
+        serializer: CacheSerializer | None = None,
+        lock_timeout: float | None = None,
+        lock_wait: float | None = None,
+        stats: bool = False,
+    ) -> None:
+        """Initialize the async Redis cache.
+
+        Args:
+            url: Redis connection URL.
+            prefix: Key prefix for namespacing cache keys.
+            ttl: Default time-to-live in seconds for cached entries.
+            codec: JSON codec used to serialize values.
+            serializer: Serializer for stored values. Takes precedence
+                over ``codec``.
+            lock_timeout: Maximum time in seconds a recompute lock is held,
+                or None to recompute without locking.
+            lock_wait: Maximum time in seconds to wait for another caller's
+                recompute. Defaults to ``lock_timeout``.
+            stats: Whether to collect statistics.
+        """
+        if lock_timeout is not None and lock_timeout <= 0:
+            raise ValueError("lock_timeout must be positive")
+        self._client = aioredis.from_url(url)
+        self._prefix = prefix
+        self._default_ttl = ttl
+        self._serializer = serializer if serializer is not None else CacheSerializer(codec=codec)
+        self._lock_timeout = lock_timeout
+        self._lock_wait = lock_wait if lock_wait is not None else lock_timeout
+        # Redis expires and evicts keys itself, so only reads and writes are seen
+        self.stats: CacheStats | None = CacheStats() if stats else None
+
+    def _make_key(self, key: str) -> str:
+        """Create a prefixed key for Redis storage."""
+        return f"{self._prefix}{key}"
+
+    async def aget(self, key: str) -> Any | None:
+        """Get cached value or None if not found/expired.
+
+        Args:
+            key: The cache key to retrieve.
+
+        Returns:
+            The cached value if found and not expired, None otherwise.
+        """
+        start = time.perf_counter()
+        data = await self._client.get(self._make_key(key))
+        if self.stats is not None:
+            self.stats.record_get(key, data is not None, time.perf_counter() - start)
+        if data is None:
+            return None
+        return self._serializer.loads(data)
+
+    async def aset(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Set cached value with TTL.
+
+        Args:
+            key: The cache key to set.
+            value: The value to cache. Must be JSON-serializable or bytes.
+            ttl: Time-to-live in seconds. If None, uses the default TTL.
+        """
+        ttl = ttl if ttl is not None else self._default_ttl
+        await self._client.setex(self._make_key(key), ttl, self._serializer.dumps(value))
+        if self.stats is not None:
+            self.stats.record_set(key)
+
+    async def adelete(self, key: str) -> bool:
+        """Delete cached value.
+
+        Args:
+            key: The cache key to delete.
+
+        Returns:
+            True if the key existed and was deleted, False otherwise.
+        """
+        return bool(await self._client.delete(self._make_key(key)))
+
+    async def aclear(self) -> None:
+        """Clear all keys with our prefix, using SCAN in batches."""
+        pattern = f"{self._prefix}*"
+        cursor = 0
+        while True:
+            cursor, keys = await self._client.scan(cursor, match=pattern)
+            if keys:
+                await self._client.delete(*keys)
+            if cursor == 0:
+                break
+
+    async def aget_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Get several cached values with a single MGET.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            Mapping of the keys that were found to their values.
+        """
+        if not keys:
+            return {}
+        start = time.perf_counter()
+        values = await self._client.mget([self._make_key(key) for key in keys])
+        found = {
+            key: self._serializer.loads(data)
+            for key, data in zip(keys, values, strict=True)
+            if data is not None
+        }
+        if self.stats is not None:
+            self.stats.record_get_many(keys, found, time.perf_counter() - start)
+        return found
+
+    async def aset_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Set several cached values in one pipelined round trip.
+
+        Args:
+            items: Mapping of cache keys to values.
+            ttl: Time-to-live in seconds. If None, uses the default TTL.
+        """
+        if not items:
+            return
+        ttl = ttl if ttl is not None else self._default_ttl
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.setex(self._make_key(key), ttl, self._serializer.dumps(value))
+            await pipe.execute()
+        if self.stats is not None:
+            for key in items:
+                self.stats.record_set(key)
+
+    async def adelete_many(self, keys: Sequence[str]) -> int:
+        """Delete several cached values with a single DEL.
+
+        Args:
+            keys: The cache keys to delete.
+
+        Returns:
+            Number of keys that existed and were deleted.
+        """
+        if not keys:
+            return 0
+        return int(await self._client.delete(*(self._make_key(key) for key in keys)))
+
+    async def arecompute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+        *,
+        wait: bool = True,
+    ) -> Any | None:
+        """Async version of ``RedisCache.recompute``."""
+        if self._lock_timeout is None:
+            value = await compute()
+            await self.aset(key, value, ttl)
+            return value
+
+        lock_key = self._make_key(f"{key}:lock")
+        token = uuid.uuid4().hex
+        timeout_ms = int(self._lock_timeout * 1000)
+        if await self._client.set(lock_key, token, nx=True, px=timeout_ms):
+            try:
+                value = await compute()
+                await self.aset(key, value, ttl)
+                return value
+            finally:
+                await self._client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+        if not wait:
+            return None
+        value = await self._wait_for(key)
+        if value is not None:
+            return value
+        value = await compute()
+        await self.aset(key, value, ttl)
+        return value
+
+    async def _wait_for(self, key: str) -> Any | None:
+        wait = self._lock_wait or 0.0
+        left = remaining()
+        if left is not None:
+            wait = min(wait, left)
+        until = time.monotonic() + wait
+        while time.monotonic() < until:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            # Read directly so that polling is not counted as cache misses
+            data = await self._client.get(self._make_key(key))
+            if data is not None:
+                return self._serializer.loads(data)
+        return None
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
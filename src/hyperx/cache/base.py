@@ -1,5 +1,6 @@
-"""Cache protocol definition for HyperX SDK."""
+"""Cache protocol definitions for HyperX SDK."""
 
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -52,3 +53,187 @@ class Cache(Protocol):
     def clear(self) -> None:
         """Clear all cached values."""
         ...
+
+
+@runtime_checkable
+class BulkCache(Cache, Protocol):
+    """A ``Cache`` that can read, write and delete several keys at once.
+
+    Kept separate from ``Cache`` so that existing four-method backends still
+    satisfy ``Cache``. The SDK checks for this protocol and falls back to
+    one call per key for caches that do not implement it (see
+    ``hyperx.cache.get_many``).
+
+    Example:
+        >>> from hyperx.cache import BulkCache, InMemoryCache
+        >>> isinstance(InMemoryCache(), BulkCache)
+        True
+    """
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Get several cached values at once.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            Mapping of the keys that were found to their values.
+        """
+        ...
+
+    def set_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Set several cached values with the same TTL.
+
+        Args:
+            items: Mapping of cache keys to values.
+            ttl: Time-to-live in seconds. If None, uses the cache's default TTL.
+        """
+        ...
+
+    def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete several cached values.
+
+        Args:
+            keys: The cache keys to delete.
+
+        Returns:
+            Number of keys that existed and were deleted.
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncCache(Protocol):
+    """Protocol for cache backends used by ``AsyncHyperX``.
+
+    Async resources await these methods so that network-backed caches do
+    not block the event loop. Synchronous ``Cache`` backends are wrapped
+    automatically (see ``hyperx.cache.as_async_cache``).
+
+    Example:
+        >>> from hyperx.cache import AsyncCache, InMemoryCache
+        >>> isinstance(InMemoryCache(), AsyncCache)
+        True
+    """
+
+    async def aget(self, key: str) -> Any | None:
+        """Get cached value or None if not found/expired.
+
+        Args:
+            key: The cache key to retrieve.
+
+        Returns:
+            The cached value if found and not expired, None otherwise.
+        """
+        ...
+
+    async def aset(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Set cached value with optional TTL in seconds.
+
+        Args:
+            key: The cache key to set.
+            value: The value to cache.
+            ttl: Time-to-live in seconds. If None, uses the cache's default TTL.
+        """
+        ...
+
+    async def adelete(self, key: str) -> bool:
+        """Delete cached value.
+
+        Args:
+            key: The cache key to delete.
+
+        Returns:
+            True if the key existed and was deleted, False otherwise.
+        """
+        ...
+
+    async def aclear(self) -> None:
+        """Clear all cached values."""
+        ...
+
+    async def aget_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Get several cached values at once.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            Mapping of the keys that were found to their values.
+        """
+        ...
+
+    async def aset_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Set several cached values with the same TTL.
+
+        Args:
+            items: Mapping of cache keys to values.
+            ttl: Time-to-live in seconds. If None, uses the cache's default TTL.
+        """
+        ...
+
+    async def adelete_many(self, keys: Sequence[str]) -> int:
+        """Delete several cached values.
+
+        Args:
+            keys: The cache keys to delete.
+
+        Returns:
+            Number of keys that existed and were deleted.
+        """
+        ...
+
+
+@runtime_checkable
+class LockingCache(Cache, Protocol):
+    """A ``Cache`` that can serialize recomputation of a key across processes.
+
+    Cache-aware resources use ``recompute`` instead of ``set`` when the
+    backend implements it, so that when a shared entry expires only one
+    caller queries the server while the others wait for its result.
+
+    Example:
+        >>> cache = RedisCache(lock_timeout=10)
+        >>> isinstance(cache, LockingCache)
+        True
+    """
+
+    def recompute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int | None = None,
+        *,
+        wait: bool = True,
+    ) -> Any | None:
+        """Compute and store a value unless another caller is already doing so.
+
+        Args:
+            key: The cache key to fill.
+            compute: Returns the value to cache.
+            ttl: Time-to-live in seconds. If None, uses the cache's default TTL.
+            wait: If another caller holds the key, wait for its value (and
+                compute it anyway if none appears in time) instead of
+                returning None at once.
+
+        Returns:
+            The value that was computed or written by the other caller, or
+            None if ``wait`` is False and another caller holds the key.
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncLockingCache(AsyncCache, Protocol):
+    """``AsyncCache`` counterpart of ``LockingCache``."""
+
+    async def arecompute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+        *,
+        wait: bool = True,
+    ) -> Any | None:
+        """Async version of ``LockingCache.recompute``."""
+        ...
@@ -0,0 +1,408 @@
+"""SQLite-backed persistent cache for single-node deployments.
+
+Uses only the standard library. The database runs in WAL mode, so any
+number of threads and processes on one machine can read while one writes,
+and cached results survive restarts of batch jobs, notebooks and CLI tools.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from hyperx.cache.serializers import CacheSerializer
+from hyperx.cache.stats import CacheStats, EvictionReason
+from hyperx.codec import JSONCodec
+
+SCHEMA_VERSION = 1
+
+# Running totals are kept by triggers, so size checks never scan the table
+# and stay correct when several processes write to the same file
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    count INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (0, 0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET count = count + 1, size = size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET size = size - OLD.size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET count = count - 1, size = size - OLD.size;
+END;
+"""
+
+UPSERT = """
+INSERT INTO entries (key, value, expires, accessed, size) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    value = excluded.value,
+    expires = excluded.expires,
+    accessed = excluded.accessed,
+    size = excluded.size
+"""
+
+# Hits refresh their LRU timestamp at most this often, so that reads of a
+# hot key do not each need a write transaction
+ACCESS_RESOLUTION = 1.0
+
+# Keys per statement in bulk reads and deletes, below SQLite's variable limit
+BULK_CHUNK = 500
+
+
+def _chunks(keys: Sequence[str]) -> Iterator[Sequence[str]]:
+    for start in range(0, len(keys), BULK_CHUNK):
+        yield keys[start : start + BULK_CHUNK]
+
+
+class DiskCache:
+    """Persistent cache in a SQLite database file.
+
+    Safe to share between threads (each thread gets its own connection) and
+    between processes on the same machine (SQLite file locking, WAL mode).
+    Values are encoded like ``RedisCache`` values, so the same
+    ``CacheSerializer`` options (msgpack, compression) apply.
+
+    When an entry is added beyond ``max_size`` entries or ``max_bytes`` of
+    stored data, expired entries are removed first, then the least
+    recently used ones. Recency is tracked to within one second.
+
+    Args:
+        path: Database file; parent directories are created
+        ttl: Default TTL in seconds (default: 300)
+        max_size: Maximum number of entries (default: 10,000)
+        max_bytes: Maximum total size of stored values in bytes
+            (default: None, unbounded)
+        codec: JSON codec for stored values (default: fastest installed)
+        serializer: Value encoding and compression (default: JSON with
+            ``codec``, uncompressed)
+        timeout: Seconds to wait for another process's write lock
+            (default: 5)
+        stats: Record hits, misses, sets, evictions and read latency by key
+            prefix in ``self.stats`` (default: False)
+
+    Example:
+        >>> cache = DiskCache("~/.cache/hyperx/cache.db", ttl=3600)
+        >>> db = HyperX(api_key="hx_sk_...", cache=cache)
+        >>> paths = db.paths.find("e:react", "e:redux")  # Cached across runs
+        >>> cache.close()
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttl: int = 300,
+        max_size: int = 10_000,
+        *,
+        max_bytes: int | None = None,
+        codec: JSONCodec | None = None,
+        serializer: CacheSerializer | None = None,
+        timeout: float = 5.0,
+        stats: bool = False,
+    ) -> None:
+        """Initialize the disk cache, creating the database if needed.
+
+        Args:
+            path: Path of the SQLite database file.
+            ttl: Default time-to-live in seconds for cached entries.
+            max_size: Maximum number of entries.
+            max_bytes: Maximum total size of stored values in bytes.
+            codec: JSON codec used to serialize values.
+            serializer: Serializer for stored values. Takes precedence
+                over ``codec``.
+            timeout: Seconds to wait when the database is locked.
+            stats: Whether to collect statistics.
+
+        Raises:
+            ValueError: If max_size or max_bytes is not positive.
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self._path = Path(path).expanduser()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._default_ttl = ttl
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._serializer = serializer if serializer is not None else CacheSerializer(codec=codec)
+        self._timeout = timeout
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self.stats: CacheStats | None = CacheStats(self._totals) if stats else None
+
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @property
+    def path(self) -> Path:
+        """The database file."""
+        return self._path
+
+    @property
+    def serializer(self) -> CacheSerializer:
+        """The value serializer, whose ``stats`` report the compression ratio."""
+        return self._serializer
+
+    def _conn(self) -> sqlite3.Connection:
+        """This thread's connection, opened on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit; writes open explicit transactions with _Transaction
+            conn = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            # Durable across process crashes; only an OS crash can lose the last writes
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _totals(self) -> tuple[int, int]:
+        count, size = self._conn().execute("SELECT count, size FROM totals").fetchone()
+        return count, size
+
+    def get(self, key: str) -> Any | None:
+        """Get cached value or None if not found/expired.
+
+        Args:
+            key: The cache key to retrieve.
+
+        Returns:
+            The cached value if found and not expired, None otherwise.
+        """
+        start = time.perf_counter()
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value, expires, accessed FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+        value = None
+        if row is not None:
+            data, expires, accessed = row
+            if now > expires:
+                self._expire(conn, [key], now)
+            else:
+                if now - accessed > ACCESS_RESOLUTION:
+                    with _Transaction(conn):
+                        conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+                value = self._serializer.loads(data)
+        if self.stats is not None:
+            self.stats.record_get(key, value is not None, time.perf_counter() - start)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Set cached value with TTL, evicting entries beyond the size limits.
+
+        Args:
+            key: The cache key to set.
+            value: The value to cache. Must be JSON-serializable or bytes.
+            ttl: Time-to-live in seconds. If None, uses the default TTL.
+        """
+        self.set_many({key: value}, ttl)
+
+    def delete(self, key: str) -> bool:
+        """Delete cached value.
+
+        Args:
+            key: The cache key to delete.
+
+        Returns:
+            True if the key existed and was deleted, False otherwise.
+        """
+        return self.delete_many([key]) == 1
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        conn = self._conn()
+        with _Transaction(conn):
+            conn.execute("DELETE FROM entries")
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Get several cached values, returning only the keys that were found.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            Mapping of the keys that were found and not expired to their values.
+        """
+        start = time.perf_counter()
+        conn = self._conn()
+        now = time.time()
+        found: dict[str, Any] = {}
+        expired: list[str] = []
+        stale: list[str] = []
+        for chunk in _chunks(list(dict.fromkeys(keys))):
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, value, expires, accessed FROM entries WHERE key IN ({placeholders})",
+                chunk,
+            )
+            for key, data, expires, accessed in rows:
+                if now > expires:
+                    expired.append(key)
+                    continue
+                if now - accessed > ACCESS_RESOLUTION:
+                    stale.append(key)
+                found[key] = self._serializer.loads(data)
+        if expired:
+            self._expire(conn, expired, now)
+        if stale:
+            with _Transaction(conn):
+                conn.executemany(
+                    "UPDATE entries SET accessed = ? WHERE key = ?", [(now, key) for key in stale]
+                )
+        if self.stats is not None:
+            self.stats.record_get_many(keys, found, time.perf_counter() - start)
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Set several cached values in one transaction.
+
+        Args:
+            items: Mapping of cache keys to values.
+            ttl: Time-to-live in seconds. If None, uses the default TTL.
+        """
+        if not items:
+            return
+        now = time.time()
+        expires = now + (ttl if ttl is not None else self._default_ttl)
+        rows = []
+        for key, value in items.items():
+            data = self._serializer.dumps(value)
+            rows.append((key, data, expires, now, len(data)))
+        conn = self._conn()
+        with _Transaction(conn):
+            conn.executemany(UPSERT, rows)
+            self._cull(conn, now)
+        if self.stats is not None:
+            for key in items:
+                self.stats.record_set(key)
+
+    def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete several cached values.
+
+        Args:
+            keys: The cache keys to delete.
+
+        Returns:
+            Number of keys that existed and were deleted.
+        """
+        deleted = 0
+        conn = self._conn()
+        with _Transaction(conn):
+            for chunk in _chunks(list(dict.fromkeys(keys))):
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(f"DELETE FROM entries WHERE key IN ({placeholders})", chunk)
+                deleted += cursor.rowcount
+        return deleted
+
+    def _expire(self, conn: sqlite3.Connection, keys: list[str], now: float) -> None:
+        """Delete keys that are still expired (another process may have refreshed them)."""
+        with _Transaction(conn):
+            for chunk in _chunks(keys):
+                where = f"expires < ? AND key IN ({','.join('?' * len(chunk))})"
+                evicted = conn.execute(f"SELECT key FROM entries WHERE {where}", (now, *chunk))
+                self._record_evictions([key for (key,) in evicted], "ttl")
+                conn.execute(f"DELETE FROM entries WHERE {where}", (now, *chunk))
+
+    def _cull(self, conn: sqlite3.Connection, now: float) -> None:
+        """Evict expired, then least recently used, entries beyond the limits."""
+        count, size = conn.execute("SELECT count, size FROM totals").fetchone()
+        if count <= self._max_size and (self._max_bytes is None or size <= self._max_bytes):
+            return
+
+        if self.stats is not None:
+            expired = conn.execute("SELECT key FROM entries WHERE expires < ?", (now,))
+            self._record_evictions([key for (key,) in expired], "ttl")
+        conn.execute("DELETE FROM entries WHERE expires < ?", (now,))
+
+        count, size = conn.execute("SELECT count, size FROM totals").fetchone()
+        excess_count = count - self._max_size
+        excess_bytes = size - self._max_bytes if self._max_bytes is not None else 0
+        if excess_count <= 0 and excess_bytes <= 0:
+            return
+        reason: EvictionReason = "size" if excess_bytes > 0 else "lru"
+        victims: list[str] = []
+        for key, entry_size in conn.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            if excess_count <= 0 and excess_bytes <= 0:
+                break
+            victims.append(key)
+            excess_count -= 1
+            excess_bytes -= entry_size
+        for chunk in _chunks(victims):
+            placeholders = ",".join("?" * len(chunk))
+            conn.execute(f"DELETE FROM entries WHERE key IN ({placeholders})", chunk)
+        self._record_evictions(victims, reason)
+
+    def _record_evictions(self, keys: list[str], reason: EvictionReason) -> None:
+        if self.stats is not None:
+            for key in keys:
+                self.stats.record_eviction(key, reason)
+
+    def close(self) -> None:
+        """Close the database connections of all threads."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet removed."""
+        return self._totals()[0]
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is stored, without updating its recency."""
+        if not isinstance(key, str):
+            return False
+        row = self._conn().execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT``, rolled back on error.
+
+    Takes the write lock up front, so concurrent writers wait (up to the
+    connection timeout) instead of failing on lock upgrade. Nested use on
+    the same connection joins the outer transaction.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self._outer = False
+
+    def __enter__(self) -> None:
+        if not self._conn.in_transaction:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._outer = True
+
+    def __exit__(self, exc_type: object, *args: object) -> None:
+        if not self._outer:
+            return
+        if exc_type is None:
+            self._conn.execute("COMMIT")
+        else:
+            self._conn.execute("ROLLBACK")
@@ -0,0 +1,373 @@
+"""Dependency-tracked invalidation of cached search and path results.
+
+Each cached result records the entity and hyperedge IDs it contains. When
+an entity or hyperedge changes, every cached result that contains it is
+deleted, so results can be cached with long TTLs without going stale:
+
+- writes made through the client (``db.entities.update()``,
+  ``db.hyperedges.create()``, ``db.batch.execute()``, ...) invalidate as
+  soon as the server confirms them;
+- ``listen()`` subscribes to the event stream and does the same for
+  changes made by other clients, also dropping cached copies of the changed
+  objects when the client has an object cache.
+
+A new hyperedge invalidates the results that contain any of its member
+entities. Results that a new entity or hyperedge would change without
+touching anything they already contain (a new search match, a shorter
+path through unrelated entities) are only refreshed by their TTL.
+
+The index lives in process memory. With a shared cache such as
+``RedisCache``, each process tracks the keys it has read or written, so
+every process should call ``listen()`` to catch changes made by the others.
+
+Example:
+    >>> db = HyperX(api_key="hx_sk_...", cache=RedisCache(), cache_invalidation=True)
+    >>> db.cache_invalidator.listen(db.events)  # Also react to remote writes
+    >>> db.paths.find("e:useState", "e:redux")
+    >>> db.entities.update("e:redux", name="Redux Toolkit")  # Drops the cached paths
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from hyperx.cache.adapters import delete_many
+
+if TYPE_CHECKING:
+    from hyperx.cache.base import AsyncCache, Cache
+    from hyperx.cache.objects import AsyncObjectCache, ObjectCache, ObjectKind
+    from hyperx.cache.semantic import SemanticCache
+    from hyperx.events import Event
+    from hyperx.models import PathResult, SearchResult
+    from hyperx.resources.async_events import AsyncEventsAPI
+    from hyperx.resources.events import EventsAPI
+
+# Event types whose payload is an entity or hyperedge
+INVALIDATING_EVENTS = ["entity.*", "hyperedge.*"]
+
+DEFAULT_MAX_KEYS = 100_000
+
+
+def path_dependencies(
+    from_entity: str, to_entity: str, paths: Iterable[PathResult]
+) -> set[str]:
+    """IDs a paths.find() result depends on: its endpoints, hyperedges and bridges."""
+    ids = {from_entity, to_entity}
+    for path in paths:
+        ids.update(path.hyperedges)
+        for bridge in path.bridges:
+            ids.update(bridge)
+    return ids
+
+
+def search_dependencies(result: SearchResult) -> set[str]:
+    """IDs a search result depends on: its entities, hyperedges and their members."""
+    ids = {entity.id for entity in result.entities}
+    for hyperedge in result.hyperedges:
+        ids.add(hyperedge.id)
+        ids.update(member.entity_id for member in hyperedge.members)
+    return ids
+
+
+def member_ids(members: Iterable[Any] | None) -> set[str]:
+    """Entity IDs of hyperedge members given as dicts or ``MemberInput``."""
+    if not members:
+        return set()
+    return {
+        member["entity_id"] if isinstance(member, Mapping) else member.entity_id
+        for member in members
+    }
+
+
+def _event_object(event: Event) -> tuple[ObjectKind, str] | None:
+    """Kind and ID of the entity or hyperedge an event is about, if any."""
+    object_id = event.data.get("id")
+    if not object_id:
+        return None
+    return ("entity" if event.type.startswith("entity.") else "hyperedge"), object_id
+
+
+def event_dependencies(event: Event) -> set[str]:
+    """IDs changed by an entity or hyperedge event; empty for other events."""
+    if not event.type.startswith(("entity.", "hyperedge.")):
+        return set()
+    ids = member_ids(event.data.get("members"))
+    if event.data.get("id"):
+        ids.add(event.data["id"])
+    return ids
+
+
+class DependencyIndex:
+    """Thread-safe two-way index between cache keys and the IDs they contain.
+
+    To bound memory, at most ``max_keys`` keys are tracked; the least
+    recently tracked keys are dropped first and then expire by TTL only.
+
+    Args:
+        max_keys: Maximum number of tracked cache keys (default: 100,000)
+    """
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS) -> None:
+        if max_keys <= 0:
+            raise ValueError("max_keys must be positive")
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+        self._keys: OrderedDict[str, frozenset[str]] = OrderedDict()
+        self._ids: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def _unlink(self, key: str, ids: frozenset[str]) -> None:
+        for id_ in ids:
+            keys = self._ids.get(id_)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._ids[id_]
+
+    def track(self, key: str, ids: Iterable[str]) -> None:
+        """Record that ``key`` holds a result containing ``ids``, replacing earlier IDs."""
+        new = frozenset(ids)
+        with self._lock:
+            old = self._keys.pop(key, None)
+            if old is not None:
+                self._unlink(key, old)
+            self._keys[key] = new
+            for id_ in new:
+                self._ids.setdefault(id_, set()).add(key)
+            while len(self._keys) > self._max_keys:
+                self._unlink(*self._keys.popitem(last=False))
+
+    def pop(self, ids: Iterable[str]) -> list[str]:
+        """Stop tracking and return the keys whose results contain any of ``ids``."""
+        with self._lock:
+            keys: set[str] = set()
+            for id_ in ids:
+                keys.update(self._ids.get(id_, ()))
+            for key in keys:
+                self._unlink(key, self._keys.pop(key))
+        return list(keys)
+
+    def clear(self) -> None:
+        """Forget all tracked keys."""
+        with self._lock:
+            self._keys.clear()
+            self._ids.clear()
+
+
+@dataclass
+class InvalidationStats:
+    """Counters for cache invalidation.
+
+    Attributes:
+        keys_invalidated: Cache entries deleted because their results changed
+        events: Entity and hyperedge events received by ``listen()``
+        stream_errors: Event stream connections that failed and were retried
+    """
+
+    keys_invalidated: int = 0
+    events: int = 0
+    stream_errors: int = 0
+
+
+class CacheInvalidator:
+    """Deletes cached results of ``HyperX`` when the data they contain changes.
+
+    Created by ``HyperX(cache_invalidation=True)`` as ``db.cache_invalidator``.
+
+    Args:
+        cache: Cache holding the tracked results; None when only the
+            semantic cache is used
+        max_keys: Maximum number of tracked cache keys (default: 100,000)
+        objects: Object cache whose copies of changed entities and
+            hyperedges are dropped on events
+        semantic: Semantic cache whose results are also invalidated
+    """
+
+    def __init__(
+        self,
+        cache: Cache | None = None,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        *,
+        objects: ObjectCache | None = None,
+        semantic: SemanticCache | None = None,
+    ) -> None:
+        self.cache = cache
+        self.objects = objects
+        self.semantic = semantic
+        self.index = DependencyIndex(max_keys)
+        self.stats = InvalidationStats()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def track(self, key: str, ids: Iterable[str]) -> None:
+        """Record that ``key`` holds a result containing ``ids``."""
+        self.index.track(key, ids)
+
+    def invalidate(self, ids: Iterable[str]) -> int:
+        """Delete the cached results that contain any of ``ids``.
+
+        Returns:
+            Number of cache keys invalidated
+        """
+        ids = set(ids)
+        if self.semantic is not None:
+            self.semantic.invalidate(ids)
+        keys = self.index.pop(ids)
+        if keys and self.cache is not None:
+            delete_many(self.cache, keys)
+            self.stats.keys_invalidated += len(keys)
+        return len(keys)
+
+    def handle_event(self, event: Event) -> int:
+        """Invalidate the results affected by one event from the event stream."""
+        ids = event_dependencies(event)
+        if not ids:
+            return 0
+        self.stats.events += 1
+        changed = _event_object(event)
+        if self.objects is not None and changed is not None:
+            self.objects.delete(changed[0], [changed[1]])
+        return self.invalidate(ids)
+
+    def listen(self, events: EventsAPI, *, reconnect_delay: float = 1.0) -> threading.Thread:
+        """Invalidate on entity and hyperedge events in a background thread.
+
+        The stream is reopened after errors, replaying events since the
+        last one received.
+
+        Args:
+            events: ``db.events`` of the client
+            reconnect_delay: Seconds to wait before reconnecting (default: 1.0)
+
+        Returns:
+            The daemon thread consuming the stream
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen,
+            args=(events, reconnect_delay),
+            name="hyperx-invalidation",
+            daemon=True,
+        )
+        self._thread.start()
+        return self._thread
+
+    def _listen(self, events: EventsAPI, reconnect_delay: float) -> None:
+        since: datetime | None = None
+        while not self._stop.is_set():
+            try:
+                for event in events.stream(INVALIDATING_EVENTS, since=since):
+                    self.handle_event(event)
+                    since = event.timestamp
+                    if self._stop.is_set():
+                        return
+            except Exception:
+                self.stats.stream_errors += 1
+            self._stop.wait(reconnect_delay)
+
+    def close(self) -> None:
+        """Stop listening; the thread exits after the next event or reconnect."""
+        self._stop.set()
+
+
+class AsyncCacheInvalidator:
+    """``CacheInvalidator`` counterpart for ``AsyncHyperX``.
+
+    Args:
+        cache: Cache holding the tracked results; None when only the
+            semantic cache is used
+        max_keys: Maximum number of tracked cache keys (default: 100,000)
+        objects: Object cache whose copies of changed entities and
+            hyperedges are dropped on events
+        semantic: Semantic cache whose results are also invalidated
+    """
+
+    def __init__(
+        self,
+        cache: AsyncCache | None = None,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        *,
+        objects: AsyncObjectCache | None = None,
+        semantic: SemanticCache | None = None,
+    ) -> None:
+        self.cache = cache
+        self.objects = objects
+        self.semantic = semantic
+        self.index = DependencyIndex(max_keys)
+        self.stats = InvalidationStats()
+        self._task: asyncio.Task[None] | None = None
+
+    def track(self, key: str, ids: Iterable[str]) -> None:
+        """Record that ``key`` holds a result containing ``ids``."""
+        self.index.track(key, ids)
+
+    async def invalidate(self, ids: Iterable[str]) -> int:
+        """Delete the cached results that contain any of ``ids``.
+
+        Returns:
+            Number of cache keys invalidated
+        """
+        ids = set(ids)
+        if self.semantic is not None:
+            self.semantic.invalidate(ids)
+        keys = self.index.pop(ids)
+        if keys and self.cache is not None:
+            await self.cache.adelete_many(keys)
+            self.stats.keys_invalidated += len(keys)
+        return len(keys)
+
+    async def handle_event(self, event: Event) -> int:
+        """Invalidate the results affected by one event from the event stream."""
+        ids = event_dependencies(event)
+        if not ids:
+            return 0
+        self.stats.events += 1
+        changed = _event_object(event)
+        if self.objects is not None and changed is not None:
+            await self.objects.delete(changed[0], [changed[1]])
+        return await self.invalidate(ids)
+
+    def listen(
+        self, events: AsyncEventsAPI, *, reconnect_delay: float = 1.0
+    ) -> asyncio.Task[None]:
+        """Invalidate on entity and hyperedge events in a background task.
+
+        Args:
+            events: ``db.events`` of the client
+            reconnect_delay: Seconds to wait before reconnecting (default: 1.0)
+
+        Returns:
+            The task consuming the stream; ``close()`` cancels it
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._listen(events, reconnect_delay))
+        return self._task
+
+    async def _listen(self, events: AsyncEventsAPI, reconnect_delay: float) -> None:
+        since: datetime | None = None
+        while True:
+            try:
+                async for event in events.stream(INVALIDATING_EVENTS, since=since):
+                    await self.handle_event(event)
+                    since = event.timestamp
+            except Exception:
+                self.stats.stream_errors += 1
+            await asyncio.sleep(reconnect_delay)
+
+    def close(self) -> None:
+        """Stop listening."""
+        if self._task is not None:
+            self._task.cancel()
@@ -0,0 +1,97 @@
+"""Canonical cache keys for cached requests.
+
+Every cached endpoint derives its key from the full request it sends, so
+any parameter that can change the response (limits, role filters, ``as_of``,
+path constraints, ``Query`` filters) is part of the key. The request is
+normalized first, so equivalent requests share an entry:
+
+- dict keys are sorted, so ``role_filter`` order does not matter;
+- runs of whitespace in text queries collapse to one space, and BM25 text
+  queries are also case-folded (the hybrid query keeps its case, since it
+  is embedded by the server);
+- timestamps are compared in UTC;
+- ``Query`` AND and OR filters are sorted, since their order does not
+  change the result;
+- embeddings are hashed as packed float32, whatever their input type.
+
+Keys look like "search_hybrid:v1:<digest>". The first segment stays the
+endpoint, which ``CacheStats`` reports by, and the version segment changes
+whenever the key scheme or a cached response format does, so entries
+written by older SDK versions are simply never read again and expire by TTL.
+
+Example:
+    >>> request_key("search_text", {"query": "React  Hooks", "limit": 10})
+    'search_text:v1:...'
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from hyperx.embeddings import EmbeddingInput, float32_bytes
+
+if TYPE_CHECKING:
+    from hyperx.query import Query
+
+# Bump when the key scheme or the cached form of a response changes
+KEY_VERSION = 1
+
+
+def normalize_text(text: str, *, fold_case: bool = False) -> str:
+    """Collapse whitespace in a text query, optionally case-folding it."""
+    text = " ".join(text.split())
+    return text.casefold() if fold_case else text
+
+
+def embedding_digest(embedding: EmbeddingInput) -> str:
+    """Digest of an embedding, identical for equal values of any input type."""
+    # Hashing the packed float32 bytes is much cheaper than formatting
+    # every value
+    return hashlib.blake2b(float32_bytes(embedding), digest_size=16).hexdigest()
+
+
+def _canonical(value: Any) -> Any:
+    """JSON fallback for values json.dumps cannot encode itself."""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.isoformat()
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+
+def request_key(prefix: str, params: Mapping[str, Any]) -> str:
+    """Versioned cache key for a request to the endpoint named ``prefix``.
+
+    Args:
+        prefix: Endpoint name, the first key segment ("paths", "search_text", ...)
+        params: JSON-compatible request parameters; datetimes are allowed
+
+    Returns:
+        "<prefix>:v<KEY_VERSION>:<digest>"
+    """
+    canonical = json.dumps(
+        params, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_canonical
+    )
+    digest = hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+    return f"{prefix}:v{KEY_VERSION}:{digest}"
+
+
+def _sorted_filters(filters: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return sorted(filters, key=lambda f: json.dumps(f, sort_keys=True))
+
+
+def query_key(query: Query) -> str:
+    """Cache key for a ``Query`` sent to ``/v1/query``."""
+    params = query.to_dict()
+    for name in ("where", "or_where"):
+        if name in params:
+            params[name] = _sorted_filters(params[name])
+    if "as_of" in params:
+        params["as_of"] = datetime.fromisoformat(params["as_of"])
+    if "text" in params:
+        params["text"] = normalize_text(params["text"])
+    return request_key("query", params)
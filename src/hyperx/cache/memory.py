@@ -1,8 +1,324 @@
 """In-memory cache implementation with LRU eviction and TTL support."""
 
+import sys
+import threading
 import time
 from collections import OrderedDict
-from typing import Any
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, Literal
+
+from hyperx.cache.stats import CacheStats, EvictionReason
+
+AdmissionPolicy = Literal["tinylfu"]
+
+# Marks a cache miss, since None can be a cached value
+_MISSING = object()
+
+_SCALARS = (str, bytes, bytearray, int, float, bool, type(None))
+
+# Default lock stripes, and the smallest shard the default will create
+DEFAULT_SHARDS = 16
+_MIN_SHARD_ENTRIES = 64
+_MIN_SHARD_BYTES = 1 << 20
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory used by a cached value, in bytes.
+
+    Counts ``sys.getsizeof`` of the value and, for dicts, lists, tuples,
+    sets and plain objects, of everything they reference. Objects reached
+    twice are counted once.
+
+    Args:
+        value: The cached value.
+
+    Returns:
+        Estimated size in bytes.
+    """
+    size = 0
+    seen: set[int] = set()
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, _SCALARS):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+    return size
+
+
+def _default_shards(max_size: int, max_bytes: int | None) -> int:
+    """Shard count used when none is given: as many as fit, up to DEFAULT_SHARDS."""
+    fit = max_size // _MIN_SHARD_ENTRIES if max_bytes is None else max_bytes // _MIN_SHARD_BYTES
+    return max(1, min(DEFAULT_SHARDS, fit, max_size))
+
+
+class _Shard:
+    """One lock-protected LRU segment of an InMemoryCache.
+
+    Holds up to ``max_size`` units of weight: one per entry, or the
+    estimated size of each entry in bytes when a ``sizer`` is given. The
+    caller holds ``lock`` around every method call.
+    """
+
+    __slots__ = ("lock", "entries", "max_size", "sizer", "weight", "stats")
+
+    def __init__(
+        self,
+        max_size: int,
+        sizer: Callable[[Any], int] | None = None,
+        stats: CacheStats | None = None,
+    ) -> None:
+        self.lock = threading.Lock()
+        # OrderedDict maintains insertion order; we use it for LRU tracking
+        # Values are tuples of (value, expiry_timestamp, weight)
+        self.entries: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self.max_size = max_size
+        self.sizer = sizer
+        self.weight = 0
+        self.stats = stats
+
+    def evicted(self, key: str, expired: bool = False) -> None:
+        """Record an eviction made by the shard itself."""
+        if self.stats is not None:
+            reason: EvictionReason = (
+                "ttl" if expired else "size" if self.sizer is not None else "lru"
+            )
+            self.stats.record_eviction(key, reason)
+
+    def lookup(self, key: str, now: float) -> Any:
+        """Return the value for key, or ``_MISSING`` if absent or expired."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return _MISSING
+        if now > entry[1]:
+            self.remove(key)
+            self.evicted(key, expired=True)
+            return _MISSING
+        # Move to end (most recently used)
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def store(self, key: str, value: Any, expiry: float) -> None:
+        """Insert or update an entry, evicting least recently used ones."""
+        weight = self.sizer(value) if self.sizer is not None else 1
+        entries = self.entries
+        previous = entries.pop(key, None)
+        if previous is not None:
+            self.weight -= previous[2]
+        # An entry larger than the whole shard would evict everything
+        if weight > self.max_size:
+            self.evicted(key)
+            return
+        entries[key] = (value, expiry, weight)
+        self.weight += weight
+        while self.weight > self.max_size:
+            # Remove the first item (oldest/least recently used)
+            evicted_key, evicted = entries.popitem(last=False)
+            self.weight -= evicted[2]
+            self.evicted(evicted_key)
+
+    def remove(self, key: str) -> bool:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        self.weight -= entry[2]
+        return True
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.weight = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+
+class _FrequencySketch:
+    """Count-min sketch of recent access counts, for TinyLFU admission.
+
+    Four 4-bit counters per key in one table. Every ``10 * capacity``
+    increments all counters are halved, so old popularity fades.
+    """
+
+    __slots__ = ("table", "shift", "additions", "sample_size")
+
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5)
+    _MASK = (1 << 64) - 1
+
+    def __init__(self, capacity: int) -> None:
+        bits = max(4, (4 * capacity - 1).bit_length())
+        self.table = bytearray(1 << bits)
+        self.shift = 64 - bits
+        self.additions = 0
+        self.sample_size = 10 * max(capacity, 1)
+
+    def _indexes(self, key: str) -> list[int]:
+        h = hash(key)
+        return [((h + seed) * seed & self._MASK) >> self.shift for seed in self._SEEDS]
+
+    def increment(self, key: str) -> None:
+        table = self.table
+        for index in self._indexes(key):
+            if table[index] < 15:
+                table[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.table = bytearray(count >> 1 for count in table)
+            self.additions //= 2
+
+    def frequency(self, key: str) -> int:
+        table = self.table
+        return min(table[index] for index in self._indexes(key))
+
+
+class _TinyLFUShard(_Shard):
+    """Shard with W-TinyLFU eviction (window LRU + segmented LRU main).
+
+    New entries go to a small window LRU (1% of capacity). Entries leaving
+    the window are admitted to the main region only if they have been
+    accessed more often recently than the main region's eviction victim,
+    so a burst of one-off keys cannot flush frequently used ones. In the
+    main region, entries hit again move from probation to protected (80%).
+    """
+
+    __slots__ = (
+        "probation",
+        "protected",
+        "window_capacity",
+        "protected_capacity",
+        "window_weight",
+        "probation_weight",
+        "protected_weight",
+        "sketch",
+    )
+
+    def __init__(
+        self,
+        max_size: int,
+        sizer: Callable[[Any], int] | None,
+        stats: CacheStats | None,
+        sketch_size: int,
+    ) -> None:
+        super().__init__(max_size, sizer, stats)
+        # ``entries`` is the window; all three regions map key -> (value, expiry, weight)
+        self.probation: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self.protected: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self.window_capacity = max(max_size // 100, 1)
+        self.protected_capacity = (max_size - self.window_capacity) * 4 // 5
+        self.window_weight = self.probation_weight = self.protected_weight = 0
+        self.sketch = _FrequencySketch(sketch_size)
+
+    def lookup(self, key: str, now: float) -> Any:
+        # Misses count too: a key requested often deserves admission
+        self.sketch.increment(key)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.protected.get(key)
+        if entry is None:
+            entry = self.probation.get(key)
+        if entry is None:
+            return _MISSING
+        if now > entry[1]:
+            self.remove(key)
+            self.evicted(key, expired=True)
+            return _MISSING
+
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+        else:
+            self._promote(key)
+        return entry[0]
+
+    def _promote(self, key: str) -> None:
+        """Move a probation entry to protected, demoting protected's LRU entries."""
+        entry = self.probation.pop(key)
+        self.probation_weight -= entry[2]
+        self.protected[key] = entry
+        self.protected_weight += entry[2]
+        while self.protected_weight > self.protected_capacity and len(self.protected) > 1:
+            demoted_key, demoted = self.protected.popitem(last=False)
+            self.protected_weight -= demoted[2]
+            self.probation[demoted_key] = demoted
+            self.probation_weight += demoted[2]
+
+    def store(self, key: str, value: Any, expiry: float) -> None:
+        weight = self.sizer(value) if self.sizer is not None else 1
+        self.sketch.increment(key)
+        # Updates go back through the window; a hot key is readmitted at once
+        self.remove(key)
+        if weight > self.max_size:
+            self.evicted(key)
+            return
+        self.entries[key] = (value, expiry, weight)
+        self.window_weight += weight
+        self.weight += weight
+        while self.window_weight > self.window_capacity:
+            candidate_key, candidate = self.entries.popitem(last=False)
+            self.window_weight -= candidate[2]
+            self.weight -= candidate[2]
+            self._admit(candidate_key, candidate)
+
+    def _admit(self, key: str, entry: tuple[Any, float, int]) -> None:
+        """Move a window entry to probation if it beats the entries it would evict."""
+        main_capacity = self.max_size - self.window_capacity
+        weight = entry[2]
+        if weight > main_capacity:
+            self.evicted(key)
+            return
+        frequency = self.sketch.frequency(key)
+        while self.weight - self.window_weight + weight > main_capacity:
+            region = self.probation if self.probation else self.protected
+            victim_key = next(iter(region))
+            if self.sketch.frequency(victim_key) >= frequency:
+                self.evicted(key)
+                return
+            self.remove(victim_key)
+            self.evicted(victim_key)
+        self.probation[key] = entry
+        self.probation_weight += weight
+        self.weight += weight
+
+    def remove(self, key: str) -> bool:
+        for region in (self.entries, self.probation, self.protected):
+            entry = region.pop(key, None)
+            if entry is not None:
+                break
+        else:
+            return False
+        if region is self.entries:
+            self.window_weight -= entry[2]
+        elif region is self.probation:
+            self.probation_weight -= entry[2]
+        else:
+            self.protected_weight -= entry[2]
+        self.weight -= entry[2]
+        return True
+
+    def clear(self) -> None:
+        super().clear()
+        self.probation.clear()
+        self.protected.clear()
+        self.window_weight = self.probation_weight = self.protected_weight = 0
+
+    def __len__(self) -> int:
+        return len(self.entries) + len(self.probation) + len(self.protected)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries or key in self.probation or key in self.protected
 
 
 class InMemoryCache:
@@ -12,10 +328,37 @@ class InMemoryCache:
     - LRU (Least Recently Used) eviction when max size is exceeded
     - TTL (Time-To-Live) expiration for cached entries
     - Standard cache operations (get, set, delete, clear)
+    - Bulk operations (get_many, set_many, delete_many) that take each
+      shard's lock once per call
+    - The ``AsyncCache`` protocol (aget, aset, ...), answered directly
+      without a thread hop since no call blocks on I/O
+
+    Keys are spread over ``shards`` independent LRU segments, each with its
+    own lock, so threads working on different keys rarely wait for each
+    other. Each shard holds up to ``max_size / shards`` entries and evicts
+    its own least recently used entry, so with more than one shard the
+    eviction order is approximately rather than strictly LRU. By default
+    the cache uses up to 16 shards, but none smaller than 64 entries (or
+    1 MiB with ``max_bytes``), so small caches stay a single strict LRU.
+
+    Entries vary widely in size (a 100-hyperedge search result versus a
+    single path), so ``max_bytes`` can bound the cache by the estimated
+    memory of its values instead of by their number. ``admission="tinylfu"``
+    replaces plain LRU with W-TinyLFU, which keeps frequently used entries
+    when a scan of one-off keys passes through the cache.
 
     Args:
-        max_size: Maximum number of items to store (default: 1000).
+        max_size: Maximum number of items to store (default: 1000). With
+            ``max_bytes`` it only sizes the TinyLFU frequency sketch.
         ttl: Default TTL in seconds for cached entries (default: 300 = 5 min).
+        shards: Number of lock stripes; 1 for a single strict LRU
+            (default: None, up to 16 depending on the size).
+        max_bytes: Memory budget in bytes, measured with ``estimate_size``
+            (default: None, bounded by ``max_size``).
+        admission: "tinylfu" for W-TinyLFU admission and eviction
+            (default: None, LRU).
+        stats: Record hits, misses, sets, evictions and read latency by
+            key prefix in ``self.stats`` (default: False).
 
     Example:
         >>> cache = InMemoryCache(max_size=100, ttl=60)
@@ -30,27 +373,83 @@ class InMemoryCache:
         >>> cache.delete("key")
         True
         >>> cache.clear()
+
+        >>> # Many threads sharing one client
+        >>> cache = InMemoryCache(max_size=10_000, shards=16)
+
+        >>> # 64 MiB budget that resists scans
+        >>> cache = InMemoryCache(max_bytes=64 << 20, admission="tinylfu")
+
+        >>> # Statistics
+        >>> cache = InMemoryCache(stats=True)
+        >>> cache.stats.by_prefix()["paths"].hit_rate
     """
 
-    def __init__(self, max_size: int = 1000, ttl: int = 300) -> None:
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: int = 300,
+        shards: int | None = None,
+        *,
+        max_bytes: int | None = None,
+        admission: AdmissionPolicy | None = None,
+        stats: bool = False,
+    ) -> None:
         """Initialize the in-memory cache.
 
         Args:
             max_size: Maximum number of items to store.
             ttl: Default TTL in seconds for cached entries.
+            shards: Number of independently locked LRU segments, or None
+                to choose one from the size.
+            max_bytes: Maximum estimated size of all values, in bytes.
+            admission: Admission policy, "tinylfu" or None for plain LRU.
+            stats: Whether to collect statistics.
+
+        Raises:
+            ValueError: If shards is less than 1 or greater than max_size,
+                max_bytes is not positive or admission is unknown.
         """
+        if shards is None:
+            shards = _default_shards(max_size, max_bytes)
+        if shards < 1 or shards > max(max_size, 1):
+            raise ValueError("shards must be between 1 and max_size")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if admission not in (None, "tinylfu"):
+            raise ValueError(f"Unsupported admission policy: {admission!r}")
         self._max_size = max_size
+        self._max_bytes = max_bytes
         self._default_ttl = ttl
-        # OrderedDict maintains insertion order; we use it for LRU tracking
-        # Values are tuples of (value, expiry_timestamp)
-        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        sizer = estimate_size if max_bytes is not None else None
+        self.stats: CacheStats | None = CacheStats(self._size) if stats else None
+        # Spread capacity so the shard sizes add up to the limit
+        base, extra = divmod(max_bytes if max_bytes is not None else max_size, shards)
+        capacities = [base + (i < extra) for i in range(shards)]
+        if admission == "tinylfu":
+            sketch_size = max(max_size // shards, 1)
+            self._shards: list[_Shard] = [
+                _TinyLFUShard(capacity, sizer, self.stats, sketch_size) for capacity in capacities
+            ]
+        else:
+            self._shards = [_Shard(capacity, sizer, self.stats) for capacity in capacities]
+
+    def _size(self) -> tuple[int, int | None]:
+        """Current (entries, estimated bytes); bytes are only tracked with max_bytes."""
+        size = None
+        if self._max_bytes is not None:
+            size = sum(shard.weight for shard in self._shards)
+        return len(self), size
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
 
     def get(self, key: str) -> Any | None:
         """Get cached value or None if not found/expired.
 
         If the entry exists but is expired, it is removed from the cache
-        and None is returned. If the entry is valid, it is moved to the
-        end of the OrderedDict (most recently used).
+        and None is returned. If the entry is valid, it is marked as most
+        recently used.
 
         Args:
             key: The cache key to retrieve.
@@ -58,29 +457,23 @@ class InMemoryCache:
         Returns:
             The cached value if found and not expired, None otherwise.
         """
-        if key not in self._cache:
-            return None
-
-        value, expiry_time = self._cache[key]
-
-        # Check if expired
-        if time.time() > expiry_time:
-            # Remove expired entry
-            del self._cache[key]
-            return None
-
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
-
-        return value
+        start = time.perf_counter() if self.stats is not None else 0.0
+        shard = self._shard(key)
+        with shard.lock:
+            value = shard.lookup(key, time.time())
+        if self.stats is not None:
+            self.stats.record_get(key, value is not _MISSING, time.perf_counter() - start)
+        return None if value is _MISSING else value
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Set cached value with optional TTL in seconds.
 
         If the key already exists, the value is updated and the entry
-        is moved to the end of the OrderedDict (most recently used).
-        If adding a new entry would exceed max_size, the oldest entry
-        (least recently used) is evicted.
+        is marked as most recently used. If adding a new entry would
+        exceed the shard's capacity, its least recently used entry is
+        evicted (with TinyLFU admission, the less frequently used of the
+        new entry and the eviction candidate). A value larger than a
+        shard's whole byte budget is not stored.
 
         Args:
             key: The cache key to set.
@@ -91,17 +484,11 @@ class InMemoryCache:
         actual_ttl = ttl if ttl is not None else self._default_ttl
         expiry_time = time.time() + actual_ttl
 
-        # If key exists, remove it first so move_to_end works correctly
-        if key in self._cache:
-            del self._cache[key]
-
-        # Add the new entry
-        self._cache[key] = (value, expiry_time)
-
-        # Evict oldest entries if over max size
-        while len(self._cache) > self._max_size:
-            # Remove the first item (oldest/least recently used)
-            self._cache.popitem(last=False)
+        shard = self._shard(key)
+        with shard.lock:
+            shard.store(key, value, expiry_time)
+        if self.stats is not None:
+            self.stats.record_set(key)
 
     def delete(self, key: str) -> bool:
         """Delete cached value.
@@ -112,11 +499,117 @@ class InMemoryCache:
         Returns:
             True if the key existed and was deleted, False otherwise.
         """
-        if key in self._cache:
-            del self._cache[key]
-            return True
-        return False
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.remove(key)
 
     def clear(self) -> None:
         """Clear all cached values."""
-        self._cache.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
+
+    def _group(self, keys: Iterable[str]) -> dict[int, list[str]]:
+        """Group keys by shard index, preserving their order."""
+        groups: dict[int, list[str]] = {}
+        n = len(self._shards)
+        for key in keys:
+            groups.setdefault(hash(key) % n, []).append(key)
+        return groups
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Get several cached values, returning only the keys that were found.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            Mapping of the keys that were found and not expired to their values.
+        """
+        found: dict[str, Any] = {}
+        start = time.perf_counter()
+        now = time.time()
+        for index, shard_keys in self._group(keys).items():
+            shard = self._shards[index]
+            with shard.lock:
+                for key in shard_keys:
+                    value = shard.lookup(key, now)
+                    if value is not _MISSING:
+                        found[key] = value
+        if self.stats is not None:
+            self.stats.record_get_many(keys, found, time.perf_counter() - start)
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Set several cached values with the same TTL.
+
+        Args:
+            items: Mapping of cache keys to values.
+            ttl: Time-to-live in seconds. If None, uses the default TTL.
+        """
+        expiry_time = time.time() + (ttl if ttl is not None else self._default_ttl)
+        for index, shard_keys in self._group(items).items():
+            shard = self._shards[index]
+            with shard.lock:
+                for key in shard_keys:
+                    shard.store(key, items[key], expiry_time)
+        if self.stats is not None:
+            for key in items:
+                self.stats.record_set(key)
+
+    def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete several cached values.
+
+        Args:
+            keys: The cache keys to delete.
+
+        Returns:
+            Number of keys that existed and were deleted.
+        """
+        deleted = 0
+        for index, shard_keys in self._group(keys).items():
+            shard = self._shards[index]
+            with shard.lock:
+                for key in shard_keys:
+                    deleted += shard.remove(key)
+        return deleted
+
+    async def aget(self, key: str) -> Any | None:
+        """Async version of ``get``."""
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Async version of ``set``."""
+        self.set(key, value, ttl)
+
+    async def adelete(self, key: str) -> bool:
+        """Async version of ``delete``."""
+        return self.delete(key)
+
+    async def aclear(self) -> None:
+        """Async version of ``clear``."""
+        self.clear()
+
+    async def aget_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Async version of ``get_many``."""
+        return self.get_many(keys)
+
+    async def aset_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Async version of ``set_many``."""
+        self.set_many(items, ttl)
+
+    async def adelete_many(self, keys: Sequence[str]) -> int:
+        """Async version of ``delete_many``."""
+        return self.delete_many(keys)
+
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet removed."""
+        return sum(len(shard) for shard in self._shards)
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is stored, without updating its LRU position."""
+        if not isinstance(key, str):
+            return False
+        shard = self._shard(key)
+        with shard.lock:
+            return key in shard
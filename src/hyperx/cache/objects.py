@@ -0,0 +1,173 @@
+"""Read-through cache of entities and hyperedges by ID.
+
+Agent tools and retrievers look up the same entities and hyperedges again
+and again. With an ``ObjectCachePolicy``, ``db.entities.get()`` and
+``db.hyperedges.get()`` read through the client's cache, under the keys
+"entity:<id>" and "hyperedge:<id>":
+
+- objects returned by ``create``, ``update``, lifecycle methods and search
+  replace the cached copy, so the next ``get`` needs no request;
+- deletes (and supersedes, for the old version) drop the cached copy;
+- a 404 is remembered for ``negative_ttl`` seconds, so repeated lookups of
+  a missing ID fail without reaching the server.
+
+Objects are cached as JSON bytes and decoded with ``model_validate_json``.
+
+Example:
+    >>> db = HyperX(
+    ...     api_key="hx_sk_...",
+    ...     cache=InMemoryCache(),
+    ...     object_cache=ObjectCachePolicy(ttl=600, negative_ttl=30),
+    ... )
+    >>> db.entities.get("e:react")  # Request
+    >>> db.entities.get("e:react")  # Cached
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from hyperx.cache.adapters import delete_many, set_many
+from hyperx.exceptions import NotFoundError
+
+if TYPE_CHECKING:
+    from hyperx.cache.base import AsyncCache, Cache
+    from hyperx.models import Entity, Hyperedge
+
+ObjectKind = Literal["entity", "hyperedge"]
+
+# Cached in place of an object that the server reported missing, followed
+# by the 404 message. Bytes, so RedisCache stores it without JSON encoding.
+_NOT_FOUND = b"\x00hx404:"
+
+
+@dataclass(frozen=True)
+class ObjectCachePolicy:
+    """Settings for caching entities and hyperedges by ID.
+
+    Attributes:
+        ttl: Seconds an object stays cached; None uses the backend's
+            default TTL (default: None)
+        negative_ttl: Seconds a 404 for an ID is remembered; 0 disables
+            negative caching (default: 30)
+    """
+
+    ttl: int | None = None
+    negative_ttl: int = 30
+
+    def __post_init__(self) -> None:
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if self.negative_ttl < 0:
+            raise ValueError("negative_ttl must not be negative")
+
+
+def object_key(kind: ObjectKind, object_id: str) -> str:
+    """Cache key of an entity or hyperedge ("entity:e:react")."""
+    return f"{kind}:{object_id}"
+
+
+def _encode(objects: Iterable[Entity | Hyperedge], kind: ObjectKind) -> dict[str, Any]:
+    return {object_key(kind, obj.id): obj.model_dump_json().encode() for obj in objects}
+
+
+def _check(cached: Any) -> bytes | None:
+    """Return a cached object's JSON, or None; raise NotFoundError for a cached 404."""
+    if not isinstance(cached, bytes):
+        return None
+    if cached.startswith(_NOT_FOUND):
+        raise NotFoundError(cached[len(_NOT_FOUND) :].decode(), 404)
+    return cached
+
+
+class ObjectCache:
+    """Caches entities and hyperedges of ``HyperX`` by ID.
+
+    Created by ``HyperX(object_cache=ObjectCachePolicy(...))``.
+
+    Args:
+        cache: Cache backend, shared with search and path results
+        policy: TTLs for objects and for 404s
+    """
+
+    def __init__(self, cache: Cache, policy: ObjectCachePolicy | None = None) -> None:
+        self.cache = cache
+        self.policy = policy or ObjectCachePolicy()
+
+    def read(self, kind: ObjectKind, object_id: str, fetch: Callable[[], bytes]) -> bytes:
+        """Return the cached JSON of an object, fetching and caching it on a miss.
+
+        Raises:
+            NotFoundError: If the object is missing, now or when last fetched
+                within ``negative_ttl``
+        """
+        key = object_key(kind, object_id)
+        cached = _check(self.cache.get(key))
+        if cached is not None:
+            return cached
+        try:
+            data = fetch()
+        except NotFoundError as e:
+            if self.policy.negative_ttl:
+                self.cache.set(key, _NOT_FOUND + e.message.encode(), self.policy.negative_ttl)
+            raise
+        self.cache.set(key, data, self.policy.ttl)
+        return data
+
+    def store(self, kind: ObjectKind, objects: Iterable[Entity | Hyperedge]) -> None:
+        """Cache objects returned by the server, replacing older copies."""
+        items = _encode(objects, kind)
+        if items:
+            set_many(self.cache, items, self.policy.ttl)
+
+    def delete(self, kind: ObjectKind, object_ids: Iterable[str]) -> None:
+        """Drop the cached copies of deleted or replaced objects."""
+        keys = [object_key(kind, object_id) for object_id in object_ids]
+        if keys:
+            delete_many(self.cache, keys)
+
+
+class AsyncObjectCache:
+    """``ObjectCache`` counterpart for ``AsyncHyperX``.
+
+    Args:
+        cache: Cache backend, shared with search and path results
+        policy: TTLs for objects and for 404s
+    """
+
+    def __init__(self, cache: AsyncCache, policy: ObjectCachePolicy | None = None) -> None:
+        self.cache = cache
+        self.policy = policy or ObjectCachePolicy()
+
+    async def read(
+        self, kind: ObjectKind, object_id: str, fetch: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """Async version of ``ObjectCache.read``."""
+        key = object_key(kind, object_id)
+        cached = _check(await self.cache.aget(key))
+        if cached is not None:
+            return cached
+        try:
+            data = await fetch()
+        except NotFoundError as e:
+            if self.policy.negative_ttl:
+                await self.cache.aset(
+                    key, _NOT_FOUND + e.message.encode(), self.policy.negative_ttl
+                )
+            raise
+        await self.cache.aset(key, data, self.policy.ttl)
+        return data
+
+    async def store(self, kind: ObjectKind, objects: Iterable[Entity | Hyperedge]) -> None:
+        """Cache objects returned by the server, replacing older copies."""
+        items = _encode(objects, kind)
+        if items:
+            await self.cache.aset_many(items, self.policy.ttl)
+
+    async def delete(self, kind: ObjectKind, object_ids: Iterable[str]) -> None:
+        """Drop the cached copies of deleted or replaced objects."""
+        keys = [object_key(kind, object_id) for object_id in object_ids]
+        if keys:
+            await self.cache.adelete_many(keys)
@@ -5,9 +5,16 @@ Requires: pip install hyperx[redis]
 
 from __future__ import annotations
 
-import json
+import time
+import uuid
+from collections.abc import Callable, Mapping, Sequence
 from typing import Any
 
+from hyperx.cache.serializers import CacheSerializer
+from hyperx.cache.stats import CacheStats
+from hyperx.codec import JSONCodec
+from hyperx.deadline import remaining
+
 try:
     import redis
 except ImportError as e:
@@ -16,6 +23,18 @@ except ImportError as e:
         "Install with: pip install hyperx[redis]"
     ) from e
 
+# Deletes the lock only if we still own it, so a caller whose lock expired
+# mid-computation cannot release a lock taken over by someone else
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Seconds between cache reads while waiting for another caller's value
+LOCK_POLL_INTERVAL = 0.05
+
 
 class RedisCache:
     """Redis-backed cache for distributed environments.
@@ -28,6 +47,19 @@ class RedisCache:
         url: Redis URL (default: redis://localhost:6379)
         prefix: Key prefix for namespacing (default: "hyperx:")
         ttl: Default TTL in seconds (default: 300)
+        codec: JSON codec for stored values (default: fastest installed)
+        serializer: Value encoding and compression, e.g.
+            ``CacheSerializer(format="msgpack", compression="zstd")``
+            (default: JSON with ``codec``, uncompressed)
+        lock_timeout: Enables stampede protection: when a cached search or
+            path result is missing, one caller across all processes holds a
+            Redis lock for at most this many seconds while it queries the
+            server, and the others wait for its result (default: None, off)
+        lock_wait: Seconds other callers wait for the lock holder's result
+            before querying the server themselves (default: ``lock_timeout``)
+        stats: Record hits, misses, sets and read latency by key prefix in
+            ``self.stats`` (default: False). Expiry and eviction happen
+            inside Redis and are not counted
 
     Example:
         >>> cache = RedisCache(url="redis://localhost:6379")
@@ -49,6 +81,12 @@ class RedisCache:
         url: str = "redis://localhost:6379",
         prefix: str = "hyperx:",
         ttl: int = 300,
+        *,
+        codec: JSONCodec | None = None,
+        serializer: CacheSerializer | None = None,
+        lock_timeout: float | None = None,
+        lock_wait: float | None = None,
+        stats: bool = False,
     ) -> None:
         """Initialize the Redis cache.
 
@@ -56,10 +94,40 @@ class RedisCache:
             url: Redis connection URL.
             prefix: Key prefix for namespacing cache keys.
             ttl: Default time-to-live in seconds for cached entries.
+            codec: JSON codec used to serialize values.
+            serializer: Serializer for stored values. Takes precedence
+                over ``codec``.
+            lock_timeout: Maximum time in seconds a recompute lock is held,
+                or None to recompute without locking.
+            lock_wait: Maximum time in seconds to wait for another caller's
+                recompute. Defaults to ``lock_timeout``.
+            stats: Whether to collect statistics.
         """
+        if lock_timeout is not None and lock_timeout <= 0:
+            raise ValueError("lock_timeout must be positive")
         self._client = redis.from_url(url)
         self._prefix = prefix
         self._default_ttl = ttl
+        self._serializer = serializer if serializer is not None else CacheSerializer(codec=codec)
+        self._lock_timeout = lock_timeout
+        self._lock_wait = lock_wait if lock_wait is not None else lock_timeout
+        # Redis expires and evicts keys itself, so only reads and writes are seen
+        self.stats: CacheStats | None = CacheStats() if stats else None
+
+    @property
+    def client(self) -> redis.Redis:
+        """The underlying Redis client, e.g. for pub/sub."""
+        return self._client
+
+    @property
+    def serializer(self) -> CacheSerializer:
+        """The value serializer, whose ``stats`` report the compression ratio."""
+        return self._serializer
+
+    @property
+    def prefix(self) -> str:
+        """The key prefix used for namespacing."""
+        return self._prefix
 
     def _make_key(self, key: str) -> str:
         """Create a prefixed key for Redis storage.
@@ -81,25 +149,30 @@ class RedisCache:
         Returns:
             The cached value if found and not expired, None otherwise.
         """
+        start = time.perf_counter()
         data = self._client.get(self._make_key(key))
+        if self.stats is not None:
+            self.stats.record_get(key, data is not None, time.perf_counter() - start)
         if data is None:
             return None
-        return json.loads(data)
+        return self._serializer.loads(data)
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Set cached value with TTL.
 
         Args:
             key: The cache key to set.
-            value: The value to cache. Must be JSON-serializable.
+            value: The value to cache. Must be JSON-serializable or bytes.
             ttl: Time-to-live in seconds. If None, uses the default TTL.
         """
         ttl = ttl if ttl is not None else self._default_ttl
         self._client.setex(
             self._make_key(key),
             ttl,
-            json.dumps(value),
+            self._serializer.dumps(value),
         )
+        if self.stats is not None:
+            self.stats.record_set(key)
 
     def delete(self, key: str) -> bool:
         """Delete cached value.
@@ -126,3 +199,122 @@ class RedisCache:
                 self._client.delete(*keys)
             if cursor == 0:
                 break
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Get several cached values with a single MGET.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            Mapping of the keys that were found to their values.
+        """
+        if not keys:
+            return {}
+        start = time.perf_counter()
+        values = self._client.mget([self._make_key(key) for key in keys])
+        found = {
+            key: self._serializer.loads(data)
+            for key, data in zip(keys, values, strict=True)
+            if data is not None
+        }
+        if self.stats is not None:
+            self.stats.record_get_many(keys, found, time.perf_counter() - start)
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Set several cached values in one pipelined round trip.
+
+        Args:
+            items: Mapping of cache keys to values.
+            ttl: Time-to-live in seconds. If None, uses the default TTL.
+        """
+        if not items:
+            return
+        ttl = ttl if ttl is not None else self._default_ttl
+        with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.setex(self._make_key(key), ttl, self._serializer.dumps(value))
+            pipe.execute()
+        if self.stats is not None:
+            for key in items:
+                self.stats.record_set(key)
+
+    def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete several cached values with a single DEL.
+
+        Args:
+            keys: The cache keys to delete.
+
+        Returns:
+            Number of keys that existed and were deleted.
+        """
+        if not keys:
+            return 0
+        return int(self._client.delete(*(self._make_key(key) for key in keys)))
+
+    def recompute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int | None = None,
+        *,
+        wait: bool = True,
+    ) -> Any | None:
+        """Compute and store a value, letting only one caller do so at a time.
+
+        Without ``lock_timeout`` this simply computes and stores the value.
+        Otherwise the caller that wins a ``SET NX PX`` lock computes the
+        value; the others poll the cache for it until ``lock_wait`` (or the
+        current ``deadline()``) runs out, then compute it themselves.
+
+        Args:
+            key: The cache key to fill.
+            compute: Returns the value to cache.
+            ttl: Time-to-live in seconds. If None, uses the default TTL.
+            wait: If False, return None at once when another caller holds
+                the lock, e.g. to keep serving a stale value.
+
+        Returns:
+            The computed value, the value stored by the lock holder, or None
+            if ``wait`` is False and another caller holds the lock.
+        """
+        if self._lock_timeout is None:
+            value = compute()
+            self.set(key, value, ttl)
+            return value
+
+        lock_key = self._make_key(f"{key}:lock")
+        token = uuid.uuid4().hex
+        timeout_ms = int(self._lock_timeout * 1000)
+        if self._client.set(lock_key, token, nx=True, px=timeout_ms):
+            try:
+                value = compute()
+                self.set(key, value, ttl)
+                return value
+            finally:
+                self._client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+        if not wait:
+            return None
+        value = self._wait_for(key)
+        if value is not None:
+            return value
+        # The lock holder is slow or gone; do not make our caller wait longer
+        value = compute()
+        self.set(key, value, ttl)
+        return value
+
+    def _wait_for(self, key: str) -> Any | None:
+        wait = self._lock_wait or 0.0
+        left = remaining()
+        if left is not None:
+            wait = min(wait, left)
+        until = time.monotonic() + wait
+        while time.monotonic() < until:
+            time.sleep(LOCK_POLL_INTERVAL)
+            # Read directly so that polling is not counted as cache misses
+            data = self._client.get(self._make_key(key))
+            if data is not None:
+                return self._serializer.loads(data)
+        return None
@@ -0,0 +1,476 @@
+"""Stale-while-revalidate and early refresh for cached reads.
+
+Without a policy, an expired cache entry makes the caller wait for a full
+server round trip, and entries written together (a popular query after a
+deploy) expire together, so their refreshes stampede the server.
+
+With a ``CachePolicy``, each cached value records when it becomes stale
+and how long it took to compute. Readers then:
+
+- return fresh entries, but start a background refresh with a probability
+  that rises as expiry approaches ("XFetch", Vattani et al. 2015), so one
+  caller usually refreshes a hot key before it expires;
+- return entries that expired less than ``stale_ttl`` seconds ago at once,
+  while one background refresh per key replaces them;
+- treat older entries as misses.
+
+Background refreshes run in a small thread pool for ``HyperX`` and as
+tasks for ``AsyncHyperX``. They do not inherit the caller's deadline.
+
+Example:
+    >>> from hyperx import CachePolicy, HyperX, InMemoryCache
+    >>> db = HyperX(
+    ...     api_key="hx_sk_...",
+    ...     cache=InMemoryCache(),
+    ...     cache_policy=CachePolicy(ttl=300, stale_ttl=60, early_refresh=1.0),
+    ... )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+import random
+import struct
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from hyperx.cache.adapters import get_many, set_many
+from hyperx.cache.base import AsyncLockingCache, LockingCache
+
+if TYPE_CHECKING:
+    from hyperx.cache.base import AsyncCache, Cache
+
+T = TypeVar("T")
+
+# Marks a cached value written under a CachePolicy
+_ENVELOPE = "_hx_swr"
+
+# Bytes values (raw response bodies) are wrapped in a binary envelope instead:
+# this marker, then expiry and compute time as little-endian doubles
+_BYTES_ENVELOPE = b"\x00hxswr"
+_BYTES_HEADER = struct.Struct("<dd")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Freshness policy for cached search and path results.
+
+    Attributes:
+        ttl: Seconds an entry is fresh (default: 300)
+        stale_ttl: Seconds after ``ttl`` during which the stale entry is
+            returned while it is refreshed in the background (default: 0)
+        early_refresh: XFetch ``beta``. 0 disables early refresh; 1.0 is the
+            usual choice, larger values refresh earlier (default: 0)
+    """
+
+    ttl: int = 300
+    stale_ttl: int = 0
+    early_refresh: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if self.stale_ttl < 0 or self.early_refresh < 0:
+            raise ValueError("stale_ttl and early_refresh must not be negative")
+
+    def wrap(self, value: Any, compute_time: float) -> Any:
+        """Wrap a value with its expiry and compute time for storage.
+
+        Bytes values get a compact binary header so they stay bytes; other
+        values are wrapped in a dict.
+        """
+        expires = time.time() + self.ttl
+        if isinstance(value, bytes):
+            return _BYTES_ENVELOPE + _BYTES_HEADER.pack(expires, compute_time) + value
+        return {_ENVELOPE: 1, "value": value, "expires": expires, "delta": compute_time}
+
+    def check(self, cached: Any) -> tuple[Any, bool] | None:
+        """Decide how to use a cached entry.
+
+        Args:
+            cached: Value read from the cache, or None
+
+        Returns:
+            None if the entry must be recomputed now, otherwise the value
+            and whether it should be refreshed in the background
+        """
+        if cached is None:
+            return None
+        if isinstance(cached, bytes) and cached.startswith(_BYTES_ENVELOPE):
+            start = len(_BYTES_ENVELOPE)
+            expires, delta = _BYTES_HEADER.unpack_from(cached, start)
+            value = cached[start + _BYTES_HEADER.size :]
+        elif isinstance(cached, dict) and _ENVELOPE in cached:
+            value, expires, delta = cached["value"], cached["expires"], cached["delta"]
+        else:
+            # Written without a policy; the backend TTL governs it
+            return cached, False
+        now = time.time()
+        if now >= expires + self.stale_ttl:
+            return None
+        if now >= expires:
+            return value, True
+        if self.early_refresh > 0:
+            # XFetch: -log(u) is exponentially distributed, so the chance
+            # of refreshing grows smoothly as expiry approaches
+            gap = -delta * self.early_refresh * math.log(1.0 - random.random())
+            return value, now + gap >= expires
+        return value, False
+
+
+@dataclass
+class RefreshStats:
+    """Counters for background refreshes.
+
+    Attributes:
+        started: Refreshes started
+        skipped: Refreshes not started because one was already running
+        failed: Refreshes that raised
+    """
+
+    started: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+
+class BackgroundRefresher:
+    """Runs at most one refresh per key at a time in a thread pool.
+
+    Args:
+        max_workers: Threads used for refreshes (default: 2)
+    """
+
+    def __init__(self, max_workers: int = 2) -> None:
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._running: set[Hashable] = set()
+        self._closed = False
+        self.stats = RefreshStats()
+
+    def submit(self, key: Hashable, fn: Callable[[], object]) -> bool:
+        """Start ``fn`` in the background unless ``key`` is already refreshing.
+
+        Returns:
+            True if the refresh was started
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            if key in self._running:
+                self.stats.skipped += 1
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self._max_workers, thread_name_prefix="hyperx-refresh"
+                )
+            self._running.add(key)
+            self.stats.started += 1
+            self._executor.submit(self._run, key, fn)
+        return True
+
+    def _run(self, key: Hashable, fn: Callable[[], object]) -> None:
+        try:
+            fn()
+        except Exception:
+            with self._lock:
+                self.stats.failed += 1
+        finally:
+            with self._lock:
+                self._running.discard(key)
+
+    def close(self) -> None:
+        """Stop accepting refreshes and drop queued ones."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncBackgroundRefresher:
+    """Runs at most one refresh per key at a time as asyncio tasks."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[Hashable, asyncio.Task[Any]] = {}
+        self.stats = RefreshStats()
+
+    def submit(self, key: Hashable, fn: Callable[[], Awaitable[object]]) -> bool:
+        """Start ``fn()`` as a task unless ``key`` is already refreshing.
+
+        Returns:
+            True if the refresh was started
+        """
+        if key in self._tasks:
+            self.stats.skipped += 1
+            return False
+        # Run in an empty context so the caller's deadline does not apply
+        task = contextvars.Context().run(asyncio.ensure_future, fn())
+        self._tasks[key] = task
+        self.stats.started += 1
+        task.add_done_callback(lambda t: self._done(key, t))
+        return True
+
+    def _done(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        self._tasks.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            self.stats.failed += 1
+
+    def close(self) -> None:
+        """Cancel running refreshes."""
+        for task in list(self._tasks.values()):
+            task.cancel()
+
+
+def load_cached(
+    cache: Cache,
+    key: str,
+    load: Callable[[], tuple[T, Any]],
+    parse: Callable[[Any], T],
+    *,
+    policy: CachePolicy | None = None,
+    refresher: BackgroundRefresher | None = None,
+) -> T:
+    """Read ``key`` from the cache, loading and storing it on a miss.
+
+    With a ``LockingCache`` such as ``RedisCache(lock_timeout=...)``, only
+    one caller across processes loads a missing key while the others wait
+    for its result, and a stale entry is refreshed by at most one caller.
+
+    Args:
+        cache: Cache backend
+        key: Cache key
+        load: Fetches the result and returns it with its cacheable form
+        parse: Rebuilds the result from its cacheable form
+        policy: Optional freshness policy
+        refresher: Runs background refreshes when ``policy`` asks for one;
+            without it, entries due for refresh are reloaded in the foreground
+
+    Returns:
+        The cached or freshly loaded result
+    """
+    cached = cache.get(key)
+    if policy is None:
+        if cached is not None:
+            return parse(cached)
+        return cast(T, _load_and_store(cache, key, load, parse, None))
+
+    hit = policy.check(cached)
+    if hit is None:
+        return cast(T, _load_and_store(cache, key, load, parse, policy))
+    value, refresh = hit
+    if refresh:
+        if refresher is not None:
+            refresher.submit(
+                key, lambda: _load_and_store(cache, key, load, parse, policy, wait=False)
+            )
+        else:
+            result = _load_and_store(cache, key, load, parse, policy, wait=False)
+            if result is not None:
+                return result
+    # Fresh, or stale while someone else refreshes it
+    return parse(value)
+
+
+def _load_and_store(
+    cache: Cache,
+    key: str,
+    load: Callable[[], tuple[T, Any]],
+    parse: Callable[[Any], T],
+    policy: CachePolicy | None,
+    *,
+    wait: bool = True,
+) -> T | None:
+    """Load ``key`` and store it; None only if ``wait`` is False and it is locked."""
+    loaded: list[T] = []
+
+    def compute() -> Any:
+        start = time.monotonic()
+        result, value = load()
+        loaded.append(result)
+        if policy is None:
+            return value
+        return policy.wrap(value, time.monotonic() - start)
+
+    ttl = None if policy is None else policy.ttl + policy.stale_ttl
+    if isinstance(cache, LockingCache):
+        stored = cache.recompute(key, compute, ttl, wait=wait)
+        if loaded:
+            return loaded[0]
+        # Another caller loaded it, or holds the lock and we did not wait
+        hit = _unwrap(stored, policy)
+        if hit is not None:
+            return parse(hit[0])
+        if not wait:
+            return None
+    cache.set(key, compute(), ttl)
+    return loaded[-1]
+
+
+def _unwrap(stored: Any, policy: CachePolicy | None) -> tuple[Any, bool] | None:
+    if stored is None:
+        return None
+    return (stored, False) if policy is None else policy.check(stored)
+
+
+def load_cached_many(
+    cache: Cache,
+    loads: Mapping[str, Callable[[], tuple[T, Any]]],
+    parse: Callable[[Any], T],
+    *,
+    policy: CachePolicy | None = None,
+    refresher: BackgroundRefresher | None = None,
+) -> dict[str, T]:
+    """Bulk version of ``load_cached``: one cache read and one cache write.
+
+    Misses are loaded one after another without recompute locks. Entries
+    due for a background refresh are refreshed per key as in
+    ``load_cached``.
+
+    Args:
+        cache: Cache backend
+        loads: Maps each cache key to a function that fetches its result
+        parse: Rebuilds a result from its cacheable form
+        policy: Optional freshness policy
+        refresher: Runs background refreshes when ``policy`` asks for one
+
+    Returns:
+        Mapping of every key in ``loads`` to its result, in the same order
+    """
+    cached = get_many(cache, list(loads))
+    results: dict[str, T] = {}
+    missing = []
+    for key, load in loads.items():
+        hit = _unwrap(cached.get(key), policy)
+        if hit is not None:
+            value, refresh = hit
+            if refresh and refresher is not None:
+                refresher.submit(
+                    key, partial(_load_and_store, cache, key, load, parse, policy, wait=False)
+                )
+            if not refresh or refresher is not None:
+                results[key] = parse(value)
+                continue
+        missing.append(key)
+
+    stored = {}
+    for key in missing:
+        start = time.monotonic()
+        results[key], value = loads[key]()
+        stored[key] = value if policy is None else policy.wrap(value, time.monotonic() - start)
+    if stored:
+        set_many(cache, stored, None if policy is None else policy.ttl + policy.stale_ttl)
+    return {key: results[key] for key in loads}
+
+
+async def aload_cached(
+    cache: AsyncCache,
+    key: str,
+    load: Callable[[], Awaitable[tuple[T, Any]]],
+    parse: Callable[[Any], T],
+    *,
+    policy: CachePolicy | None = None,
+    refresher: AsyncBackgroundRefresher | None = None,
+) -> T:
+    """Async version of ``load_cached``."""
+    cached = await cache.aget(key)
+    if policy is None:
+        if cached is not None:
+            return parse(cached)
+        return cast(T, await _aload_and_store(cache, key, load, parse, None))
+
+    hit = policy.check(cached)
+    if hit is None:
+        return cast(T, await _aload_and_store(cache, key, load, parse, policy))
+    value, refresh = hit
+    if refresh:
+        if refresher is not None:
+            refresher.submit(
+                key, lambda: _aload_and_store(cache, key, load, parse, policy, wait=False)
+            )
+        else:
+            result = await _aload_and_store(cache, key, load, parse, policy, wait=False)
+            if result is not None:
+                return result
+    return parse(value)
+
+
+async def _aload_and_store(
+    cache: AsyncCache,
+    key: str,
+    load: Callable[[], Awaitable[tuple[T, Any]]],
+    parse: Callable[[Any], T],
+    policy: CachePolicy | None,
+    *,
+    wait: bool = True,
+) -> T | None:
+    loaded: list[T] = []
+
+    async def compute() -> Any:
+        start = time.monotonic()
+        result, value = await load()
+        loaded.append(result)
+        if policy is None:
+            return value
+        return policy.wrap(value, time.monotonic() - start)
+
+    ttl = None if policy is None else policy.ttl + policy.stale_ttl
+    if isinstance(cache, AsyncLockingCache):
+        stored = await cache.arecompute(key, compute, ttl, wait=wait)
+        if loaded:
+            return loaded[0]
+        hit = _unwrap(stored, policy)
+        if hit is not None:
+            return parse(hit[0])
+        if not wait:
+            return None
+    await cache.aset(key, await compute(), ttl)
+    return loaded[-1]
+
+
+async def aload_cached_many(
+    cache: AsyncCache,
+    loads: Mapping[str, Callable[[], Awaitable[tuple[T, Any]]]],
+    parse: Callable[[Any], T],
+    *,
+    policy: CachePolicy | None = None,
+    refresher: AsyncBackgroundRefresher | None = None,
+) -> dict[str, T]:
+    """Async version of ``load_cached_many``; misses are loaded concurrently."""
+    cached = await cache.aget_many(list(loads))
+    results: dict[str, T] = {}
+    missing = []
+    for key, load in loads.items():
+        hit = _unwrap(cached.get(key), policy)
+        if hit is not None:
+            value, refresh = hit
+            if refresh and refresher is not None:
+                refresher.submit(
+                    key, partial(_aload_and_store, cache, key, load, parse, policy, wait=False)
+                )
+            if not refresh or refresher is not None:
+                results[key] = parse(value)
+                continue
+        missing.append(key)
+
+    async def timed(key: str) -> tuple[T, Any, float]:
+        start = time.monotonic()
+        result, value = await loads[key]()
+        return result, value, time.monotonic() - start
+
+    stored = {}
+    for key, (result, value, elapsed) in zip(
+        missing, await asyncio.gather(*(timed(key) for key in missing)), strict=True
+    ):
+        results[key] = result
+        stored[key] = value if policy is None else policy.wrap(value, elapsed)
+    if stored:
+        await cache.aset_many(stored, None if policy is None else policy.ttl + policy.stale_ttl)
+    return {key: results[key] for key in loads}
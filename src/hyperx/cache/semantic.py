@@ -0,0 +1,395 @@
+"""Semantic cache for vector search results keyed by embedding similarity.
+
+Requires: pip install hyperx[numpy]
+
+Exact cache keys only match identical embeddings, so two embeddings of the
+same question phrased slightly differently never share an entry. A
+``SemanticCache`` keeps the embeddings of recent searches in process memory
+and serves the cached result of the most similar one when their cosine
+similarity reaches ``threshold``.
+
+Entries only match searches with the same other parameters (``limit``,
+``role_filter``, ...). Embeddings are L2-normalized and searched by brute
+force with one matrix-vector product, which is fast up to several
+thousand entries. Above ``ivf_threshold`` entries, an IVF index (a
+k-means coarse quantizer) restricts the search to the ``nprobe`` clusters
+nearest to the query. The index can only miss a similar entry, never serve
+a dissimilar one, since every candidate is still compared exactly. It is
+trained outside the lock, so lookups continue meanwhile, and in a worker
+thread when the cache is used by ``AsyncHyperX``.
+
+Example:
+    >>> semantic = SemanticCache(threshold=0.95, max_entries=10_000, ttl=300)
+    >>> db = HyperX(api_key="hx_sk_...", semantic_cache=semantic)
+    >>> db.search.vector(embed("how do react hooks work"))   # Request
+    >>> db.search.vector(embed("how do React hooks work?"))  # Cached
+    >>> semantic.stats.hit_rate
+    0.5
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "Semantic cache requires the numpy package. Install with: pip install hyperx[numpy]"
+    ) from e
+
+from hyperx.embeddings import EmbeddingInput, float32_bytes
+
+# k-means iterations when (re)training the IVF index
+_KMEANS_ITERATIONS = 10
+
+
+@dataclass
+class SemanticCacheStats:
+    """Counters for a SemanticCache.
+
+    Attributes:
+        hits: Lookups answered by a similar enough cached embedding
+        misses: Lookups with no similar enough entry
+        sets: Results stored
+        evictions: Entries removed, by reason ("lru", "ttl", "invalidated")
+    """
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (0.0 before any lookup)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _kmeans(vectors: Any) -> Any:
+    """Centroids of spherical k-means over unit ``vectors``."""
+    clusters = min(max(int(math.sqrt(len(vectors))), 16), 1024)
+    rng = np.random.default_rng(0)
+    sample = vectors[rng.choice(len(vectors), min(len(vectors), 64 * clusters), replace=False)]
+    centroids = sample[:clusters].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # Empty clusters keep their previous centroid
+        centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+    return centroids
+
+
+def _unit(embedding: EmbeddingInput) -> Any:
+    """The embedding as an L2-normalized float32 vector, or None if it is zero."""
+    vector = np.frombuffer(float32_bytes(embedding), dtype="<f4")
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else None
+
+
+class SemanticCache:
+    """In-process cache of search results keyed by embedding similarity.
+
+    Thread-safe. Results are returned as stored, so callers must not modify
+    them.
+
+    Args:
+        threshold: Minimum cosine similarity for a hit (default: 0.95)
+        max_entries: Maximum number of cached results; the least recently
+            used entry is evicted first, after expired ones (default: 10,000)
+        ttl: Seconds a result stays cached; None keeps results until
+            evicted (default: 300)
+        ivf_threshold: Number of entries from which the IVF index is used
+            instead of brute force; it is retrained whenever the cache has
+            doubled since. No index is built if it exceeds ``max_entries``
+            (default: 5,000)
+        nprobe: IVF clusters searched per lookup (default: 8)
+
+    Example:
+        >>> cache = SemanticCache(threshold=0.9)
+        >>> cache.set([0.1, 0.9], "scope", "result")
+        >>> cache.get([0.11, 0.9], "scope")
+        'result'
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        *,
+        max_entries: int = 10_000,
+        ttl: float | None = 300,
+        ivf_threshold: int = 5_000,
+        nprobe: int = 8,
+    ) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if ivf_threshold <= 0 or nprobe <= 0:
+            raise ValueError("ivf_threshold and nprobe must be positive")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self.stats = SemanticCacheStats()
+        self._lock = threading.Lock()
+        self._dim: int | None = None
+        # Incremented by every reset, so a training started before it is discarded
+        self._generation = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        # Slots 0.._top-1 have been used; freed slots are reused first
+        self._top = 0
+        self._free: list[int] = []
+        self._vectors = np.empty((0, self._dim or 0), dtype=np.float32)
+        self._scopes = np.empty(0, dtype=np.int64)  # -1 marks a free slot
+        self._stamps = np.empty(0, dtype=np.int64)  # Write sequence number
+        self._expires = np.empty(0, dtype=np.float64)
+        self._used = np.empty(0, dtype=np.float64)
+        self._clusters = np.empty(0, dtype=np.int32)
+        self._values: list[Any] = []
+        self._deps: list[frozenset[str]] = []
+        self._by_id: dict[str, set[int]] = {}
+        # Scope IDs are never reused, and dropped with their last entry
+        self._scope_ids: dict[Hashable, int] = {}
+        self._scope_keys: dict[int, Hashable] = {}
+        self._scope_sizes: dict[int, int] = {}
+        self._next_scope_id = 0
+        self._writes = 0
+        self._centroids: Any = None
+        self._trained_size = 0
+        self._training = False
+        self._generation += 1
+
+    def __len__(self) -> int:
+        return self._top - len(self._free)
+
+    def get(self, embedding: EmbeddingInput, scope: Hashable) -> Any:
+        """Return the result cached for the most similar embedding, or None.
+
+        Args:
+            embedding: Query embedding
+            scope: The search's other parameters; only entries stored with
+                an equal scope can match
+        """
+        query = _unit(embedding)
+        with self._lock:
+            now = time.time()
+            slot = self._nearest(query, scope, now) if query is not None else None
+            if slot is None:
+                self.stats.misses += 1
+                return None
+            self._used[slot] = now
+            self.stats.hits += 1
+            return self._values[slot]
+
+    def set(
+        self,
+        embedding: EmbeddingInput,
+        scope: Hashable,
+        value: Any,
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        """Cache a result under its query embedding.
+
+        Args:
+            embedding: Query embedding
+            scope: The search's other parameters
+            value: Result to cache
+            depends_on: Entity and hyperedge IDs in the result, for
+                ``invalidate()``
+
+        Raises:
+            ValueError: If the embedding's dimension differs from the cached ones
+        """
+        if self._insert(embedding, scope, value, depends_on):
+            self._train()
+
+    async def set_async(
+        self,
+        embedding: EmbeddingInput,
+        scope: Hashable,
+        value: Any,
+        depends_on: Iterable[str] = (),
+    ) -> None:
+        """Like ``set()``, but retrain the IVF index in a worker thread."""
+        if self._insert(embedding, scope, value, depends_on):
+            await asyncio.to_thread(self._train)
+
+    def _insert(
+        self, embedding: EmbeddingInput, scope: Hashable, value: Any, depends_on: Iterable[str]
+    ) -> bool:
+        """Store an entry; return whether the caller must now retrain the index."""
+        vector = _unit(embedding)
+        if vector is None:
+            return False
+        with self._lock:
+            if self._dim is None:
+                self._dim = vector.size
+                self._reset()
+            elif vector.size != self._dim:
+                raise ValueError(
+                    f"Embedding has {vector.size} dimensions, the cache holds {self._dim}"
+                )
+            now = time.time()
+            slot = self._allocate(now)
+            self._vectors[slot] = vector
+            scope_id = self._scope_ids.get(scope)
+            if scope_id is None:
+                scope_id = self._scope_ids[scope] = self._next_scope_id
+                self._scope_keys[scope_id] = scope
+                self._next_scope_id += 1
+            self._scope_sizes[scope_id] = self._scope_sizes.get(scope_id, 0) + 1
+            self._scopes[slot] = scope_id
+            self._writes += 1
+            self._stamps[slot] = self._writes
+            self._expires[slot] = now + self.ttl if self.ttl is not None else math.inf
+            self._used[slot] = now
+            self._values[slot] = value
+            self._deps[slot] = deps = frozenset(depends_on)
+            for id_ in deps:
+                self._by_id.setdefault(id_, set()).add(slot)
+            if self._centroids is not None:
+                self._clusters[slot] = int(np.argmax(self._centroids @ vector))
+            self.stats.sets += 1
+            if (
+                self._training
+                or len(self) < self.ivf_threshold
+                or len(self) < 2 * self._trained_size
+            ):
+                return False
+            self._training = True
+            return True
+
+    def invalidate(self, ids: Iterable[str]) -> int:
+        """Drop the cached results that contain any of ``ids``.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            slots: set[int] = set()
+            for id_ in ids:
+                slots.update(self._by_id.get(id_, ()))
+            for slot in slots:
+                self._remove(slot, "invalidated")
+        return len(slots)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._dim = None
+            self._reset()
+
+    def _nearest(self, query: Any, scope: Hashable, now: float) -> int | None:
+        """Slot of the most similar live entry in ``scope`` above the threshold."""
+        scope_id = self._scope_ids.get(scope)
+        if scope_id is None or query.size != self._dim:
+            return None
+        top = self._top
+        mask = (self._scopes[:top] == scope_id) & (self._expires[:top] > now)
+        if self._centroids is None:
+            # One BLAS matrix-vector product beats gathering the candidates
+            similarities = self._vectors[:top] @ query
+            similarities[~mask] = -np.inf
+            best = int(np.argmax(similarities))
+            return best if similarities[best] >= self.threshold else None
+        probes = np.argsort(self._centroids @ query)[-self.nprobe :]
+        rows = np.flatnonzero(mask & np.isin(self._clusters[:top], probes))
+        if not rows.size:
+            return None
+        similarities = self._vectors[rows] @ query
+        best = int(np.argmax(similarities))
+        return int(rows[best]) if similarities[best] >= self.threshold else None
+
+    def _allocate(self, now: float) -> int:
+        """A free slot, growing the arrays or evicting an entry if needed."""
+        if not self._free and self._top >= self.max_entries:
+            live = self._scopes[: self._top] >= 0
+            expired = np.flatnonzero(live & (self._expires[: self._top] <= now))
+            if expired.size:
+                for slot in expired.tolist():
+                    self._remove(slot, "ttl")
+            else:
+                used = np.where(live, self._used[: self._top], np.inf)
+                self._remove(int(np.argmin(used)), "lru")
+        if self._free:
+            return self._free.pop()
+        if self._top == len(self._scopes):
+            self._grow(min(max(2 * self._top, 64), self.max_entries))
+        self._top += 1
+        return self._top - 1
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - len(self._scopes)
+        self._vectors = np.concatenate(
+            [self._vectors, np.zeros((extra, self._dim or 0), dtype=np.float32)]
+        )
+        self._scopes = np.concatenate([self._scopes, np.full(extra, -1, dtype=np.int64)])
+        self._stamps = np.concatenate([self._stamps, np.zeros(extra, dtype=np.int64)])
+        self._expires = np.concatenate([self._expires, np.zeros(extra)])
+        self._used = np.concatenate([self._used, np.zeros(extra)])
+        self._clusters = np.concatenate([self._clusters, np.full(extra, -1, dtype=np.int32)])
+        self._values.extend([None] * extra)
+        self._deps.extend([frozenset()] * extra)
+
+    def _remove(self, slot: int, reason: str) -> None:
+        for id_ in self._deps[slot]:
+            slots = self._by_id.get(id_)
+            if slots is not None:
+                slots.discard(slot)
+                if not slots:
+                    del self._by_id[id_]
+        scope_id = int(self._scopes[slot])
+        self._scope_sizes[scope_id] -= 1
+        if not self._scope_sizes[scope_id]:
+            del self._scope_sizes[scope_id]
+            del self._scope_ids[self._scope_keys.pop(scope_id)]
+        self._scopes[slot] = -1
+        self._values[slot] = None
+        self._deps[slot] = frozenset()
+        self._free.append(slot)
+        self.stats.evictions[reason] = self.stats.evictions.get(reason, 0) + 1
+
+    def _train(self) -> None:
+        """(Re)build the IVF index over a snapshot of the live entries.
+
+        k-means runs without the lock; entries written meanwhile are
+        assigned to the new centroids when they are swapped in.
+        """
+        with self._lock:
+            generation = self._generation
+            writes = self._writes
+            rows = np.flatnonzero(self._scopes[: self._top] >= 0)
+            vectors = self._vectors[rows]
+        try:
+            centroids = _kmeans(vectors)
+            assignment = np.argmax(vectors @ centroids.T, axis=1)
+        except BaseException:
+            with self._lock:
+                if self._generation == generation:
+                    self._training = False
+            raise
+        with self._lock:
+            if self._generation != generation:
+                return
+            self._clusters[rows] = assignment
+            live = np.flatnonzero(self._scopes[: self._top] >= 0)
+            written = live[self._stamps[live] > writes]
+            self._clusters[written] = np.argmax(self._vectors[written] @ centroids.T, axis=1)
+            self._centroids = centroids
+            self._trained_size = rows.size
+            self._training = False
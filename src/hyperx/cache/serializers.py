@@ -0,0 +1,201 @@
+"""Value serialization for Redis-backed caches.
+
+Cached search and path results are mostly JSON with the same keys repeated
+for every entity and hyperedge ("entity_type", "created_at", ...), which
+compresses very well. ``CacheSerializer`` encodes values as JSON or
+msgpack and compresses them with zstd or lz4 above a size threshold.
+
+Every stored value describes its own format: JSON text is stored as-is, and
+other formats start with a control byte that JSON text never starts with.
+Any ``CacheSerializer`` can therefore read values written with different
+settings (given the needed packages), so settings can be changed without
+flushing Redis.
+
+Example:
+    >>> from hyperx.cache import CacheSerializer, RedisCache
+    >>> serializer = CacheSerializer(compression="zstd", threshold=512)
+    >>> cache = RedisCache(serializer=serializer)
+    >>> ...
+    >>> serializer.stats.ratio  # Bytes before / after compression
+    4.7
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from hyperx.codec import JSONCodec, get_codec
+
+SerializerFormat = Literal["json", "msgpack"]
+CacheCompression = Literal["zstd", "lz4"]
+
+DEFAULT_SERIALIZER_THRESHOLD = 1024
+
+# Format tags. JSON text starts with a printable character or whitespace.
+RAW_TAG = b"\x00"  # Bytes stored as-is
+MSGPACK_TAG = b"\x01"
+ZSTD_TAG = b"\x02"  # Followed by a compressed, tagged or JSON value
+LZ4_TAG = b"\x03"
+
+
+def _import(module: str, extra: str) -> Any:
+    try:
+        return __import__(module, fromlist=["_"])
+    except ImportError:
+        raise ImportError(
+            f"This cache serializer requires the {module.split('.')[0]} package. "
+            f"Install with: pip install hyperx[{extra}]"
+        ) from None
+
+
+@dataclass
+class SerializerStats:
+    """Size counters for values written by a CacheSerializer.
+
+    Attributes:
+        values: Values serialized
+        compressed: Values stored compressed
+        raw_bytes: Total size before compression
+        stored_bytes: Total size actually stored
+    """
+
+    values: int = 0
+    compressed: int = 0
+    raw_bytes: int = 0
+    stored_bytes: int = 0
+
+    @property
+    def ratio(self) -> float:
+        """Achieved compression ratio (raw / stored, 1.0 before any writes)."""
+        return self.raw_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+
+@dataclass
+class CacheSerializer:
+    """Encodes cache values, optionally compressing large ones.
+
+    Bytes values (raw response bodies) are stored as-is under either
+    format; ``format`` applies to other values.
+
+    Args:
+        format: "json" (default) or "msgpack" (requires ``hyperx[msgpack]``)
+        compression: None (default), "zstd" (requires ``hyperx[zstd]``) or
+            "lz4" (requires ``hyperx[lz4]``)
+        threshold: Minimum encoded size in bytes to compress (default: 1 KiB)
+        level: Compression level (default: the library's default)
+        codec: JSON codec for the "json" format (default: fastest installed)
+
+    Example:
+        >>> serializer = CacheSerializer(format="msgpack", compression="lz4")
+        >>> serializer.loads(serializer.dumps({"data": 123}))
+        {'data': 123}
+    """
+
+    format: SerializerFormat = "json"
+    compression: CacheCompression | None = None
+    threshold: int = DEFAULT_SERIALIZER_THRESHOLD
+    level: int | None = None
+    codec: JSONCodec | None = None
+    stats: SerializerStats = field(default_factory=SerializerStats, init=False, compare=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _json: JSONCodec = field(init=False, repr=False, compare=False)
+    # Optional packages by module name, imported once each
+    _modules: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.format not in ("json", "msgpack"):
+            raise ValueError(f"Unsupported serializer format: {self.format!r}")
+        if self.compression not in (None, "zstd", "lz4"):
+            raise ValueError(f"Unsupported cache compression: {self.compression!r}")
+        if self.codec is None:
+            self.codec = get_codec()
+        self._json = self.codec
+        # Fail at construction rather than on the first cache write
+        if self.format == "msgpack":
+            self._module("msgpack", "msgpack")
+        if self.compression == "zstd":
+            self._module("zstandard", "zstd")
+        elif self.compression == "lz4":
+            self._module("lz4.frame", "lz4")
+
+    def _module(self, module: str, extra: str) -> Any:
+        """An optional package, imported on first use."""
+        found = self._modules.get(module)
+        if found is None:
+            found = self._modules[module] = _import(module, extra)
+        return found
+
+    @property
+    def name(self) -> str:
+        """Short description, e.g. "msgpack+zstd"."""
+        return self.format if self.compression is None else f"{self.format}+{self.compression}"
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value for storage.
+
+        Args:
+            value: Bytes, or a JSON/msgpack-serializable value
+
+        Returns:
+            The encoded, possibly compressed, value
+        """
+        if isinstance(value, bytes):
+            data = RAW_TAG + value
+        elif self.format == "msgpack":
+            data = MSGPACK_TAG + self._module("msgpack", "msgpack").packb(value, use_bin_type=True)
+        else:
+            data = self._json.dumps(value)
+
+        stored = data
+        if self.compression is not None and len(data) >= self.threshold:
+            compressed = self._compress(data)
+            # Incompressible values are cheaper to store and read as they are
+            if len(compressed) < len(data):
+                stored = compressed
+
+        with self._lock:
+            self.stats.values += 1
+            self.stats.compressed += stored is not data
+            self.stats.raw_bytes += len(data)
+            self.stats.stored_bytes += len(stored)
+        return stored
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode a value written by any CacheSerializer (or plain JSON).
+
+        Args:
+            data: Stored value
+
+        Returns:
+            The decoded value
+        """
+        value: bytes = data.encode() if isinstance(data, str) else data
+        tag = value[:1]
+        if tag == ZSTD_TAG:
+            zstandard = self._module("zstandard", "zstd")
+            value = zstandard.ZstdDecompressor().decompress(value[1:])
+            tag = value[:1]
+        elif tag == LZ4_TAG:
+            value = self._module("lz4.frame", "lz4").decompress(value[1:])
+            tag = value[:1]
+        if tag == RAW_TAG:
+            return value[1:]
+        if tag == MSGPACK_TAG:
+            return self._module("msgpack", "msgpack").unpackb(value[1:], raw=False)
+        return self._json.loads(value)
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            zstandard = self._module("zstandard", "zstd")
+            # Compressor objects are not thread-safe, so create one per value
+            level = self.level if self.level is not None else 3
+            compressed: bytes = zstandard.ZstdCompressor(level=level).compress(data)
+            return ZSTD_TAG + compressed
+        lz4_frame = self._module("lz4.frame", "lz4")
+        level = self.level if self.level is not None else 0
+        compressed = lz4_frame.compress(data, compression_level=level)
+        return LZ4_TAG + compressed
@@ -0,0 +1,218 @@
+"""Hit, miss and eviction statistics for cache backends.
+
+Backends created with ``stats=True`` record every read, write and eviction
+in a ``CacheStats``, broken down by key prefix: the part of the key before
+the first colon, e.g. "paths", "search_hybrid", "search_text" or
+"search_vector" for the keys used by the SDK.
+
+Example:
+    >>> cache = InMemoryCache(stats=True)
+    >>> db = HyperX(api_key="hx_sk_...", cache=cache)
+    >>> ...
+    >>> cache.stats.by_prefix()["paths"].hit_rate
+    0.82
+    >>> db.cache_stats()  # Plain dict for metrics exporters
+    {'entries': 412, 'bytes': None, 'total': {...}, 'prefixes': {...}, 'hot_keys': [...]}
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from collections.abc import Callable, Container, Sequence
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Literal
+
+EvictionReason = Literal["lru", "ttl", "size"]
+
+# Prefix for keys without a colon, so arbitrary keys cannot add prefixes
+OTHER_PREFIX = "other"
+
+DEFAULT_HOT_KEYS_TRACKED = 1000
+
+
+def key_prefix(key: str) -> str:
+    """Return the stats prefix of a cache key ("paths:e:a:e:b:..." -> "paths")."""
+    prefix, sep, _ = key.partition(":")
+    return prefix if sep else OTHER_PREFIX
+
+
+def cache_stats_of(cache: object) -> CacheStats | None:
+    """Return the ``CacheStats`` of a backend created with ``stats=True``, if any."""
+    stats = getattr(cache, "stats", None)
+    if stats is None:
+        # SyncCacheAdapter around a synchronous backend
+        stats = getattr(getattr(cache, "cache", None), "stats", None)
+    return stats if isinstance(stats, CacheStats) else None
+
+
+@dataclass
+class KeyStats:
+    """Counters for one key prefix, or for all keys.
+
+    Attributes:
+        hits: Reads that found a value
+        misses: Reads that found nothing (including expired entries)
+        sets: Values written
+        evictions: Entries removed by the cache itself, by reason: "lru"
+            (replacement policy, to stay within ``max_size``), "ttl"
+            (expired) or "size" (to stay within ``max_bytes``, or too large
+            to store at all)
+        hit_seconds: Total time spent in reads that hit
+        miss_seconds: Total time spent in reads that missed
+    """
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: dict[str, int] = field(default_factory=dict)
+    hit_seconds: float = 0.0
+    miss_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of reads that hit (0.0 before any reads)."""
+        reads = self.hits + self.misses
+        return self.hits / reads if reads else 0.0
+
+    @property
+    def avg_hit_latency(self) -> float:
+        """Average seconds per read that hit."""
+        return self.hit_seconds / self.hits if self.hits else 0.0
+
+    @property
+    def avg_miss_latency(self) -> float:
+        """Average seconds per read that missed."""
+        return self.miss_seconds / self.misses if self.misses else 0.0
+
+    def _add(self, other: KeyStats) -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.sets += other.sets
+        self.hit_seconds += other.hit_seconds
+        self.miss_seconds += other.miss_seconds
+        for reason, count in other.evictions.items():
+            self.evictions[reason] = self.evictions.get(reason, 0) + count
+
+    def to_dict(self) -> dict[str, Any]:
+        """Counters and derived rates as a plain dict."""
+        return {
+            **asdict(self),
+            "hit_rate": self.hit_rate,
+            "avg_hit_latency": self.avg_hit_latency,
+            "avg_miss_latency": self.avg_miss_latency,
+        }
+
+
+class CacheStats:
+    """Thread-safe statistics collector owned by a cache backend.
+
+    Also counts reads per key to report the hottest keys. To bound memory,
+    only the most read ``hot_keys_tracked`` keys are kept (approximately:
+    the counts are pruned when twice as many keys have been seen).
+
+    Args:
+        size: Returns the backend's current (entries, bytes); either may be
+            None when the backend cannot tell
+        hot_keys_tracked: Number of keys whose reads are counted
+            (default: 1000)
+    """
+
+    def __init__(
+        self,
+        size: Callable[[], tuple[int | None, int | None]] | None = None,
+        hot_keys_tracked: int = DEFAULT_HOT_KEYS_TRACKED,
+    ) -> None:
+        self._size = size
+        self._hot_keys_tracked = hot_keys_tracked
+        self._lock = threading.Lock()
+        self._prefixes: dict[str, KeyStats] = {}
+        self._reads: Counter[str] = Counter()
+
+    def _prefix_stats(self, key: str) -> KeyStats:
+        prefix = key_prefix(key)
+        stats = self._prefixes.get(prefix)
+        if stats is None:
+            stats = self._prefixes[prefix] = KeyStats()
+        return stats
+
+    def record_get(self, key: str, hit: bool, seconds: float) -> None:
+        """Record one read of ``key`` that took ``seconds``."""
+        with self._lock:
+            stats = self._prefix_stats(key)
+            if hit:
+                stats.hits += 1
+                stats.hit_seconds += seconds
+            else:
+                stats.misses += 1
+                stats.miss_seconds += seconds
+            self._reads[key] += 1
+            if len(self._reads) > 2 * self._hot_keys_tracked:
+                self._reads = Counter(dict(self._reads.most_common(self._hot_keys_tracked)))
+
+    def record_get_many(
+        self, keys: Sequence[str], found: Container[str], seconds: float
+    ) -> None:
+        """Record a bulk read of ``keys``, splitting its time evenly over them."""
+        if not keys:
+            return
+        per_key = seconds / len(keys)
+        for key in keys:
+            self.record_get(key, key in found, per_key)
+
+    def record_set(self, key: str) -> None:
+        """Record one write of ``key``."""
+        with self._lock:
+            self._prefix_stats(key).sets += 1
+
+    def record_eviction(self, key: str, reason: EvictionReason) -> None:
+        """Record that the backend removed ``key`` for ``reason``."""
+        with self._lock:
+            evictions = self._prefix_stats(key).evictions
+            evictions[reason] = evictions.get(reason, 0) + 1
+
+    def by_prefix(self) -> dict[str, KeyStats]:
+        """Copies of the counters for each key prefix seen so far."""
+        with self._lock:
+            return {
+                prefix: replace(stats, evictions=dict(stats.evictions))
+                for prefix, stats in self._prefixes.items()
+            }
+
+    def total(self) -> KeyStats:
+        """Counters summed over all prefixes."""
+        total = KeyStats()
+        for stats in self.by_prefix().values():
+            total._add(stats)
+        return total
+
+    def hot_keys(self, n: int = 10) -> list[tuple[str, int]]:
+        """The ``n`` most read keys with their read counts, most read first."""
+        with self._lock:
+            return self._reads.most_common(n)
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._prefixes.clear()
+            self._reads.clear()
+
+    def snapshot(self, hot_keys: int = 10) -> dict[str, Any]:
+        """All statistics as a plain dict, e.g. for a metrics exporter.
+
+        Args:
+            hot_keys: Number of hottest keys to include
+
+        Returns:
+            Dict with "entries" and "bytes" (current size, None if unknown),
+            "total" and per-prefix "prefixes" counters, and "hot_keys" as
+            [key, reads] pairs
+        """
+        entries, size = self._size() if self._size is not None else (None, None)
+        return {
+            "entries": entries,
+            "bytes": size,
+            "total": self.total().to_dict(),
+            "prefixes": {prefix: stats.to_dict() for prefix, stats in self.by_prefix().items()},
+            "hot_keys": [list(item) for item in self.hot_keys(hot_keys)],
+        }
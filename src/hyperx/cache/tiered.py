@@ -0,0 +1,292 @@
+"""Two-tier cache: in-process L1 in front of a shared Redis L2.
+
+Requires: pip install hyperx[redis]
+
+Reads are answered from the local ``InMemoryCache`` when possible and
+otherwise from Redis, filling L1 on the way back. Writes and deletes go to
+both tiers and are broadcast over Redis pub/sub, so every other process
+using the same channel drops its L1 copy. Hot keys therefore cost a dict
+lookup instead of a network round trip, while all processes stay coherent.
+
+Pub/sub delivery is best effort: messages sent while a subscriber is
+disconnected are lost. ``l1_ttl`` bounds how long such a process can serve
+a stale L1 entry, and L1 is cleared whenever the subscription fails.
+
+Example:
+    >>> from hyperx.cache import RedisCache, TieredCache
+    >>> cache = TieredCache(RedisCache(url="redis://localhost:6379"), l1_ttl=30)
+    >>> db = HyperX(api_key="hx_sk_...", cache=cache)
+    >>> ...
+    >>> cache.stats.l1_hits, cache.stats.l2_hits
+    >>> cache.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from hyperx.cache.memory import InMemoryCache
+from hyperx.cache.redis import RedisCache
+
+DEFAULT_CHANNEL = "hyperx:invalidations"
+
+# Message body meaning "drop every L1 entry"
+_CLEAR = "*"
+
+
+@dataclass
+class TieredCacheStats:
+    """Counters for a TieredCache.
+
+    Attributes:
+        l1_hits: Reads answered by the in-process cache
+        l2_hits: Reads answered by Redis after an L1 miss
+        misses: Reads found in neither tier
+        invalidations: Invalidation messages received from other processes
+    """
+
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class TieredCache:
+    """L1 ``InMemoryCache`` in front of an L2 ``RedisCache``.
+
+    Args:
+        l2: Shared Redis cache
+        l1: Local cache (default: ``InMemoryCache(max_size=1000)``)
+        l1_ttl: Maximum time in seconds an entry stays in L1 (default: 60)
+        channel: Pub/sub channel for invalidations (default:
+            "hyperx:invalidations"). Processes sharing an L2 prefix must
+            use the same channel.
+        listen: Subscribe to invalidations from other processes (default: True)
+
+    Example:
+        >>> cache = TieredCache(RedisCache(prefix="myapp:"), l1_ttl=30)
+        >>> cache.set("key", {"data": 123})  # L1 + L2, other pods drop "key"
+        >>> cache.get("key")  # Served from L1
+        {'data': 123}
+    """
+
+    def __init__(
+        self,
+        l2: RedisCache,
+        l1: InMemoryCache | None = None,
+        *,
+        l1_ttl: int = 60,
+        channel: str = DEFAULT_CHANNEL,
+        listen: bool = True,
+    ) -> None:
+        self.l1 = l1 if l1 is not None else InMemoryCache(max_size=1000, ttl=l1_ttl)
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.channel = channel
+        self.stats = TieredCacheStats()
+        # Identifies our own messages so we do not drop what we just wrote
+        self._origin = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._listener: Any = None
+        if listen:
+            self._subscribe()
+
+    def _subscribe(self) -> None:
+        pubsub = self.l2.client.pubsub(ignore_subscribe_messages=True)  # type: ignore[no-untyped-call]
+        pubsub.subscribe(**{self.channel: self._on_message})
+        self._listener = pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=self._on_listener_error
+        )
+
+    def _on_message(self, message: dict[str, Any]) -> None:
+        data = message.get("data")
+        if isinstance(data, bytes):
+            data = data.decode()
+        if not isinstance(data, str):
+            return
+        origin, _, key = data.partition(" ")
+        if origin == self._origin:
+            return
+        with self._lock:
+            self.stats.invalidations += 1
+        if key == _CLEAR:
+            self.l1.clear()
+        else:
+            self.l1.delete(key)
+
+    def _on_listener_error(self, error: BaseException, pubsub: Any, thread: Any) -> None:
+        # Messages may have been missed while disconnected
+        self.l1.clear()
+        time.sleep(1.0)
+
+    def _publish(self, key: str) -> None:
+        self.l2.client.publish(self.channel, f"{self._origin} {key}")
+
+    def _publish_many(self, keys: Iterable[str]) -> None:
+        with self.l2.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.publish(self.channel, f"{self._origin} {key}")
+            pipe.execute()
+
+    def _l1_ttl(self, ttl: int | None) -> int:
+        return self.l1_ttl if ttl is None else min(ttl, self.l1_ttl)
+
+    def _count(self, field: str, n: int = 1) -> None:
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + n)
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from L1, falling back to L2 and filling L1.
+
+        Args:
+            key: The cache key to retrieve.
+
+        Returns:
+            The cached value if found in either tier, None otherwise.
+        """
+        value = self.l1.get(key)
+        if value is not None:
+            self._count("l1_hits")
+            return value
+        value = self.l2.get(key)
+        if value is None:
+            self._count("misses")
+            return None
+        self._count("l2_hits")
+        self.l1.set(key, value, self.l1_ttl)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Write a value to both tiers and invalidate other processes' L1.
+
+        Args:
+            key: The cache key to set.
+            value: The value to cache.
+            ttl: Time-to-live in seconds. If None, uses the L2 default TTL.
+                L1 keeps the entry for at most ``l1_ttl`` seconds.
+        """
+        self.l2.set(key, value, ttl)
+        self.l1.set(key, value, self._l1_ttl(ttl))
+        self._publish(key)
+
+    def delete(self, key: str) -> bool:
+        """Delete a value from both tiers and from other processes' L1.
+
+        Args:
+            key: The cache key to delete.
+
+        Returns:
+            True if the key existed in either tier, False otherwise.
+        """
+        in_l1 = self.l1.delete(key)
+        in_l2 = self.l2.delete(key)
+        self._publish(key)
+        return in_l1 or in_l2
+
+    def clear(self) -> None:
+        """Clear both tiers and every other process's L1."""
+        self.l1.clear()
+        self.l2.clear()
+        self._publish(_CLEAR)
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Get several values, reading only L1 misses from L2 with one MGET.
+
+        Args:
+            keys: The cache keys to retrieve.
+
+        Returns:
+            Mapping of the keys found in either tier to their values.
+        """
+        found = self.l1.get_many(keys)
+        self._count("l1_hits", len(found))
+        missing = [key for key in keys if key not in found]
+        if missing:
+            found.update(self._get_many_l2(missing))
+        return found
+
+    def set_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Write several values to both tiers and invalidate other processes' L1.
+
+        Args:
+            items: Mapping of cache keys to values.
+            ttl: Time-to-live in seconds. If None, uses the L2 default TTL.
+        """
+        if not items:
+            return
+        self.l2.set_many(items, ttl)
+        self.l1.set_many(items, self._l1_ttl(ttl))
+        self._publish_many(items)
+
+    def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete several values from both tiers and from other processes' L1.
+
+        Args:
+            keys: The cache keys to delete.
+
+        Returns:
+            Number of keys that existed in L2.
+        """
+        if not keys:
+            return 0
+        self.l1.delete_many(keys)
+        deleted = self.l2.delete_many(keys)
+        self._publish_many(keys)
+        return deleted
+
+    async def aget(self, key: str) -> Any | None:
+        """Async ``get``: L1 hits return without leaving the event loop."""
+        value = self.l1.get(key)
+        if value is not None:
+            self._count("l1_hits")
+            return value
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Async version of ``set``, run in a worker thread."""
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    async def adelete(self, key: str) -> bool:
+        """Async version of ``delete``, run in a worker thread."""
+        return await asyncio.to_thread(self.delete, key)
+
+    async def aclear(self) -> None:
+        """Async version of ``clear``, run in a worker thread."""
+        await asyncio.to_thread(self.clear)
+
+    async def aget_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        """Async ``get_many``: only L1 misses leave the event loop."""
+        found = self.l1.get_many(keys)
+        self._count("l1_hits", len(found))
+        missing = [key for key in keys if key not in found]
+        if missing:
+            found.update(await asyncio.to_thread(self._get_many_l2, missing))
+        return found
+
+    def _get_many_l2(self, keys: Sequence[str]) -> dict[str, Any]:
+        from_l2 = self.l2.get_many(keys)
+        self._count("l2_hits", len(from_l2))
+        self._count("misses", len(keys) - len(from_l2))
+        if from_l2:
+            self.l1.set_many(from_l2, self.l1_ttl)
+        return from_l2
+
+    async def aset_many(self, items: Mapping[str, Any], ttl: int | None = None) -> None:
+        """Async version of ``set_many``, run in a worker thread."""
+        await asyncio.to_thread(self.set_many, items, ttl)
+
+    async def adelete_many(self, keys: Sequence[str]) -> int:
+        """Async version of ``delete_many``, run in a worker thread."""
+        return await asyncio.to_thread(self.delete_many, keys)
+
+    def close(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
@@ -0,0 +1,269 @@
+"""Circuit breaker for failing or slow endpoint families.
+
+When one part of the API degrades (for example path finding timing out),
+callers that keep sending requests to it tie up connections and worker
+threads for the full timeout. A circuit breaker tracks recent outcomes per
+endpoint family (``paths``, ``search``, ``entities``, ``batch``, ...) and,
+once the error or slow-call rate crosses a threshold, fails calls to that
+family immediately with ``CircuitOpenError``. After a cool-down a few
+probe requests are let through; if they succeed the circuit closes again.
+
+Example:
+    >>> from hyperx import CircuitBreaker, HyperX
+    >>> breaker = CircuitBreaker(
+    ...     failure_rate_threshold=0.5,
+    ...     slow_call_threshold=5.0,
+    ...     on_state_change=lambda change: print(change),
+    ... )
+    >>> db = HyperX(api_key="hx_sk_...", circuit_breaker=breaker)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from hyperx.exceptions import CircuitOpenError
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+def endpoint_family(path: str) -> str:
+    """Get the endpoint family of a request path.
+
+    Args:
+        path: Request path such as "/v1/entities/e:123"
+
+    Returns:
+        The resource segment of the path, e.g. "entities"
+    """
+    parts = path.split("/", 3)
+    return parts[2] if len(parts) > 2 and parts[2] else path
+
+
+@dataclass(frozen=True)
+class CircuitStateChange:
+    """A circuit moving from one state to another.
+
+    Attributes:
+        family: Endpoint family of the circuit
+        previous: State before the change
+        state: State after the change
+    """
+
+    family: str
+    previous: CircuitState
+    state: CircuitState
+
+
+class _Circuit:
+    """State of one endpoint family's circuit."""
+
+    __slots__ = ("family", "state", "opened_at", "outcomes", "probes", "probe_successes")
+
+    def __init__(self, family: str, window_size: int) -> None:
+        self.family = family
+        self.state: CircuitState = "closed"
+        self.opened_at = 0.0
+        # (failed, slow) for the most recent calls while closed
+        self.outcomes: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+        self.probes = 0
+        self.probe_successes = 0
+
+
+@dataclass(frozen=True)
+class CircuitPermit:
+    """Permission to send one request, returned by ``CircuitBreaker.before``."""
+
+    family: str
+    probe: bool
+
+
+class CircuitBreaker:
+    """Per-endpoint-family circuit breaker.
+
+    A circuit opens when, over the last ``window_size`` calls (and at least
+    ``minimum_calls``), the share of failed calls reaches
+    ``failure_rate_threshold`` or the share of calls slower than
+    ``slow_call_threshold`` reaches ``slow_call_rate_threshold``. Failures
+    are connection errors, timeouts and 5xx responses; 4xx responses
+    (including 429) mean the service is healthy and count as successes.
+
+    Args:
+        failure_rate_threshold: Failure share that opens the circuit (default: 0.5)
+        slow_call_threshold: Seconds after which a call counts as slow
+                             (default: None, latency is not tracked)
+        slow_call_rate_threshold: Slow-call share that opens the circuit (default: 0.8)
+        window_size: Number of recent calls evaluated per family (default: 20)
+        minimum_calls: Calls needed before the circuit can open (default: 10)
+        open_duration: Seconds to fail fast before probing (default: 30)
+        half_open_max_calls: Probe requests allowed while half-open; the
+                             circuit closes once all of them succeed (default: 1)
+        on_state_change: Optional callback invoked with a ``CircuitStateChange``
+                         whenever a circuit changes state
+
+    One breaker may be shared by several clients. All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float | None = None,
+        slow_call_rate_threshold: float = 0.8,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Callable[[CircuitStateChange], None] | None = None,
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError("rate thresholds must be in (0, 1]")
+        if minimum_calls < 1 or window_size < minimum_calls:
+            raise ValueError("window_size must be >= minimum_calls >= 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def state(self, family: str) -> CircuitState:
+        """Get the current state of a family's circuit.
+
+        Args:
+            family: Endpoint family, e.g. "paths"
+
+        Returns:
+            "closed", "open" or "half_open"
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            return circuit.state if circuit is not None else "closed"
+
+    def reset(self, family: str | None = None) -> None:
+        """Close one circuit, or all circuits, and forget recent outcomes.
+
+        Args:
+            family: Endpoint family to reset (default: all)
+        """
+        with self._lock:
+            circuits = (
+                list(self._circuits.values())
+                if family is None
+                else [c for c in (self._circuits.get(family),) if c is not None]
+            )
+            changes = [self._transition(c, "closed") for c in circuits if c.state != "closed"]
+            for circuit in circuits:
+                circuit.outcomes.clear()
+        self._notify(changes)
+
+    def before(self, path: str) -> CircuitPermit:
+        """Check that a request may be sent.
+
+        Args:
+            path: Request path
+
+        Returns:
+            A permit to pass to ``record`` or ``abandon`` once the call ends
+
+        Raises:
+            CircuitOpenError: If the family's circuit is open
+        """
+        family = endpoint_family(path)
+        changes: list[CircuitStateChange] = []
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                circuit = self._circuits[family] = _Circuit(family, self.window_size)
+            if circuit.state == "closed":
+                return CircuitPermit(family, probe=False)
+            remaining = circuit.opened_at + self.open_duration - time.monotonic()
+            if circuit.state == "open":
+                if remaining > 0:
+                    raise CircuitOpenError(family, remaining)
+                changes.append(self._transition(circuit, "half_open"))
+            if circuit.probes >= self.half_open_max_calls:
+                raise CircuitOpenError(family, max(remaining, 0.0))
+            circuit.probes += 1
+        self._notify(changes)
+        return CircuitPermit(family, probe=True)
+
+    def record(self, permit: CircuitPermit, *, failed: bool, duration: float) -> None:
+        """Record the outcome of a permitted call.
+
+        Args:
+            permit: Permit returned by ``before``
+            failed: Whether the call failed (transport error or 5xx)
+            duration: Call duration in seconds
+        """
+        slow = self.slow_call_threshold is not None and duration >= self.slow_call_threshold
+        changes: list[CircuitStateChange] = []
+        with self._lock:
+            circuit = self._circuits[permit.family]
+            if permit.probe:
+                circuit.probes -= 1
+                # Outcomes of probes from an earlier half-open period are stale
+                if circuit.state != "half_open":
+                    return
+                if failed or slow:
+                    changes.append(self._transition(circuit, "open"))
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_max_calls:
+                        changes.append(self._transition(circuit, "closed"))
+            elif circuit.state == "closed":
+                circuit.outcomes.append((failed, slow))
+                if self._should_open(circuit):
+                    changes.append(self._transition(circuit, "open"))
+        self._notify(changes)
+
+    def abandon(self, permit: CircuitPermit) -> None:
+        """Release a permit whose call ended without an outcome (e.g. cancelled).
+
+        Args:
+            permit: Permit returned by ``before``
+        """
+        if not permit.probe:
+            return
+        with self._lock:
+            self._circuits[permit.family].probes -= 1
+
+    def _should_open(self, circuit: _Circuit) -> bool:
+        calls = len(circuit.outcomes)
+        if calls < self.minimum_calls:
+            return False
+        failures = sum(1 for failed, _ in circuit.outcomes if failed)
+        if failures / calls >= self.failure_rate_threshold:
+            return True
+        if self.slow_call_threshold is None:
+            return False
+        slow_calls = sum(1 for _, slow in circuit.outcomes if slow)
+        return slow_calls / calls >= self.slow_call_rate_threshold
+
+    def _transition(self, circuit: _Circuit, state: CircuitState) -> CircuitStateChange:
+        """Move a circuit to a new state. Must be called with the lock held."""
+        change = CircuitStateChange(circuit.family, circuit.state, state)
+        circuit.state = state
+        circuit.probe_successes = 0
+        if state == "open":
+            circuit.opened_at = time.monotonic()
+        elif state == "closed":
+            circuit.outcomes.clear()
+        return change
+
+    def _notify(self, changes: list[CircuitStateChange]) -> None:
+        if self.on_state_change is None:
+            return
+        for change in changes:
+            self.on_state_change(change)
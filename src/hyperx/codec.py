@@ -0,0 +1,125 @@
+"""JSON codecs for encoding requests and decoding responses.
+
+The SDK spends a noticeable share of CPU time encoding and decoding JSON
+for large search and batch payloads. This module provides a small codec
+abstraction with implementations backed by orjson, msgspec or the
+standard library. ``get_codec()`` picks the fastest one installed.
+
+Example:
+    >>> from hyperx.codec import get_codec
+    >>> codec = get_codec()
+    >>> codec.loads(codec.dumps({"query": "react"}))
+    {'query': 'react'}
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Literal, Protocol, runtime_checkable
+
+CodecName = Literal["auto", "orjson", "msgspec", "json"]
+
+
+@runtime_checkable
+class JSONCodec(Protocol):
+    """Protocol for JSON codecs.
+
+    ``loads`` must raise ValueError (or a subclass) for malformed input.
+    """
+
+    name: str
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to UTF-8 JSON bytes."""
+        ...
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON bytes or text to Python objects."""
+        ...
+
+
+class StdlibCodec:
+    """Codec backed by the standard library ``json`` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """Codec backed by orjson.
+
+    NumPy arrays are serialized natively and non-string dict keys are
+    converted to strings, matching the standard library's behavior.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._options)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec:
+    """Codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            # msgspec errors do not subclass ValueError
+            raise ValueError(str(e)) from e
+
+
+def get_codec(name: CodecName = "auto") -> JSONCodec:
+    """Get a JSON codec by name.
+
+    Args:
+        name: "orjson", "msgspec", "json", or "auto" (default) to use the
+              fastest installed library, falling back to the standard library.
+
+    Returns:
+        A codec instance
+
+    Raises:
+        ImportError: If the requested library is not installed
+        ValueError: If the name is unknown
+    """
+    if name == "json":
+        return StdlibCodec()
+    if name == "orjson":
+        return OrjsonCodec()
+    if name == "msgspec":
+        return MsgspecCodec()
+    if name != "auto":
+        raise ValueError(f"Unknown codec: {name!r}")
+    for factory in (OrjsonCodec, MsgspecCodec):
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return StdlibCodec()
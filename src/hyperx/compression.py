@@ -0,0 +1,80 @@
+"""Request body compression for large payloads.
+
+Bulk ingest (batch operations and ``create_many`` with embeddings) sends
+request bodies of several megabytes. Compressing them above a size
+threshold trades a little CPU for much less time on the wire.
+
+Example:
+    >>> from hyperx import HyperX, RequestCompression
+    >>> db = HyperX(
+    ...     api_key="hx_sk_...",
+    ...     compression=RequestCompression(algorithm="zstd", threshold=32_768),
+    ... )
+"""
+
+from __future__ import annotations
+
+import gzip
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+CompressionAlgorithm = Literal["gzip", "zstd"]
+
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+
+
+@dataclass
+class RequestCompression:
+    """Opt-in compression of request bodies above a size threshold.
+
+    Compressed requests carry a ``Content-Encoding`` header. Responses are
+    decompressed transparently by httpx, which advertises every encoding
+    it can decode (gzip and deflate, plus zstd and br when the
+    ``zstandard`` and ``brotli`` packages are installed).
+
+    Args:
+        algorithm: "gzip" (default) or "zstd" (requires ``hyperx[zstd]``)
+        threshold: Minimum body size in bytes to compress (default: 64 KiB)
+        level: Compression level (default: 6 for gzip, 3 for zstd)
+    """
+
+    algorithm: CompressionAlgorithm = "gzip"
+    threshold: int = DEFAULT_COMPRESSION_THRESHOLD
+    level: int | None = None
+    _zstd: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.algorithm == "gzip":
+            return
+        if self.algorithm != "zstd":
+            raise ValueError(f"Unsupported compression algorithm: {self.algorithm!r}")
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstd compression requires the zstandard package. "
+                "Install with: pip install hyperx[zstd]"
+            ) from None
+        self._zstd = zstandard
+
+    def compress(self, body: bytes) -> bytes | None:
+        """Compress a request body if it exceeds the threshold.
+
+        Args:
+            body: Encoded request body
+
+        Returns:
+            The compressed body, or None if the body should be sent as-is
+        """
+        if len(body) < self.threshold:
+            return None
+        if self.algorithm == "zstd":
+            # Compressor objects are not thread-safe, so create one per body
+            level = self.level if self.level is not None else 3
+            return bytes(self._zstd.ZstdCompressor(level=level).compress(body))
+        return gzip.compress(body, compresslevel=self.level if self.level is not None else 6)
+
+    @property
+    def content_encoding(self) -> str:
+        """Value for the Content-Encoding header of compressed requests."""
+        return self.algorithm
@@ -0,0 +1,84 @@
+"""Deadlines that bound a whole group of requests.
+
+The client ``timeout`` applies to each HTTP request on its own. Agent tools
+and retrievers make many requests in sequence, so a context-scoped
+deadline bounds the total: every request inside the scope is sent with
+only the remaining time as its timeout, retries stop when the deadline
+would be missed, and multi-step operations check the deadline between
+steps and stop early.
+
+Deadlines are stored in a ``contextvars.ContextVar``, so they follow the
+code that set them into called functions and asyncio tasks created inside
+the scope, and never leak into other threads or tasks. Nested scopes can
+only shorten the deadline.
+
+Example:
+    >>> from hyperx.deadline import deadline
+    >>> with deadline(5.0):
+    ...     entity = db.entities.get("e:react")
+    ...     paths = db.paths.find("e:react", "e:redux")  # Gets what is left of 5s
+
+    Every resource method also accepts ``timeout=`` to bound a single call:
+
+    >>> db.paths.find("e:react", "e:redux", timeout=2.0)
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from hyperx.exceptions import DeadlineExceededError
+
+_deadline: ContextVar[float | None] = ContextVar("hyperx_deadline", default=None)
+
+
+@contextmanager
+def deadline(timeout: float | None) -> Iterator[None]:
+    """Bound all HyperX requests in the block to ``timeout`` seconds in total.
+
+    Args:
+        timeout: Seconds from now, or None for no additional limit
+
+    Example:
+        >>> with deadline(2.5):
+        ...     results = db.search("react")
+    """
+    if timeout is None:
+        yield
+        return
+    expires = time.monotonic() + timeout
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Get the time left before the current deadline.
+
+    Returns:
+        Seconds left (negative once expired), or None outside a deadline scope
+    """
+    expires = _deadline.get()
+    return None if expires is None else expires - time.monotonic()
+
+
+def expired() -> bool:
+    """Check whether the current deadline has passed."""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check_deadline() -> None:
+    """Raise if the current deadline has passed.
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    if expired():
+        raise DeadlineExceededError("Deadline exceeded")
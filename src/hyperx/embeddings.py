@@ -0,0 +1,157 @@
+"""Embedding encoding for entity creation and vector search.
+
+A 1536-dimension embedding serialized as a JSON float list is ~20KB of
+text, and formatting it costs one Python float-to-string conversion per
+dimension. When the server supports it, embeddings can instead be sent as
+base64-encoded little-endian binary, which is ~4x smaller (float32) and is
+produced with a single buffer copy.
+
+Embeddings may be given as lists or tuples of floats, NumPy arrays,
+``array.array`` or memoryviews. NumPy is used when the input is a NumPy
+array but is never required.
+
+Binary embeddings are sent as an object instead of a list::
+
+    {"encoding": "base64", "dtype": "float32", "data": "AACAPwAAAEA..."}
+
+int8 embeddings are symmetrically quantized and carry the scale needed to
+recover the original values (``value = int8 * scale``)::
+
+    {"encoding": "base64", "dtype": "int8", "scale": 0.0078, "data": "..."}
+"""
+
+from __future__ import annotations
+
+import base64
+import struct
+import sys
+from array import array
+from typing import Any, Literal
+
+EmbeddingFormat = Literal["json", "float32", "float16", "int8"]
+
+# list/tuple of floats, numpy.ndarray, array.array or memoryview
+EmbeddingInput = Any
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _is_numpy(embedding: Any) -> bool:
+    return hasattr(embedding, "astype") and hasattr(embedding, "tobytes")
+
+
+def _float32_array(embedding: EmbeddingInput) -> array[float]:
+    """Convert any supported input to a native float32 array."""
+    if isinstance(embedding, memoryview):
+        if embedding.format == "f":
+            return array("f", embedding.tobytes())
+        if embedding.format in ("B", "b", "c"):
+            # Raw bytes are interpreted as packed float32 values
+            return array("f", embedding.tobytes())
+        return array("f", embedding.tolist())
+    if isinstance(embedding, array):
+        return embedding if embedding.typecode == "f" else array("f", embedding)
+    return array("f", embedding)
+
+
+def to_float_list(embedding: EmbeddingInput) -> list[float]:
+    """Convert an embedding to a list of Python floats.
+
+    Args:
+        embedding: Embedding in any supported input type
+
+    Returns:
+        The embedding as a list (the input itself if it already is one)
+    """
+    if isinstance(embedding, list):
+        return embedding
+    if _is_numpy(embedding):
+        return list(embedding.tolist())
+    if isinstance(embedding, memoryview):
+        return _float32_array(embedding).tolist()
+    if isinstance(embedding, array):
+        return embedding.tolist()
+    return list(embedding)
+
+
+def float32_bytes(embedding: EmbeddingInput) -> bytes:
+    """Pack an embedding as little-endian float32 bytes.
+
+    Args:
+        embedding: Embedding in any supported input type
+
+    Returns:
+        Packed bytes, 4 per dimension
+    """
+    if _is_numpy(embedding):
+        return bytes(embedding.astype("<f4", copy=False).tobytes())
+    values = _float32_array(embedding)
+    if not _LITTLE_ENDIAN:
+        values = array("f", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _float16_bytes(embedding: EmbeddingInput) -> bytes:
+    if _is_numpy(embedding):
+        return bytes(embedding.astype("<f2").tobytes())
+    values = to_float_list(embedding)
+    return struct.pack(f"<{len(values)}e", *values)
+
+
+def _int8_bytes(embedding: EmbeddingInput) -> tuple[bytes, float]:
+    if _is_numpy(embedding):
+        values = embedding.astype("<f4", copy=False)
+        peak = float(abs(values).max()) if values.size else 0.0
+        scale = peak / 127 if peak else 1.0
+        quantized = (values / scale).round().clip(-127, 127).astype("i1")
+        return bytes(quantized.tobytes()), scale
+    floats = to_float_list(embedding)
+    peak = max((abs(v) for v in floats), default=0.0)
+    scale = peak / 127 if peak else 1.0
+    inverse = 1.0 / scale
+    quantized = array("b", (max(-127, min(127, round(v * inverse))) for v in floats))
+    return quantized.tobytes(), scale
+
+
+def encode_embedding(
+    embedding: EmbeddingInput, fmt: EmbeddingFormat = "json"
+) -> list[float] | dict[str, Any]:
+    """Encode an embedding for an API request.
+
+    Args:
+        embedding: Embedding in any supported input type
+        fmt: "json" for a float list (default), or "float32", "float16" or
+             "int8" for base64-encoded binary
+
+    Returns:
+        A float list for "json", otherwise a binary embedding object
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt == "json":
+        return to_float_list(embedding)
+    extra: dict[str, Any] = {}
+    if fmt == "float32":
+        data = float32_bytes(embedding)
+    elif fmt == "float16":
+        data = _float16_bytes(embedding)
+    elif fmt == "int8":
+        data, extra["scale"] = _int8_bytes(embedding)
+    else:
+        raise ValueError(f"Unknown embedding format: {fmt!r}")
+    return {
+        "encoding": "base64",
+        "dtype": fmt,
+        **extra,
+        "data": base64.b64encode(data).decode("ascii"),
+    }
+
+
+def has_embedding(embedding: EmbeddingInput | None) -> bool:
+    """Check whether an optional embedding argument holds any values.
+
+    Unlike truthiness, this works for NumPy arrays.
+    """
+    return embedding is not None and len(embedding) > 0
@@ -36,3 +36,22 @@ class RateLimitError(HyperXError):
 class ServerError(HyperXError):
     """Raised when server returns 5xx error."""
     pass
+
+
+class CircuitOpenError(HyperXError):
+    """Raised when a request is rejected because its circuit breaker is open.
+
+    Attributes:
+        family: Endpoint family whose circuit is open (e.g. "paths")
+        retry_after: Seconds until the circuit lets probe requests through
+    """
+
+    def __init__(self, family: str, retry_after: float):
+        super().__init__(f"Circuit open for '{family}' endpoints; retry in {retry_after:.1f}s")
+        self.family = family
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(HyperXError, TimeoutError):
+    """Raised when a call's timeout or the enclosing deadline has passed."""
+    pass
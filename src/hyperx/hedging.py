@@ -0,0 +1,158 @@
+"""Tail-latency hedging for idempotent reads.
+
+A small share of requests is much slower than the rest (GC pauses, a busy
+replica, a lost packet), and those outliers dominate p99 latency. Hedging
+sends a second copy of a read that has not completed within the recent
+p95 latency of its endpoint family, uses whichever response arrives first
+and cancels the other. A budget caps the extra load hedges may add.
+
+Hedging is available on ``AsyncHyperX`` only and applies to GET requests
+and read-only POST endpoints (search, paths, query).
+
+Example:
+    >>> from hyperx import AsyncHyperX, HedgingPolicy
+    >>> hedging = HedgingPolicy(percentile=95, max_hedge_ratio=0.05)
+    >>> db = AsyncHyperX(api_key="hx_sk_...", hedging=hedging)
+    >>> ...
+    >>> hedging.stats.hedged, hedging.stats.hedge_wins
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from hyperx.retry import RetryBudget
+
+
+@dataclass
+class HedgingStats:
+    """Counters for hedged requests.
+
+    Attributes:
+        requests: Reads eligible for hedging
+        hedged: Reads for which a hedge request was sent
+        hedge_wins: Hedged reads answered by the hedge rather than the original
+        budget_exhausted: Hedges skipped because the budget was spent
+    """
+
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    budget_exhausted: int = 0
+
+
+class HedgingPolicy:
+    """Configuration and state for request hedging.
+
+    The hedge delay for an endpoint family (``search``, ``entities``, ...)
+    is the given percentile of its last ``window_size`` latencies, clamped
+    to ``[min_delay, max_delay]``. Until ``min_samples`` latencies have been
+    observed, ``initial_delay`` is used.
+
+    Hedges are limited to ``max_hedge_ratio`` of requests over a sliding
+    10-second window, plus ``min_hedges_per_second`` so that low-traffic
+    clients can still hedge.
+
+    Latency history, budget and stats are shared by every client using the
+    policy. The policy is thread-safe.
+
+    Args:
+        percentile: Latency percentile after which to hedge (default: 95)
+        initial_delay: Hedge delay in seconds before enough samples (default: 0.5)
+        min_delay: Lower bound for the hedge delay in seconds (default: 0.01)
+        max_delay: Upper bound for the hedge delay in seconds (default: 5)
+        window_size: Latencies kept per endpoint family (default: 200)
+        min_samples: Latencies needed before the percentile is used (default: 20)
+        max_hedge_ratio: Hedges allowed per request (default: 0.1)
+        min_hedges_per_second: Hedges always allowed per second (default: 0.5)
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        initial_delay: float = 0.5,
+        min_delay: float = 0.01,
+        max_delay: float = 5.0,
+        window_size: int = 200,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.1,
+        min_hedges_per_second: float = 0.5,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if min_delay > max_delay:
+            raise ValueError("min_delay must not exceed max_delay")
+        if min_samples < 1 or window_size < min_samples:
+            raise ValueError("window_size must be >= min_samples >= 1")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_hedges_per_second = min_hedges_per_second
+        self.stats = HedgingStats()
+        self._lock = threading.Lock()
+        self._latencies: dict[str, deque[float]] = {}
+        self._budget = RetryBudget(max_hedge_ratio, min_hedges_per_second)
+
+    def delay(self, family: str) -> float:
+        """Get the current hedge delay for an endpoint family.
+
+        Args:
+            family: Endpoint family, e.g. "search"
+
+        Returns:
+            Seconds to wait for the original request before hedging
+        """
+        with self._lock:
+            latencies = self._latencies.get(family)
+            if latencies is None or len(latencies) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(latencies)
+        # Nearest-rank percentile
+        rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+        return min(max(ordered[rank], self.min_delay), self.max_delay)
+
+    def observe(self, family: str, latency: float) -> None:
+        """Record the latency of a completed read.
+
+        Args:
+            family: Endpoint family of the request
+            latency: Time until the first response arrived, in seconds
+        """
+        with self._lock:
+            latencies = self._latencies.get(family)
+            if latencies is None:
+                latencies = self._latencies[family] = deque(maxlen=self.window_size)
+            latencies.append(latency)
+
+    def start(self) -> None:
+        """Record an eligible read, adding to the hedge budget."""
+        self._budget.deposit()
+        with self._lock:
+            self.stats.requests += 1
+
+    def try_hedge(self) -> bool:
+        """Try to spend budget for one hedge request.
+
+        Returns:
+            True if the hedge may be sent
+        """
+        allowed = self._budget.withdraw()
+        with self._lock:
+            if allowed:
+                self.stats.hedged += 1
+            else:
+                self.stats.budget_exhausted += 1
+        return allowed
+
+    def record_win(self) -> None:
+        """Record that a hedge answered before the original request."""
+        with self._lock:
+            self.stats.hedge_wins += 1
@@ -1,21 +1,154 @@
 """HTTP client wrapper for HyperX API."""
 
+from __future__ import annotations
+
+import asyncio
+import time
 from typing import Any
 
 import httpx
 
 from hyperx._version import __version__
+from hyperx.circuit import CircuitBreaker, CircuitPermit, endpoint_family
+from hyperx.codec import JSONCodec, get_codec
+from hyperx.compression import RequestCompression
+from hyperx.deadline import deadline, expired, remaining
 from hyperx.exceptions import (
     AuthenticationError,
+    DeadlineExceededError,
     HyperXError,
     NotFoundError,
     RateLimitError,
     ServerError,
     ValidationError,
 )
+from hyperx.hedging import HedgingPolicy
+from hyperx.ratelimit import RateLimiter
+from hyperx.retry import RetryBudget, RetryEvent, RetryPolicy
+from hyperx.singleflight import SingleFlight
 
 DEFAULT_BASE_URL = "https://api.hyperxdb.dev"
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# POST endpoints that only read data and are therefore safe to repeat
+IDEMPOTENT_POST_PATHS = frozenset({
+    "/v1/search",
+    "/v1/search/vector",
+    "/v1/search/text",
+    "/v1/paths",
+    "/v1/query",
+})
+
+
+def is_idempotent(method: str, path: str) -> bool:
+    """Check whether a request can safely be sent more than once.
+
+    Args:
+        method: HTTP method
+        path: Request path
+
+    Returns:
+        True for GET/PUT/DELETE and read-only POST endpoints
+    """
+    if method in ("GET", "HEAD", "PUT", "DELETE"):
+        return True
+    return method == "POST" and path in IDEMPOTENT_POST_PATHS
+
+
+def _is_read(method: str, path: str) -> bool:
+    """Check whether a request only reads data (GET or a read-only POST)."""
+    return method == "GET" or (method == "POST" and path in IDEMPOTENT_POST_PATHS)
+
+
+def _coalesce_key(
+    method: str, path: str, params: dict[str, Any] | None, content: bytes | None
+) -> tuple[str, str, str, bytes | None] | None:
+    """Key identifying a read request for single-flight, or None for writes."""
+    if not _is_read(method, path):
+        return None
+    return method, path, repr(sorted(params.items())) if params else "", content
+
+
+def _attempt_timeout(timeout: httpx.Timeout) -> httpx.Timeout:
+    """Clamp the client timeout to the time left before the current deadline.
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceededError("Deadline exceeded before the request was sent")
+    return httpx.Timeout(
+        connect=left if timeout.connect is None else min(timeout.connect, left),
+        read=left if timeout.read is None else min(timeout.read, left),
+        write=left if timeout.write is None else min(timeout.write, left),
+        pool=left if timeout.pool is None else min(timeout.pool, left),
+    )
+
+
+def _check_http2(http2: bool) -> None:
+    """Raise a helpful error if HTTP/2 is requested without the h2 package."""
+    if not http2:
+        return
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "HTTP/2 support requires the h2 package. "
+            "Install with: pip install hyperx[http2]"
+        ) from None
+
+
+def _check_transport_options(
+    transport: object | None, limits: httpx.Limits | None, http2: bool
+) -> None:
+    """Reject pool options that would be silently ignored by a custom transport."""
+    if transport is not None and (limits is not None or http2):
+        raise ValueError(
+            "limits and http2 configure the default transport; "
+            "set them on the transport you pass instead"
+        )
+
+
+class SharedTransport(httpx.BaseTransport):
+    """Transport wrapper that lets several clients share one connection pool.
+
+    Closing a client that uses a SharedTransport leaves the underlying
+    transport open; the caller that created the transport owns it and is
+    responsible for closing it.
+
+    Example:
+        >>> transport = httpx.HTTPTransport(limits=httpx.Limits(max_connections=50))
+        >>> db1 = HyperX(api_key="hx_sk_...", transport=transport)
+        >>> db2 = HyperX(api_key="hx_sk_...", transport=transport)
+        >>> ...
+        >>> transport.close()
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of SharedTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
 
 
 class HTTPClient:
@@ -25,15 +158,40 @@ class HTTPClient:
         self,
         api_key: str,
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        *,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        codec: JSONCodec | None = None,
+        compression: RequestCompression | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        single_flight: SingleFlight | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
+        _check_transport_options(transport, limits, http2)
+        _check_http2(http2)
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self._timeout = httpx.Timeout(timeout)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.codec = codec if codec is not None else get_codec()
+        self.compression = compression
+        self.single_flight = single_flight
+        self.circuit_breaker = circuit_breaker
+        self._retry_budget = (
+            RetryBudget(retry.budget_ratio, retry.budget_min_per_second) if retry else None
+        )
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=timeout,
             headers=self._headers(),
+            limits=limits if limits is not None else DEFAULT_LIMITS,
+            http2=http2,
+            transport=SharedTransport(transport) if transport is not None else None,
         )
 
     def _headers(self) -> dict[str, str]:
@@ -43,14 +201,19 @@ class HTTPClient:
             "User-Agent": f"hyperx-python/{__version__}",
         }
 
-    def _handle_response(self, response: httpx.Response) -> Any:
-        """Handle API response and raise appropriate exceptions."""
+    def _handle_response(self, response: httpx.Response, *, raw: bool = False) -> Any:
+        """Handle API response and raise appropriate exceptions.
+
+        With ``raw``, successful responses are returned as the undecoded body.
+        """
         if 200 <= response.status_code < 300:
-            return response.json() if response.content else None
+            if raw:
+                return response.content
+            return self.codec.loads(response.content) if response.content else None
 
         error_body = None
         try:
-            error_body = response.json()
+            error_body = self.codec.loads(response.content)
         except (ValueError, TypeError):
             pass
 
@@ -69,25 +232,211 @@ class HTTPClient:
         else:
             raise HyperXError(message, response.status_code, error_body)
 
-    def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        """Make GET request."""
-        response = self._client.get(path, params=params)
-        return self._handle_response(response)
+    def _encode_body(
+        self, json: dict[str, Any] | None
+    ) -> tuple[bytes | None, dict[str, str] | None]:
+        """Encode a JSON body, compressing it when configured and large enough."""
+        if json is None:
+            return None, None
+        content = self.codec.dumps(json)
+        if self.compression is not None:
+            compressed = self.compression.compress(content)
+            if compressed is not None:
+                return compressed, {"Content-Encoding": self.compression.content_encoding}
+        return content, None
 
-    def post(self, path: str, json: dict[str, Any] | None = None) -> Any:
-        """Make POST request."""
-        response = self._client.post(path, json=json)
-        return self._handle_response(response)
+    def _retry_delay(
+        self,
+        method: str,
+        path: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Return the delay before retrying, or None if the attempt is final."""
+        if self.retry is None or self._retry_budget is None:
+            return None
+        if not self.retry.should_retry(
+            idempotent=is_idempotent(method, path),
+            attempt=attempt,
+            status_code=response.status_code if response is not None else None,
+            error=error,
+        ):
+            return None
+        delay = self.retry.compute_delay(attempt + 1, response)
+        left = remaining()
+        if left is not None and delay >= left:
+            return None
+        if not self._retry_budget.withdraw():
+            return None
+        if self.retry.on_retry is not None:
+            self.retry.on_retry(
+                RetryEvent(
+                    method=method,
+                    path=path,
+                    attempt=attempt + 1,
+                    delay=delay,
+                    status_code=response.status_code if response is not None else None,
+                    error=error,
+                )
+            )
+        return delay
 
-    def put(self, path: str, json: dict[str, Any] | None = None) -> Any:
-        """Make PUT request."""
-        response = self._client.put(path, json=json)
-        return self._handle_response(response)
+    def _record(self, permit: CircuitPermit | None, start: float, *, failed: bool) -> None:
+        """Report the outcome of an attempt to the circuit breaker."""
+        if self.circuit_breaker is not None and permit is not None:
+            self.circuit_breaker.record(permit, failed=failed, duration=time.monotonic() - start)
 
-    def delete(self, path: str) -> Any:
-        """Make DELETE request."""
-        response = self._client.delete(path)
-        return self._handle_response(response)
+    def _abandon(self, permit: CircuitPermit | None) -> None:
+        """Release a circuit breaker permit for an attempt without an outcome."""
+        if self.circuit_breaker is not None and permit is not None:
+            self.circuit_breaker.abandon(permit)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send a single attempt through the circuit breaker and rate limiter."""
+        permit = self.circuit_breaker.before(path) if self.circuit_breaker is not None else None
+        if self.rate_limiter is not None:
+            try:
+                self.rate_limiter.acquire(method, path)
+            except BaseException:
+                self._abandon(permit)
+                raise
+        try:
+            # Timed after the limiter wait, so client-side throttling is not
+            # reported to the circuit breaker as call latency
+            start = time.monotonic()
+            try:
+                response = self._client.request(
+                    method,
+                    path,
+                    params=params,
+                    content=content,
+                    headers=headers,
+                    timeout=_attempt_timeout(self._timeout),
+                )
+            except httpx.TransportError:
+                self._record(permit, start, failed=True)
+                raise
+            except BaseException:
+                self._abandon(permit)
+                raise
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+        self._record(permit, start, failed=response.status_code >= 500)
+        return response
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Send a request, merging identical concurrent reads if configured."""
+        content, headers = self._encode_body(json)
+        # A caller with a deadline is not merged, since followers would
+        # inherit its deadline (and the errors it causes)
+        if self.single_flight is not None and remaining() is None:
+            key = _coalesce_key(method, path, params, content)
+            if key is not None:
+                # Scope by credentials in case the SingleFlight is shared, and
+                # by result type since raw and decoded callers cannot share
+                return self.single_flight.do(
+                    (self.base_url, self.api_key, key, raw),
+                    lambda: self._execute(
+                        method, path, params=params, content=content, headers=headers, raw=raw
+                    ),
+                )
+        return self._execute(
+            method, path, params=params, content=content, headers=headers, raw=raw
+        )
+
+    def _execute(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None,
+        content: bytes | None,
+        headers: dict[str, str] | None,
+        raw: bool = False,
+    ) -> Any:
+        """Send a request, retrying transient failures per the retry policy."""
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                response = self._send(
+                    method, path, params=params, content=content, headers=headers
+                )
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, path, attempt, error=e)
+                if delay is None:
+                    if isinstance(e, httpx.TimeoutException) and expired():
+                        raise DeadlineExceededError(f"Deadline exceeded: {e}") from e
+                    raise
+            else:
+                if response.status_code < 400:
+                    return self._handle_response(response, raw=raw)
+                delay = self._retry_delay(method, path, attempt, response=response)
+                if delay is None:
+                    return self._handle_response(response, raw=raw)
+            attempt += 1
+            time.sleep(delay)
+
+    def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Make GET request, optionally bounded to ``timeout`` seconds in total.
+
+        With ``raw``, the response body is returned as bytes without decoding.
+        """
+        with deadline(timeout):
+            return self._request("GET", path, params=params, raw=raw)
+
+    def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Make POST request, optionally bounded to ``timeout`` seconds in total.
+
+        With ``raw``, the response body is returned as bytes without decoding.
+        """
+        with deadline(timeout):
+            return self._request("POST", path, json=json, raw=raw)
+
+    def put(
+        self, path: str, json: dict[str, Any] | None = None, *, timeout: float | None = None
+    ) -> Any:
+        """Make PUT request, optionally bounded to ``timeout`` seconds in total."""
+        with deadline(timeout):
+            return self._request("PUT", path, json=json)
+
+    def delete(self, path: str, *, timeout: float | None = None) -> Any:
+        """Make DELETE request, optionally bounded to ``timeout`` seconds in total."""
+        with deadline(timeout):
+            return self._request("DELETE", path)
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -101,15 +450,42 @@ class AsyncHTTPClient:
         self,
         api_key: str,
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: float | httpx.Timeout = DEFAULT_TIMEOUT,
+        *,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        codec: JSONCodec | None = None,
+        compression: RequestCompression | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        single_flight: SingleFlight | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
     ):
+        _check_transport_options(transport, limits, http2)
+        _check_http2(http2)
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self._timeout = httpx.Timeout(timeout)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.codec = codec if codec is not None else get_codec()
+        self.compression = compression
+        self.single_flight = single_flight
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self._retry_budget = (
+            RetryBudget(retry.budget_ratio, retry.budget_min_per_second) if retry else None
+        )
         self._client = httpx.AsyncClient(
             base_url=self.base_url,
             timeout=timeout,
             headers=self._headers(),
+            limits=limits if limits is not None else DEFAULT_LIMITS,
+            http2=http2,
+            transport=AsyncSharedTransport(transport) if transport is not None else None,
         )
 
     def _headers(self) -> dict[str, str]:
@@ -119,14 +495,19 @@ class AsyncHTTPClient:
             "User-Agent": f"hyperx-python/{__version__}",
         }
 
-    def _handle_response(self, response: httpx.Response) -> Any:
-        """Handle API response and raise appropriate exceptions."""
+    def _handle_response(self, response: httpx.Response, *, raw: bool = False) -> Any:
+        """Handle API response and raise appropriate exceptions.
+
+        With ``raw``, successful responses are returned as the undecoded body.
+        """
         if 200 <= response.status_code < 300:
-            return response.json() if response.content else None
+            if raw:
+                return response.content
+            return self.codec.loads(response.content) if response.content else None
 
         error_body = None
         try:
-            error_body = response.json()
+            error_body = self.codec.loads(response.content)
         except (ValueError, TypeError):
             pass
 
@@ -145,25 +526,266 @@ class AsyncHTTPClient:
         else:
             raise HyperXError(message, response.status_code, error_body)
 
-    async def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        """Make GET request."""
-        response = await self._client.get(path, params=params)
-        return self._handle_response(response)
-
-    async def post(self, path: str, json: dict[str, Any] | None = None) -> Any:
-        """Make POST request."""
-        response = await self._client.post(path, json=json)
-        return self._handle_response(response)
-
-    async def put(self, path: str, json: dict[str, Any] | None = None) -> Any:
-        """Make PUT request."""
-        response = await self._client.put(path, json=json)
-        return self._handle_response(response)
-
-    async def delete(self, path: str) -> Any:
-        """Make DELETE request."""
-        response = await self._client.delete(path)
-        return self._handle_response(response)
+    def _encode_body(
+        self, json: dict[str, Any] | None
+    ) -> tuple[bytes | None, dict[str, str] | None]:
+        """Encode a JSON body, compressing it when configured and large enough."""
+        if json is None:
+            return None, None
+        content = self.codec.dumps(json)
+        if self.compression is not None:
+            compressed = self.compression.compress(content)
+            if compressed is not None:
+                return compressed, {"Content-Encoding": self.compression.content_encoding}
+        return content, None
+
+    def _retry_delay(
+        self,
+        method: str,
+        path: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Return the delay before retrying, or None if the attempt is final."""
+        if self.retry is None or self._retry_budget is None:
+            return None
+        if not self.retry.should_retry(
+            idempotent=is_idempotent(method, path),
+            attempt=attempt,
+            status_code=response.status_code if response is not None else None,
+            error=error,
+        ):
+            return None
+        delay = self.retry.compute_delay(attempt + 1, response)
+        left = remaining()
+        if left is not None and delay >= left:
+            return None
+        if not self._retry_budget.withdraw():
+            return None
+        if self.retry.on_retry is not None:
+            self.retry.on_retry(
+                RetryEvent(
+                    method=method,
+                    path=path,
+                    attempt=attempt + 1,
+                    delay=delay,
+                    status_code=response.status_code if response is not None else None,
+                    error=error,
+                )
+            )
+        return delay
+
+    def _record(self, permit: CircuitPermit | None, start: float, *, failed: bool) -> None:
+        """Report the outcome of an attempt to the circuit breaker."""
+        if self.circuit_breaker is not None and permit is not None:
+            self.circuit_breaker.record(permit, failed=failed, duration=time.monotonic() - start)
+
+    def _abandon(self, permit: CircuitPermit | None) -> None:
+        """Release a circuit breaker permit for an attempt without an outcome."""
+        if self.circuit_breaker is not None and permit is not None:
+            self.circuit_breaker.abandon(permit)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send a single attempt through the circuit breaker and rate limiter."""
+        permit = self.circuit_breaker.before(path) if self.circuit_breaker is not None else None
+        if self.rate_limiter is not None:
+            try:
+                await self.rate_limiter.acquire_async(method, path)
+            except BaseException:
+                self._abandon(permit)
+                raise
+        try:
+            # Timed after the limiter wait, so client-side throttling is not
+            # reported to the circuit breaker as call latency
+            start = time.monotonic()
+            try:
+                response = await self._client.request(
+                    method,
+                    path,
+                    params=params,
+                    content=content,
+                    headers=headers,
+                    timeout=_attempt_timeout(self._timeout),
+                )
+            except httpx.TransportError:
+                self._record(permit, start, failed=True)
+                raise
+            except BaseException:
+                self._abandon(permit)
+                raise
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+        self._record(permit, start, failed=response.status_code >= 500)
+        return response
+
+    async def _send_hedged(
+        self,
+        hedging: HedgingPolicy,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send an attempt, racing a second copy if the first is slower than usual."""
+        family = endpoint_family(path)
+        hedging.start()
+        start = time.monotonic()
+        tasks = [
+            asyncio.ensure_future(
+                self._send(method, path, params=params, content=content, headers=headers)
+            )
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedging.delay(family))
+            if not done and hedging.try_hedge():
+                tasks.append(
+                    asyncio.ensure_future(
+                        self._send(method, path, params=params, content=content, headers=headers)
+                    )
+                )
+            pending = set(tasks)
+            errors: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer the original when both copies finish together
+                for index, task in enumerate(tasks):
+                    if task in done and task.exception() is None:
+                        hedging.observe(family, time.monotonic() - start)
+                        if index > 0:
+                            hedging.record_win()
+                        return task.result()
+                errors.extend(e for t in tasks if t in done and (e := t.exception()) is not None)
+            # Both copies failed; report the first failure
+            raise errors[0]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark a losing copy's error as retrieved
+                    task.exception()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Send a request, merging identical concurrent reads if configured."""
+        content, headers = self._encode_body(json)
+        # A caller with a deadline is not merged, since followers would
+        # inherit its deadline (and the errors it causes)
+        if self.single_flight is not None and remaining() is None:
+            key = _coalesce_key(method, path, params, content)
+            if key is not None:
+                # Scope by credentials in case the SingleFlight is shared, and
+                # by result type since raw and decoded callers cannot share
+                return await self.single_flight.do_async(
+                    (self.base_url, self.api_key, key, raw),
+                    lambda: self._execute(
+                        method, path, params=params, content=content, headers=headers, raw=raw
+                    ),
+                )
+        return await self._execute(
+            method, path, params=params, content=content, headers=headers, raw=raw
+        )
+
+    async def _execute(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None,
+        content: bytes | None,
+        headers: dict[str, str] | None,
+        raw: bool = False,
+    ) -> Any:
+        """Send a request, retrying transient failures per the retry policy."""
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+        hedging = self.hedging if _is_read(method, path) else None
+        attempt = 0
+        while True:
+            try:
+                if hedging is not None:
+                    response = await self._send_hedged(
+                        hedging, method, path, params=params, content=content, headers=headers
+                    )
+                else:
+                    response = await self._send(
+                        method, path, params=params, content=content, headers=headers
+                    )
+            except httpx.TransportError as e:
+                delay = self._retry_delay(method, path, attempt, error=e)
+                if delay is None:
+                    if isinstance(e, httpx.TimeoutException) and expired():
+                        raise DeadlineExceededError(f"Deadline exceeded: {e}") from e
+                    raise
+            else:
+                if response.status_code < 400:
+                    return self._handle_response(response, raw=raw)
+                delay = self._retry_delay(method, path, attempt, response=response)
+                if delay is None:
+                    return self._handle_response(response, raw=raw)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Make GET request, optionally bounded to ``timeout`` seconds in total.
+
+        With ``raw``, the response body is returned as bytes without decoding.
+        """
+        with deadline(timeout):
+            return await self._request("GET", path, params=params, raw=raw)
+
+    async def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """Make POST request, optionally bounded to ``timeout`` seconds in total.
+
+        With ``raw``, the response body is returned as bytes without decoding.
+        """
+        with deadline(timeout):
+            return await self._request("POST", path, json=json, raw=raw)
+
+    async def put(
+        self, path: str, json: dict[str, Any] | None = None, *, timeout: float | None = None
+    ) -> Any:
+        """Make PUT request, optionally bounded to ``timeout`` seconds in total."""
+        with deadline(timeout):
+            return await self._request("PUT", path, json=json)
+
+    async def delete(self, path: str, *, timeout: float | None = None) -> Any:
+        """Make DELETE request, optionally bounded to ``timeout`` seconds in total."""
+        with deadline(timeout):
+            return await self._request("DELETE", path)
 
     async def close(self) -> None:
         """Close the HTTP client."""
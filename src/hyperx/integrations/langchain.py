@@ -17,6 +17,8 @@ from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from pydantic import ConfigDict
 
+from hyperx.deadline import deadline, expired
+
 try:
     from langchain_core.callbacks import (
         AsyncCallbackManagerForRetrieverRun,
@@ -50,6 +52,8 @@ class HyperXRetriever(BaseRetriever):
         max_hops: For graph strategy, max hops to expand (default: 2)
         expand_types: For graph strategy, entity types to expand through
         include_paths: For graph strategy, include path descriptions
+        timeout: Time limit in seconds for one retrieval; graph expansion
+            stops early and returns what it has when the time is up
 
     Example:
         >>> retriever = HyperXRetriever(client=db, strategy="search", k=10)
@@ -62,6 +66,7 @@ class HyperXRetriever(BaseRetriever):
     max_hops: int = 2
     expand_types: list[str] | None = None
     include_paths: bool = True
+    timeout: float | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -80,12 +85,13 @@ class HyperXRetriever(BaseRetriever):
         Returns:
             List of Documents from hyperedges
         """
-        if self.strategy == "search":
-            return self._search_strategy(query)
-        elif self.strategy == "graph":
-            return self._graph_strategy(query)
-        else:
-            raise ValueError(f"Unknown strategy: {self.strategy}")
+        with deadline(self.timeout):
+            if self.strategy == "search":
+                return self._search_strategy(query)
+            elif self.strategy == "graph":
+                return self._graph_strategy(query)
+            else:
+                raise ValueError(f"Unknown strategy: {self.strategy}")
 
     async def _aget_relevant_documents(
         self,
@@ -128,6 +134,8 @@ class HyperXRetriever(BaseRetriever):
         for i, source_id in enumerate(entities_to_expand):
             # Try to find paths to other entities in results
             for target_id in entities_to_expand[i + 1 :]:
+                if expired():
+                    break
                 try:
                     paths = self.client.paths.find(
                         from_entity=source_id,
@@ -213,6 +221,7 @@ class HyperXRetrievalPipeline(BaseRetriever):
         reranker: Optional callable (query, docs) -> ranked docs
         k: Final number of documents to return
         fetch_k: Number to fetch before reranking (default: 3*k)
+        timeout: Time limit in seconds for search and graph expansion
 
     Example:
         >>> pipeline = HyperXRetrievalPipeline(
@@ -233,6 +242,7 @@ class HyperXRetrievalPipeline(BaseRetriever):
     reranker: Callable[[str, list[Document]], list[Document]] | None = None
     k: int = 10
     fetch_k: int | None = None
+    timeout: float | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -255,13 +265,14 @@ class HyperXRetrievalPipeline(BaseRetriever):
         run_manager: CallbackManagerForRetrieverRun,
     ) -> list[Document]:
         """Execute the full retrieval pipeline."""
-        # Step 1: Hybrid search (vector + text combined by API)
-        result = self.client.search(query, limit=self.fetch_k)
-        docs = self._hyperedges_to_documents(result.hyperedges)
+        with deadline(self.timeout):
+            # Step 1: Hybrid search (vector + text combined by API)
+            result = self.client.search(query, limit=self.fetch_k)
+            docs = self._hyperedges_to_documents(result.hyperedges)
 
-        # Step 2: Optional graph expansion
-        if self.expand_graph:
-            docs = self._expand_with_graph(result, docs)
+            # Step 2: Optional graph expansion
+            if self.expand_graph:
+                docs = self._expand_with_graph(result, docs)
 
         # Step 3: Optional reranking
         if self.reranker is not None:
@@ -295,6 +306,8 @@ class HyperXRetrievalPipeline(BaseRetriever):
 
         for i, source_id in enumerate(entity_ids):
             for target_id in entity_ids[i + 1 :]:
+                if expired():
+                    break
                 try:
                     paths = self.client.paths.find(
                         from_entity=source_id,
@@ -6,7 +6,12 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from hyperx.cache.adapters import as_async_cache
+
 if TYPE_CHECKING:
+    from hyperx.cache.base import AsyncCache, Cache
+    from hyperx.cache.invalidation import AsyncCacheInvalidator, CacheInvalidator
+    from hyperx.cache.refresh import AsyncBackgroundRefresher, BackgroundRefresher, CachePolicy
     from hyperx.http import AsyncHTTPClient, HTTPClient
     from hyperx.models import SearchResult
 
@@ -244,26 +249,79 @@ class QueryExecutor:
         >>> results = executor.execute()
     """
 
-    def __init__(self, http: HTTPClient, query: Query) -> None:
+    def __init__(
+        self,
+        http: HTTPClient,
+        query: Query,
+        cache: Cache | None = None,
+        *,
+        cache_policy: CachePolicy | None = None,
+        refresher: BackgroundRefresher | None = None,
+        invalidator: CacheInvalidator | None = None,
+    ) -> None:
         """Initialize the query executor.
 
         Args:
             http: HTTP client for making API requests
             query: Query object to execute
+            cache: Optional cache for query results
+            cache_policy: Optional freshness policy for cached results
+            refresher: Runs background refreshes for ``cache_policy``
+            invalidator: Tracks cached results for invalidation on writes
         """
         self._http = http
         self._query = query
-
-    def execute(self) -> SearchResult:
+        self._cache = cache
+        self._cache_policy = cache_policy
+        self._refresher = refresher
+        self._invalidator = invalidator
+
+    def execute(
+        self, *, cache: bool | None = None, timeout: float | None = None
+    ) -> SearchResult:
         """Execute the query and return results.
 
+        With a client cache, results are cached under a key covering every
+        part of the query, so equal queries built in any filter order
+        share an entry.
+
+        Args:
+            cache: Override cache behavior. None uses client default,
+                   True forces caching, False bypasses cache.
+            timeout: Optional time limit for this call in seconds
+
         Returns:
             SearchResult containing matched entities and hyperedges
         """
-        from hyperx.models import SearchResult
-
-        data = self._http.post("/v1/query", json=self._query.to_dict())
-        return SearchResult.model_validate(data)
+        from hyperx.cache.invalidation import search_dependencies
+        from hyperx.cache.keys import query_key
+        from hyperx.cache.refresh import load_cached
+        from hyperx.resources.search import search_result
+
+        use_cache = cache if cache is not None else (self._cache is not None)
+        cache_key = query_key(self._query)
+        payload = self._query.to_dict()
+
+        def load() -> tuple[SearchResult, Any]:
+            data = self._http.post("/v1/query", json=payload, timeout=timeout, raw=True)
+            result = search_result(data)
+            if use_cache and self._invalidator is not None:
+                self._invalidator.track(cache_key, search_dependencies(result))
+            return result, data
+
+        if not use_cache or self._cache is None:
+            return load()[0]
+        result = load_cached(
+            self._cache,
+            cache_key,
+            load,
+            search_result,
+            policy=self._cache_policy,
+            refresher=self._refresher,
+        )
+        if self._invalidator is not None and cache_key not in self._invalidator.index:
+            self._invalidator.track(cache_key, search_dependencies(result))
+        return result
 
 
 class AsyncQueryExecutor:
@@ -277,23 +335,76 @@ class AsyncQueryExecutor:
         >>> results = await executor.execute()
     """
 
-    def __init__(self, http: AsyncHTTPClient, query: Query) -> None:
+    def __init__(
+        self,
+        http: AsyncHTTPClient,
+        query: Query,
+        cache: Cache | AsyncCache | None = None,
+        *,
+        cache_policy: CachePolicy | None = None,
+        refresher: AsyncBackgroundRefresher | None = None,
+        invalidator: AsyncCacheInvalidator | None = None,
+    ) -> None:
         """Initialize the async query executor.
 
         Args:
             http: Async HTTP client for making API requests
             query: Query object to execute
+            cache: Optional cache for query results
+            cache_policy: Optional freshness policy for cached results
+            refresher: Runs background refreshes for ``cache_policy``
+            invalidator: Tracks cached results for invalidation on writes
         """
         self._http = http
         self._query = query
-
-    async def execute(self) -> SearchResult:
+        self._cache = as_async_cache(cache) if cache is not None else None
+        self._cache_policy = cache_policy
+        self._refresher = refresher
+        self._invalidator = invalidator
+
+    async def execute(
+        self, *, cache: bool | None = None, timeout: float | None = None
+    ) -> SearchResult:
         """Execute the query and return results.
 
+        With a client cache, results are cached under a key covering every
+        part of the query, so equal queries built in any filter order
+        share an entry.
+
+        Args:
+            cache: Override cache behavior. None uses client default,
+                   True forces caching, False bypasses cache.
+            timeout: Optional time limit for this call in seconds
+
         Returns:
             SearchResult containing matched entities and hyperedges
         """
-        from hyperx.models import SearchResult
-
-        data = await self._http.post("/v1/query", json=self._query.to_dict())
-        return SearchResult.model_validate(data)
+        from hyperx.cache.invalidation import search_dependencies
+        from hyperx.cache.keys import query_key
+        from hyperx.cache.refresh import aload_cached
+        from hyperx.resources.search import search_result
+
+        use_cache = cache if cache is not None else (self._cache is not None)
+        cache_key = query_key(self._query)
+        payload = self._query.to_dict()
+
+        async def load() -> tuple[SearchResult, Any]:
+            data = await self._http.post("/v1/query", json=payload, timeout=timeout, raw=True)
+            result = search_result(data)
+            if use_cache and self._invalidator is not None:
+                self._invalidator.track(cache_key, search_dependencies(result))
+            return result, data
+
+        if not use_cache or self._cache is None:
+            return (await load())[0]
+        result = await aload_cached(
+            self._cache,
+            cache_key,
+            load,
+            search_result,
+            policy=self._cache_policy,
+            refresher=self._refresher,
+        )
+        if self._invalidator is not None and cache_key not in self._invalidator.index:
+            self._invalidator.track(cache_key, search_dependencies(result))
+        return result
@@ -0,0 +1,189 @@
+"""Client-side rate limiting for HyperX API requests.
+
+A RateLimiter caps request throughput with a token bucket and, optionally,
+the number of requests in flight. Callers that would exceed the limits are
+delayed (blocked or awaited) instead of being sent to the server only to be
+rejected with 429.
+
+One RateLimiter can be shared by any number of HyperX and AsyncHyperX
+clients in the same process, so all workers using an API key draw from a
+single budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from fnmatch import fnmatch
+
+
+class RateLimiter:
+    """Token-bucket rate limiter with per-endpoint weights.
+
+    Each request costs ``weight`` tokens; tokens refill at ``rate`` per
+    second up to ``burst``. Expensive endpoints can be given a higher
+    weight so they consume more of the budget.
+
+    Weight patterns use glob-style wildcards. A pattern containing a space
+    is matched against ``"METHOD /path"``, otherwise against the path
+    alone. The first matching pattern wins; unmatched requests weigh 1.
+
+    The limiter is thread-safe and may be shared between sync and async
+    clients. Waiting is done outside the internal lock, with ``time.sleep``
+    for sync callers and ``asyncio.sleep`` for async callers.
+
+    Args:
+        rate: Tokens added per second (sustained requests per second)
+        burst: Bucket capacity (default: same as rate, minimum 1)
+        max_concurrent: Maximum requests in flight (default: unlimited)
+        weights: Mapping of endpoint pattern to token cost
+
+    Example:
+        >>> from hyperx import HyperX, RateLimiter
+        >>> limiter = RateLimiter(
+        ...     rate=20,
+        ...     max_concurrent=8,
+        ...     weights={"POST /v1/paths": 5, "/v1/search*": 2},
+        ... )
+        >>> db1 = HyperX(api_key="hx_sk_...", rate_limiter=limiter)
+        >>> db2 = HyperX(api_key="hx_sk_...", rate_limiter=limiter)  # Shared budget
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        *,
+        max_concurrent: int | None = None,
+        weights: dict[str, float] | None = None,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity in tokens.
+            max_concurrent: Maximum number of requests in flight.
+            weights: Mapping of endpoint pattern to token cost.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self._rate = rate
+        self._burst = burst if burst is not None else max(rate, 1.0)
+        self._max_concurrent = max_concurrent
+        self._weights = dict(weights or {})
+
+        self._lock = threading.Lock()
+        self._tokens = self._burst
+        self._updated = time.monotonic()
+
+        self._in_flight = 0
+        self._slot_available = threading.Condition(self._lock)
+        self._async_waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = (
+            deque()
+        )
+
+    def weight_for(self, method: str, path: str) -> float:
+        """Get the token cost of a request.
+
+        Args:
+            method: HTTP method
+            path: Request path
+
+        Returns:
+            Token cost of the request
+        """
+        for pattern, weight in self._weights.items():
+            target = f"{method} {path}" if " " in pattern else path
+            if fnmatch(target, pattern):
+                return weight
+        return 1.0
+
+    def _reserve(self, weight: float) -> float:
+        """Take tokens and return how long the caller must wait for them.
+
+        Tokens are reserved immediately (the balance may go negative), so
+        waiting callers are served in arrival order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= min(weight, self._burst)
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self, method: str, path: str) -> None:
+        """Block until a request may be sent.
+
+        Every successful acquire must be paired with release().
+
+        Args:
+            method: HTTP method
+            path: Request path
+        """
+        wait = self._reserve(self.weight_for(method, path))
+        if wait > 0:
+            time.sleep(wait)
+        if self._max_concurrent is None:
+            return
+        with self._slot_available:
+            while self._in_flight >= self._max_concurrent:
+                self._slot_available.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self, method: str, path: str) -> None:
+        """Wait without blocking the event loop until a request may be sent.
+
+        Every successful acquire must be paired with release().
+
+        Args:
+            method: HTTP method
+            path: Request path
+        """
+        wait = self._reserve(self.weight_for(method, path))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        if self._max_concurrent is None:
+            return
+        with self._lock:
+            if self._in_flight < self._max_concurrent:
+                self._in_flight += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter: asyncio.Future[None] = loop.create_future()
+            self._async_waiters.append((loop, waiter))
+        # release() hands the slot over before resolving the future
+        await waiter
+
+    def release(self) -> None:
+        """Release a concurrency slot taken by acquire()."""
+        if self._max_concurrent is None:
+            return
+        with self._lock:
+            while self._async_waiters:
+                loop, waiter = self._async_waiters.popleft()
+                if waiter.done() or loop.is_closed():
+                    continue
+                # Slot passes directly to the waiter; in_flight is unchanged
+                loop.call_soon_threadsafe(self._wake, waiter)
+                return
+            self._in_flight -= 1
+            self._slot_available.notify()
+
+    def _wake(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.done():
+            # Waiter was cancelled after the slot was handed over
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a concurrency slot."""
+        with self._lock:
+            return self._in_flight
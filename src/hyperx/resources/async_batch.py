@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from hyperx.batch import (
     BatchItemResult,
@@ -12,7 +12,13 @@ from hyperx.batch import (
     HyperedgeCreate,
     HyperedgeDelete,
 )
+from hyperx.embeddings import EmbeddingFormat
 from hyperx.http import AsyncHTTPClient
+from hyperx.resources.batch import batch_dependencies
+
+if TYPE_CHECKING:
+    from hyperx.cache.invalidation import AsyncCacheInvalidator
+    from hyperx.cache.objects import AsyncObjectCache
 
 # Type alias for batch operations
 BatchOperation = EntityCreate | HyperedgeCreate | EntityDelete | HyperedgeDelete
@@ -42,19 +48,35 @@ class AsyncBatchAPI:
         ...     print(f"Created {result.succeeded} items")
     """
 
-    def __init__(self, http: AsyncHTTPClient):
+    def __init__(
+        self,
+        http: AsyncHTTPClient,
+        *,
+        embedding_format: EmbeddingFormat = "json",
+        invalidator: AsyncCacheInvalidator | None = None,
+        objects: AsyncObjectCache | None = None,
+    ):
         """Initialize AsyncBatchAPI.
 
         Args:
             http: Async HTTP client for making API requests.
+            embedding_format: Wire format for entity embeddings ("json",
+                "float32", "float16" or "int8").
+            invalidator: Drops cached results containing deleted entities
+                and hyperedges, or members of created hyperedges.
+            objects: Drops cached copies of deleted entities and hyperedges.
         """
         self._http = http
+        self._embedding_format = embedding_format
+        self._invalidator = invalidator
+        self._objects = objects
 
     async def execute(
         self,
         operations: list[BatchOperation],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> BatchResult:
         """Execute batch operations asynchronously.
 
@@ -64,6 +86,7 @@ class AsyncBatchAPI:
             atomic: If True (default), all operations succeed or all fail.
                 If False, operations are executed in best-effort mode where
                 individual failures don't affect other operations.
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             BatchResult containing details about the batch execution including
@@ -86,7 +109,12 @@ class AsyncBatchAPI:
             ...         print(f"Operation {item.index} failed: {item.error}")
         """
         # Serialize operations to dictionaries
-        serialized_operations = [op.to_dict() for op in operations]
+        serialized_operations = [
+            op.to_dict(embedding_format=self._embedding_format)
+            if isinstance(op, EntityCreate)
+            else op.to_dict()
+            for op in operations
+        ]
 
         # Build request payload
         payload: dict[str, Any] = {
@@ -95,7 +123,17 @@ class AsyncBatchAPI:
         }
 
         # Make API request
-        data = await self._http.post("/v1/batch", json=payload)
+        data = await self._http.post("/v1/batch", json=payload, timeout=timeout)
+        if self._invalidator is not None:
+            await self._invalidator.invalidate(batch_dependencies(operations))
+        if self._objects is not None:
+            await self._objects.delete(
+                "entity", [op.entity_id for op in operations if isinstance(op, EntityDelete)]
+            )
+            await self._objects.delete(
+                "hyperedge",
+                [op.hyperedge_id for op in operations if isinstance(op, HyperedgeDelete)],
+            )
 
         # Parse response into BatchResult
         return self._parse_result(data)
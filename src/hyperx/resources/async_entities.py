@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+from hyperx.embeddings import EmbeddingFormat, EmbeddingInput, encode_embedding, has_embedding
 from hyperx.http import AsyncHTTPClient
 from hyperx.models import Entity
 
+if TYPE_CHECKING:
+    from hyperx.cache.invalidation import AsyncCacheInvalidator
+    from hyperx.cache.objects import AsyncObjectCache
+
 
 class AsyncEntitiesAPI:
     """Async API for managing entities in HyperX.
@@ -18,15 +25,54 @@ class AsyncEntitiesAPI:
         ...     await db.entities.delete(entity.id)
     """
 
-    def __init__(self, http: AsyncHTTPClient):
+    def __init__(
+        self,
+        http: AsyncHTTPClient,
+        *,
+        embedding_format: EmbeddingFormat = "json",
+        invalidator: AsyncCacheInvalidator | None = None,
+        objects: AsyncObjectCache | None = None,
+    ):
         self._http = http
+        self._embedding_format = embedding_format
+        self._invalidator = invalidator
+        self._objects = objects
+
+    async def _after_write(
+        self,
+        changed: Iterable[str] = (),
+        *,
+        stored: Sequence[Entity] = (),
+        removed: Sequence[str] = (),
+    ) -> None:
+        """Update the client caches after a successful write.
+
+        Args:
+            changed: IDs whose cached search and path results are now stale
+            stored: Entities returned by the server, cached by ID
+            removed: IDs of deleted or superseded entities
+        """
+        if self._invalidator is not None:
+            await self._invalidator.invalidate(changed)
+        if self._objects is not None:
+            await self._objects.delete("entity", removed)
+            await self._objects.store("entity", stored)
+
+    def _encode_entity(self, entity: dict[str, Any]) -> dict[str, Any]:
+        """Encode the embedding of a ``create_many`` entity dict, if any."""
+        embedding = entity.get("embedding")
+        if embedding is None or (isinstance(embedding, list) and self._embedding_format == "json"):
+            return entity
+        return {**entity, "embedding": encode_embedding(embedding, self._embedding_format)}
 
     async def create(
         self,
         name: str,
         entity_type: str,
         attributes: dict[str, Any] | None = None,
-        embedding: list[float] | None = None,
+        embedding: EmbeddingInput | None = None,
+        *,
+        timeout: float | None = None,
     ) -> Entity:
         """Create a new entity.
 
@@ -34,7 +80,9 @@ class AsyncEntitiesAPI:
             name: Human-readable name for the entity
             entity_type: Type classification (e.g., "concept", "person", "document")
             attributes: Optional key-value attributes
-            embedding: Optional vector embedding
+            embedding: Optional vector embedding (list of floats, NumPy array,
+                       ``array('f')`` or memoryview)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The created entity
@@ -42,32 +90,47 @@ class AsyncEntitiesAPI:
         payload: dict[str, Any] = {"name": name, "entity_type": entity_type}
         if attributes:
             payload["attributes"] = attributes
-        if embedding:
-            payload["embedding"] = embedding
+        if has_embedding(embedding):
+            payload["embedding"] = encode_embedding(embedding, self._embedding_format)
 
-        data = await self._http.post("/v1/entities", json=payload)
-        return Entity.model_validate(data)
+        data = await self._http.post("/v1/entities", json=payload, timeout=timeout)
+        entity = Entity.model_validate(data)
+        await self._after_write(stored=[entity])
+        return entity
 
-    async def get(self, entity_id: str) -> Entity:
+    async def get(
+        self, entity_id: str, *, cache: bool | None = None, timeout: float | None = None
+    ) -> Entity:
         """Get an entity by ID.
 
         Args:
             entity_id: The entity ID (e.g., "e:uuid...")
+            cache: Override object caching. None uses the client default
+                   (cached if the client has an object cache), False
+                   bypasses the cache.
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The entity
 
         Raises:
-            NotFoundError: If entity doesn't exist
+            NotFoundError: If entity doesn't exist, or did within the
+                           object cache's ``negative_ttl``
         """
-        data = await self._http.get(f"/v1/entities/{entity_id}")
-        return Entity.model_validate(data)
-
-    async def delete(self, entity_id: str) -> bool:
+        path = f"/v1/entities/{entity_id}"
+        if self._objects is None or cache is False:
+            data = await self._http.get(path, timeout=timeout)
+            return Entity.model_validate(data)
+        fetch = partial(self._http.get, path, timeout=timeout, raw=True)
+        data = await self._objects.read("entity", entity_id, fetch)
+        return Entity.model_validate_json(data)
+
+    async def delete(self, entity_id: str, *, timeout: float | None = None) -> bool:
         """Delete an entity.
 
         Args:
             entity_id: The entity ID to delete
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             True if deleted
@@ -75,21 +138,25 @@ class AsyncEntitiesAPI:
         Raises:
             NotFoundError: If entity doesn't exist
         """
-        await self._http.delete(f"/v1/entities/{entity_id}")
+        await self._http.delete(f"/v1/entities/{entity_id}", timeout=timeout)
+        await self._after_write([entity_id], removed=[entity_id])
         return True
 
-    async def list(self, limit: int = 100, offset: int = 0) -> list[Entity]:
+    async def list(
+        self, limit: int = 100, offset: int = 0, *, timeout: float | None = None
+    ) -> list[Entity]:
         """List entities with pagination.
 
         Args:
             limit: Maximum number of entities to return (default: 100)
             offset: Number of entities to skip (default: 0)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of entities
         """
         params: dict[str, Any] = {"limit": limit, "offset": offset}
-        data = await self._http.get("/v1/entities", params=params)
+        data = await self._http.get("/v1/entities", params=params, timeout=timeout)
         return [Entity.model_validate(e) for e in data]
 
     async def update(
@@ -98,6 +165,8 @@ class AsyncEntitiesAPI:
         name: str | None = None,
         entity_type: str | None = None,
         attributes: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> Entity:
         """Update an entity.
 
@@ -106,6 +175,7 @@ class AsyncEntitiesAPI:
             name: New name (optional)
             entity_type: New type (optional)
             attributes: New attributes (optional)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The updated entity
@@ -118,14 +188,17 @@ class AsyncEntitiesAPI:
         if attributes is not None:
             payload["attributes"] = attributes
 
-        data = await self._http.put(f"/v1/entities/{entity_id}", json=payload)
-        return Entity.model_validate(data)
+        data = await self._http.put(f"/v1/entities/{entity_id}", json=payload, timeout=timeout)
+        entity = Entity.model_validate(data)
+        await self._after_write([entity_id], stored=[entity])
+        return entity
 
     async def create_many(
         self,
-        entities: list[dict[str, Any]],
+        entities: Sequence[dict[str, Any]],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> list[Entity]:
         """Create multiple entities in a single request.
 
@@ -134,10 +207,11 @@ class AsyncEntitiesAPI:
                 - name (required): Entity name
                 - entity_type (required): Entity type
                 - attributes (optional): Key-value attributes
-                - embedding (optional): Vector embedding
+                - embedding (optional): Vector embedding (any supported type)
                 - valid_from (optional): datetime
                 - valid_until (optional): datetime
             atomic: If True (default), all succeed or all fail
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of created Entity objects
@@ -145,25 +219,30 @@ class AsyncEntitiesAPI:
         Raises:
             HyperXError: If atomic=True and any entity fails validation
         """
-        payload = {"entities": entities, "atomic": atomic}
-        data = await self._http.post("/v1/entities/batch", json=payload)
-        return [Entity.model_validate(e) for e in data["entities"]]
+        payload = {"entities": [self._encode_entity(e) for e in entities], "atomic": atomic}
+        data = await self._http.post("/v1/entities/batch", json=payload, timeout=timeout)
+        created = [Entity.model_validate(e) for e in data["entities"]]
+        await self._after_write(stored=created)
+        return created
 
     async def delete_many(
         self,
         entity_ids: list[str],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> int:
         """Delete multiple entities.
 
         Args:
             entity_ids: List of entity IDs to delete
             atomic: If True (default), all succeed or all fail
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             Number of entities deleted
         """
         payload = {"ids": entity_ids, "atomic": atomic}
-        data = await self._http.post("/v1/entities/batch/delete", json=payload)
+        data = await self._http.post("/v1/entities/batch/delete", json=payload, timeout=timeout)
+        await self._after_write(entity_ids, removed=entity_ids)
         return data["deleted"]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import Any, AsyncGenerator
 
@@ -82,7 +81,7 @@ class AsyncEventsAPI:
             response.raise_for_status()
             async for line in response.aiter_lines():
                 if line.startswith("data: "):
-                    data = json.loads(line[6:])
+                    data = self._http.codec.loads(line[6:])
                     yield Event(
                         type=data["type"],
                         data=data["data"],
@@ -97,6 +96,7 @@ class AsyncEventsAPI:
         since: datetime | None = None,
         until: datetime | None = None,
         limit: int = 100,
+        timeout: float | None = None,
     ) -> list[Event]:
         """Get historical events (non-streaming).
 
@@ -108,6 +108,7 @@ class AsyncEventsAPI:
             since: Start time - only events after this timestamp
             until: End time - only events before this timestamp
             limit: Maximum number of events to return (default: 100)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of past events, ordered by timestamp (oldest first)
@@ -129,7 +130,7 @@ class AsyncEventsAPI:
         if until:
             params["until"] = until.isoformat()
 
-        data = await self._http.get("/v1/events", params=params)
+        data = await self._http.get("/v1/events", params=params, timeout=timeout)
         return [
             Event(
                 type=e["type"],
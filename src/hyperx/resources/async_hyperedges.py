@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+from hyperx.cache.invalidation import member_ids
 from hyperx.http import AsyncHTTPClient
 from hyperx.models import Hyperedge
 from hyperx.resources.hyperedges import MemberInput
 
+if TYPE_CHECKING:
+    from hyperx.cache.invalidation import AsyncCacheInvalidator
+    from hyperx.cache.objects import AsyncObjectCache
+
 
 class AsyncHyperedgesAPI:
     """Async API for managing hyperedges in HyperX.
@@ -26,14 +33,44 @@ class AsyncHyperedgesAPI:
         ...     )
     """
 
-    def __init__(self, http: AsyncHTTPClient):
+    def __init__(
+        self,
+        http: AsyncHTTPClient,
+        *,
+        invalidator: AsyncCacheInvalidator | None = None,
+        objects: AsyncObjectCache | None = None,
+    ):
         self._http = http
+        self._invalidator = invalidator
+        self._objects = objects
+
+    async def _after_write(
+        self,
+        changed: Iterable[str] = (),
+        *,
+        stored: Sequence[Hyperedge] = (),
+        removed: Sequence[str] = (),
+    ) -> None:
+        """Update the client caches after a successful write.
+
+        Args:
+            changed: IDs whose cached search and path results are now stale
+            stored: Hyperedges returned by the server, cached by ID
+            removed: IDs of deleted or superseded hyperedges
+        """
+        if self._invalidator is not None:
+            await self._invalidator.invalidate(changed)
+        if self._objects is not None:
+            await self._objects.delete("hyperedge", removed)
+            await self._objects.store("hyperedge", stored)
 
     async def create(
         self,
         description: str,
         members: list[dict[str, str] | MemberInput],
         attributes: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> Hyperedge:
         """Create a new hyperedge.
 
@@ -41,6 +78,7 @@ class AsyncHyperedgesAPI:
             description: Human-readable description of the relationship
             members: List of entity members with roles (min 2)
             attributes: Optional key-value attributes
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The created hyperedge
@@ -50,29 +88,44 @@ class AsyncHyperedgesAPI:
         if attributes:
             payload["attributes"] = attributes
 
-        data = await self._http.post("/v1/hyperedges", json=payload)
-        return Hyperedge.model_validate(data)
+        data = await self._http.post("/v1/hyperedges", json=payload, timeout=timeout)
+        hyperedge = Hyperedge.model_validate(data)
+        await self._after_write(member_ids(members), stored=[hyperedge])
+        return hyperedge
 
-    async def get(self, hyperedge_id: str) -> Hyperedge:
+    async def get(
+        self, hyperedge_id: str, *, cache: bool | None = None, timeout: float | None = None
+    ) -> Hyperedge:
         """Get a hyperedge by ID.
 
         Args:
             hyperedge_id: The hyperedge ID (e.g., "h:uuid...")
+            cache: Override object caching. None uses the client default
+                   (cached if the client has an object cache), False
+                   bypasses the cache.
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The hyperedge
 
         Raises:
-            NotFoundError: If hyperedge doesn't exist
+            NotFoundError: If hyperedge doesn't exist, or did within the
+                           object cache's ``negative_ttl``
         """
-        data = await self._http.get(f"/v1/hyperedges/{hyperedge_id}")
-        return Hyperedge.model_validate(data)
-
-    async def delete(self, hyperedge_id: str) -> bool:
+        path = f"/v1/hyperedges/{hyperedge_id}"
+        if self._objects is None or cache is False:
+            data = await self._http.get(path, timeout=timeout)
+            return Hyperedge.model_validate(data)
+        fetch = partial(self._http.get, path, timeout=timeout, raw=True)
+        data = await self._objects.read("hyperedge", hyperedge_id, fetch)
+        return Hyperedge.model_validate_json(data)
+
+    async def delete(self, hyperedge_id: str, *, timeout: float | None = None) -> bool:
         """Delete a hyperedge.
 
         Args:
             hyperedge_id: The hyperedge ID to delete
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             True if deleted
@@ -80,21 +133,25 @@ class AsyncHyperedgesAPI:
         Raises:
             NotFoundError: If hyperedge doesn't exist
         """
-        await self._http.delete(f"/v1/hyperedges/{hyperedge_id}")
+        await self._http.delete(f"/v1/hyperedges/{hyperedge_id}", timeout=timeout)
+        await self._after_write([hyperedge_id], removed=[hyperedge_id])
         return True
 
-    async def list(self, limit: int = 100, offset: int = 0) -> list[Hyperedge]:
+    async def list(
+        self, limit: int = 100, offset: int = 0, *, timeout: float | None = None
+    ) -> list[Hyperedge]:
         """List hyperedges with pagination.
 
         Args:
             limit: Maximum number to return (default: 100)
             offset: Number to skip (default: 0)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of hyperedges
         """
         params: dict[str, Any] = {"limit": limit, "offset": offset}
-        data = await self._http.get("/v1/hyperedges", params=params)
+        data = await self._http.get("/v1/hyperedges", params=params, timeout=timeout)
         return [Hyperedge.model_validate(h) for h in data]
 
     async def update(
@@ -103,6 +160,8 @@ class AsyncHyperedgesAPI:
         description: str | None = None,
         members: list[dict[str, str] | MemberInput] | None = None,
         attributes: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> Hyperedge:
         """Update a hyperedge.
 
@@ -111,6 +170,7 @@ class AsyncHyperedgesAPI:
             description: New description (optional)
             members: New members list (optional)
             attributes: New attributes (optional)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The updated hyperedge
@@ -125,14 +185,17 @@ class AsyncHyperedgesAPI:
         if attributes is not None:
             payload["attributes"] = attributes
 
-        data = await self._http.put(f"/v1/hyperedges/{hyperedge_id}", json=payload)
-        return Hyperedge.model_validate(data)
+        data = await self._http.put(f"/v1/hyperedges/{hyperedge_id}", json=payload, timeout=timeout)
+        hyperedge = Hyperedge.model_validate(data)
+        await self._after_write([hyperedge_id, *member_ids(members)], stored=[hyperedge])
+        return hyperedge
 
     async def create_many(
         self,
         hyperedges: list[dict[str, Any]],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> list[Hyperedge]:
         """Create multiple hyperedges in a single request.
 
@@ -144,6 +207,7 @@ class AsyncHyperedgesAPI:
                 - valid_from (optional): datetime
                 - valid_until (optional): datetime
             atomic: If True (default), all succeed or all fail
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of created Hyperedge objects
@@ -152,24 +216,30 @@ class AsyncHyperedgesAPI:
             HyperXError: If atomic=True and any hyperedge fails validation
         """
         payload = {"hyperedges": hyperedges, "atomic": atomic}
-        data = await self._http.post("/v1/hyperedges/batch", json=payload)
-        return [Hyperedge.model_validate(h) for h in data["hyperedges"]]
+        data = await self._http.post("/v1/hyperedges/batch", json=payload, timeout=timeout)
+        created = [Hyperedge.model_validate(h) for h in data["hyperedges"]]
+        members = member_ids(m for h in payload["hyperedges"] for m in h["members"])
+        await self._after_write(members, stored=created)
+        return created
 
     async def delete_many(
         self,
         hyperedge_ids: list[str],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> int:
         """Delete multiple hyperedges.
 
         Args:
             hyperedge_ids: List of hyperedge IDs to delete
             atomic: If True (default), all succeed or all fail
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             Number of hyperedges deleted
         """
         payload = {"ids": hyperedge_ids, "atomic": atomic}
-        data = await self._http.post("/v1/hyperedges/batch/delete", json=payload)
+        data = await self._http.post("/v1/hyperedges/batch/delete", json=payload, timeout=timeout)
+        await self._after_write(hyperedge_ids, removed=hyperedge_ids)
         return data["deleted"]
@@ -6,13 +6,20 @@ This is HyperX's key differentiator from vector databases.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
+from hyperx.cache.adapters import as_async_cache
+from hyperx.cache.invalidation import path_dependencies
+from hyperx.cache.keys import request_key
+from hyperx.cache.refresh import aload_cached
 from hyperx.http import AsyncHTTPClient
-from hyperx.models import PathResult, PathsResponse
+from hyperx.models import PathResult
+from hyperx.resources.paths import paths_result
 
 if TYPE_CHECKING:
-    from hyperx.cache.base import Cache
+    from hyperx.cache.base import AsyncCache, Cache
+    from hyperx.cache.invalidation import AsyncCacheInvalidator
+    from hyperx.cache.refresh import AsyncBackgroundRefresher, CachePolicy
 
 
 class AsyncPathsAPI:
@@ -33,20 +40,27 @@ class AsyncPathsAPI:
         ...         print(f"Cost: {path.cost}, Hops: {len(path.hyperedges)}")
     """
 
-    def __init__(self, http: AsyncHTTPClient, cache: Cache | None = None):
-        self._http = http
-        self._cache = cache
-
-    def _cache_key(
+    def __init__(
         self,
-        from_entity: str,
-        to_entity: str,
-        max_hops: int,
-        intersection_size: int,
-        k_paths: int,
-    ) -> str:
-        """Generate a cache key for paths.find() parameters."""
-        return f"paths:{from_entity}:{to_entity}:{max_hops}:{intersection_size}:{k_paths}"
+        http: AsyncHTTPClient,
+        cache: Cache | AsyncCache | None = None,
+        *,
+        cache_policy: CachePolicy | None = None,
+        refresher: AsyncBackgroundRefresher | None = None,
+        invalidator: AsyncCacheInvalidator | None = None,
+    ):
+        self._http = http
+        self._cache = as_async_cache(cache) if cache is not None else None
+        self._cache_policy = cache_policy
+        self._refresher = refresher
+        self._invalidator = invalidator
+
+    def _cache_key(self, payload: dict[str, Any]) -> str:
+        """Generate a cache key covering every parameter of a paths request."""
+        # The server cache hint does not change the paths found. The
+        # endpoints keep their order: paths are listed from ``from``.
+        params = {k: v for k, v in payload.items() if k != "cache_hint"}
+        return request_key("paths", params)
 
     async def find(
         self,
@@ -58,6 +72,7 @@ class AsyncPathsAPI:
         *,
         cache: bool | None = None,
         cache_hint: Literal["short", "medium", "long"] | None = None,
+        timeout: float | None = None,
     ) -> list[PathResult]:
         """Find multi-hop paths between two entities.
 
@@ -75,6 +90,7 @@ class AsyncPathsAPI:
                    True forces caching, False bypasses cache.
             cache_hint: Server-side cache hint ("short", "medium", "long")
                         to indicate how long the server should cache results.
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of PathResult objects, each containing:
@@ -97,19 +113,8 @@ class AsyncPathsAPI:
         # Determine if caching is enabled
         use_cache = cache if cache is not None else (self._cache is not None)
 
-        # Generate cache key
-        cache_key = self._cache_key(
-            from_entity, to_entity, max_hops, intersection_size, k_paths
-        )
-
-        # Check cache if enabled (sync operation - InMemoryCache is synchronous)
-        if use_cache and self._cache:
-            cached = self._cache.get(cache_key)
-            if cached is not None:
-                return [PathResult.model_validate(p) for p in cached]
-
         # Build payload
-        payload = {
+        payload: dict[str, Any] = {
             "from": from_entity,
             "to": to_entity,
             "constraints": {
@@ -123,12 +128,29 @@ class AsyncPathsAPI:
         if cache_hint is not None:
             payload["cache_hint"] = cache_hint
 
-        # Make API call
-        data = await self._http.post("/v1/paths", json=payload)
-        response = PathsResponse.model_validate(data)
-
-        # Store in cache if enabled (sync operation)
-        if use_cache and self._cache:
-            self._cache.set(cache_key, [p.model_dump() for p in response.paths])
-
-        return response.paths
+        cache_key = self._cache_key(payload)
+
+        async def load() -> tuple[list[PathResult], Any]:
+            data = await self._http.post(
+                "/v1/paths", json=payload, timeout=timeout, raw=True
+            )
+            paths = paths_result(data)
+            if use_cache and self._invalidator is not None:
+                self._invalidator.track(
+                    cache_key, path_dependencies(from_entity, to_entity, paths)
+                )
+            return paths, data
+
+        if not use_cache or self._cache is None:
+            return (await load())[0]
+        paths = await aload_cached(
+            self._cache,
+            cache_key,
+            load,
+            paths_result,
+            policy=self._cache_policy,
+            refresher=self._refresher,
+        )
+        if self._invalidator is not None and cache_key not in self._invalidator.index:
+            self._invalidator.track(cache_key, path_dependencies(from_entity, to_entity, paths))
+        return paths
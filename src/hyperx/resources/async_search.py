@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
-import hashlib
-from typing import TYPE_CHECKING
-
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from hyperx.cache.adapters import as_async_cache
+from hyperx.cache.invalidation import search_dependencies
+from hyperx.cache.keys import embedding_digest, normalize_text, request_key
+from hyperx.cache.refresh import aload_cached, aload_cached_many
+from hyperx.embeddings import EmbeddingFormat, EmbeddingInput, encode_embedding
 from hyperx.http import AsyncHTTPClient
-from hyperx.models import Entity, Hyperedge, SearchResult
+from hyperx.models import SearchResult
+from hyperx.resources.search import search_result
 
 if TYPE_CHECKING:
-    from hyperx.cache.base import Cache
+    from hyperx.cache.base import AsyncCache, Cache
+    from hyperx.cache.invalidation import AsyncCacheInvalidator
+    from hyperx.cache.objects import AsyncObjectCache
+    from hyperx.cache.refresh import AsyncBackgroundRefresher, CachePolicy
+    from hyperx.cache.semantic import SemanticCache
 
 
 class AsyncSearchAPI:
@@ -24,21 +36,114 @@ class AsyncSearchAPI:
         ...         print(entity.name)
     """
 
-    def __init__(self, http: AsyncHTTPClient, cache: Cache | None = None):
+    def __init__(
+        self,
+        http: AsyncHTTPClient,
+        cache: Cache | AsyncCache | None = None,
+        *,
+        embedding_format: EmbeddingFormat = "json",
+        cache_policy: CachePolicy | None = None,
+        refresher: AsyncBackgroundRefresher | None = None,
+        invalidator: AsyncCacheInvalidator | None = None,
+        objects: AsyncObjectCache | None = None,
+        semantic: SemanticCache | None = None,
+    ):
         self._http = http
-        self._cache = cache
+        self._cache = as_async_cache(cache) if cache is not None else None
+        self._embedding_format = embedding_format
+        self._cache_policy = cache_policy
+        self._refresher = refresher
+        self._invalidator = invalidator
+        self._objects = objects
+        self._semantic = semantic
+
+    def _cache_key(self, prefix: str, payload: dict[str, Any]) -> str:
+        """Generate a cache key covering every parameter of a search request."""
+        # Whitespace never changes a search; case only matters to the
+        # embedding of hybrid queries, so BM25 text queries are also folded
+        query = normalize_text(payload["query"], fold_case=prefix == "search_text")
+        return request_key(prefix, {**payload, "query": query})
+
+    def _cache_key_vector(self, embedding: EmbeddingInput, payload: dict[str, Any]) -> str:
+        """Generate a cache key for a vector search request."""
+        # The payload holds the encoded embedding; key on its float32 digest
+        # so equal embeddings share an entry whatever their input type
+        return request_key("search_vector", {**payload, "embedding": embedding_digest(embedding)})
+
+    async def _search(
+        self,
+        path: str,
+        payload: dict[str, Any],
+        cache_key: str,
+        *,
+        cache: bool | None,
+        timeout: float | None,
+    ) -> SearchResult:
+        """POST a search, going through the cache if enabled."""
+        # None uses the client default: cache whenever a cache is configured
+        use_cache = cache if cache is not None else (self._cache is not None)
+        load = partial(self._load, path, payload, timeout, cache_key if use_cache else None)
+        if not use_cache or self._cache is None:
+            return (await load())[0]
+        result = await aload_cached(
+            self._cache,
+            cache_key,
+            load,
+            search_result,
+            policy=self._cache_policy,
+            refresher=self._refresher,
+        )
+        self._ensure_tracked(cache_key, result)
+        return result
+
+    async def _search_similar(
+        self,
+        embedding: EmbeddingInput,
+        prefix: str,
+        params: dict[str, Any],
+        search: Callable[[], Awaitable[SearchResult]],
+        cache: bool | None,
+    ) -> SearchResult:
+        """Run a search through the semantic cache, if one is configured.
 
-    def _cache_key(self, prefix: str, query: str, limit: int) -> str:
-        """Generate a cache key for search parameters."""
-        query_hash = hashlib.md5(query.encode()).hexdigest()[:8]
-        return f"{prefix}:{query_hash}:{limit}"
+        ``params`` are the search's parameters other than the query; only
+        results of searches with equal ones are reused.
+        """
+        if self._semantic is None or cache is False:
+            return await search()
+        scope = request_key(prefix, params)
+        result: SearchResult | None = self._semantic.get(embedding, scope)
+        if result is None:
+            result = await search()
+            await self._semantic.set_async(embedding, scope, result, search_dependencies(result))
+        return result
+
+    def _ensure_tracked(self, cache_key: str, result: SearchResult) -> None:
+        """Track a cached result read before this process saw it loaded."""
+        if self._invalidator is not None and cache_key not in self._invalidator.index:
+            self._invalidator.track(cache_key, search_dependencies(result))
 
-    def _cache_key_vector(self, embedding: list[float], limit: int) -> str:
-        """Generate a cache key for vector search parameters."""
-        # Hash the embedding for a compact key
-        embedding_str = ",".join(f"{v:.6f}" for v in embedding)
-        embedding_hash = hashlib.md5(embedding_str.encode()).hexdigest()[:8]
-        return f"search_vector:{embedding_hash}:{limit}"
+    async def _load(
+        self,
+        path: str,
+        payload: dict[str, Any],
+        timeout: float | None,
+        cache_key: str | None = None,
+    ) -> tuple[SearchResult, Any]:
+        """POST a search and return the result with its raw body for caching.
+
+        With ``cache_key``, the result's IDs are tracked for invalidation, and
+        with an object cache, its entities and hyperedges are cached by ID.
+        """
+        data = await self._http.post(path, json=payload, timeout=timeout, raw=True)
+        result = search_result(data)
+        if cache_key is not None and self._invalidator is not None:
+            self._invalidator.track(cache_key, search_dependencies(result))
+        if self._objects is not None:
+            # Results carry full objects; later get() calls can use them
+            await self._objects.store("entity", result.entities)
+            await self._objects.store("hyperedge", result.hyperedges)
+        return result, data
 
     async def __call__(
         self,
@@ -47,6 +152,8 @@ class AsyncSearchAPI:
         *,
         cache: bool | None = None,
         role_filter: dict[str, str] | None = None,
+        embedding: EmbeddingInput | None = None,
+        timeout: float | None = None,
     ) -> SearchResult:
         """Hybrid search across entities and hyperedges.
 
@@ -59,56 +166,96 @@ class AsyncSearchAPI:
                 - {"subject": "e:react"} - only hyperedges where React is subject
                 - {"subject_type": "library"} - subject is any library type entity
                 - Multiple keys are AND conditions
+            embedding: Embedding of ``query``. Only used to look up the
+                       semantic cache, so that similar questions share
+                       results; the server still embeds ``query`` itself.
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             SearchResult with matching entities and hyperedges
         """
-        # Determine if caching is enabled
-        use_cache = cache if cache is not None else (self._cache is not None)
-        cache_key = self._cache_key("search_hybrid", query, limit)
-
-        # Check cache if enabled (sync operation - InMemoryCache is synchronous)
-        if use_cache and self._cache:
-            cached = self._cache.get(cache_key)
-            if cached is not None:
-                return SearchResult(
-                    entities=[Entity.model_validate(e) for e in cached.get("entities", [])],
-                    hyperedges=[Hyperedge.model_validate(h) for h in cached.get("hyperedges", [])],
-                )
-
         # Build request payload
-        payload: dict = {"query": query, "limit": limit}
+        payload: dict[str, Any] = {"query": query, "limit": limit}
         if role_filter:
             payload["role_filter"] = role_filter
 
-        # Make API call
-        data = await self._http.post("/v1/search", json=payload)
-        result = SearchResult(
-            entities=[Entity.model_validate(e) for e in data.get("entities", [])],
-            hyperedges=[Hyperedge.model_validate(h) for h in data.get("hyperedges", [])],
+        cache_key = self._cache_key("search_hybrid", payload)
+        search = partial(
+            self._search, "/v1/search", payload, cache_key, cache=cache, timeout=timeout
         )
+        if embedding is None:
+            return await search()
+        params = {k: v for k, v in payload.items() if k != "query"}
+        return await self._search_similar(embedding, "search_hybrid", params, search, cache)
 
-        # Store in cache if enabled (sync operation)
-        if use_cache and self._cache:
-            self._cache.set(cache_key, {
-                "entities": [e.model_dump() for e in result.entities],
-                "hyperedges": [h.model_dump() for h in result.hyperedges],
-            })
+    async def many(
+        self,
+        queries: Sequence[str],
+        limit: int = 10,
+        *,
+        cache: bool | None = None,
+        role_filter: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> list[SearchResult]:
+        """Run several hybrid searches, reading and writing the cache in bulk.
 
-        return result
+        All cached results are fetched with one cache call (a single MGET
+        with ``AsyncRedisCache``), and only the misses are sent to the
+        server, concurrently.
+
+        Args:
+            queries: Search query strings
+            limit: Maximum results to return per query
+            cache: Override cache behavior. None uses client default,
+                   True forces caching, False bypasses cache.
+            role_filter: Filter hyperedges by role conditions, as in ``search()``
+            timeout: Optional time limit for each server request in seconds
+
+        Returns:
+            One SearchResult per query, in the same order
+        """
+        use_cache = cache if cache is not None else (self._cache is not None)
+        loads = {}
+        keys = []
+        for query in queries:
+            payload: dict[str, Any] = {"query": query, "limit": limit}
+            if role_filter:
+                payload["role_filter"] = role_filter
+            key = self._cache_key("search_hybrid", payload)
+            loads[key] = partial(
+                self._load, "/v1/search", payload, timeout, key if use_cache else None
+            )
+            keys.append(key)
+
+        if not use_cache or self._cache is None:
+            loaded = await asyncio.gather(*(load() for load in loads.values()))
+            by_key = {key: result for key, (result, _) in zip(loads, loaded, strict=True)}
+            return [by_key[key] for key in keys]
+        results = await aload_cached_many(
+            self._cache,
+            loads,
+            search_result,
+            policy=self._cache_policy,
+            refresher=self._refresher,
+        )
+        for key, result in results.items():
+            self._ensure_tracked(key, result)
+        return [results[key] for key in keys]
 
     async def vector(
         self,
-        embedding: list[float],
+        embedding: EmbeddingInput,
         limit: int = 10,
         *,
         cache: bool | None = None,
         role_filter: dict[str, str] | None = None,
+        timeout: float | None = None,
     ) -> SearchResult:
         """Vector-only search using embedding similarity.
 
         Args:
-            embedding: Query embedding vector
+            embedding: Query embedding vector (list of floats, NumPy array,
+                       ``array('f')`` or memoryview)
             limit: Maximum results to return
             cache: Override cache behavior. None uses client default,
                    True forces caching, False bypasses cache.
@@ -116,43 +263,25 @@ class AsyncSearchAPI:
                 - {"subject": "e:react"} - only hyperedges where React is subject
                 - {"subject_type": "library"} - subject is any library type entity
                 - Multiple keys are AND conditions
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             SearchResult with matching entities and hyperedges
         """
-        # Determine if caching is enabled
-        use_cache = cache if cache is not None else (self._cache is not None)
-        cache_key = self._cache_key_vector(embedding, limit)
-
-        # Check cache if enabled (sync operation)
-        if use_cache and self._cache:
-            cached = self._cache.get(cache_key)
-            if cached is not None:
-                return SearchResult(
-                    entities=[Entity.model_validate(e) for e in cached.get("entities", [])],
-                    hyperedges=[Hyperedge.model_validate(h) for h in cached.get("hyperedges", [])],
-                )
-
         # Build request payload
-        payload: dict = {"embedding": embedding, "limit": limit}
+        payload: dict[str, Any] = {
+            "embedding": encode_embedding(embedding, self._embedding_format),
+            "limit": limit,
+        }
         if role_filter:
             payload["role_filter"] = role_filter
 
-        # Make API call
-        data = await self._http.post("/v1/search/vector", json=payload)
-        result = SearchResult(
-            entities=[Entity.model_validate(e) for e in data.get("entities", [])],
-            hyperedges=[Hyperedge.model_validate(h) for h in data.get("hyperedges", [])],
+        cache_key = self._cache_key_vector(embedding, payload)
+        search = partial(
+            self._search, "/v1/search/vector", payload, cache_key, cache=cache, timeout=timeout
         )
-
-        # Store in cache if enabled (sync operation)
-        if use_cache and self._cache:
-            self._cache.set(cache_key, {
-                "entities": [e.model_dump() for e in result.entities],
-                "hyperedges": [h.model_dump() for h in result.hyperedges],
-            })
-
-        return result
+        params = {k: v for k, v in payload.items() if k != "embedding"}
+        return await self._search_similar(embedding, "search_vector", params, search, cache)
 
     async def text(
         self,
@@ -161,6 +290,7 @@ class AsyncSearchAPI:
         *,
         cache: bool | None = None,
         role_filter: dict[str, str] | None = None,
+        timeout: float | None = None,
     ) -> SearchResult:
         """Text-only search using BM25 ranking.
 
@@ -173,40 +303,17 @@ class AsyncSearchAPI:
                 - {"subject": "e:react"} - only hyperedges where React is subject
                 - {"subject_type": "library"} - subject is any library type entity
                 - Multiple keys are AND conditions
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             SearchResult with matching entities and hyperedges
         """
-        # Determine if caching is enabled
-        use_cache = cache if cache is not None else (self._cache is not None)
-        cache_key = self._cache_key("search_text", query, limit)
-
-        # Check cache if enabled (sync operation)
-        if use_cache and self._cache:
-            cached = self._cache.get(cache_key)
-            if cached is not None:
-                return SearchResult(
-                    entities=[Entity.model_validate(e) for e in cached.get("entities", [])],
-                    hyperedges=[Hyperedge.model_validate(h) for h in cached.get("hyperedges", [])],
-                )
-
         # Build request payload
-        payload: dict = {"query": query, "limit": limit}
+        payload: dict[str, Any] = {"query": query, "limit": limit}
         if role_filter:
             payload["role_filter"] = role_filter
 
-        # Make API call
-        data = await self._http.post("/v1/search/text", json=payload)
-        result = SearchResult(
-            entities=[Entity.model_validate(e) for e in data.get("entities", [])],
-            hyperedges=[Hyperedge.model_validate(h) for h in data.get("hyperedges", [])],
+        cache_key = self._cache_key("search_text", payload)
+        return await self._search(
+            "/v1/search/text", payload, cache_key, cache=cache, timeout=timeout
         )
-
-        # Store in cache if enabled (sync operation)
-        if use_cache and self._cache:
-            self._cache.set(cache_key, {
-                "entities": [e.model_dump() for e in result.entities],
-                "hyperedges": [h.model_dump() for h in result.hyperedges],
-            })
-
-        return result
@@ -38,6 +38,7 @@ class AsyncTriggersAPI:
         action: Literal["webhook", "notification"],
         *,
         webhook_id: str | None = None,
+        timeout: float | None = None,
     ) -> Trigger:
         """Create a custom trigger.
 
@@ -49,6 +50,7 @@ class AsyncTriggersAPI:
             event_types: Which events to evaluate
             action: What to do when condition matches
             webhook_id: Required if action == "webhook"
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             Created Trigger
@@ -62,14 +64,15 @@ class AsyncTriggersAPI:
         if webhook_id:
             payload["webhook_id"] = webhook_id
 
-        data = await self._http.post("/v1/triggers", json=payload)
+        data = await self._http.post("/v1/triggers", json=payload, timeout=timeout)
         return Trigger.model_validate(data)
 
-    async def get(self, trigger_id: str) -> Trigger:
+    async def get(self, trigger_id: str, *, timeout: float | None = None) -> Trigger:
         """Get a trigger by ID.
 
         Args:
             trigger_id: The trigger ID
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The trigger
@@ -77,16 +80,19 @@ class AsyncTriggersAPI:
         Raises:
             NotFoundError: If trigger doesn't exist
         """
-        data = await self._http.get(f"/v1/triggers/{trigger_id}")
+        data = await self._http.get(f"/v1/triggers/{trigger_id}", timeout=timeout)
         return Trigger.model_validate(data)
 
-    async def list(self) -> list[Trigger]:
+    async def list(self, *, timeout: float | None = None) -> list[Trigger]:
         """List all triggers.
 
+        Args:
+            timeout: Optional time limit for this call in seconds
+
         Returns:
             List of triggers
         """
-        data = await self._http.get("/v1/triggers")
+        data = await self._http.get("/v1/triggers", timeout=timeout)
         return [Trigger.model_validate(t) for t in data]
 
     async def update(
@@ -97,6 +103,7 @@ class AsyncTriggersAPI:
         condition: str | None = None,
         event_types: list[str] | None = None,
         active: bool | None = None,
+        timeout: float | None = None,
     ) -> Trigger:
         """Update a trigger.
 
@@ -106,6 +113,7 @@ class AsyncTriggersAPI:
             condition: New condition expression (optional)
             event_types: New event types list (optional)
             active: Active status (optional)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The updated trigger
@@ -120,14 +128,15 @@ class AsyncTriggersAPI:
         if active is not None:
             payload["active"] = active
 
-        data = await self._http.put(f"/v1/triggers/{trigger_id}", json=payload)
+        data = await self._http.put(f"/v1/triggers/{trigger_id}", json=payload, timeout=timeout)
         return Trigger.model_validate(data)
 
-    async def delete(self, trigger_id: str) -> bool:
+    async def delete(self, trigger_id: str, *, timeout: float | None = None) -> bool:
         """Delete a trigger.
 
         Args:
             trigger_id: The trigger ID to delete
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             True if deleted
@@ -135,19 +144,22 @@ class AsyncTriggersAPI:
         Raises:
             NotFoundError: If trigger doesn't exist
         """
-        await self._http.delete(f"/v1/triggers/{trigger_id}")
+        await self._http.delete(f"/v1/triggers/{trigger_id}", timeout=timeout)
         return True
 
     async def test(
         self,
         trigger_id: str,
         event_data: dict[str, Any],
+        *,
+        timeout: float | None = None,
     ) -> dict[str, Any]:
         """Test a trigger against sample event data.
 
         Args:
             trigger_id: The trigger ID to test
             event_data: Sample event data to evaluate the condition against
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             {"matched": bool, "evaluation": str}
@@ -155,5 +167,6 @@ class AsyncTriggersAPI:
         data = await self._http.post(
             f"/v1/triggers/{trigger_id}/test",
             json={"event_data": event_data},
+            timeout=timeout,
         )
         return data
@@ -29,6 +29,7 @@ class AsyncWebhooksAPI:
         events: list[str],
         *,
         secret: str | None = None,
+        timeout: float | None = None,
     ) -> Webhook:
         """Create a webhook subscription.
 
@@ -40,6 +41,7 @@ class AsyncWebhooksAPI:
                 - "path.discovered"
                 - Use wildcards: "entity.*", "*"
             secret: Optional secret for HMAC signature verification
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             Created Webhook
@@ -51,14 +53,15 @@ class AsyncWebhooksAPI:
         if secret:
             payload["secret"] = secret
 
-        data = await self._http.post("/v1/webhooks", json=payload)
+        data = await self._http.post("/v1/webhooks", json=payload, timeout=timeout)
         return Webhook.model_validate(data)
 
-    async def get(self, webhook_id: str) -> Webhook:
+    async def get(self, webhook_id: str, *, timeout: float | None = None) -> Webhook:
         """Get a webhook by ID.
 
         Args:
             webhook_id: The webhook ID
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The webhook
@@ -66,16 +69,19 @@ class AsyncWebhooksAPI:
         Raises:
             NotFoundError: If webhook doesn't exist
         """
-        data = await self._http.get(f"/v1/webhooks/{webhook_id}")
+        data = await self._http.get(f"/v1/webhooks/{webhook_id}", timeout=timeout)
         return Webhook.model_validate(data)
 
-    async def list(self) -> list[Webhook]:
+    async def list(self, *, timeout: float | None = None) -> list[Webhook]:
         """List all webhooks.
 
+        Args:
+            timeout: Optional time limit for this call in seconds
+
         Returns:
             List of webhooks
         """
-        data = await self._http.get("/v1/webhooks")
+        data = await self._http.get("/v1/webhooks", timeout=timeout)
         return [Webhook.model_validate(w) for w in data]
 
     async def update(
@@ -85,6 +91,7 @@ class AsyncWebhooksAPI:
         url: str | None = None,
         events: list[str] | None = None,
         active: bool | None = None,
+        timeout: float | None = None,
     ) -> Webhook:
         """Update a webhook.
 
@@ -93,6 +100,7 @@ class AsyncWebhooksAPI:
             url: New URL (optional)
             events: New events list (optional)
             active: Active status (optional)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The updated webhook
@@ -105,14 +113,15 @@ class AsyncWebhooksAPI:
         if active is not None:
             payload["active"] = active
 
-        data = await self._http.put(f"/v1/webhooks/{webhook_id}", json=payload)
+        data = await self._http.put(f"/v1/webhooks/{webhook_id}", json=payload, timeout=timeout)
         return Webhook.model_validate(data)
 
-    async def delete(self, webhook_id: str) -> bool:
+    async def delete(self, webhook_id: str, *, timeout: float | None = None) -> bool:
         """Delete a webhook.
 
         Args:
             webhook_id: The webhook ID to delete
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             True if deleted
@@ -120,7 +129,7 @@ class AsyncWebhooksAPI:
         Raises:
             NotFoundError: If webhook doesn't exist
         """
-        await self._http.delete(f"/v1/webhooks/{webhook_id}")
+        await self._http.delete(f"/v1/webhooks/{webhook_id}", timeout=timeout)
         return True
 
     async def deliveries(
@@ -128,12 +137,14 @@ class AsyncWebhooksAPI:
         webhook_id: str,
         *,
         limit: int = 100,
+        timeout: float | None = None,
     ) -> list[WebhookDelivery]:
         """List recent delivery attempts for a webhook.
 
         Args:
             webhook_id: The webhook ID
             limit: Maximum number of deliveries to return (default: 100)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of webhook deliveries
@@ -141,17 +152,19 @@ class AsyncWebhooksAPI:
         data = await self._http.get(
             f"/v1/webhooks/{webhook_id}/deliveries",
             params={"limit": limit},
+            timeout=timeout,
         )
         return [WebhookDelivery.model_validate(d) for d in data]
 
-    async def test(self, webhook_id: str) -> WebhookDelivery:
+    async def test(self, webhook_id: str, *, timeout: float | None = None) -> WebhookDelivery:
         """Send a test delivery to a webhook.
 
         Args:
             webhook_id: The webhook ID to test
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The test delivery result
         """
-        data = await self._http.post(f"/v1/webhooks/{webhook_id}/test")
+        data = await self._http.post(f"/v1/webhooks/{webhook_id}/test", timeout=timeout)
         return WebhookDelivery.model_validate(data)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 from hyperx.batch import (
     BatchItemResult,
@@ -12,12 +13,35 @@ from hyperx.batch import (
     HyperedgeCreate,
     HyperedgeDelete,
 )
+from hyperx.cache.invalidation import member_ids
+from hyperx.embeddings import EmbeddingFormat
 from hyperx.http import HTTPClient
 
+if TYPE_CHECKING:
+    from hyperx.cache.invalidation import CacheInvalidator
+    from hyperx.cache.objects import ObjectCache
+
 # Type alias for batch operations
 BatchOperation = EntityCreate | HyperedgeCreate | EntityDelete | HyperedgeDelete
 
 
+def batch_dependencies(operations: Iterable[BatchOperation]) -> set[str]:
+    """IDs whose cached results a batch may change.
+
+    Deleted entities and hyperedges, and the members of created hyperedges;
+    created entities cannot be in any cached result yet.
+    """
+    ids: set[str] = set()
+    for op in operations:
+        if isinstance(op, EntityDelete):
+            ids.add(op.entity_id)
+        elif isinstance(op, HyperedgeDelete):
+            ids.add(op.hyperedge_id)
+        elif isinstance(op, HyperedgeCreate):
+            ids.update(member_ids(op.members))
+    return ids
+
+
 class BatchAPI:
     """API for executing batch operations.
 
@@ -42,19 +66,35 @@ class BatchAPI:
         >>> print(f"Created {result.succeeded} items")
     """
 
-    def __init__(self, http: HTTPClient):
+    def __init__(
+        self,
+        http: HTTPClient,
+        *,
+        embedding_format: EmbeddingFormat = "json",
+        invalidator: CacheInvalidator | None = None,
+        objects: ObjectCache | None = None,
+    ):
         """Initialize BatchAPI.
 
         Args:
             http: HTTP client for making API requests.
+            embedding_format: Wire format for entity embeddings ("json",
+                "float32", "float16" or "int8").
+            invalidator: Drops cached results containing deleted entities
+                and hyperedges, or members of created hyperedges.
+            objects: Drops cached copies of deleted entities and hyperedges.
         """
         self._http = http
+        self._embedding_format = embedding_format
+        self._invalidator = invalidator
+        self._objects = objects
 
     def execute(
         self,
         operations: list[BatchOperation],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> BatchResult:
         """Execute batch operations.
 
@@ -64,6 +104,7 @@ class BatchAPI:
             atomic: If True (default), all operations succeed or all fail.
                 If False, operations are executed in best-effort mode where
                 individual failures don't affect other operations.
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             BatchResult containing details about the batch execution including
@@ -86,7 +127,12 @@ class BatchAPI:
             ...         print(f"Operation {item.index} failed: {item.error}")
         """
         # Serialize operations to dictionaries
-        serialized_operations = [op.to_dict() for op in operations]
+        serialized_operations = [
+            op.to_dict(embedding_format=self._embedding_format)
+            if isinstance(op, EntityCreate)
+            else op.to_dict()
+            for op in operations
+        ]
 
         # Build request payload
         payload: dict[str, Any] = {
@@ -95,7 +141,17 @@ class BatchAPI:
         }
 
         # Make API request
-        data = self._http.post("/v1/batch", json=payload)
+        data = self._http.post("/v1/batch", json=payload, timeout=timeout)
+        if self._invalidator is not None:
+            self._invalidator.invalidate(batch_dependencies(operations))
+        if self._objects is not None:
+            self._objects.delete(
+                "entity", [op.entity_id for op in operations if isinstance(op, EntityDelete)]
+            )
+            self._objects.delete(
+                "hyperedge",
+                [op.hyperedge_id for op in operations if isinstance(op, HyperedgeDelete)],
+            )
 
         # Parse response into BatchResult
         return self._parse_result(data)
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+from hyperx.embeddings import EmbeddingFormat, EmbeddingInput, encode_embedding, has_embedding
 from hyperx.http import HTTPClient
 from hyperx.models import Entity
 
+if TYPE_CHECKING:
+    from hyperx.cache.invalidation import CacheInvalidator
+    from hyperx.cache.objects import ObjectCache
+
 
 class EntitiesAPI:
     """API for managing entities in HyperX.
@@ -19,18 +26,56 @@ class EntitiesAPI:
         >>> db.entities.delete(entity.id)
     """
 
-    def __init__(self, http: HTTPClient):
+    def __init__(
+        self,
+        http: HTTPClient,
+        *,
+        embedding_format: EmbeddingFormat = "json",
+        invalidator: CacheInvalidator | None = None,
+        objects: ObjectCache | None = None,
+    ):
         self._http = http
+        self._embedding_format = embedding_format
+        self._invalidator = invalidator
+        self._objects = objects
+
+    def _after_write(
+        self,
+        changed: Iterable[str] = (),
+        *,
+        stored: Sequence[Entity] = (),
+        removed: Sequence[str] = (),
+    ) -> None:
+        """Update the client caches after a successful write.
+
+        Args:
+            changed: IDs whose cached search and path results are now stale
+            stored: Entities returned by the server, cached by ID
+            removed: IDs of deleted or superseded entities
+        """
+        if self._invalidator is not None:
+            self._invalidator.invalidate(changed)
+        if self._objects is not None:
+            self._objects.delete("entity", removed)
+            self._objects.store("entity", stored)
+
+    def _encode_entity(self, entity: dict[str, Any]) -> dict[str, Any]:
+        """Encode the embedding of a ``create_many`` entity dict, if any."""
+        embedding = entity.get("embedding")
+        if embedding is None or (isinstance(embedding, list) and self._embedding_format == "json"):
+            return entity
+        return {**entity, "embedding": encode_embedding(embedding, self._embedding_format)}
 
     def create(
         self,
         name: str,
         entity_type: str,
         attributes: dict[str, Any] | None = None,
-        embedding: list[float] | None = None,
+        embedding: EmbeddingInput | None = None,
         *,
         valid_from: datetime | None = None,
         valid_until: datetime | None = None,
+        timeout: float | None = None,
     ) -> Entity:
         """Create a new entity.
 
@@ -38,9 +83,11 @@ class EntitiesAPI:
             name: Human-readable name for the entity
             entity_type: Type classification (e.g., "concept", "person", "document")
             attributes: Optional key-value attributes
-            embedding: Optional vector embedding
+            embedding: Optional vector embedding (list of floats, NumPy array,
+                       ``array('f')`` or memoryview)
             valid_from: When entity becomes valid (default: now)
             valid_until: When entity stops being valid (default: forever)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The created entity
@@ -51,36 +98,51 @@ class EntitiesAPI:
         }
         if attributes:
             payload["attributes"] = attributes
-        if embedding:
-            payload["embedding"] = embedding
+        if has_embedding(embedding):
+            payload["embedding"] = encode_embedding(embedding, self._embedding_format)
         if valid_from:
             payload["valid_from"] = valid_from.isoformat()
         if valid_until:
             payload["valid_until"] = valid_until.isoformat()
 
-        data = self._http.post("/v1/entities", json=payload)
-        return Entity.model_validate(data)
+        data = self._http.post("/v1/entities", json=payload, timeout=timeout)
+        entity = Entity.model_validate(data)
+        self._after_write(stored=[entity])
+        return entity
 
-    def get(self, entity_id: str) -> Entity:
+    def get(
+        self, entity_id: str, *, cache: bool | None = None, timeout: float | None = None
+    ) -> Entity:
         """Get an entity by ID.
 
         Args:
             entity_id: The entity ID (e.g., "e:uuid...")
+            cache: Override object caching. None uses the client default
+                   (cached if the client has an object cache), False
+                   bypasses the cache.
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The entity
 
         Raises:
-            NotFoundError: If entity doesn't exist
+            NotFoundError: If entity doesn't exist, or did within the
+                           object cache's ``negative_ttl``
         """
-        data = self._http.get(f"/v1/entities/{entity_id}")
-        return Entity.model_validate(data)
-
-    def delete(self, entity_id: str) -> bool:
+        path = f"/v1/entities/{entity_id}"
+        if self._objects is None or cache is False:
+            data = self._http.get(path, timeout=timeout)
+            return Entity.model_validate(data)
+        fetch = partial(self._http.get, path, timeout=timeout, raw=True)
+        data = self._objects.read("entity", entity_id, fetch)
+        return Entity.model_validate_json(data)
+
+    def delete(self, entity_id: str, *, timeout: float | None = None) -> bool:
         """Delete an entity.
 
         Args:
             entity_id: The entity ID to delete
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             True if deleted
@@ -88,7 +150,8 @@ class EntitiesAPI:
         Raises:
             NotFoundError: If entity doesn't exist
         """
-        self._http.delete(f"/v1/entities/{entity_id}")
+        self._http.delete(f"/v1/entities/{entity_id}", timeout=timeout)
+        self._after_write([entity_id], removed=[entity_id])
         return True
 
     def update(
@@ -97,6 +160,8 @@ class EntitiesAPI:
         name: str | None = None,
         entity_type: str | None = None,
         attributes: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> Entity:
         """Update an entity.
 
@@ -105,6 +170,7 @@ class EntitiesAPI:
             name: New name (optional)
             entity_type: New type (optional)
             attributes: New attributes (optional)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The updated entity
@@ -117,8 +183,10 @@ class EntitiesAPI:
         if attributes is not None:
             payload["attributes"] = attributes
 
-        data = self._http.put(f"/v1/entities/{entity_id}", json=payload)
-        return Entity.model_validate(data)
+        data = self._http.put(f"/v1/entities/{entity_id}", json=payload, timeout=timeout)
+        entity = Entity.model_validate(data)
+        self._after_write([entity_id], stored=[entity])
+        return entity
 
     def list(
         self,
@@ -128,6 +196,7 @@ class EntitiesAPI:
         as_of: datetime | None = None,
         include_deprecated: bool = False,
         include_history: bool = False,
+        timeout: float | None = None,
     ) -> list[Entity]:
         """List entities with pagination and temporal filters.
 
@@ -137,6 +206,7 @@ class EntitiesAPI:
             as_of: Filter to entities valid at this time
             include_deprecated: Include deprecated entities
             include_history: Include superseded entities
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of entities
@@ -149,15 +219,16 @@ class EntitiesAPI:
         if include_history:
             params["include_history"] = "true"
 
-        data = self._http.get("/v1/entities", params=params)
+        data = self._http.get("/v1/entities", params=params, timeout=timeout)
         return [Entity.model_validate(e) for e in data]
 
-    def deprecate(self, entity_id: str, reason: str) -> Entity:
+    def deprecate(self, entity_id: str, reason: str, *, timeout: float | None = None) -> Entity:
         """Deprecate an entity.
 
         Args:
             entity_id: The entity ID to deprecate
             reason: Reason for deprecation
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The deprecated entity
@@ -165,8 +236,11 @@ class EntitiesAPI:
         data = self._http.post(
             f"/v1/entities/{entity_id}/deprecate",
             json={"reason": reason},
+            timeout=timeout,
         )
-        return Entity.model_validate(data)
+        entity = Entity.model_validate(data)
+        self._after_write([entity_id], stored=[entity])
+        return entity
 
     def supersede(
         self,
@@ -174,6 +248,8 @@ class EntitiesAPI:
         name: str,
         entity_type: str,
         attributes: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> Entity:
         """Supersede an entity with a new version.
 
@@ -182,6 +258,7 @@ class EntitiesAPI:
             name: Name for the new version
             entity_type: Entity type for the new version
             attributes: Attributes for the new version
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The new entity version
@@ -196,50 +273,61 @@ class EntitiesAPI:
         data = self._http.post(
             f"/v1/entities/{entity_id}/supersede",
             json=payload,
+            timeout=timeout,
         )
-        return Entity.model_validate(data)
+        entity = Entity.model_validate(data)
+        self._after_write([entity_id], stored=[entity], removed=[entity_id])
+        return entity
 
-    def retire(self, entity_id: str) -> Entity:
+    def retire(self, entity_id: str, *, timeout: float | None = None) -> Entity:
         """Retire an entity.
 
         Args:
             entity_id: The entity ID to retire
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The retired entity
         """
-        data = self._http.post(f"/v1/entities/{entity_id}/retire")
-        return Entity.model_validate(data)
+        data = self._http.post(f"/v1/entities/{entity_id}/retire", timeout=timeout)
+        entity = Entity.model_validate(data)
+        self._after_write([entity_id], stored=[entity])
+        return entity
 
-    def reactivate(self, entity_id: str) -> Entity:
+    def reactivate(self, entity_id: str, *, timeout: float | None = None) -> Entity:
         """Reactivate a deprecated entity.
 
         Args:
             entity_id: The entity ID to reactivate
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The reactivated entity
         """
-        data = self._http.post(f"/v1/entities/{entity_id}/reactivate")
-        return Entity.model_validate(data)
+        data = self._http.post(f"/v1/entities/{entity_id}/reactivate", timeout=timeout)
+        entity = Entity.model_validate(data)
+        self._after_write([entity_id], stored=[entity])
+        return entity
 
-    def history(self, entity_id: str) -> list[Entity]:
+    def history(self, entity_id: str, *, timeout: float | None = None) -> list[Entity]:
         """Get version history for an entity.
 
         Args:
             entity_id: The entity ID
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of all versions, ordered by version number
         """
-        data = self._http.get(f"/v1/entities/{entity_id}/history")
+        data = self._http.get(f"/v1/entities/{entity_id}/history", timeout=timeout)
         return [Entity.model_validate(e) for e in data]
 
     def create_many(
         self,
-        entities: list[dict[str, Any]],
+        entities: Sequence[dict[str, Any]],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> list[Entity]:
         """Create multiple entities in a single request.
 
@@ -248,10 +336,11 @@ class EntitiesAPI:
                 - name (required): Entity name
                 - entity_type (required): Entity type
                 - attributes (optional): Key-value attributes
-                - embedding (optional): Vector embedding
+                - embedding (optional): Vector embedding (any supported type)
                 - valid_from (optional): datetime
                 - valid_until (optional): datetime
             atomic: If True (default), all succeed or all fail
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of created Entity objects
@@ -259,25 +348,30 @@ class EntitiesAPI:
         Raises:
             HyperXError: If atomic=True and any entity fails validation
         """
-        payload = {"entities": entities, "atomic": atomic}
-        data = self._http.post("/v1/entities/batch", json=payload)
-        return [Entity.model_validate(e) for e in data["entities"]]
+        payload = {"entities": [self._encode_entity(e) for e in entities], "atomic": atomic}
+        data = self._http.post("/v1/entities/batch", json=payload, timeout=timeout)
+        created = [Entity.model_validate(e) for e in data["entities"]]
+        self._after_write(stored=created)
+        return created
 
     def delete_many(
         self,
         entity_ids: list[str],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> int:
         """Delete multiple entities.
 
         Args:
             entity_ids: List of entity IDs to delete
             atomic: If True (default), all succeed or all fail
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             Number of entities deleted
         """
         payload = {"ids": entity_ids, "atomic": atomic}
-        data = self._http.post("/v1/entities/batch/delete", json=payload)
+        data = self._http.post("/v1/entities/batch/delete", json=payload, timeout=timeout)
+        self._after_write(entity_ids, removed=entity_ids)
         return data["deleted"]
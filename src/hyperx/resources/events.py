@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import Any, Generator
 
@@ -90,7 +89,7 @@ class EventsAPI:
             response.raise_for_status()
             for line in response.iter_lines():
                 if line.startswith("data: "):
-                    data = json.loads(line[6:])
+                    data = self._http.codec.loads(line[6:])
                     yield Event(
                         type=data["type"],
                         data=data["data"],
@@ -105,6 +104,7 @@ class EventsAPI:
         since: datetime | None = None,
         until: datetime | None = None,
         limit: int = 100,
+        timeout: float | None = None,
     ) -> list[Event]:
         """Get historical events (non-streaming).
 
@@ -116,6 +116,7 @@ class EventsAPI:
             since: Start time - only events after this timestamp
             until: End time - only events before this timestamp
             limit: Maximum number of events to return (default: 100)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of past events, ordered by timestamp (oldest first)
@@ -137,7 +138,7 @@ class EventsAPI:
         if until:
             params["until"] = until.isoformat()
 
-        data = self._http.get("/v1/events", params=params)
+        data = self._http.get("/v1/events", params=params, timeout=timeout)
         return [
             Event(
                 type=e["type"],
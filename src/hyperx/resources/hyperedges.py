@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+from hyperx.cache.invalidation import member_ids
 from hyperx.http import HTTPClient
 from hyperx.models import Hyperedge
 
+if TYPE_CHECKING:
+    from hyperx.cache.invalidation import CacheInvalidator
+    from hyperx.cache.objects import ObjectCache
+
 
 class MemberInput:
     """Helper for creating hyperedge members.
@@ -43,8 +50,36 @@ class HyperedgesAPI:
         ... )
     """
 
-    def __init__(self, http: HTTPClient):
+    def __init__(
+        self,
+        http: HTTPClient,
+        *,
+        invalidator: CacheInvalidator | None = None,
+        objects: ObjectCache | None = None,
+    ):
         self._http = http
+        self._invalidator = invalidator
+        self._objects = objects
+
+    def _after_write(
+        self,
+        changed: Iterable[str] = (),
+        *,
+        stored: Sequence[Hyperedge] = (),
+        removed: Sequence[str] = (),
+    ) -> None:
+        """Update the client caches after a successful write.
+
+        Args:
+            changed: IDs whose cached search and path results are now stale
+            stored: Hyperedges returned by the server, cached by ID
+            removed: IDs of deleted or superseded hyperedges
+        """
+        if self._invalidator is not None:
+            self._invalidator.invalidate(changed)
+        if self._objects is not None:
+            self._objects.delete("hyperedge", removed)
+            self._objects.store("hyperedge", stored)
 
     def create(
         self,
@@ -54,6 +89,7 @@ class HyperedgesAPI:
         *,
         valid_from: datetime | None = None,
         valid_until: datetime | None = None,
+        timeout: float | None = None,
     ) -> Hyperedge:
         """Create a new hyperedge.
 
@@ -63,6 +99,7 @@ class HyperedgesAPI:
             attributes: Optional key-value attributes
             valid_from: When relationship becomes valid (default: now)
             valid_until: When relationship stops being valid (default: forever)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The created hyperedge
@@ -82,29 +119,44 @@ class HyperedgesAPI:
         if valid_until:
             payload["valid_until"] = valid_until.isoformat()
 
-        data = self._http.post("/v1/hyperedges", json=payload)
-        return Hyperedge.model_validate(data)
+        data = self._http.post("/v1/hyperedges", json=payload, timeout=timeout)
+        hyperedge = Hyperedge.model_validate(data)
+        self._after_write(member_ids(members), stored=[hyperedge])
+        return hyperedge
 
-    def get(self, hyperedge_id: str) -> Hyperedge:
+    def get(
+        self, hyperedge_id: str, *, cache: bool | None = None, timeout: float | None = None
+    ) -> Hyperedge:
         """Get a hyperedge by ID.
 
         Args:
             hyperedge_id: The hyperedge ID (e.g., "h:uuid...")
+            cache: Override object caching. None uses the client default
+                   (cached if the client has an object cache), False
+                   bypasses the cache.
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The hyperedge
 
         Raises:
-            NotFoundError: If hyperedge doesn't exist
+            NotFoundError: If hyperedge doesn't exist, or did within the
+                           object cache's ``negative_ttl``
         """
-        data = self._http.get(f"/v1/hyperedges/{hyperedge_id}")
-        return Hyperedge.model_validate(data)
-
-    def delete(self, hyperedge_id: str) -> bool:
+        path = f"/v1/hyperedges/{hyperedge_id}"
+        if self._objects is None or cache is False:
+            data = self._http.get(path, timeout=timeout)
+            return Hyperedge.model_validate(data)
+        fetch = partial(self._http.get, path, timeout=timeout, raw=True)
+        data = self._objects.read("hyperedge", hyperedge_id, fetch)
+        return Hyperedge.model_validate_json(data)
+
+    def delete(self, hyperedge_id: str, *, timeout: float | None = None) -> bool:
         """Delete a hyperedge.
 
         Args:
             hyperedge_id: The hyperedge ID to delete
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             True if deleted
@@ -112,7 +164,8 @@ class HyperedgesAPI:
         Raises:
             NotFoundError: If hyperedge doesn't exist
         """
-        self._http.delete(f"/v1/hyperedges/{hyperedge_id}")
+        self._http.delete(f"/v1/hyperedges/{hyperedge_id}", timeout=timeout)
+        self._after_write([hyperedge_id], removed=[hyperedge_id])
         return True
 
     def list(
@@ -123,6 +176,7 @@ class HyperedgesAPI:
         as_of: datetime | None = None,
         include_deprecated: bool = False,
         include_history: bool = False,
+        timeout: float | None = None,
     ) -> list[Hyperedge]:
         """List hyperedges with pagination and temporal filters.
 
@@ -132,6 +186,7 @@ class HyperedgesAPI:
             as_of: Filter to hyperedges valid at this time
             include_deprecated: Include deprecated hyperedges
             include_history: Include superseded hyperedges
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of hyperedges
@@ -144,7 +199,7 @@ class HyperedgesAPI:
         if include_history:
             params["include_history"] = "true"
 
-        data = self._http.get("/v1/hyperedges", params=params)
+        data = self._http.get("/v1/hyperedges", params=params, timeout=timeout)
         return [Hyperedge.model_validate(h) for h in data]
 
     def update(
@@ -153,6 +208,8 @@ class HyperedgesAPI:
         description: str | None = None,
         members: list[dict[str, str] | MemberInput] | None = None,
         attributes: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> Hyperedge:
         """Update a hyperedge.
 
@@ -161,6 +218,7 @@ class HyperedgesAPI:
             description: New description (optional)
             members: New members list (optional)
             attributes: New attributes (optional)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The updated hyperedge
@@ -175,15 +233,20 @@ class HyperedgesAPI:
         if attributes is not None:
             payload["attributes"] = attributes
 
-        data = self._http.put(f"/v1/hyperedges/{hyperedge_id}", json=payload)
-        return Hyperedge.model_validate(data)
+        data = self._http.put(f"/v1/hyperedges/{hyperedge_id}", json=payload, timeout=timeout)
+        hyperedge = Hyperedge.model_validate(data)
+        self._after_write([hyperedge_id, *member_ids(members)], stored=[hyperedge])
+        return hyperedge
 
-    def deprecate(self, hyperedge_id: str, reason: str) -> Hyperedge:
+    def deprecate(
+        self, hyperedge_id: str, reason: str, *, timeout: float | None = None
+    ) -> Hyperedge:
         """Deprecate a hyperedge.
 
         Args:
             hyperedge_id: The hyperedge ID to deprecate
             reason: Reason for deprecation
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The deprecated hyperedge
@@ -191,8 +254,11 @@ class HyperedgesAPI:
         data = self._http.post(
             f"/v1/hyperedges/{hyperedge_id}/deprecate",
             json={"reason": reason},
+            timeout=timeout,
         )
-        return Hyperedge.model_validate(data)
+        hyperedge = Hyperedge.model_validate(data)
+        self._after_write([hyperedge_id], stored=[hyperedge])
+        return hyperedge
 
     def supersede(
         self,
@@ -200,6 +266,8 @@ class HyperedgesAPI:
         description: str,
         members: list[dict[str, str] | MemberInput],
         attributes: dict[str, Any] | None = None,
+        *,
+        timeout: float | None = None,
     ) -> Hyperedge:
         """Supersede a hyperedge with a new version.
 
@@ -208,6 +276,7 @@ class HyperedgesAPI:
             description: Description for the new version
             members: Members for the new version
             attributes: Attributes for the new version
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The new hyperedge version
@@ -225,43 +294,55 @@ class HyperedgesAPI:
         data = self._http.post(
             f"/v1/hyperedges/{hyperedge_id}/supersede",
             json=payload,
+            timeout=timeout,
+        )
+        hyperedge = Hyperedge.model_validate(data)
+        self._after_write(
+            [hyperedge_id, *member_ids(members)], stored=[hyperedge], removed=[hyperedge_id]
         )
-        return Hyperedge.model_validate(data)
+        return hyperedge
 
-    def retire(self, hyperedge_id: str) -> Hyperedge:
+    def retire(self, hyperedge_id: str, *, timeout: float | None = None) -> Hyperedge:
         """Retire a hyperedge.
 
         Args:
             hyperedge_id: The hyperedge ID to retire
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The retired hyperedge
         """
-        data = self._http.post(f"/v1/hyperedges/{hyperedge_id}/retire")
-        return Hyperedge.model_validate(data)
+        data = self._http.post(f"/v1/hyperedges/{hyperedge_id}/retire", timeout=timeout)
+        hyperedge = Hyperedge.model_validate(data)
+        self._after_write([hyperedge_id], stored=[hyperedge])
+        return hyperedge
 
-    def reactivate(self, hyperedge_id: str) -> Hyperedge:
+    def reactivate(self, hyperedge_id: str, *, timeout: float | None = None) -> Hyperedge:
         """Reactivate a deprecated hyperedge.
 
         Args:
             hyperedge_id: The hyperedge ID to reactivate
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The reactivated hyperedge
         """
-        data = self._http.post(f"/v1/hyperedges/{hyperedge_id}/reactivate")
-        return Hyperedge.model_validate(data)
+        data = self._http.post(f"/v1/hyperedges/{hyperedge_id}/reactivate", timeout=timeout)
+        hyperedge = Hyperedge.model_validate(data)
+        self._after_write([hyperedge_id], stored=[hyperedge])
+        return hyperedge
 
-    def history(self, hyperedge_id: str) -> list[Hyperedge]:
+    def history(self, hyperedge_id: str, *, timeout: float | None = None) -> list[Hyperedge]:
         """Get version history for a hyperedge.
 
         Args:
             hyperedge_id: The hyperedge ID
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of all versions, ordered by version number
         """
-        data = self._http.get(f"/v1/hyperedges/{hyperedge_id}/history")
+        data = self._http.get(f"/v1/hyperedges/{hyperedge_id}/history", timeout=timeout)
         return [Hyperedge.model_validate(h) for h in data]
 
     def create_many(
@@ -269,6 +350,7 @@ class HyperedgesAPI:
         hyperedges: list[dict[str, Any]],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> list[Hyperedge]:
         """Create multiple hyperedges in a single request.
 
@@ -280,6 +362,7 @@ class HyperedgesAPI:
                 - valid_from (optional): datetime
                 - valid_until (optional): datetime
             atomic: If True (default), all succeed or all fail
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of created Hyperedge objects
@@ -288,24 +371,30 @@ class HyperedgesAPI:
             HyperXError: If atomic=True and any hyperedge fails validation
         """
         payload = {"hyperedges": hyperedges, "atomic": atomic}
-        data = self._http.post("/v1/hyperedges/batch", json=payload)
-        return [Hyperedge.model_validate(h) for h in data["hyperedges"]]
+        data = self._http.post("/v1/hyperedges/batch", json=payload, timeout=timeout)
+        created = [Hyperedge.model_validate(h) for h in data["hyperedges"]]
+        members = member_ids(m for h in payload["hyperedges"] for m in h["members"])
+        self._after_write(members, stored=created)
+        return created
 
     def delete_many(
         self,
         hyperedge_ids: list[str],
         *,
         atomic: bool = True,
+        timeout: float | None = None,
     ) -> int:
         """Delete multiple hyperedges.
 
         Args:
             hyperedge_ids: List of hyperedge IDs to delete
             atomic: If True (default), all succeed or all fail
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             Number of hyperedges deleted
         """
         payload = {"ids": hyperedge_ids, "atomic": atomic}
-        data = self._http.post("/v1/hyperedges/batch/delete", json=payload)
+        data = self._http.post("/v1/hyperedges/batch/delete", json=payload, timeout=timeout)
+        self._after_write(hyperedge_ids, removed=hyperedge_ids)
         return data["deleted"]
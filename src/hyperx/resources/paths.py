@@ -6,13 +6,32 @@ This is HyperX's key differentiator from vector databases.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
+from hyperx.cache.invalidation import path_dependencies
+from hyperx.cache.keys import request_key
+from hyperx.cache.refresh import load_cached
 from hyperx.http import HTTPClient
 from hyperx.models import PathResult, PathsResponse
 
 if TYPE_CHECKING:
     from hyperx.cache.base import Cache
+    from hyperx.cache.invalidation import CacheInvalidator
+    from hyperx.cache.refresh import BackgroundRefresher, CachePolicy
+
+
+def paths_result(data: bytes | dict[str, Any] | list[dict[str, Any]]) -> list[PathResult]:
+    """Build path results from a raw response body or a cached entry.
+
+    Raw bytes are validated directly from JSON by pydantic, without building
+    intermediate dicts. Dicts (decoded responses) and lists of path dicts
+    (cache entries written by earlier SDK versions) are also accepted.
+    """
+    if isinstance(data, bytes | bytearray):
+        return PathsResponse.model_validate_json(data).paths
+    if isinstance(data, list):
+        return [PathResult.model_validate(p) for p in data]
+    return PathsResponse.model_validate(data).paths
 
 
 class PathsAPI:
@@ -32,20 +51,27 @@ class PathsAPI:
         ...     print(f"Cost: {path.cost}, Hops: {len(path.hyperedges)}")
     """
 
-    def __init__(self, http: HTTPClient, cache: Cache | None = None):
+    def __init__(
+        self,
+        http: HTTPClient,
+        cache: Cache | None = None,
+        *,
+        cache_policy: CachePolicy | None = None,
+        refresher: BackgroundRefresher | None = None,
+        invalidator: CacheInvalidator | None = None,
+    ):
         self._http = http
         self._cache = cache
+        self._cache_policy = cache_policy
+        self._refresher = refresher
+        self._invalidator = invalidator
 
-    def _cache_key(
-        self,
-        from_entity: str,
-        to_entity: str,
-        max_hops: int,
-        intersection_size: int,
-        k_paths: int,
-    ) -> str:
-        """Generate a cache key for paths.find() parameters."""
-        return f"paths:{from_entity}:{to_entity}:{max_hops}:{intersection_size}:{k_paths}"
+    def _cache_key(self, payload: dict[str, Any]) -> str:
+        """Generate a cache key covering every parameter of a paths request."""
+        # The server cache hint does not change the paths found. The
+        # endpoints keep their order: paths are listed from ``from``.
+        params = {k: v for k, v in payload.items() if k != "cache_hint"}
+        return request_key("paths", params)
 
     def find(
         self,
@@ -57,6 +83,7 @@ class PathsAPI:
         *,
         cache: bool | None = None,
         cache_hint: Literal["short", "medium", "long"] | None = None,
+        timeout: float | None = None,
     ) -> list[PathResult]:
         """Find multi-hop paths between two entities.
 
@@ -74,6 +101,7 @@ class PathsAPI:
                    True forces caching, False bypasses cache.
             cache_hint: Server-side cache hint ("short", "medium", "long")
                         to indicate how long the server should cache results.
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of PathResult objects, each containing:
@@ -95,19 +123,8 @@ class PathsAPI:
         # Determine if caching is enabled
         use_cache = cache if cache is not None else (self._cache is not None)
 
-        # Generate cache key
-        cache_key = self._cache_key(
-            from_entity, to_entity, max_hops, intersection_size, k_paths
-        )
-
-        # Check cache if enabled
-        if use_cache and self._cache:
-            cached = self._cache.get(cache_key)
-            if cached is not None:
-                return [PathResult.model_validate(p) for p in cached]
-
         # Build payload
-        payload = {
+        payload: dict[str, Any] = {
             "from": from_entity,
             "to": to_entity,
             "constraints": {
@@ -121,12 +138,31 @@ class PathsAPI:
         if cache_hint is not None:
             payload["cache_hint"] = cache_hint
 
-        # Make API call
-        data = self._http.post("/v1/paths", json=payload)
-        response = PathsResponse.model_validate(data)
-
-        # Store in cache if enabled
-        if use_cache and self._cache:
-            self._cache.set(cache_key, [p.model_dump() for p in response.paths])
-
-        return response.paths
+        cache_key = self._cache_key(payload)
+
+        def load() -> tuple[list[PathResult], Any]:
+            # Cache the response body as received; hits decode it with one
+            # model_validate_json call instead of a dump/validate round trip
+            data = self._http.post("/v1/paths", json=payload, timeout=timeout, raw=True)
+            paths = paths_result(data)
+            if use_cache and self._invalidator is not None:
+                # Also re-tracks results replaced by background refreshes
+                self._invalidator.track(
+                    cache_key, path_dependencies(from_entity, to_entity, paths)
+                )
+            return paths, data
+
+        if not use_cache or self._cache is None:
+            return load()[0]
+        paths = load_cached(
+            self._cache,
+            cache_key,
+            load,
+            paths_result,
+            policy=self._cache_policy,
+            refresher=self._refresher,
+        )
+        if self._invalidator is not None and cache_key not in self._invalidator.index:
+            # Hit on an entry written before this process tracked it
+            self._invalidator.track(cache_key, path_dependencies(from_entity, to_entity, paths))
+        return paths
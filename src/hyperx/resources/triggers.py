@@ -35,6 +35,7 @@ class TriggersAPI:
         action: Literal["webhook", "notification"],
         *,
         webhook_id: str | None = None,
+        timeout: float | None = None,
     ) -> Trigger:
         """Create a custom trigger.
 
@@ -46,6 +47,7 @@ class TriggersAPI:
             event_types: Which events to evaluate
             action: What to do when condition matches
             webhook_id: Required if action == "webhook"
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             Created Trigger
@@ -59,14 +61,15 @@ class TriggersAPI:
         if webhook_id:
             payload["webhook_id"] = webhook_id
 
-        data = self._http.post("/v1/triggers", json=payload)
+        data = self._http.post("/v1/triggers", json=payload, timeout=timeout)
         return Trigger.model_validate(data)
 
-    def get(self, trigger_id: str) -> Trigger:
+    def get(self, trigger_id: str, *, timeout: float | None = None) -> Trigger:
         """Get a trigger by ID.
 
         Args:
             trigger_id: The trigger ID
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The trigger
@@ -74,16 +77,19 @@ class TriggersAPI:
         Raises:
             NotFoundError: If trigger doesn't exist
         """
-        data = self._http.get(f"/v1/triggers/{trigger_id}")
+        data = self._http.get(f"/v1/triggers/{trigger_id}", timeout=timeout)
         return Trigger.model_validate(data)
 
-    def list(self) -> list[Trigger]:
+    def list(self, *, timeout: float | None = None) -> list[Trigger]:
         """List all triggers.
 
+        Args:
+            timeout: Optional time limit for this call in seconds
+
         Returns:
             List of triggers
         """
-        data = self._http.get("/v1/triggers")
+        data = self._http.get("/v1/triggers", timeout=timeout)
         return [Trigger.model_validate(t) for t in data]
 
     def update(
@@ -94,6 +100,7 @@ class TriggersAPI:
         condition: str | None = None,
         event_types: list[str] | None = None,
         active: bool | None = None,
+        timeout: float | None = None,
     ) -> Trigger:
         """Update a trigger.
 
@@ -103,6 +110,7 @@ class TriggersAPI:
             condition: New condition expression (optional)
             event_types: New event types list (optional)
             active: Active status (optional)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The updated trigger
@@ -117,14 +125,15 @@ class TriggersAPI:
         if active is not None:
             payload["active"] = active
 
-        data = self._http.put(f"/v1/triggers/{trigger_id}", json=payload)
+        data = self._http.put(f"/v1/triggers/{trigger_id}", json=payload, timeout=timeout)
         return Trigger.model_validate(data)
 
-    def delete(self, trigger_id: str) -> bool:
+    def delete(self, trigger_id: str, *, timeout: float | None = None) -> bool:
         """Delete a trigger.
 
         Args:
             trigger_id: The trigger ID to delete
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             True if deleted
@@ -132,19 +141,22 @@ class TriggersAPI:
         Raises:
             NotFoundError: If trigger doesn't exist
         """
-        self._http.delete(f"/v1/triggers/{trigger_id}")
+        self._http.delete(f"/v1/triggers/{trigger_id}", timeout=timeout)
         return True
 
     def test(
         self,
         trigger_id: str,
         event_data: dict[str, Any],
+        *,
+        timeout: float | None = None,
     ) -> dict[str, Any]:
         """Test a trigger against sample event data.
 
         Args:
             trigger_id: The trigger ID to test
             event_data: Sample event data to evaluate the condition against
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             {"matched": bool, "evaluation": str}
@@ -152,5 +164,6 @@ class TriggersAPI:
         data = self._http.post(
             f"/v1/triggers/{trigger_id}/test",
             json={"event_data": event_data},
+            timeout=timeout,
         )
         return data
@@ -28,6 +28,7 @@ class WebhooksAPI:
         events: list[str],
         *,
         secret: str | None = None,
+        timeout: float | None = None,
     ) -> Webhook:
         """Create a webhook subscription.
 
@@ -39,6 +40,7 @@ class WebhooksAPI:
                 - "path.discovered"
                 - Use wildcards: "entity.*", "*"
             secret: Optional secret for HMAC signature verification
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             Created Webhook
@@ -50,14 +52,15 @@ class WebhooksAPI:
         if secret:
             payload["secret"] = secret
 
-        data = self._http.post("/v1/webhooks", json=payload)
+        data = self._http.post("/v1/webhooks", json=payload, timeout=timeout)
         return Webhook.model_validate(data)
 
-    def get(self, webhook_id: str) -> Webhook:
+    def get(self, webhook_id: str, *, timeout: float | None = None) -> Webhook:
         """Get a webhook by ID.
 
         Args:
             webhook_id: The webhook ID
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The webhook
@@ -65,16 +68,19 @@ class WebhooksAPI:
         Raises:
             NotFoundError: If webhook doesn't exist
         """
-        data = self._http.get(f"/v1/webhooks/{webhook_id}")
+        data = self._http.get(f"/v1/webhooks/{webhook_id}", timeout=timeout)
         return Webhook.model_validate(data)
 
-    def list(self) -> list[Webhook]:
+    def list(self, *, timeout: float | None = None) -> list[Webhook]:
         """List all webhooks.
 
+        Args:
+            timeout: Optional time limit for this call in seconds
+
         Returns:
             List of webhooks
         """
-        data = self._http.get("/v1/webhooks")
+        data = self._http.get("/v1/webhooks", timeout=timeout)
         return [Webhook.model_validate(w) for w in data]
 
     def update(
@@ -84,6 +90,7 @@ class WebhooksAPI:
         url: str | None = None,
         events: list[str] | None = None,
         active: bool | None = None,
+        timeout: float | None = None,
     ) -> Webhook:
         """Update a webhook.
 
@@ -92,6 +99,7 @@ class WebhooksAPI:
             url: New URL (optional)
             events: New events list (optional)
             active: Active status (optional)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The updated webhook
@@ -104,14 +112,15 @@ class WebhooksAPI:
         if active is not None:
             payload["active"] = active
 
-        data = self._http.put(f"/v1/webhooks/{webhook_id}", json=payload)
+        data = self._http.put(f"/v1/webhooks/{webhook_id}", json=payload, timeout=timeout)
         return Webhook.model_validate(data)
 
-    def delete(self, webhook_id: str) -> bool:
+    def delete(self, webhook_id: str, *, timeout: float | None = None) -> bool:
         """Delete a webhook.
 
         Args:
             webhook_id: The webhook ID to delete
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             True if deleted
@@ -119,7 +128,7 @@ class WebhooksAPI:
         Raises:
             NotFoundError: If webhook doesn't exist
         """
-        self._http.delete(f"/v1/webhooks/{webhook_id}")
+        self._http.delete(f"/v1/webhooks/{webhook_id}", timeout=timeout)
         return True
 
     def deliveries(
@@ -127,12 +136,14 @@ class WebhooksAPI:
         webhook_id: str,
         *,
         limit: int = 100,
+        timeout: float | None = None,
     ) -> list[WebhookDelivery]:
         """List recent delivery attempts for a webhook.
 
         Args:
             webhook_id: The webhook ID
             limit: Maximum number of deliveries to return (default: 100)
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             List of webhook deliveries
@@ -140,17 +151,19 @@ class WebhooksAPI:
         data = self._http.get(
             f"/v1/webhooks/{webhook_id}/deliveries",
             params={"limit": limit},
+            timeout=timeout,
         )
         return [WebhookDelivery.model_validate(d) for d in data]
 
-    def test(self, webhook_id: str) -> WebhookDelivery:
+    def test(self, webhook_id: str, *, timeout: float | None = None) -> WebhookDelivery:
         """Send a test delivery to a webhook.
 
         Args:
             webhook_id: The webhook ID to test
+            timeout: Optional time limit for this call in seconds
 
         Returns:
             The test delivery result
         """
-        data = self._http.post(f"/v1/webhooks/{webhook_id}/test")
+        data = self._http.post(f"/v1/webhooks/{webhook_id}/test", timeout=timeout)
         return WebhookDelivery.model_validate(data)
@@ -0,0 +1,227 @@
+"""Retry policy for transient HyperX API failures.
+
+Provides a configurable retry policy with jittered exponential backoff,
+``Retry-After`` support and a per-client retry budget so that retries
+cannot multiply load on the server during an outage.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryEvent:
+    """Details about a retry that is about to happen.
+
+    Passed to ``RetryPolicy.on_retry`` before the client sleeps.
+
+    Attributes:
+        method: HTTP method of the request being retried
+        path: Request path (e.g., "/v1/search")
+        attempt: Number of the retry about to be made (1 for the first retry)
+        delay: Seconds the client will wait before retrying
+        status_code: Status code of the failed response, if any
+        error: Transport error that caused the retry, if any
+    """
+
+    method: str
+    path: str
+    attempt: int
+    delay: float
+    status_code: int | None = None
+    error: Exception | None = None
+
+
+@dataclass
+class RetryPolicy:
+    """Retry policy for ``HyperX`` and ``AsyncHyperX``.
+
+    Idempotent requests (GET, PUT, DELETE and read-only POSTs such as
+    search and paths) are retried on retryable status codes and transport
+    errors. Non-idempotent POSTs are only retried when the server
+    rejected them with 429 or the connection could not be established,
+    since in both cases the request was never processed.
+
+    Delays use "full jitter" exponential backoff: a random delay between
+    0 and ``min(backoff_max, backoff_base * 2 ** (attempt - 1))``. When the
+    server sends a ``Retry-After`` header it takes precedence (capped at
+    ``max_retry_after``).
+
+    Args:
+        max_retries: Maximum number of retries per request (default: 3)
+        backoff_base: Base delay in seconds for exponential backoff (default: 0.5)
+        backoff_max: Maximum backoff delay in seconds (default: 30)
+        jitter: Randomize delays to avoid synchronized retries (default: True)
+        retry_statuses: Status codes that trigger a retry
+        respect_retry_after: Honor the server's Retry-After header (default: True)
+        max_retry_after: Upper bound for Retry-After delays in seconds (default: 60)
+        budget_ratio: Retries allowed per request, averaged over time (default: 0.2)
+        budget_min_per_second: Retries always allowed per second, even when
+            the ratio budget is exhausted (default: 1.0)
+        on_retry: Optional hook called with a RetryEvent before every retry
+
+    Example:
+        >>> from hyperx import HyperX, RetryPolicy
+        >>> retries = []
+        >>> policy = RetryPolicy(max_retries=5, on_retry=retries.append)
+        >>> db = HyperX(api_key="hx_sk_...", retry=policy)
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = field(default=DEFAULT_RETRY_STATUSES)
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+    budget_ratio: float = 0.2
+    budget_min_per_second: float = 1.0
+    on_retry: Callable[[RetryEvent], None] | None = None
+
+    def should_retry(
+        self,
+        *,
+        idempotent: bool,
+        attempt: int,
+        status_code: int | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """Decide whether a failed attempt may be retried.
+
+        Args:
+            idempotent: Whether the request is safe to repeat
+            attempt: Number of retries already made for this request
+            status_code: Status code of the failed response, if any
+            error: Transport error raised by the attempt, if any
+
+        Returns:
+            True if the request should be retried
+        """
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+                return True
+            return idempotent and isinstance(error, httpx.TransportError)
+        if status_code is None or status_code not in self.retry_statuses:
+            return False
+        return idempotent or status_code == 429
+
+    def compute_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Compute the delay before the given retry.
+
+        Args:
+            attempt: Number of the retry about to be made (1-based)
+            response: Failed response, used for the Retry-After header
+
+        Returns:
+            Delay in seconds
+        """
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        ceiling: float = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, ceiling)
+        return ceiling
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value.
+
+    Supports both delta-seconds ("120") and HTTP-date
+    ("Wed, 21 Oct 2015 07:28:00 GMT") forms.
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """Sliding-window budget limiting retries to a fraction of traffic.
+
+    Over the last ``window`` seconds, retries may not exceed
+    ``ratio * requests + min_per_second * window``. The ratio term bounds
+    the extra load retries add during an outage; the reserve keeps
+    retries possible for low-traffic clients.
+
+    Each HTTP client owns its own budget, even when several clients share
+    one RetryPolicy. The budget is thread-safe.
+
+    Args:
+        ratio: Retries allowed per request
+        min_per_second: Retries always allowed per second
+        window: Length of the sliding window in seconds (default: 10)
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, window: int = 10) -> None:
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._window = window
+        self._lock = threading.Lock()
+        # Per-second buckets of [second, requests, retries]
+        self._buckets: deque[list[int]] = deque()
+        self.retries = 0
+        self.exhausted = 0
+
+    def _bucket(self) -> list[int]:
+        now = int(time.monotonic())
+        while self._buckets and self._buckets[0][0] <= now - self._window:
+            self._buckets.popleft()
+        if not self._buckets or self._buckets[-1][0] != now:
+            self._buckets.append([now, 0, 0])
+        return self._buckets[-1]
+
+    def deposit(self) -> None:
+        """Record a request."""
+        with self._lock:
+            self._bucket()[1] += 1
+
+    def withdraw(self) -> bool:
+        """Try to spend budget for one retry.
+
+        Returns:
+            True if the retry is within budget
+        """
+        with self._lock:
+            bucket = self._bucket()
+            requests = sum(b[1] for b in self._buckets)
+            retries = sum(b[2] for b in self._buckets)
+            allowed = self._ratio * requests + self._min_per_second * self._window
+            if retries + 1 > allowed:
+                self.exhausted += 1
+                return False
+            bucket[2] += 1
+            self.retries += 1
+            return True
@@ -0,0 +1,146 @@
+"""Request coalescing for identical concurrent reads.
+
+When several threads or asyncio tasks issue the same read at the same
+time (agent tools fanning out over the same entity or path query), only
+the first one is sent to the server. The others wait for it and share its
+result or exception.
+
+Only GET requests and read-only POST endpoints (search, paths, query) are
+coalesced. Requests are identical when their method, path, query
+parameters and encoded body match. Merged callers receive the same decoded
+response object, so it must not be mutated in place.
+
+Example:
+    >>> from hyperx import AsyncHyperX, SingleFlight
+    >>> single_flight = SingleFlight()
+    >>> db = AsyncHyperX(api_key="hx_sk_...", single_flight=single_flight)
+    >>> await asyncio.gather(*(db.entities.get("e:react") for _ in range(10)))
+    >>> single_flight.stats.merged
+    9
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for coalesced requests.
+
+    Attributes:
+        executed: Requests actually sent (one per group of identical calls)
+        merged: Calls that were served by another call's in-flight request
+    """
+
+    executed: int = 0
+    merged: int = 0
+
+
+class _Call:
+    """An in-flight synchronous call shared by its followers."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Merges identical in-flight calls into one.
+
+    Works for both threads (``do``) and asyncio tasks (``do_async``). Async
+    calls are only merged with other calls on the same event loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future[Any]] = {}
+        self.stats = SingleFlightStats()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently in flight."""
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless an identical call is in flight, then share its outcome.
+
+        Args:
+            key: Identity of the call
+            fn: Function performing the call
+
+        Returns:
+            The result of ``fn``, possibly from another thread's call
+
+        Raises:
+            Exception: Whatever ``fn`` raised, in every merged caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.stats.merged += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.stats.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = fn()
+            return call.result  # type: ignore[no-any-return]
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async counterpart of ``do``.
+
+        The shared request runs in its own task, so cancelling one caller
+        does not cancel the request for the others.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function performing the call
+
+        Returns:
+            The result of ``fn``, possibly from another task's call
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is not None:
+                self.stats.merged += 1
+            else:
+                task = self._tasks[task_key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda _: self._forget(task_key))
+                self.stats.executed += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, task_key: tuple[asyncio.AbstractEventLoop, Hashable]) -> None:
+        with self._lock:
+            task = self._tasks.pop(task_key, None)
+        # Retrieve the exception so an abandoned task does not log a warning
+        if task is not None and not task.cancelled():
+            task.exception()
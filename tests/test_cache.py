@@ -1,5 +1,6 @@
 """Tests for cache protocol and in-memory backend."""
 
+import threading
 import time
 
 import pytest
@@ -81,7 +82,7 @@ class TestInMemoryCacheBasics:
         cache.set("none_key", None)
         # This should return None and be distinguishable from "not found"
         # We need to use a sentinel or check if key exists
-        assert "none_key" in cache._cache
+        assert "none_key" in cache
 
 
 class TestInMemoryCacheDelete:
@@ -311,7 +312,7 @@ class TestInMemoryCacheEdgeCases:
         assert cache.get("key1") is None
 
         # Entry should be removed from internal cache
-        assert "key1" not in cache._cache
+        assert "key1" not in cache
 
 
 class TestInMemoryCacheInit:
@@ -322,11 +323,84 @@ class TestInMemoryCacheInit:
         cache = InMemoryCache()
         assert cache._max_size == 1000
         assert cache._default_ttl == 300
-        assert len(cache._cache) == 0
+        assert len(cache) == 0
 
     def test_custom_initialization(self):
         """Cache should accept custom initialization parameters."""
         cache = InMemoryCache(max_size=500, ttl=120)
         assert cache._max_size == 500
         assert cache._default_ttl == 120
-        assert len(cache._cache) == 0
+        assert len(cache) == 0
+
+
+class TestInMemoryCacheSharding:
+    """Tests for lock-striped shards and thread safety."""
+
+    def test_shard_capacities_add_up_to_max_size(self):
+        """Shard capacities should add up to max_size."""
+        cache = InMemoryCache(max_size=10, shards=4)
+        assert sorted(shard.max_size for shard in cache._shards) == [2, 2, 3, 3]
+
+    def test_sharded_cache_never_exceeds_max_size(self):
+        """A sharded cache should evict within each shard."""
+        cache = InMemoryCache(max_size=16, shards=4, ttl=3600)
+        for i in range(100):
+            cache.set(f"key{i}", i)
+
+        assert len(cache) <= 16
+        assert cache.get("key99") == 99
+
+    def test_operations_across_shards(self):
+        """get, delete and clear should work regardless of shard."""
+        cache = InMemoryCache(max_size=100, shards=8)
+        for i in range(20):
+            cache.set(f"key{i}", i)
+
+        assert [cache.get(f"key{i}") for i in range(20)] == list(range(20))
+        assert cache.delete("key3") is True
+        assert "key3" not in cache
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_default_shards(self):
+        """The default stripes large caches and keeps small ones strict LRU."""
+        assert len(InMemoryCache()._shards) == 15
+        assert len(InMemoryCache(max_size=100_000)._shards) == 16
+        assert len(InMemoryCache(max_size=100)._shards) == 1
+        assert len(InMemoryCache(max_bytes=64 << 20)._shards) == 16
+        assert len(InMemoryCache(max_bytes=1 << 20)._shards) == 1
+
+    def test_invalid_shards(self):
+        """shards must be between 1 and max_size."""
+        with pytest.raises(ValueError):
+            InMemoryCache(shards=0)
+        with pytest.raises(ValueError):
+            InMemoryCache(max_size=4, shards=8)
+
+    @pytest.mark.parametrize("shards", [1, 8])
+    def test_concurrent_access(self, shards):
+        """Concurrent get/set/delete should not raise or corrupt the LRU."""
+        cache = InMemoryCache(max_size=64, shards=shards, ttl=3600)
+        errors: list[BaseException] = []
+
+        def worker(seed: int) -> None:
+            try:
+                for i in range(2000):
+                    key = f"key{(seed * 7 + i) % 128}"
+                    cache.set(key, i)
+                    cache.get(key)
+                    if i % 5 == 0:
+                        cache.delete(key)
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) <= 64
+        for shard in cache._shards:
+            assert len(shard.entries) <= shard.max_size
@@ -0,0 +1,209 @@
+"""Tests for the AsyncCache protocol, adapters and async Redis backend."""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from hyperx import AsyncHyperX
+from hyperx.cache import AsyncCache, Cache, InMemoryCache, SyncCacheAdapter, as_async_cache
+
+
+def encoded(value):
+    """Compact JSON bytes, as written by every supported codec."""
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class RecordingCache:
+    """Synchronous dict-backed cache that records the threads it is called on."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.threads: set[int] = set()
+
+    def get(self, key: str) -> Any | None:
+        self.threads.add(threading.get_ident())
+        return self.data.get(key)
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.threads.add(threading.get_ident())
+        self.data[key] = value
+
+    def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        self.data.clear()
+
+
+class TestAsyncCacheProtocol:
+    """Tests for protocol conformance and as_async_cache()."""
+
+    def test_in_memory_cache_is_both(self):
+        cache = InMemoryCache()
+        assert isinstance(cache, Cache)
+        assert isinstance(cache, AsyncCache)
+
+    def test_sync_cache_is_not_async(self):
+        assert not isinstance(RecordingCache(), AsyncCache)
+
+    def test_async_cache_returned_unchanged(self):
+        cache = InMemoryCache()
+        assert as_async_cache(cache) is cache
+
+    def test_sync_cache_is_wrapped(self):
+        cache = RecordingCache()
+        adapter = as_async_cache(cache)
+        assert isinstance(adapter, SyncCacheAdapter)
+        assert isinstance(adapter, AsyncCache)
+        assert adapter.cache is cache
+
+
+class TestInMemoryCacheAsync:
+    """Tests for the native async methods of InMemoryCache."""
+
+    async def test_single_key_operations(self):
+        cache = InMemoryCache()
+        await cache.aset("key", {"data": 1})
+        assert await cache.aget("key") == {"data": 1}
+        assert await cache.adelete("key") is True
+        assert await cache.aget("key") is None
+
+    async def test_bulk_operations(self):
+        cache = InMemoryCache()
+        await cache.aset_many({"a": 1, "b": 2})
+        assert await cache.aget_many(["a", "b", "missing"]) == {"a": 1, "b": 2}
+        assert await cache.adelete_many(["a", "missing"]) == 1
+        await cache.aclear()
+        assert len(cache) == 0
+
+
+class TestSyncCacheAdapter:
+    """Tests for running sync caches off the event loop."""
+
+    async def test_calls_run_in_worker_thread(self):
+        cache = RecordingCache()
+        adapter = SyncCacheAdapter(cache)
+
+        await adapter.aset("key", "value")
+        assert await adapter.aget("key") == "value"
+
+        assert threading.get_ident() not in cache.threads
+
+    async def test_bulk_operations(self):
+        adapter = SyncCacheAdapter(RecordingCache())
+        await adapter.aset_many({"a": 1, "b": 2})
+        assert await adapter.aget_many(["a", "c"]) == {"a": 1}
+        assert await adapter.adelete_many(["a", "b", "c"]) == 2
+        assert await adapter.adelete("a") is False
+        await adapter.aclear()
+
+
+class TestAsyncClientCache:
+    """Tests for cache use by AsyncHyperX resources."""
+
+    async def test_sync_cache_is_adapted(self):
+        cache = RecordingCache()
+        mock_http = MagicMock()
+        mock_http.post = AsyncMock(return_value={"paths": []})
+
+        with patch("hyperx.async_client.AsyncHTTPClient", return_value=mock_http):
+            client = AsyncHyperX(api_key="hx_sk_test", cache=cache)
+            await client.paths.find("e:start", "e:end")
+            await client.paths.find("e:start", "e:end")
+
+        assert isinstance(client.paths._cache, SyncCacheAdapter)
+        assert mock_http.post.call_count == 1
+        assert threading.get_ident() not in cache.threads
+
+    async def test_async_cache_is_awaited(self):
+        cache = MagicMock(spec=InMemoryCache)
+        cache.aget = AsyncMock(return_value={"entities": [], "hyperedges": []})
+        mock_http = MagicMock()
+        mock_http.post = AsyncMock()
+
+        with patch("hyperx.async_client.AsyncHTTPClient", return_value=mock_http):
+            client = AsyncHyperX(api_key="hx_sk_test", cache=cache)
+            result = await client.search("react")
+
+        assert result.entities == []
+        cache.aget.assert_awaited_once()
+        mock_http.post.assert_not_called()
+
+
+class TestAsyncRedisCache:
+    """Tests for AsyncRedisCache with a mocked redis.asyncio client."""
+
+    @pytest.fixture
+    def redis_client(self):
+        pytest.importorskip("redis")
+        client = MagicMock()
+        for name in ("get", "setex", "delete", "scan", "mget", "aclose"):
+            setattr(client, name, AsyncMock())
+        with patch("redis.asyncio.from_url", return_value=client):
+            yield client
+
+    @pytest.fixture
+    def cache(self, redis_client):
+        from hyperx.cache import AsyncRedisCache
+
+        return AsyncRedisCache(prefix="app:", ttl=60)
+
+    async def test_get_and_set(self, cache, redis_client):
+        redis_client.get.return_value = encoded({"data": 1})
+
+        await cache.aset("key", {"data": 1})
+        assert await cache.aget("key") == {"data": 1}
+
+        redis_client.setex.assert_awaited_once_with("app:key", 60, encoded({"data": 1}))
+        redis_client.get.assert_awaited_once_with("app:key")
+
+    async def test_get_missing(self, cache, redis_client):
+        redis_client.get.return_value = None
+        assert await cache.aget("key") is None
+
+    async def test_delete(self, cache, redis_client):
+        redis_client.delete.return_value = 1
+        assert await cache.adelete("key") is True
+        redis_client.delete.assert_awaited_once_with("app:key")
+
+    async def test_clear_scans_prefix(self, cache, redis_client):
+        redis_client.scan.side_effect = [(5, [b"app:a"]), (0, [b"app:b"])]
+
+        await cache.aclear()
+
+        assert redis_client.scan.await_count == 2
+        assert redis_client.scan.await_args.kwargs["match"] == "app:*"
+        assert redis_client.delete.await_count == 2
+
+    async def test_get_many_uses_mget(self, cache, redis_client):
+        redis_client.mget.return_value = [encoded(1), None]
+
+        assert await cache.aget_many(["a", "b"]) == {"a": 1}
+        redis_client.mget.assert_awaited_once_with(["app:a", "app:b"])
+
+    async def test_set_many_uses_pipeline(self, cache, redis_client):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        redis_client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        redis_client.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        await cache.aset_many({"a": 1, "b": 2}, ttl=10)
+
+        assert pipe.setex.call_count == 2
+        pipe.setex.assert_any_call("app:a", 10, encoded(1))
+        pipe.execute.assert_awaited_once()
+
+    async def test_delete_many(self, cache, redis_client):
+        redis_client.delete.return_value = 2
+        assert await cache.adelete_many(["a", "b", "c"]) == 2
+        redis_client.delete.assert_awaited_once_with("app:a", "app:b", "app:c")
+        assert await cache.adelete_many([]) == 0
+
+    async def test_aclose(self, cache, redis_client):
+        await cache.aclose()
+        redis_client.aclose.assert_awaited_once()
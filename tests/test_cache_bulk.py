@@ -0,0 +1,223 @@
+"""Tests for bulk cache operations and multi-query search."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from hyperx import AsyncHyperX, HyperX
+from hyperx.cache import (
+    BulkCache,
+    Cache,
+    InMemoryCache,
+    delete_many,
+    get_many,
+    set_many,
+)
+
+
+def encoded(value):
+    """Compact JSON bytes, as written by every supported codec."""
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class DictCache:
+    """Minimal four-method cache without bulk support."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.calls = 0
+
+    def get(self, key: str) -> Any | None:
+        self.calls += 1
+        return self.data.get(key)
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.calls += 1
+        self.data[key] = value
+
+    def delete(self, key: str) -> bool:
+        self.calls += 1
+        return self.data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        self.data.clear()
+
+
+class CountingCache(InMemoryCache):
+    """InMemoryCache that counts single-key and bulk calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.single = 0
+        self.bulk = 0
+
+    def get(self, key: str) -> Any | None:
+        self.single += 1
+        return super().get(key)
+
+    def get_many(self, keys):
+        self.bulk += 1
+        return super().get_many(keys)
+
+    def set_many(self, items, ttl=None):
+        self.bulk += 1
+        super().set_many(items, ttl)
+
+
+class TestBulkProtocol:
+    """Tests for BulkCache and the fallback helpers."""
+
+    def test_plain_cache_is_not_bulk(self):
+        cache = DictCache()
+        assert isinstance(cache, Cache)
+        assert not isinstance(cache, BulkCache)
+        assert isinstance(InMemoryCache(), BulkCache)
+
+    def test_helpers_fall_back_to_single_calls(self):
+        cache = DictCache()
+        set_many(cache, {"a": 1, "b": 2})
+        assert get_many(cache, ["a", "b", "c"]) == {"a": 1, "b": 2}
+        assert delete_many(cache, ["a", "c"]) == 1
+        assert cache.calls == 7
+
+
+class TestInMemoryCacheBulk:
+    """Tests for native InMemoryCache bulk operations."""
+
+    @pytest.mark.parametrize("shards", [1, 4])
+    def test_round_trip(self, shards):
+        cache = InMemoryCache(max_size=100, shards=shards)
+        cache.set_many({f"k{i}": i for i in range(20)})
+
+        assert cache.get_many(["k0", "k19", "missing"]) == {"k0": 0, "k19": 19}
+        assert cache.delete_many(["k0", "k1", "missing"]) == 2
+        assert len(cache) == 18
+
+    def test_expired_entries_are_dropped(self):
+        cache = InMemoryCache()
+        with patch("hyperx.cache.memory.time.time", return_value=1000.0):
+            cache.set_many({"a": 1}, ttl=10)
+        with patch("hyperx.cache.memory.time.time", return_value=1011.0):
+            assert cache.get_many(["a"]) == {}
+        assert "a" not in cache
+
+    def test_set_many_respects_max_size(self):
+        cache = InMemoryCache(max_size=3)
+        cache.set_many({f"k{i}": i for i in range(5)})
+        assert len(cache) == 3
+        assert cache.get_many(["k0", "k4"]) == {"k4": 4}
+
+
+class TestRedisCacheBulk:
+    """Tests for RedisCache MGET, pipelined SETEX and multi-key DEL."""
+
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip("redis")
+        client = MagicMock()
+        with patch("redis.from_url", return_value=client):
+            yield client
+
+    @pytest.fixture
+    def cache(self, client):
+        from hyperx.cache import RedisCache
+
+        return RedisCache(prefix="app:", ttl=60)
+
+    def test_get_many_uses_mget(self, cache, client):
+        client.mget.return_value = [encoded(1), None]
+        assert cache.get_many(["a", "b"]) == {"a": 1}
+        client.mget.assert_called_once_with(["app:a", "app:b"])
+        client.get.assert_not_called()
+
+    def test_set_many_uses_pipeline(self, cache, client):
+        pipe = client.pipeline.return_value.__enter__.return_value
+
+        cache.set_many({"a": 1, "b": 2})
+
+        client.pipeline.assert_called_once_with(transaction=False)
+        pipe.setex.assert_any_call("app:a", 60, encoded(1))
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_called_once()
+
+    def test_delete_many(self, cache, client):
+        client.delete.return_value = 1
+        assert cache.delete_many(["a", "b"]) == 1
+        client.delete.assert_called_once_with("app:a", "app:b")
+
+    def test_empty_inputs_skip_redis(self, cache, client):
+        assert cache.get_many([]) == {}
+        cache.set_many({})
+        assert cache.delete_many([]) == 0
+        client.mget.assert_not_called()
+        client.pipeline.assert_not_called()
+        client.delete.assert_not_called()
+
+
+def search_response(path: str, json: dict[str, Any], **kwargs: Any) -> bytes:
+    """Raw body of a search response with one entity named after the query."""
+    name = json["query"]
+    return encoded(
+        {
+            "entities": [
+                {
+                    "id": f"e:{name}",
+                    "name": name,
+                    "entity_type": "concept",
+                    "attributes": {},
+                    "created_at": "2026-01-01T00:00:00Z",
+                    "updated_at": "2026-01-01T00:00:00Z",
+                }
+            ],
+            "hyperedges": [],
+        }
+    )
+
+
+class TestSearchMany:
+    """Tests for SearchAPI.many and AsyncSearchAPI.many."""
+
+    def test_one_bulk_read_and_write(self):
+        cache = CountingCache()
+        mock_http = MagicMock()
+        mock_http.post.side_effect = search_response
+
+        with patch("hyperx.client.HTTPClient", return_value=mock_http):
+            client = HyperX(api_key="hx_sk_test", cache=cache)
+            client.search("react")
+            cache.bulk = cache.single = 0
+
+            results = client.search.many(["react", "redux", "react"])
+
+        assert [r.entities[0].name for r in results] == ["react", "redux", "react"]
+        assert mock_http.post.call_count == 2  # Only "redux" was a miss
+        assert (cache.bulk, cache.single) == (2, 0)
+
+    def test_without_cache(self):
+        mock_http = MagicMock()
+        mock_http.post.side_effect = search_response
+
+        with patch("hyperx.client.HTTPClient", return_value=mock_http):
+            client = HyperX(api_key="hx_sk_test")
+            results = client.search.many(["a", "b"])
+
+        assert [r.entities[0].name for r in results] == ["a", "b"]
+
+    async def test_async_misses_fetched_concurrently(self):
+        cache = CountingCache()
+        mock_http = MagicMock()
+        mock_http.post = AsyncMock(side_effect=search_response)
+
+        with patch("hyperx.async_client.AsyncHTTPClient", return_value=mock_http):
+            client = AsyncHyperX(api_key="hx_sk_test", cache=cache)
+            first = await client.search.many(["a", "b"])
+            second = await client.search.many(["b", "a"])
+
+        assert [r.entities[0].name for r in first] == ["a", "b"]
+        assert [r.entities[0].name for r in second] == ["b", "a"]
+        assert mock_http.post.await_count == 2
+        assert cache.single == 0
@@ -0,0 +1,215 @@
+"""Tests for the SQLite-backed DiskCache."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hyperx import HyperX
+from hyperx.cache import BulkCache, Cache, DiskCache
+
+PATHS = {"paths": [{"hyperedges": ["h:1"], "bridges": [["e:a", "e:b"]], "cost": 1.0}]}
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / "hyperx.db"
+
+
+@pytest.fixture
+def cache(db_path: Path):
+    cache = DiskCache(db_path, ttl=60)
+    yield cache
+    cache.close()
+
+
+def write_keys(path: str, worker: int) -> None:
+    """Process entry point: write 50 keys and read them back."""
+    cache = DiskCache(path, ttl=60)
+    for i in range(50):
+        cache.set(f"w{worker}:{i}", {"worker": worker, "i": i})
+    assert cache.get(f"w{worker}:0") == {"worker": worker, "i": 0}
+    cache.close()
+
+
+class TestDiskCache:
+    """Tests for single-key operations."""
+
+    def test_protocols(self, cache):
+        assert isinstance(cache, Cache)
+        assert isinstance(cache, BulkCache)
+
+    def test_creates_parent_directories(self, cache, db_path):
+        assert db_path.exists()
+
+    def test_set_get_delete(self, cache):
+        cache.set("key", {"data": 123})
+        assert cache.get("key") == {"data": 123}
+        assert "key" in cache
+        assert cache.delete("key")
+        assert not cache.delete("key")
+        assert cache.get("key") is None
+
+    def test_bytes_values(self, cache):
+        cache.set("paths:k", b'{"paths":[]}')
+        assert cache.get("paths:k") == b'{"paths":[]}'
+
+    def test_overwrite(self, cache):
+        cache.set("key", "a")
+        cache.set("key", "bb")
+        assert cache.get("key") == "bb"
+        assert len(cache) == 1
+
+    def test_ttl(self, cache):
+        with patch("hyperx.cache.disk.time.time", return_value=1000.0):
+            cache.set("key", "value", ttl=10)
+        with patch("hyperx.cache.disk.time.time", return_value=1005.0):
+            assert cache.get("key") == "value"
+        with patch("hyperx.cache.disk.time.time", return_value=1011.0):
+            assert cache.get("key") is None
+        assert "key" not in cache
+
+    def test_clear(self, cache):
+        cache.set_many({"a": 1, "b": 2})
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_survives_restart(self, db_path):
+        first = DiskCache(db_path)
+        first.set("paths:k", b"body")
+        first.close()
+
+        second = DiskCache(db_path)
+        assert second.get("paths:k") == b"body"
+        second.close()
+
+    def test_wal_mode(self, cache):
+        assert cache._conn().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_invalid_limits(self, db_path):
+        with pytest.raises(ValueError):
+            DiskCache(db_path, max_size=0)
+        with pytest.raises(ValueError):
+            DiskCache(db_path, max_bytes=0)
+
+
+class TestEviction:
+    """Tests for LRU and size-bounded eviction."""
+
+    def test_max_size_evicts_least_recently_used(self, db_path):
+        cache = DiskCache(db_path, max_size=3)
+        for i, key in enumerate("abc"):
+            with patch("hyperx.cache.disk.time.time", return_value=1000.0 + 10 * i):
+                cache.set(key, i)
+        with patch("hyperx.cache.disk.time.time", return_value=1100.0):
+            cache.get("a")
+            cache.set("d", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 3
+        cache.close()
+
+    def test_expired_entries_evicted_first(self, db_path):
+        cache = DiskCache(db_path, max_size=2)
+        with patch("hyperx.cache.disk.time.time", return_value=1000.0):
+            cache.set("old", 1, ttl=1)
+            cache.set("recent", 2, ttl=1000)
+        with patch("hyperx.cache.disk.time.time", return_value=1500.0):
+            cache.set("new", 3)
+
+        assert "old" not in cache
+        assert "recent" in cache
+        cache.close()
+
+    def test_max_bytes(self, db_path):
+        cache = DiskCache(db_path, max_bytes=3000, stats=True)
+        for i in range(5):
+            with patch("hyperx.cache.disk.time.time", return_value=1000.0 + i * 10):
+                cache.set(f"paths:{i}", b"x" * 999)
+
+        assert len(cache) == 3
+        assert cache.stats.snapshot()["bytes"] <= 3000
+        assert cache.stats.by_prefix()["paths"].evictions == {"size": 2}
+        cache.close()
+
+
+class TestBulk:
+    """Tests for the bulk operations."""
+
+    def test_round_trip(self, cache):
+        cache.set_many({f"k{i}": i for i in range(1200)})
+        found = cache.get_many([f"k{i}" for i in range(0, 1200, 2)] + ["missing"])
+
+        assert len(found) == 600
+        assert found["k10"] == 10
+        assert cache.delete_many([f"k{i}" for i in range(1000)] + ["missing"]) == 1000
+        assert len(cache) == 200
+
+    def test_duplicate_keys(self, cache):
+        cache.set("a", 1)
+        assert cache.get_many(["a", "a"]) == {"a": 1}
+        assert cache.delete_many(["a", "a"]) == 1
+
+
+class TestConcurrency:
+    """Tests for access from several threads and processes."""
+
+    def test_threads(self, cache):
+        errors: list[Exception] = []
+
+        def work(n: int) -> None:
+            try:
+                for i in range(50):
+                    cache.set(f"t{n}:{i}", i)
+                    cache.get(f"t{n}:{i}")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache) == 400
+
+    def test_processes(self, db_path):
+        DiskCache(db_path).close()
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=write_keys, args=(str(db_path), n)) for n in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+
+        assert [worker.exitcode for worker in workers] == [0, 0, 0, 0]
+        cache = DiskCache(db_path)
+        assert len(cache) == 200
+        assert cache.get("w3:49") == {"worker": 3, "i": 49}
+        cache.close()
+
+
+class TestClient:
+    """Tests for DiskCache as a client cache."""
+
+    def test_paths_cached_across_clients(self, db_path):
+        mock_http = MagicMock()
+        mock_http.post.return_value = json.dumps(PATHS).encode()
+
+        with patch("hyperx.client.HTTPClient", return_value=mock_http):
+            first = HyperX(api_key="hx_sk_test", cache=DiskCache(db_path))
+            first.paths.find("e:a", "e:b")
+            second = HyperX(api_key="hx_sk_test", cache=DiskCache(db_path))
+            paths = second.paths.find("e:a", "e:b")
+
+        assert mock_http.post.call_count == 1
+        assert paths[0].hyperedges == ["h:1"]
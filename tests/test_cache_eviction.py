@@ -0,0 +1,144 @@
+"""Tests for byte-bounded eviction and TinyLFU admission in InMemoryCache."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from hyperx.cache import InMemoryCache
+from hyperx.cache.memory import estimate_size
+
+
+class TestEstimateSize:
+    """Tests for estimate_size."""
+
+    def test_bytes_use_getsizeof(self):
+        assert estimate_size(b"x" * 1000) == sys.getsizeof(b"x" * 1000)
+
+    def test_containers_include_items(self):
+        value = {"entities": [{"name": "x" * 1000}]}
+        assert estimate_size(value) > 1000
+        assert estimate_size(value) > estimate_size({"entities": []})
+
+    def test_shared_objects_counted_once(self):
+        item = "y" * 1000
+        assert estimate_size([item, item]) < 2 * sys.getsizeof(item)
+
+    def test_cycles(self):
+        value: list = []
+        value.append(value)
+        assert estimate_size(value) == sys.getsizeof(value)
+
+
+class TestMaxBytes:
+    """Tests for InMemoryCache(max_bytes=...)."""
+
+    def test_invalid_max_bytes(self):
+        with pytest.raises(ValueError):
+            InMemoryCache(max_bytes=0)
+
+    def test_evicts_by_size(self):
+        cache = InMemoryCache(max_size=1000, max_bytes=5000)
+        cache.set("small", b"x" * 100)
+        cache.set("large", b"x" * 4000)
+        cache.set("other", b"x" * 1500)
+
+        assert "small" not in cache
+        assert "large" not in cache
+        assert cache.get("other") is not None
+
+    def test_many_small_entries_exceed_max_size(self):
+        cache = InMemoryCache(max_size=10, max_bytes=100_000)
+        for i in range(100):
+            cache.set(f"k{i}", b"x" * 10)
+        assert len(cache) == 100
+
+    def test_value_larger_than_budget_not_stored(self):
+        cache = InMemoryCache(max_bytes=1000)
+        cache.set("key", b"small")
+        cache.set("key", b"x" * 2000)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_update_replaces_size(self):
+        cache = InMemoryCache(max_bytes=3000)
+        cache.set("a", b"x" * 2000)
+        cache.set("a", b"x" * 10)
+        cache.set("b", b"x" * 2000)
+
+        assert cache.get("a") == b"x" * 10
+        assert cache.get("b") is not None
+
+    def test_budget_split_across_shards(self):
+        cache = InMemoryCache(max_size=100, shards=4, max_bytes=10_001)
+        assert sorted(shard.max_size for shard in cache._shards) == [2500, 2500, 2500, 2501]
+
+
+class TestTinyLFU:
+    """Tests for InMemoryCache(admission="tinylfu")."""
+
+    def test_invalid_admission(self):
+        with pytest.raises(ValueError):
+            InMemoryCache(admission="lfu")  # type: ignore[arg-type]
+
+    def test_basic_operations(self):
+        cache = InMemoryCache(max_size=100, admission="tinylfu")
+        cache.set("a", 1)
+        cache.set_many({"b": 2, "c": 3})
+
+        assert cache.get("a") == 1
+        assert cache.get_many(["b", "c", "d"]) == {"b": 2, "c": 3}
+        assert cache.delete("a")
+        assert cache.delete_many(["b", "missing"]) == 1
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_respects_max_size(self):
+        cache = InMemoryCache(max_size=50, admission="tinylfu")
+        for i in range(500):
+            cache.set(f"k{i}", i)
+        assert len(cache) == 50
+
+    def test_scan_does_not_flush_hot_keys(self):
+        hot = [f"hot{i}" for i in range(80)]
+        lru = InMemoryCache(max_size=100, ttl=3600)
+        lfu = InMemoryCache(max_size=100, ttl=3600, admission="tinylfu")
+
+        for cache in (lru, lfu):
+            for _ in range(5):
+                for key in hot:
+                    if cache.get(key) is None:
+                        cache.set(key, key)
+            for i in range(1000):
+                cache.set(f"scan{i}", i)
+
+        assert sum(key in lru for key in hot) == 0
+        assert sum(key in lfu for key in hot) >= 72  # Sketch counts are approximate
+
+    def test_frequent_new_key_is_admitted(self):
+        cache = InMemoryCache(max_size=100, ttl=3600, admission="tinylfu")
+        for i in range(100):
+            cache.set(f"k{i}", i)
+
+        for _ in range(5):
+            cache.get("popular")
+        cache.set("popular", "value")
+        cache.set("filler", 0)  # Pushes "popular" out of the window
+
+        assert cache.get("popular") == "value"
+
+    def test_expired_entries(self):
+        cache = InMemoryCache(max_size=100, ttl=-1, admission="tinylfu")
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+    def test_with_max_bytes(self):
+        cache = InMemoryCache(max_bytes=20_000, admission="tinylfu")
+        for i in range(100):
+            cache.set(f"k{i}", b"x" * 1000)
+        assert sum(shard.weight for shard in cache._shards) <= 20_000
+        assert 0 < len(cache) <= 20
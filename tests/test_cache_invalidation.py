@@ -0,0 +1,336 @@
+"""Tests for dependency-tracked cache invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timezone
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX, InMemoryCache
+from hyperx.batch import EntityCreate, EntityDelete, HyperedgeCreate
+from hyperx.cache import AsyncCacheInvalidator, CacheInvalidator, as_async_cache
+from hyperx.cache.invalidation import (
+    DependencyIndex,
+    event_dependencies,
+    member_ids,
+    path_dependencies,
+    search_dependencies,
+)
+from hyperx.events import Event
+from hyperx.exceptions import NotFoundError
+from hyperx.resources.hyperedges import MemberInput
+from hyperx.resources.paths import paths_result
+from hyperx.resources.search import search_result
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+TIMESTAMPS = {"created_at": "2026-01-15T00:00:00Z", "updated_at": "2026-01-15T00:00:00Z"}
+ENTITY = {"id": "e:react", "name": "React", "entity_type": "library", **TIMESTAMPS}
+HYPEREDGE = {
+    "id": "h:1",
+    "description": "React provides Hooks",
+    "members": [
+        {"entity_id": "e:react", "role": "subject"},
+        {"entity_id": "e:hooks", "role": "object"},
+    ],
+    **TIMESTAMPS,
+}
+SEARCH = {"entities": [ENTITY], "hyperedges": [HYPEREDGE]}
+PATHS = {"paths": [{"hyperedges": ["h:1", "h:2"], "bridges": [["e:x"]], "cost": 2.0}]}
+
+
+def event(type: str, data: dict) -> Event:
+    return Event(type=type, data=data, timestamp=datetime(2026, 1, 16, tzinfo=timezone.utc))
+
+
+@pytest.fixture
+def db():
+    client = HyperX(
+        api_key=TEST_API_KEY,
+        base_url=TEST_BASE_URL,
+        cache=InMemoryCache(),
+        cache_invalidation=True,
+    )
+    yield client
+    client.close()
+
+
+class TestDependencies:
+    """Tests for extracting the IDs a result or change depends on."""
+
+    def test_path_dependencies(self):
+        paths = paths_result(json.dumps(PATHS).encode())
+        assert path_dependencies("e:a", "e:b", paths) == {"e:a", "e:b", "h:1", "h:2", "e:x"}
+
+    def test_search_dependencies(self):
+        result = search_result(json.dumps(SEARCH).encode())
+        assert search_dependencies(result) == {"e:react", "h:1", "e:hooks"}
+
+    def test_member_ids(self):
+        members = [{"entity_id": "e:a", "role": "subject"}, MemberInput("e:b", "object")]
+        assert member_ids(members) == {"e:a", "e:b"}
+        assert member_ids(None) == set()
+
+    def test_event_dependencies(self):
+        assert event_dependencies(event("entity.updated", ENTITY)) == {"e:react"}
+        assert event_dependencies(event("hyperedge.created", HYPEREDGE)) == {
+            "h:1",
+            "e:react",
+            "e:hooks",
+        }
+        assert event_dependencies(event("path.discovered", {"id": "p:1"})) == set()
+
+
+class TestDependencyIndex:
+    """Tests for the key <-> ID index."""
+
+    def test_track_and_pop(self):
+        index = DependencyIndex()
+        index.track("paths:1", ["e:a", "h:1"])
+        index.track("paths:2", ["e:b", "h:1"])
+
+        assert sorted(index.pop(["h:1"])) == ["paths:1", "paths:2"]
+        assert len(index) == 0
+        assert index.pop(["e:a"]) == []
+
+    def test_track_replaces_ids(self):
+        index = DependencyIndex()
+        index.track("paths:1", ["e:a"])
+        index.track("paths:1", ["e:b"])
+
+        assert index.pop(["e:a"]) == []
+        assert index.pop(["e:b"]) == ["paths:1"]
+
+    def test_max_keys_drops_oldest(self):
+        index = DependencyIndex(max_keys=2)
+        for i in range(3):
+            index.track(f"paths:{i}", [f"e:{i}"])
+
+        assert "paths:0" not in index
+        assert len(index) == 2
+        assert index._ids.keys() == {"e:1", "e:2"}
+
+    def test_invalid_max_keys(self):
+        with pytest.raises(ValueError):
+            DependencyIndex(max_keys=0)
+
+
+class TestLocalWrites:
+    """Tests for invalidation by writes made through the client."""
+
+    def test_disabled_by_default(self):
+        with HyperX(api_key=TEST_API_KEY, cache=InMemoryCache()) as db:
+            assert db.cache_invalidator is None
+        with HyperX(api_key=TEST_API_KEY, cache_invalidation=True) as db:
+            assert db.cache_invalidator is None  # Nothing to invalidate
+
+    def test_entity_update_invalidates_paths(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/paths", json=PATHS, is_reusable=True)
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/entities/e:x", json=ENTITY)
+
+        db.paths.find("e:a", "e:b")
+        db.paths.find("e:a", "e:b")
+        db.entities.update("e:x", name="X")
+        db.paths.find("e:a", "e:b")
+
+        assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/v1/paths")) == 2
+        assert db.cache_invalidator.stats.keys_invalidated == 1
+
+    def test_unrelated_write_keeps_entry(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/paths", json=PATHS)
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/entities/e:other", json=ENTITY)
+
+        db.paths.find("e:a", "e:b")
+        db.entities.delete("e:other")
+        db.paths.find("e:a", "e:b")
+
+        assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/v1/paths")) == 1
+
+    def test_hyperedge_delete_invalidates_search(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/search", json=SEARCH, is_reusable=True)
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/hyperedges/h:1", method="DELETE")
+
+        db.search("react")
+        db.hyperedges.delete("h:1")
+        db.search("react")
+
+        assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/v1/search")) == 2
+
+    def test_hyperedge_create_invalidates_member_results(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/paths", json=PATHS, is_reusable=True)
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/hyperedges", json=HYPEREDGE)
+
+        db.paths.find("e:a", "e:b")
+        db.hyperedges.create(
+            "A uses C", [{"entity_id": "e:a", "role": "subject"}, MemberInput("e:c", "object")]
+        )
+        db.paths.find("e:a", "e:b")
+
+        assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/v1/paths")) == 2
+
+    def test_search_many_tracks_each_query(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/search", json=SEARCH, is_reusable=True)
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/entities/e:hooks", method="DELETE")
+
+        db.search.many(["react", "hooks"])
+        assert len(db.cache_invalidator.index) == 2
+        db.entities.delete("e:hooks")
+        assert len(db.cache_invalidator.index) == 0
+
+    def test_batch_invalidates(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/paths", json=PATHS, is_reusable=True)
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/batch",
+            json={"success": True, "total": 2, "succeeded": 2, "failed": 0, "results": []},
+        )
+
+        db.paths.find("e:a", "e:b")
+        db.batch.execute(
+            [
+                EntityCreate(name="New", entity_type="concept"),
+                HyperedgeCreate(description="d", members=[{"entity_id": "e:x", "role": "r"}]),
+                EntityDelete(entity_id="e:gone"),
+            ]
+        )
+        db.paths.find("e:a", "e:b")
+
+        assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/v1/paths")) == 2
+
+    def test_failed_write_does_not_invalidate(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/paths", json=PATHS)
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/entities/e:x", status_code=404, json={"error": "x"}
+        )
+
+        db.paths.find("e:a", "e:b")
+        with pytest.raises(NotFoundError):
+            db.entities.update("e:x", name="X")
+
+        assert len(db.cache_invalidator.index) == 1
+
+    def test_hit_from_another_client_is_tracked(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/paths", json=PATHS)
+        cache = InMemoryCache()
+        first = HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, cache=cache)
+        second = HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, cache=cache, cache_invalidation=True
+        )
+
+        first.paths.find("e:a", "e:b")
+        second.paths.find("e:a", "e:b")
+
+        assert second.cache_invalidator.invalidate(["h:2"]) == 1
+        assert len(cache) == 0
+
+
+class FakeEvents:
+    """EventsAPI stand-in whose first stream fails and second yields events."""
+
+    def __init__(self, events: list[Event]):
+        self.events = events
+        self.calls: list[datetime | None] = []
+        self.done = threading.Event()
+
+    def stream(self, event_types=None, *, since=None) -> Iterator[Event]:
+        self.calls.append(since)
+        if len(self.calls) == 1:
+            yield self.events[0]
+            raise ConnectionError("dropped")
+        yield from self.events[1:]
+        self.done.set()
+
+
+class TestEventStream:
+    """Tests for invalidation by events from other clients."""
+
+    def test_handle_event(self):
+        cache = InMemoryCache()
+        cache.set("search_text:abc:10", b"{}")
+        invalidator = CacheInvalidator(cache)
+        invalidator.track("search_text:abc:10", ["e:react"])
+
+        assert invalidator.handle_event(event("path.discovered", {"id": "e:react"})) == 0
+        assert invalidator.handle_event(event("entity.deleted", {"id": "e:react"})) == 1
+        assert cache.get("search_text:abc:10") is None
+        assert invalidator.stats.events == 1
+
+    def test_listen_reconnects_since_last_event(self):
+        cache = InMemoryCache()
+        invalidator = CacheInvalidator(cache)
+        for key in ("paths:1", "paths:2"):
+            cache.set(key, b"{}")
+        invalidator.track("paths:1", ["e:a"])
+        invalidator.track("paths:2", ["h:2"])
+        events = FakeEvents(
+            [event("entity.updated", {"id": "e:a"}), event("hyperedge.deleted", {"id": "h:2"})]
+        )
+
+        invalidator.listen(events, reconnect_delay=0.01)
+        assert events.done.wait(5)
+        invalidator.close()
+
+        assert len(cache) == 0
+        assert events.calls == [None, events.events[0].timestamp]
+        assert invalidator.stats.stream_errors == 1
+
+
+class TestAsync:
+    """Tests for AsyncHyperX(cache_invalidation=True)."""
+
+    async def test_entity_delete_invalidates_paths(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/paths", json=PATHS, is_reusable=True)
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/entities/e:x", method="DELETE")
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            cache=InMemoryCache(),
+            cache_invalidation=True,
+        ) as db:
+            await db.paths.find("e:a", "e:b")
+            await db.paths.find("e:a", "e:b")
+            await db.entities.delete("e:x")
+            await db.paths.find("e:a", "e:b")
+
+        assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/v1/paths")) == 2
+
+    async def test_search_and_hyperedge_update(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/search", json=SEARCH, is_reusable=True)
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/hyperedges/h:1", json=HYPEREDGE)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            cache=InMemoryCache(),
+            cache_invalidation=True,
+        ) as db:
+            await db.search.many(["react"])
+            await db.hyperedges.update("h:1", description="changed")
+            await db.search("react")
+
+        assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/v1/search")) == 2
+
+    async def test_listen(self):
+        cache = InMemoryCache()
+        cache.set("paths:1", b"{}")
+        invalidator = AsyncCacheInvalidator(as_async_cache(cache))
+        invalidator.track("paths:1", ["e:a"])
+        received = asyncio.Event()
+
+        class Events:
+            async def stream(self, event_types=None, *, since=None) -> AsyncIterator[Event]:
+                yield event("entity.deleted", {"id": "e:a"})
+                received.set()
+                await asyncio.sleep(3600)
+
+        invalidator.listen(Events())  # type: ignore[arg-type]
+        await asyncio.wait_for(received.wait(), 5)
+        invalidator.close()
+
+        assert cache.get("paths:1") is None
@@ -0,0 +1,171 @@
+"""Tests for canonical, versioned cache keys."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX, InMemoryCache
+from hyperx.cache import KEY_VERSION, query_key, request_key
+from hyperx.cache.keys import normalize_text
+from hyperx.query import Query
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+EMPTY = {"entities": [], "hyperedges": []}
+PATHS = {"paths": [{"hyperedges": ["h:1"], "bridges": [], "cost": 1.0}]}
+
+
+@pytest.fixture
+def db():
+    db = HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, cache=InMemoryCache())
+    yield db
+    db.close()
+
+
+class TestRequestKey:
+    """Tests for request_key() and normalization."""
+
+    def test_format(self):
+        key = request_key("search_text", {"query": "react", "limit": 10})
+        prefix, version, digest = key.split(":")
+        assert prefix == "search_text"
+        assert version == f"v{KEY_VERSION}"
+        assert len(digest) == 32
+
+    def test_dict_order_ignored(self):
+        first = request_key("search_hybrid", {"role_filter": {"a": "1", "b": "2"}, "limit": 5})
+        second = request_key("search_hybrid", {"limit": 5, "role_filter": {"b": "2", "a": "1"}})
+        assert first == second
+
+    def test_every_parameter_counts(self):
+        base = {"query": "react", "limit": 10}
+        assert request_key("search_hybrid", base) != request_key(
+            "search_hybrid", {**base, "role_filter": {"subject": "e:react"}}
+        )
+        assert request_key("search_hybrid", base) != request_key("search_text", base)
+
+    def test_datetimes_compared_in_utc(self):
+        utc = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+        cet = utc.astimezone(timezone(timedelta(hours=1)))
+        assert request_key("query", {"as_of": utc}) == request_key("query", {"as_of": cet})
+
+    def test_unsupported_value(self):
+        with pytest.raises(TypeError):
+            request_key("query", {"value": object()})
+
+    def test_normalize_text(self):
+        assert normalize_text("  React \n Hooks ") == "React Hooks"
+        assert normalize_text("React  Hooks", fold_case=True) == "react hooks"
+
+
+class TestQueryKey:
+    """Tests for query_key()."""
+
+    def test_filter_order_ignored(self):
+        first = Query().where(role="subject", entity="e:a").where(role="object", entity="e:b")
+        second = Query().where(role="object", entity="e:b").where(role="subject", entity="e:a")
+        assert query_key(first) == query_key(second)
+
+    def test_and_or_filters_differ(self):
+        first = Query().where(role="subject", entity="e:a")
+        second = Query().or_where(role="subject", entity="e:a")
+        assert query_key(first) != query_key(second)
+
+    def test_as_of(self):
+        utc = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+        cet = utc.astimezone(timezone(timedelta(hours=1)))
+        assert query_key(Query().temporal(utc)) == query_key(Query().temporal(cet))
+        assert query_key(Query().temporal(utc)) != query_key(Query())
+        assert query_key(Query().temporal(utc)) != query_key(
+            Query().temporal(utc + timedelta(days=1))
+        )
+
+    def test_limit_and_offset(self):
+        assert query_key(Query().limit(10)) != query_key(Query().limit(20))
+        assert query_key(Query().offset(10)) != query_key(Query())
+
+
+class TestClientKeys:
+    """Tests for the keys used by cached endpoints."""
+
+    def test_role_filter_cached_separately(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/search", json=EMPTY, is_reusable=True)
+
+        db.search("react")
+        db.search("react", role_filter={"subject": "e:react"})
+        db.search("react", role_filter={"subject": "e:react"})
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_hybrid_whitespace_normalized(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/search", json=EMPTY, is_reusable=True)
+
+        db.search("react hooks")
+        db.search("  react   hooks ")
+        db.search("React Hooks")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_text_case_folded(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/search/text", json=EMPTY, is_reusable=True)
+
+        db.search.text("React Hooks")
+        db.search.text("react  hooks")
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_vector_role_filter(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/search/vector", json=EMPTY, is_reusable=True
+        )
+
+        db.search.vector([0.1, 0.2])
+        db.search.vector([0.1, 0.2], role_filter={"subject_type": "library"})
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_paths_cache_hint_ignored(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/paths", json=PATHS, is_reusable=True)
+
+        db.paths.find("e:a", "e:b")
+        db.paths.find("e:a", "e:b", cache_hint="long")
+        db.paths.find("e:b", "e:a")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_key_prefixes(self, db):
+        assert db.paths._cache_key({"from": "e:a"}).startswith("paths:v1:")
+        assert db.search._cache_key("search_text", {"query": "x"}).startswith("search_text:v1:")
+
+    def test_query_cached(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/query", json=EMPTY, is_reusable=True)
+
+        db.query(Query().where(role="subject", entity="e:a").limit(5)).execute()
+        db.query(Query().limit(5).where(role="subject", entity="e:a")).execute()
+        db.query(Query().where(role="subject", entity="e:a").limit(5)).execute(cache=False)
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_query_uncached_without_cache(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/query", json=EMPTY, is_reusable=True)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            db.query(Query()).execute()
+            db.query(Query()).execute()
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_async_query_cached(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/query", json=EMPTY)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, cache=InMemoryCache()
+        ) as db:
+            await db.query(Query().text("react")).execute()
+            await db.query(Query().text("react")).execute()
+
+        assert len(httpx_mock.get_requests()) == 1
@@ -0,0 +1,306 @@
+"""Tests for the read-through entity and hyperedge cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX, InMemoryCache, ObjectCachePolicy
+from hyperx.batch import EntityDelete
+from hyperx.cache import ObjectCache
+from hyperx.events import Event
+from hyperx.exceptions import NotFoundError
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+TIMESTAMPS = {"created_at": "2026-01-15T00:00:00Z", "updated_at": "2026-01-15T00:00:00Z"}
+ENTITY = {"id": "e:react", "name": "React", "entity_type": "library", **TIMESTAMPS}
+HYPEREDGE = {
+    "id": "h:1",
+    "description": "React provides Hooks",
+    "members": [
+        {"entity_id": "e:react", "role": "subject"},
+        {"entity_id": "e:hooks", "role": "object"},
+    ],
+    **TIMESTAMPS,
+}
+ENTITY_URL = f"{TEST_BASE_URL}/v1/entities/e:react"
+
+
+def client(**kwargs) -> HyperX:
+    return HyperX(
+        api_key=TEST_API_KEY,
+        base_url=TEST_BASE_URL,
+        cache=InMemoryCache(),
+        object_cache=ObjectCachePolicy(),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def db():
+    db = client()
+    yield db
+    db.close()
+
+
+class TestPolicy:
+    """Tests for ObjectCachePolicy validation."""
+
+    def test_defaults(self):
+        policy = ObjectCachePolicy()
+        assert policy.ttl is None
+        assert policy.negative_ttl == 30
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            ObjectCachePolicy(ttl=0)
+        with pytest.raises(ValueError):
+            ObjectCachePolicy(negative_ttl=-1)
+
+    def test_requires_cache(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, json=ENTITY, is_reusable=True)
+        with HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, object_cache=ObjectCachePolicy()
+        ) as db:
+            db.entities.get("e:react")
+            db.entities.get("e:react")
+        assert len(httpx_mock.get_requests()) == 2
+
+
+class TestReadThrough:
+    """Tests for get() reading through the object cache."""
+
+    def test_get_cached(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, json=ENTITY)
+
+        first = db.entities.get("e:react")
+        second = db.entities.get("e:react")
+
+        assert second == first
+        assert second.name == "React"
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_hyperedge_get_cached(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/hyperedges/h:1", json=HYPEREDGE)
+
+        db.hyperedges.get("h:1")
+        hyperedge = db.hyperedges.get("h:1")
+
+        assert hyperedge.members[1].entity_id == "e:hooks"
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_cache_false_bypasses(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, json=ENTITY, is_reusable=True)
+
+        db.entities.get("e:react")
+        db.entities.get("e:react", cache=False)
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_not_found_cached(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/entities/e:missing",
+            status_code=404,
+            json={"error": "Entity not found"},
+        )
+
+        for _ in range(2):
+            with pytest.raises(NotFoundError) as exc_info:
+                db.entities.get("e:missing")
+            assert exc_info.value.status_code == 404
+            assert "not found" in exc_info.value.message
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_not_found_expires(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/entities/e:react", status_code=404, json={"error": "x"}
+        )
+        httpx_mock.add_response(url=ENTITY_URL, json=ENTITY)
+        db = client()
+
+        with (
+            patch("hyperx.cache.memory.time.time", return_value=1000.0),
+            pytest.raises(NotFoundError),
+        ):
+            db.entities.get("e:react")
+        with patch("hyperx.cache.memory.time.time", return_value=1031.0):
+            assert db.entities.get("e:react").id == "e:react"
+        db.close()
+
+    def test_negative_caching_disabled(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=ENTITY_URL, status_code=404, json={"error": "x"}, is_reusable=True
+        )
+        db = HyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            cache=InMemoryCache(),
+            object_cache=ObjectCachePolicy(negative_ttl=0),
+        )
+
+        for _ in range(2):
+            with pytest.raises(NotFoundError):
+                db.entities.get("e:react")
+
+        assert len(httpx_mock.get_requests()) == 2
+        db.close()
+
+
+class TestWrites:
+    """Tests for writes refreshing and dropping cached objects."""
+
+    def test_create_populates(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/entities", method="POST", json=ENTITY)
+
+        db.entities.create(name="React", entity_type="library")
+
+        assert db.entities.get("e:react").name == "React"
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_create_replaces_cached_not_found(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, status_code=404, json={"error": "x"})
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/entities", method="POST", json=ENTITY)
+
+        with pytest.raises(NotFoundError):
+            db.entities.get("e:react")
+        db.entities.create(name="React", entity_type="library")
+
+        assert db.entities.get("e:react").id == "e:react"
+
+    def test_update_refreshes(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, method="GET", json=ENTITY)
+        httpx_mock.add_response(url=ENTITY_URL, method="PUT", json={**ENTITY, "name": "React 19"})
+
+        db.entities.get("e:react")
+        db.entities.update("e:react", name="React 19")
+
+        assert db.entities.get("e:react").name == "React 19"
+        assert len(httpx_mock.get_requests(method="GET")) == 1
+
+    def test_delete_drops(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, method="GET", json=ENTITY, is_reusable=True)
+        httpx_mock.add_response(url=ENTITY_URL, method="DELETE", json={"deleted": True})
+
+        db.entities.get("e:react")
+        db.entities.delete("e:react")
+        db.entities.get("e:react")
+
+        assert len(httpx_mock.get_requests(method="GET")) == 2
+
+    def test_supersede_drops_old_version(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, method="GET", json=ENTITY, is_reusable=True)
+        httpx_mock.add_response(url=f"{ENTITY_URL}/supersede", json={**ENTITY, "id": "e:react-v2"})
+
+        db.entities.get("e:react")
+        db.entities.supersede("e:react", name="React", entity_type="library")
+        db.entities.get("e:react")
+        db.entities.get("e:react-v2")
+
+        assert len(httpx_mock.get_requests(method="GET")) == 2
+
+    def test_batch_delete_drops(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, method="GET", json=ENTITY, is_reusable=True)
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/batch",
+            json={
+                "success": True,
+                "total": 1,
+                "succeeded": 1,
+                "failed": 0,
+                "results": [{"success": True, "index": 0}],
+            },
+        )
+
+        db.entities.get("e:react")
+        db.batch.execute([EntityDelete("e:react")])
+        db.entities.get("e:react")
+
+        assert len(httpx_mock.get_requests(method="GET")) == 2
+
+    def test_search_populates(self, db, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/search",
+            json={"entities": [ENTITY], "hyperedges": [HYPEREDGE]},
+        )
+
+        db.search("react")
+        db.entities.get("e:react")
+        db.hyperedges.get("h:1")
+
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestEvents:
+    """Tests for event-driven invalidation of cached objects."""
+
+    def test_event_drops_object(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, json=ENTITY, is_reusable=True)
+        db = client(cache_invalidation=True)
+
+        db.entities.get("e:react")
+        db.cache_invalidator.handle_event(
+            Event(
+                type="entity.updated",
+                data={"id": "e:react"},
+                timestamp=datetime(2026, 1, 16, tzinfo=timezone.utc),
+            )
+        )
+        db.entities.get("e:react")
+
+        assert isinstance(db.cache_invalidator.objects, ObjectCache)
+        assert len(httpx_mock.get_requests()) == 2
+        db.close()
+
+
+class TestAsync:
+    """Tests for the AsyncHyperX object cache."""
+
+    async def test_get_cached(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=ENTITY_URL, json=ENTITY)
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            cache=InMemoryCache(),
+            object_cache=ObjectCachePolicy(),
+        ) as db:
+            await db.entities.get("e:react")
+            entity = await db.entities.get("e:react")
+
+        assert entity.name == "React"
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_not_found_and_delete(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/hyperedges/h:missing",
+            status_code=404,
+            json={"error": "x"},
+        )
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/hyperedges/h:1",
+            method="GET",
+            json=HYPEREDGE,
+            is_reusable=True,
+        )
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/hyperedges/h:1", method="DELETE", json={"deleted": True}
+        )
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            cache=InMemoryCache(),
+            object_cache=ObjectCachePolicy(),
+        ) as db:
+            for _ in range(2):
+                with pytest.raises(NotFoundError):
+                    await db.hyperedges.get("h:missing")
+            await db.hyperedges.get("h:1")
+            await db.hyperedges.delete("h:1")
+            await db.hyperedges.get("h:1")
+
+        assert len(httpx_mock.get_requests(method="GET")) == 3
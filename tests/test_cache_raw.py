@@ -0,0 +1,143 @@
+"""Tests for caching raw response bodies instead of dumped models."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import CachePolicy, HyperX, InMemoryCache
+from hyperx.cache import CacheSerializer
+from hyperx.codec import StdlibCodec
+from hyperx.http import HTTPClient
+from hyperx.resources.paths import paths_result
+from hyperx.resources.search import search_result
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+ENTITY = {
+    "id": "e:react",
+    "name": "React",
+    "entity_type": "library",
+    "attributes": {"lang": "js"},
+    "created_at": "2026-01-15T00:00:00Z",
+    "updated_at": "2026-01-15T00:00:00Z",
+}
+SEARCH = {"entities": [ENTITY], "hyperedges": []}
+PATHS = {"paths": [{"hyperedges": ["h:1", "h:2"], "bridges": [["e:x"]], "cost": 2.0}]}
+PATHS_REQUEST = {
+    "from": "e:a",
+    "to": "e:b",
+    "constraints": {"max_hops": 4, "intersection_size": 1, "k_paths": 3},
+}
+
+
+def body(data: dict) -> bytes:
+    return json.dumps(data).encode()
+
+
+class TestRawPost:
+    """Tests for HTTPClient.post(raw=True)."""
+
+    def test_returns_undecoded_body(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(content=body(SEARCH))
+        http = HTTPClient(TEST_API_KEY, TEST_BASE_URL)
+        try:
+            assert http.post("/v1/search", json={"query": "react"}, raw=True) == body(SEARCH)
+        finally:
+            http.close()
+
+
+class TestParsers:
+    """Tests for building results from raw bodies and older cache entries."""
+
+    def test_search_result_from_bytes_and_dict(self):
+        from_bytes = search_result(body(SEARCH))
+        assert from_bytes == search_result(SEARCH)
+        assert from_bytes.entities[0].name == "React"
+
+    def test_search_result_defaults_missing_lists(self):
+        assert search_result(b'{"entities": []}').hyperedges == []
+
+    def test_paths_result_accepts_legacy_list(self):
+        legacy = PATHS["paths"]
+        assert paths_result(legacy) == paths_result(body(PATHS)) == paths_result(PATHS)
+
+
+class TestClientCaching:
+    """Tests for raw bodies stored by the resources."""
+
+    def test_search_caches_response_body(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(content=body(SEARCH))
+        cache = InMemoryCache()
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, cache=cache) as db:
+            first = db.search("react")
+            with patch("hyperx.models.Entity.model_dump") as model_dump:
+                second = db.search("react")
+
+        model_dump.assert_not_called()
+        assert first == second
+        key = db.search._cache_key("search_hybrid", {"query": "react", "limit": 10})
+        assert cache.get(key) == body(SEARCH)
+
+    def test_paths_cache_response_body(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(content=body(PATHS))
+        cache = InMemoryCache()
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, cache=cache) as db:
+            first = db.paths.find("e:a", "e:b")
+            second = db.paths.find("e:a", "e:b")
+
+        assert first == second
+        assert first[0].cost == 2.0
+        assert cache.get(db.paths._cache_key(PATHS_REQUEST)) == body(PATHS)
+
+    def test_legacy_dict_entry_is_still_served(self):
+        cache = InMemoryCache()
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, cache=cache) as db:
+            cache.set(db.paths._cache_key(PATHS_REQUEST), PATHS["paths"])
+            paths = db.paths.find("e:a", "e:b")
+
+        assert paths[0].hyperedges == ["h:1", "h:2"]
+
+
+class TestBytesEnvelope:
+    """Tests for CachePolicy with raw byte values."""
+
+    def test_wrap_keeps_bytes(self):
+        policy = CachePolicy(ttl=60, stale_ttl=30)
+        with patch("hyperx.cache.refresh.time.time", return_value=1000.0):
+            wrapped = policy.wrap(b'{"paths":[]}', 0.5)
+        assert isinstance(wrapped, bytes)
+
+        with patch("hyperx.cache.refresh.time.time", return_value=1030.0):
+            assert policy.check(wrapped) == (b'{"paths":[]}', False)
+        with patch("hyperx.cache.refresh.time.time", return_value=1070.0):
+            assert policy.check(wrapped) == (b'{"paths":[]}', True)
+        with patch("hyperx.cache.refresh.time.time", return_value=1091.0):
+            assert policy.check(wrapped) is None
+
+    def test_plain_bytes_are_fresh(self):
+        assert CachePolicy().check(b"{}") == (b"{}", False)
+
+
+class TestRedisValueEncoding:
+    """Tests for storing bytes values in Redis."""
+
+    @pytest.fixture
+    def serializer(self):
+        return CacheSerializer(codec=StdlibCodec())
+
+    def test_bytes_round_trip(self, serializer):
+        stored = serializer.dumps(b'{"a":1}')
+        assert stored == b'\x00{"a":1}'
+        assert serializer.loads(stored) == b'{"a":1}'
+
+    def test_json_values_unchanged(self, serializer):
+        assert serializer.dumps({"a": 1}) == b'{"a":1}'
+        assert serializer.loads(b'{"a":1}') == {"a": 1}
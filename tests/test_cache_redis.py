@@ -8,6 +8,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 
+def encoded(value):
+    """Compact JSON bytes, as written by every supported codec."""
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
 class TestRedisCacheInit:
     """Tests for RedisCache initialization."""
 
@@ -139,7 +144,7 @@ class TestRedisCacheSet:
             mock_client.setex.assert_called_once_with(
                 "hyperx:mykey",
                 300,
-                json.dumps({"data": 123}),
+                encoded({"data": 123}),
             )
 
     def test_set_with_custom_ttl(self):
@@ -156,7 +161,7 @@ class TestRedisCacheSet:
             mock_client.setex.assert_called_once_with(
                 "hyperx:mykey",
                 60,
-                json.dumps("value"),
+                encoded("value"),
             )
 
     def test_set_with_ttl_none_uses_default(self):
@@ -173,7 +178,7 @@ class TestRedisCacheSet:
             mock_client.setex.assert_called_once_with(
                 "hyperx:mykey",
                 120,
-                json.dumps("value"),
+                encoded("value"),
             )
 
     def test_set_complex_value(self):
@@ -331,7 +336,7 @@ class TestRedisCacheEdgeCases:
             mock_client.setex.assert_called_once_with(
                 "hyperx:",
                 300,
-                json.dumps("value"),
+                encoded("value"),
             )
 
     def test_special_characters_in_key(self):
@@ -348,7 +353,7 @@ class TestRedisCacheEdgeCases:
             mock_client.setex.assert_called_once_with(
                 "hyperx:key:with:colons",
                 300,
-                json.dumps("value"),
+                encoded("value"),
             )
 
     def test_unicode_key(self):
@@ -365,7 +370,7 @@ class TestRedisCacheEdgeCases:
             mock_client.setex.assert_called_once_with(
                 "hyperx:日本語キー",
                 300,
-                json.dumps("value"),
+                encoded("value"),
             )
 
     def test_null_value(self):
@@ -382,7 +387,7 @@ class TestRedisCacheEdgeCases:
             mock_client.setex.assert_called_once_with(
                 "hyperx:nullkey",
                 300,
-                json.dumps(None),
+                encoded(None),
             )
 
     def test_get_returns_deserialized_null(self):
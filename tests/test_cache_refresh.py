@@ -0,0 +1,240 @@
+"""Tests for stale-while-revalidate and early refresh of cached reads."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from hyperx import AsyncHyperX, CachePolicy, HyperX
+from hyperx.cache import (
+    AsyncBackgroundRefresher,
+    BackgroundRefresher,
+    InMemoryCache,
+)
+from hyperx.cache.refresh import load_cached
+from hyperx.deadline import deadline, remaining
+
+PATHS = {"paths": [{"hyperedges": ["h:1"], "bridges": [["e:a", "e:b"]], "cost": 1.0}]}
+
+
+def entry(expires: float, value=None, delta: float = 0.1) -> dict:
+    return {"_hx_swr": 1, "value": value, "expires": expires, "delta": delta}
+
+
+class TestCachePolicy:
+    """Tests for deciding how to use a cached entry."""
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            CachePolicy(ttl=0)
+        with pytest.raises(ValueError):
+            CachePolicy(stale_ttl=-1)
+        with pytest.raises(ValueError):
+            CachePolicy(early_refresh=-0.5)
+
+    def test_wrap(self):
+        with patch("hyperx.cache.refresh.time.time", return_value=1000.0):
+            wrapped = CachePolicy(ttl=60).wrap({"a": 1}, 0.25)
+        assert wrapped == entry(1060.0, {"a": 1}, 0.25)
+
+    @pytest.mark.parametrize(
+        ("now", "expected"),
+        [
+            (50.0, ("v", False)),  # Fresh
+            (105.0, ("v", True)),  # Stale, within grace period
+            (110.0, None),  # Past the grace period
+        ],
+    )
+    def test_check_states(self, now, expected):
+        policy = CachePolicy(ttl=100, stale_ttl=10)
+        with patch("hyperx.cache.refresh.time.time", return_value=now):
+            assert policy.check(entry(100.0, "v")) == expected
+
+    def test_miss(self):
+        assert CachePolicy().check(None) is None
+
+    def test_value_without_envelope_is_fresh(self):
+        assert CachePolicy().check({"paths": []}) == ({"paths": []}, False)
+
+    def test_early_refresh_probability_rises_near_expiry(self):
+        policy = CachePolicy(ttl=100, early_refresh=1.0)
+        # u = 0.5 gives a gap of delta * ln(2) ~= 0.69s for delta = 1
+        with patch("hyperx.cache.refresh.random.random", return_value=0.5):
+            with patch("hyperx.cache.refresh.time.time", return_value=99.0):
+                assert policy.check(entry(100.0, "v", delta=1.0)) == ("v", False)
+            with patch("hyperx.cache.refresh.time.time", return_value=99.5):
+                assert policy.check(entry(100.0, "v", delta=1.0)) == ("v", True)
+
+    def test_early_refresh_disabled(self):
+        policy = CachePolicy(ttl=100)
+        with patch("hyperx.cache.refresh.time.time", return_value=99.999):
+            assert policy.check(entry(100.0, "v", delta=60.0)) == ("v", False)
+
+
+class TestLoadCached:
+    """Tests for load_cached() with and without a policy."""
+
+    def test_miss_stores_envelope_with_grace_ttl(self):
+        cache = MagicMock(spec=InMemoryCache)
+        cache.get.return_value = None
+        policy = CachePolicy(ttl=60, stale_ttl=30)
+
+        result = load_cached(cache, "k", lambda: ("r", {"v": 1}), dict, policy=policy)
+
+        assert result == "r"
+        key, stored, ttl = cache.set.call_args.args
+        assert stored["value"] == {"v": 1}
+        assert ttl == 90
+
+    def test_stale_without_refresher_reloads_in_foreground(self):
+        cache = InMemoryCache()
+        cache.set("k", entry(0.0, "old"))
+        policy = CachePolicy(ttl=60, stale_ttl=10**10)
+
+        result = load_cached(cache, "k", lambda: ("new", "new"), str, policy=policy)
+
+        assert result == "new"
+
+
+class TestBackgroundRefresher:
+    """Tests for the thread-pool refresher."""
+
+    def test_one_refresh_per_key(self):
+        refresher = BackgroundRefresher()
+        release = threading.Event()
+
+        def slow() -> None:
+            release.wait(5)
+
+        assert refresher.submit("k", slow) is True
+        assert refresher.submit("k", slow) is False
+        release.set()
+        refresher.close()
+
+        assert refresher.stats.started == 1
+        assert refresher.stats.skipped == 1
+
+    def test_failures_are_counted_and_key_released(self):
+        refresher = BackgroundRefresher()
+        done = threading.Event()
+
+        def boom() -> None:
+            done.set()
+            raise RuntimeError("refresh failed")
+
+        refresher.submit("k", boom)
+        done.wait(5)
+        for _ in range(100):
+            if refresher.stats.failed:
+                break
+            threading.Event().wait(0.01)
+
+        assert refresher.stats.failed == 1
+        assert refresher.submit("k", lambda: None) is True
+        refresher.close()
+
+    def test_closed_refresher_rejects_work(self):
+        refresher = BackgroundRefresher()
+        refresher.close()
+        assert refresher.submit("k", lambda: None) is False
+
+
+class TestSyncClient:
+    """Tests for stale-while-revalidate through HyperX."""
+
+    def test_stale_entry_served_while_refreshing(self):
+        mock_http = MagicMock()
+        mock_http.post.return_value = PATHS
+        cache = InMemoryCache(shards=1)
+        policy = CachePolicy(ttl=60, stale_ttl=10**10)
+
+        with patch("hyperx.client.HTTPClient", return_value=mock_http):
+            client = HyperX(api_key="hx_sk_test", cache=cache, cache_policy=policy)
+            client.paths.find("e:a", "e:b")
+            key = next(iter(cache._shards[0].entries))
+            stale = cache.get(key)
+            stale["expires"] = 0.0
+            stale["value"] = []
+            cache.set(key, stale)
+
+            refreshed = threading.Event()
+
+            def post(*args, **kwargs):
+                refreshed.set()
+                return PATHS
+
+            mock_http.post.side_effect = post
+            result = client.paths.find("e:a", "e:b")
+            assert refreshed.wait(5)
+            client.close()
+
+        assert result == []  # The stale value, returned without waiting
+        assert mock_http.post.call_count == 2
+
+    def test_without_policy_no_refresher(self):
+        with patch("hyperx.client.HTTPClient"):
+            client = HyperX(api_key="hx_sk_test", cache=InMemoryCache())
+        assert client._refresher is None
+        assert client.paths._cache_policy is None
+
+
+class TestAsyncRefresh:
+    """Tests for the task-based refresher and AsyncHyperX."""
+
+    async def test_one_task_per_key(self):
+        refresher = AsyncBackgroundRefresher()
+        release = asyncio.Event()
+
+        async def slow() -> None:
+            await release.wait()
+
+        assert refresher.submit("k", slow) is True
+        assert refresher.submit("k", slow) is False
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert refresher.submit("k", slow) is True
+        refresher.close()
+        await asyncio.sleep(0)
+        assert refresher.stats.started == 2
+        assert refresher.stats.skipped == 1
+
+    async def test_refresh_ignores_callers_deadline(self):
+        refresher = AsyncBackgroundRefresher()
+        seen = []
+
+        async def refresh() -> None:
+            seen.append(remaining())
+
+        with deadline(0.5):
+            refresher.submit("k", refresh)
+        await asyncio.sleep(0)
+
+        assert seen == [None]
+
+    async def test_stale_search_served_while_refreshing(self):
+        mock_http = MagicMock()
+        mock_http.post = AsyncMock(return_value={"entities": [], "hyperedges": []})
+        mock_http.close = AsyncMock()
+        cache = InMemoryCache(shards=1)
+        policy = CachePolicy(ttl=60, stale_ttl=10**10)
+
+        with patch("hyperx.async_client.AsyncHTTPClient", return_value=mock_http):
+            client = AsyncHyperX(api_key="hx_sk_test", cache=cache, cache_policy=policy)
+            await client.search("react")
+            key = next(iter(cache._shards[0].entries))
+            stale = cache.get(key)
+            stale["expires"] = 0.0
+            cache.set(key, stale)
+
+            await client.search("react")
+            assert client._refresher.stats.started == 1
+            await asyncio.sleep(0.01)
+            await client.close()
+
+        assert mock_http.post.await_count == 2
+        assert cache.get(key)["expires"] > 0
@@ -0,0 +1,350 @@
+"""Tests for the embedding-similarity SemanticCache."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX, InMemoryCache
+from hyperx.events import Event
+
+np = pytest.importorskip("numpy")
+
+from hyperx.cache import semantic as semantic_module  # noqa: E402
+from hyperx.cache.semantic import SemanticCache  # noqa: E402
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+TIMESTAMPS = {"created_at": "2026-01-15T00:00:00Z", "updated_at": "2026-01-15T00:00:00Z"}
+ENTITY = {"id": "e:react", "name": "React", "entity_type": "library", **TIMESTAMPS}
+SEARCH = {"entities": [ENTITY], "hyperedges": []}
+
+QUESTION = [0.6, 0.8, 0.0]
+REPHRASED = [0.61, 0.79, 0.02]  # cosine ~0.9996 to QUESTION
+OTHER = [0.0, 0.0, 1.0]
+
+
+class TestSemanticCache:
+    """Tests for lookups, scopes and validation."""
+
+    def test_similar_embedding_hits(self):
+        cache = SemanticCache(threshold=0.99)
+        cache.set(QUESTION, "s", "result")
+
+        assert cache.get(REPHRASED, "s") == "result"
+        assert cache.get(OTHER, "s") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_magnitude_ignored(self):
+        cache = SemanticCache()
+        cache.set(QUESTION, "s", "result")
+        assert cache.get([3.0, 4.0, 0.0], "s") == "result"
+
+    def test_input_types(self):
+        cache = SemanticCache()
+        cache.set(np.array(QUESTION, dtype=np.float32), "s", "result")
+        assert cache.get(QUESTION, "s") == "result"
+
+    def test_scopes_do_not_mix(self):
+        cache = SemanticCache()
+        cache.set(QUESTION, "limit=10", "ten")
+        cache.set(QUESTION, "limit=20", "twenty")
+
+        assert cache.get(QUESTION, "limit=10") == "ten"
+        assert cache.get(QUESTION, "limit=20") == "twenty"
+        assert cache.get(QUESTION, "limit=30") is None
+
+    def test_most_similar_wins(self):
+        cache = SemanticCache(threshold=0.5)
+        cache.set([1.0, 0.2, 0.0], "s", "far")
+        cache.set([1.0, 0.01, 0.0], "s", "near")
+        assert cache.get([1.0, 0.0, 0.0], "s") == "near"
+
+    def test_zero_embedding(self):
+        cache = SemanticCache()
+        cache.set([0.0, 0.0, 0.0], "s", "result")
+        assert len(cache) == 0
+        assert cache.get([0.0, 0.0, 0.0], "s") is None
+
+    def test_dimension_mismatch(self):
+        cache = SemanticCache()
+        cache.set(QUESTION, "s", "result")
+        with pytest.raises(ValueError):
+            cache.set([1.0, 0.0], "s", "result")
+        assert cache.get([1.0, 0.0], "s") is None
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            SemanticCache(threshold=0)
+        with pytest.raises(ValueError):
+            SemanticCache(max_entries=0)
+        with pytest.raises(ValueError):
+            SemanticCache(ttl=0)
+
+    def test_clear(self):
+        cache = SemanticCache()
+        cache.set(QUESTION, "s", "result")
+        cache.clear()
+        assert len(cache) == 0
+        cache.set([1.0, 0.0], "s", "two dimensions")
+        assert cache.get([1.0, 0.0], "s") == "two dimensions"
+
+
+class TestEviction:
+    """Tests for TTL, LRU and invalidation."""
+
+    def test_ttl(self):
+        cache = SemanticCache(ttl=10)
+        with patch("hyperx.cache.semantic.time.time", return_value=1000.0):
+            cache.set(QUESTION, "s", "result")
+        with patch("hyperx.cache.semantic.time.time", return_value=1011.0):
+            assert cache.get(QUESTION, "s") is None
+
+    def test_lru(self):
+        cache = SemanticCache(max_entries=2, ttl=None)
+        for i, embedding in enumerate(([1.0, 0.0], [0.0, 1.0])):
+            with patch("hyperx.cache.semantic.time.time", return_value=1000.0 + i):
+                cache.set(embedding, "s", i)
+        with patch("hyperx.cache.semantic.time.time", return_value=1010.0):
+            cache.get([1.0, 0.0], "s")
+            cache.set([-1.0, 0.0], "s", 2)
+
+        assert len(cache) == 2
+        assert cache.get([1.0, 0.0], "s") == 0
+        assert cache.get([0.0, 1.0], "s") is None
+        assert cache.stats.evictions == {"lru": 1}
+
+    def test_expired_evicted_first(self):
+        cache = SemanticCache(max_entries=2, ttl=10)
+        with patch("hyperx.cache.semantic.time.time", return_value=1000.0):
+            cache.set([1.0, 0.0], "s", 0)
+        with patch("hyperx.cache.semantic.time.time", return_value=1008.0):
+            cache.set([0.0, 1.0], "s", 1)
+        with patch("hyperx.cache.semantic.time.time", return_value=1012.0):
+            cache.set([-1.0, 0.0], "s", 2)
+            assert cache.get([0.0, 1.0], "s") == 1
+
+        assert cache.stats.evictions == {"ttl": 1}
+
+    def test_invalidate(self):
+        cache = SemanticCache()
+        cache.set(QUESTION, "s", "result", depends_on={"e:react"})
+        cache.set(OTHER, "s", "other", depends_on={"e:vue"})
+
+        assert cache.invalidate(["e:react", "e:missing"]) == 1
+        assert cache.get(QUESTION, "s") is None
+        assert cache.get(OTHER, "s") == "other"
+        assert cache.stats.evictions == {"invalidated": 1}
+
+    def test_scope_dropped_with_last_entry(self):
+        cache = SemanticCache(max_entries=2, ttl=None)
+        cache.set(QUESTION, "a", "a", depends_on={"e:react"})
+        cache.set(QUESTION, "b", "b")
+        cache.invalidate(["e:react"])
+        assert list(cache._scope_ids) == ["b"]
+
+        cache.set(QUESTION, "a", "a again")
+        cache.set(OTHER, "c", "c")  # Evicts "b"
+        assert set(cache._scope_ids) == {"a", "c"}
+        assert cache.get(QUESTION, "a") == "a again"
+        assert cache.get(QUESTION, "b") is None
+
+
+class TestIVF:
+    """Tests for the IVF index used by large caches."""
+
+    def test_recall(self):
+        rng = np.random.default_rng(7)
+        vectors = rng.standard_normal((600, 32)).astype(np.float32)
+        cache = SemanticCache(threshold=0.95, max_entries=1000, ivf_threshold=500)
+        for i, vector in enumerate(vectors):
+            cache.set(vector, "s", i)
+
+        assert cache._centroids is not None
+        noise = rng.standard_normal(vectors.shape).astype(np.float32) * 0.02
+        found = [cache.get(vector, "s") for vector in vectors + noise]
+        assert sum(f == i for i, f in enumerate(found)) >= 570
+        assert cache.get(rng.standard_normal(32), "s") is None
+
+    def test_used_with_defaults(self):
+        cache = SemanticCache()
+        rng = np.random.default_rng(7)
+        for i, vector in enumerate(rng.standard_normal((cache.ivf_threshold, 8))):
+            cache.set(vector, "s", i)
+
+        assert cache.ivf_threshold < cache.max_entries
+        assert cache._centroids is not None
+
+    def test_trained_outside_lock(self):
+        rng = np.random.default_rng(7)
+        vectors = rng.standard_normal((40, 8)).astype(np.float32)
+        cache = SemanticCache(threshold=0.99, ivf_threshold=32, nprobe=1)
+        kmeans = semantic_module._kmeans
+
+        def train(sample):
+            assert cache._lock.acquire(blocking=False)
+            cache._lock.release()
+            # Written while training, so assigned when the centroids are swapped in
+            cache.set(vectors[-1], "s", "during")
+            return kmeans(sample)
+
+        with patch("hyperx.cache.semantic._kmeans", side_effect=train) as mock_kmeans:
+            for i, vector in enumerate(vectors[:32]):
+                cache.set(vector, "s", i)
+
+        mock_kmeans.assert_called_once()
+        assert cache._centroids is not None
+        assert cache.get(vectors[-1], "s") == "during"
+        assert cache.get(vectors[0], "s") == 0
+
+    async def test_async_trains_in_worker_thread(self):
+        threads = []
+        kmeans = semantic_module._kmeans
+
+        def train(sample):
+            threads.append(threading.current_thread())
+            return kmeans(sample)
+
+        rng = np.random.default_rng(7)
+        cache = SemanticCache(ivf_threshold=32)
+        with patch("hyperx.cache.semantic._kmeans", side_effect=train):
+            for i, vector in enumerate(rng.standard_normal((32, 8))):
+                await cache.set_async(vector, "s", i)
+
+        assert threads
+        assert threads[0] is not threading.main_thread()
+        assert cache._centroids is not None
+
+
+class TestClient:
+    """Tests for the semantic cache in search."""
+
+    def test_vector_search(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/search/vector", json=SEARCH)
+        semantic = SemanticCache(threshold=0.99)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, semantic_cache=semantic) as db:
+            db.search.vector(QUESTION)
+            result = db.search.vector(REPHRASED)
+
+        assert result.entities[0].id == "e:react"
+        assert len(httpx_mock.get_requests()) == 1
+        assert semantic.stats.hits == 1
+
+    def test_parameters_scope_results(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/search/vector", json=SEARCH, is_reusable=True
+        )
+
+        with HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, semantic_cache=SemanticCache()
+        ) as db:
+            db.search.vector(QUESTION)
+            db.search.vector(QUESTION, limit=20)
+            db.search.vector(QUESTION, role_filter={"subject": "e:react"})
+            db.search.vector(QUESTION, cache=False)
+
+        assert len(httpx_mock.get_requests()) == 4
+
+    def test_hybrid_with_embedding(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/search", json=SEARCH, is_reusable=True)
+
+        with HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, semantic_cache=SemanticCache()
+        ) as db:
+            db.search("how do react hooks work", embedding=QUESTION)
+            db.search("how do React hooks work?", embedding=REPHRASED)
+            db.search("how do React hooks work?")
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert "embedding" not in httpx_mock.get_requests()[0].read().decode()
+
+    def test_write_invalidates(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/search/vector", json=SEARCH, is_reusable=True
+        )
+        semantic = SemanticCache()
+        db = HyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            cache=InMemoryCache(),
+            cache_invalidation=True,
+            semantic_cache=semantic,
+        )
+
+        db.search.vector(QUESTION)
+        db.cache_invalidator.handle_event(
+            Event(
+                type="entity.updated",
+                data={"id": "e:react"},
+                timestamp=datetime(2026, 1, 16, tzinfo=timezone.utc),
+            )
+        )
+        db.search.vector(REPHRASED)
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert semantic.stats.evictions == {"invalidated": 1}
+        db.close()
+
+    def test_write_invalidates_without_cache(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/search/vector", json=SEARCH, is_reusable=True
+        )
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/entities/e:react", method="PUT", json=ENTITY
+        )
+        semantic = SemanticCache()
+
+        with HyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            cache_invalidation=True,
+            semantic_cache=semantic,
+        ) as db:
+            db.search.vector(QUESTION)
+            db.entities.update("e:react", name="React 19")
+            db.search.vector(QUESTION)
+
+        assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/v1/search/vector")) == 2
+        assert semantic.stats.evictions == {"invalidated": 1}
+
+    async def test_async_write_invalidates_without_cache(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/search/vector", json=SEARCH, is_reusable=True
+        )
+        httpx_mock.add_response(
+            url=f"{TEST_BASE_URL}/v1/entities/e:react", method="DELETE", json={"deleted": True}
+        )
+        semantic = SemanticCache()
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            cache_invalidation=True,
+            semantic_cache=semantic,
+        ) as db:
+            await db.search.vector(QUESTION)
+            await db.entities.delete("e:react")
+            await db.search.vector(QUESTION)
+
+        assert len(httpx_mock.get_requests(url=f"{TEST_BASE_URL}/v1/search/vector")) == 2
+        assert semantic.stats.evictions == {"invalidated": 1}
+
+    async def test_async_vector_search(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/search/vector", json=SEARCH)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, semantic_cache=SemanticCache()
+        ) as db:
+            await db.search.vector(QUESTION)
+            result = await db.search.vector(np.array(REPHRASED))
+
+        assert result.entities[0].name == "React"
+        assert len(httpx_mock.get_requests()) == 1
@@ -0,0 +1,161 @@
+"""Tests for Redis cache value serializers and compression."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hyperx.cache import CacheSerializer
+from hyperx.codec import StdlibCodec
+
+ENTITY = {
+    "id": "e:react",
+    "name": "React",
+    "entity_type": "library",
+    "attributes": {"lang": "js"},
+    "created_at": "2026-01-15T00:00:00Z",
+    "updated_at": "2026-01-15T00:00:00Z",
+}
+LARGE = {"entities": [dict(ENTITY, id=f"e:{i}") for i in range(50)], "hyperedges": []}
+
+
+@pytest.fixture(params=["zstd", "lz4"])
+def compression(request):
+    pytest.importorskip("zstandard" if request.param == "zstd" else "lz4")
+    return request.param
+
+
+class TestCacheSerializer:
+    """Tests for CacheSerializer encoding and decoding."""
+
+    def test_default_is_plain_json(self):
+        serializer = CacheSerializer(codec=StdlibCodec())
+        assert serializer.name == "json"
+        assert serializer.dumps({"a": 1}) == b'{"a":1}'
+        assert serializer.loads('{"a":1}') == {"a": 1}
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            CacheSerializer(format="pickle")  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            CacheSerializer(compression="gzip")  # type: ignore[arg-type]
+
+    def test_compresses_above_threshold(self, compression):
+        serializer = CacheSerializer(compression=compression, threshold=256)
+
+        stored = serializer.dumps(LARGE)
+        small = serializer.dumps({"a": 1})
+
+        assert serializer.loads(stored) == LARGE
+        assert serializer.loads(small) == {"a": 1}
+        assert small == b'{"a":1}'
+        assert serializer.stats.values == 2
+        assert serializer.stats.compressed == 1
+        assert serializer.stats.ratio > 5
+
+    def test_raw_bytes_compressed(self, compression):
+        body = StdlibCodec().dumps(LARGE)
+        serializer = CacheSerializer(compression=compression)
+
+        stored = serializer.dumps(body)
+
+        assert len(stored) < len(body) / 5
+        assert serializer.loads(stored) == body
+
+    def test_incompressible_value_stored_as_is(self):
+        pytest.importorskip("zstandard")
+        serializer = CacheSerializer(compression="zstd", threshold=0)
+        value = bytes(range(256))
+
+        assert serializer.dumps(value) == b"\x00" + value
+        assert serializer.stats.compressed == 0
+        assert serializer.stats.ratio == 1.0
+
+    def test_reads_values_written_with_other_settings(self):
+        pytest.importorskip("zstandard")
+        compressed = CacheSerializer(compression="zstd", threshold=0).dumps(LARGE)
+        plain = CacheSerializer().dumps(LARGE)
+
+        reader = CacheSerializer()
+        assert reader.loads(compressed) == reader.loads(plain) == LARGE
+
+
+    def test_modules_imported_once(self, compression):
+        serializer = CacheSerializer(compression=compression, threshold=0)
+
+        with patch("hyperx.cache.serializers._import") as mock_import:
+            assert serializer.loads(serializer.dumps(LARGE)) == LARGE
+
+        mock_import.assert_not_called()
+
+class TestMsgpack:
+    """Tests for the msgpack format."""
+
+    @pytest.fixture(autouse=True)
+    def msgpack(self):
+        pytest.importorskip("msgpack")
+
+    def test_round_trip(self):
+        serializer = CacheSerializer(format="msgpack")
+        stored = serializer.dumps(LARGE)
+
+        assert stored[:1] == b"\x01"
+        assert len(stored) < len(CacheSerializer().dumps(LARGE))
+        assert serializer.loads(stored) == LARGE
+        # Readable by a JSON serializer sharing the namespace
+        assert CacheSerializer().loads(stored) == LARGE
+
+    def test_bytes_stay_raw(self):
+        assert CacheSerializer(format="msgpack").dumps(b"{}") == b"\x00{}"
+
+
+class TestMissingDependencies:
+    """Tests for install hints when optional packages are missing."""
+
+    def test_msgpack_hint(self):
+        with (
+            patch.dict(sys.modules, {"msgpack": None}),
+            pytest.raises(ImportError, match=r"hyperx\[msgpack\]"),
+        ):
+            CacheSerializer(format="msgpack")
+
+    def test_lz4_hint(self):
+        with (
+            patch.dict(sys.modules, {"lz4": None, "lz4.frame": None}),
+            pytest.raises(ImportError, match=r"hyperx\[lz4\]"),
+        ):
+            CacheSerializer(compression="lz4")
+
+
+class TestRedisCacheSerializer:
+    """Tests for RedisCache with a serializer."""
+
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip("redis")
+        pytest.importorskip("zstandard")
+        client = MagicMock()
+        with patch("redis.from_url", return_value=client):
+            yield client
+
+    def test_stores_compressed_values(self, client):
+        from hyperx.cache import RedisCache
+
+        cache = RedisCache(serializer=CacheSerializer(compression="zstd"))
+        cache.set("k", LARGE)
+        stored = client.setex.call_args.args[2]
+        client.get.return_value = stored
+
+        assert stored[:1] == b"\x02"
+        assert cache.get("k") == LARGE
+        assert cache.serializer.stats.ratio > 5
+
+    def test_get_many_decodes_each_value(self, client):
+        from hyperx.cache import RedisCache
+
+        cache = RedisCache(serializer=CacheSerializer(compression="zstd", threshold=0))
+        client.mget.return_value = [cache.serializer.dumps(LARGE), b'{"a":1}', None]
+
+        assert cache.get_many(["x", "y", "z"]) == {"x": LARGE, "y": {"a": 1}}
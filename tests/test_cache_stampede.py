@@ -0,0 +1,246 @@
+"""Tests for Redis recompute locks that prevent cache stampedes."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("redis")
+
+from hyperx import CachePolicy, HyperX  # noqa: E402
+from hyperx.cache import InMemoryCache, LockingCache, RedisCache  # noqa: E402
+from hyperx.cache.refresh import load_cached  # noqa: E402
+from hyperx.deadline import deadline  # noqa: E402
+
+PATHS = {"paths": [{"hyperedges": ["h:1"], "bridges": [["e:a", "e:b"]], "cost": 1.0}]}
+
+
+class FakeRedis:
+    """Thread-safe key space with SET NX and the lock release script."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self.lock:
+            return self.data.get(key)
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        with self.lock:
+            self.data[key] = value
+
+    def set(self, key: str, value: str, nx: bool = False, px: int | None = None) -> bool:
+        with self.lock:
+            if nx and key in self.data:
+                return False
+            self.data[key] = value
+            return True
+
+    def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        with self.lock:
+            if self.data.get(key) == token:
+                del self.data[key]
+                return 1
+            return 0
+
+
+class AsyncFakeRedis:
+    """Async view of a FakeRedis."""
+
+    def __init__(self, sync: FakeRedis) -> None:
+        self.sync = sync
+
+    async def get(self, key: str) -> Any:
+        return self.sync.get(key)
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.sync.setex(key, ttl, value)
+
+    async def set(self, key: str, value: str, nx: bool = False, px: int | None = None) -> bool:
+        return self.sync.set(key, value, nx=nx, px=px)
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        return self.sync.eval(script, numkeys, key, token)
+
+
+@pytest.fixture
+def server():
+    fake = FakeRedis()
+    with patch("redis.from_url", return_value=fake):
+        yield fake
+
+
+def slow_load(calls: list[int], delay: float = 0.2):
+    def load() -> tuple[str, str]:
+        calls.append(1)
+        time.sleep(delay)
+        return "result", "result"
+
+    return load
+
+
+class TestRecompute:
+    """Tests for RedisCache.recompute."""
+
+    def test_is_locking_cache(self, server):
+        assert isinstance(RedisCache(lock_timeout=5), LockingCache)
+        assert not isinstance(InMemoryCache(), LockingCache)
+
+    def test_invalid_lock_timeout(self, server):
+        with pytest.raises(ValueError):
+            RedisCache(lock_timeout=0)
+
+    def test_without_lock_timeout_computes_directly(self, server):
+        cache = RedisCache(prefix="app:")
+        assert cache.recompute("key", lambda: {"v": 1}) == {"v": 1}
+        assert cache.get("key") == {"v": 1}
+        assert "app:key:lock" not in server.data
+
+    def test_lock_is_released(self, server):
+        cache = RedisCache(prefix="app:", lock_timeout=5)
+        assert cache.recompute("key", lambda: "value") == "value"
+        assert "app:key:lock" not in server.data
+
+    def test_lock_released_when_compute_raises(self, server):
+        cache = RedisCache(prefix="app:", lock_timeout=5)
+
+        def boom() -> None:
+            raise RuntimeError("server down")
+
+        with pytest.raises(RuntimeError):
+            cache.recompute("key", boom)
+        assert "app:key:lock" not in server.data
+
+    def test_no_wait_returns_none_when_locked(self, server):
+        cache = RedisCache(prefix="app:", lock_timeout=5)
+        server.data["app:key:lock"] = "other"
+        assert cache.recompute("key", lambda: "value", wait=False) is None
+        assert cache.get("key") is None
+
+    def test_waiter_gets_holders_value(self, server):
+        cache = RedisCache(prefix="app:", lock_timeout=5)
+        server.data["app:key:lock"] = "other"
+        threading.Timer(0.1, lambda: cache.set("key", "theirs")).start()
+
+        assert cache.recompute("key", lambda: "ours") == "theirs"
+
+    def test_waiter_computes_after_lock_wait(self, server):
+        cache = RedisCache(prefix="app:", lock_timeout=5, lock_wait=0.1)
+        server.data["app:key:lock"] = "other"
+        assert cache.recompute("key", lambda: "ours") == "ours"
+
+    def test_wait_bounded_by_deadline(self, server):
+        cache = RedisCache(prefix="app:", lock_timeout=30)
+        server.data["app:key:lock"] = "other"
+        start = time.monotonic()
+        with deadline(0.1):
+            assert cache.recompute("key", lambda: "ours") == "ours"
+        assert time.monotonic() - start < 1
+
+
+class TestStampede:
+    """Tests for one load per key across processes."""
+
+    def test_concurrent_misses_load_once(self, server):
+        calls: list[int] = []
+        pods = [RedisCache(prefix="app:", lock_timeout=5) for _ in range(8)]
+        results: list[str] = []
+
+        def read(cache: RedisCache) -> None:
+            results.append(load_cached(cache, "paths:k", slow_load(calls), str))
+
+        threads = [threading.Thread(target=read, args=(pod,)) for pod in pods]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["result"] * 8
+
+    def test_stale_entry_served_while_other_pod_refreshes(self, server):
+        policy = CachePolicy(ttl=60, stale_ttl=600)
+        cache = RedisCache(prefix="app:", lock_timeout=5)
+        stale = {"_hx_swr": 1, "value": "stale", "expires": time.time() - 1, "delta": 0}
+        cache.set("paths:k", stale)
+        server.data["app:paths:k:lock"] = "other"
+        calls: list[int] = []
+
+        result = load_cached(cache, "paths:k", slow_load(calls), str, policy=policy)
+
+        assert result == "stale"
+        assert calls == []
+
+    def test_client_pods_query_server_once(self, server):
+        post_calls: list[int] = []
+
+        def post(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            post_calls.append(1)
+            time.sleep(0.2)
+            return PATHS
+
+        clients = []
+        for _ in range(4):
+            mock_http = MagicMock()
+            mock_http.post.side_effect = post
+            with patch("hyperx.client.HTTPClient", return_value=mock_http):
+                cache = RedisCache(prefix="app:", lock_timeout=5)
+                clients.append(HyperX(api_key="hx_sk_test", cache=cache))
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda c=c: results.append(c.paths.find("e:a", "e:b")))
+            for c in clients
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(post_calls) == 1
+        assert len(results) == 4
+        assert all(len(paths) == 1 for paths in results)
+
+
+class TestAsyncRecompute:
+    """Tests for AsyncRedisCache.arecompute."""
+
+    @pytest.fixture
+    def aserver(self, server):
+        fake = AsyncFakeRedis(server)
+        with patch("redis.asyncio.from_url", return_value=fake):
+            yield server
+
+    async def test_concurrent_misses_load_once(self, aserver):
+        from hyperx.cache import AsyncRedisCache
+        from hyperx.cache.refresh import aload_cached
+
+        calls: list[int] = []
+
+        async def load() -> tuple[str, str]:
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return "result", "result"
+
+        pods = [AsyncRedisCache(prefix="app:", lock_timeout=5) for _ in range(5)]
+        results = await asyncio.gather(*(aload_cached(p, "k", load, str) for p in pods))
+
+        assert calls == [1]
+        assert results == ["result"] * 5
+        assert "app:k:lock" not in aserver.data
+
+    async def test_no_wait_returns_none_when_locked(self, aserver):
+        from hyperx.cache import AsyncRedisCache
+
+        cache = AsyncRedisCache(prefix="app:", lock_timeout=5)
+        aserver.data["app:k:lock"] = "other"
+        compute = AsyncMock(return_value="value")
+
+        assert await cache.arecompute("k", compute, wait=False) is None
+        compute.assert_not_awaited()
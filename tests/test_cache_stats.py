@@ -0,0 +1,193 @@
+"""Tests for cache statistics and the client cache_stats() surface."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hyperx import AsyncHyperX, HyperX
+from hyperx.cache import CacheStats, InMemoryCache, as_async_cache
+from hyperx.cache.stats import key_prefix
+
+PATHS = {"paths": [{"hyperedges": ["h:1"], "bridges": [["e:a", "e:b"]], "cost": 1.0}]}
+
+
+class TestCacheStats:
+    """Tests for the CacheStats collector."""
+
+    def test_key_prefix(self):
+        assert key_prefix("paths:e:a:e:b:4:1:3") == "paths"
+        assert key_prefix("search_hybrid:abc:10") == "search_hybrid"
+        assert key_prefix("no-colon") == "other"
+
+    def test_counts_by_prefix(self):
+        stats = CacheStats()
+        stats.record_get("paths:a", True, 0.002)
+        stats.record_get("paths:b", False, 0.004)
+        stats.record_get("search_text:q", True, 0.001)
+        stats.record_set("paths:b")
+        stats.record_eviction("paths:a", "ttl")
+
+        paths = stats.by_prefix()["paths"]
+        assert (paths.hits, paths.misses, paths.sets) == (1, 1, 1)
+        assert paths.evictions == {"ttl": 1}
+        assert paths.hit_rate == 0.5
+        assert paths.avg_hit_latency == pytest.approx(0.002)
+        assert paths.avg_miss_latency == pytest.approx(0.004)
+
+        total = stats.total()
+        assert (total.hits, total.misses) == (2, 1)
+
+    def test_by_prefix_returns_copies(self):
+        stats = CacheStats()
+        stats.record_eviction("paths:a", "lru")
+        stats.by_prefix()["paths"].evictions["lru"] = 100
+        assert stats.by_prefix()["paths"].evictions == {"lru": 1}
+
+    def test_hot_keys(self):
+        stats = CacheStats()
+        for key, reads in (("paths:a", 3), ("paths:b", 1), ("search_text:c", 2)):
+            for _ in range(reads):
+                stats.record_get(key, True, 0.0)
+
+        assert stats.hot_keys(2) == [("paths:a", 3), ("search_text:c", 2)]
+
+    def test_hot_keys_bounded(self):
+        stats = CacheStats(hot_keys_tracked=10)
+        for _ in range(5):
+            stats.record_get("hot", True, 0.0)
+        for i in range(1000):
+            stats.record_get(f"cold{i}", False, 0.0)
+
+        assert len(stats._reads) <= 20
+        assert stats.hot_keys(1) == [("hot", 5)]
+
+    def test_snapshot_is_plain_data(self):
+        stats = CacheStats(size=lambda: (3, None))
+        stats.record_get("paths:a", True, 0.001)
+        snapshot = stats.snapshot()
+
+        assert json.loads(json.dumps(snapshot)) == snapshot
+        assert snapshot["entries"] == 3
+        assert snapshot["prefixes"]["paths"]["hit_rate"] == 1.0
+        assert snapshot["hot_keys"] == [["paths:a", 1]]
+
+    def test_reset(self):
+        stats = CacheStats()
+        stats.record_get("paths:a", True, 0.0)
+        stats.reset()
+        assert stats.by_prefix() == {}
+        assert stats.hot_keys() == []
+
+
+class TestInMemoryCacheStats:
+    """Tests for InMemoryCache(stats=True)."""
+
+    def test_disabled_by_default(self):
+        assert InMemoryCache().stats is None
+
+    def test_reads_and_writes(self):
+        cache = InMemoryCache(stats=True)
+        cache.set("paths:a", 1)
+        cache.get("paths:a")
+        cache.get("paths:b")
+        cache.set_many({"search_text:x": 1})
+        cache.get_many(["search_text:x", "search_text:y"])
+
+        by_prefix = cache.stats.by_prefix()
+        assert (by_prefix["paths"].hits, by_prefix["paths"].misses) == (1, 1)
+        assert by_prefix["search_text"].sets == 1
+        assert (by_prefix["search_text"].hits, by_prefix["search_text"].misses) == (1, 1)
+
+    def test_eviction_reasons(self):
+        cache = InMemoryCache(max_size=1, stats=True)
+        cache.set("paths:a", 1)
+        cache.set("paths:b", 2)
+        cache.set("paths:c", 3, ttl=-1)
+        cache.get("paths:c")
+
+        sized = InMemoryCache(max_bytes=1000, stats=True)
+        sized.set("paths:big", b"x" * 2000)
+
+        assert cache.stats.by_prefix()["paths"].evictions == {"lru": 2, "ttl": 1}
+        assert sized.stats.by_prefix()["paths"].evictions == {"size": 1}
+
+    def test_tinylfu_rejections_are_evictions(self):
+        cache = InMemoryCache(max_size=10, admission="tinylfu", stats=True)
+        for i in range(50):
+            cache.set(f"paths:{i}", i)
+        assert cache.stats.total().evictions["lru"] == 40
+
+    def test_snapshot_size(self):
+        cache = InMemoryCache(max_bytes=100_000, stats=True)
+        cache.set("paths:a", b"x" * 100)
+        snapshot = cache.stats.snapshot()
+        assert snapshot["entries"] == 1
+        assert snapshot["bytes"] > 100
+
+
+class TestRedisCacheStats:
+    """Tests for RedisCache(stats=True)."""
+
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip("redis")
+        client = MagicMock()
+        with patch("redis.from_url", return_value=client):
+            yield client
+
+    def test_reads_and_writes(self, client):
+        from hyperx.cache import RedisCache
+
+        cache = RedisCache(stats=True)
+        client.get.return_value = None
+        cache.get("paths:a")
+        cache.set("paths:a", {"v": 1})
+        client.get.return_value = b'{"v":1}'
+        cache.get("paths:a")
+        client.mget.return_value = [b"1", None]
+        cache.get_many(["search_text:x", "search_text:y"])
+
+        by_prefix = cache.stats.by_prefix()
+        assert (by_prefix["paths"].hits, by_prefix["paths"].misses) == (1, 1)
+        assert by_prefix["paths"].sets == 1
+        assert by_prefix["search_text"].hit_rate == 0.5
+        assert cache.stats.snapshot()["entries"] is None
+
+
+class TestClientCacheStats:
+    """Tests for HyperX.cache_stats() and AsyncHyperX.cache_stats()."""
+
+    def test_reports_paths_prefix(self):
+        mock_http = MagicMock()
+        mock_http.post.return_value = json.dumps(PATHS).encode()
+
+        with patch("hyperx.client.HTTPClient", return_value=mock_http):
+            db = HyperX(api_key="hx_sk_test", cache=InMemoryCache(stats=True))
+            db.paths.find("e:a", "e:b")
+            db.paths.find("e:a", "e:b")
+
+        stats = db.cache_stats(hot_keys=1)
+        assert stats is not None
+        assert stats["prefixes"]["paths"]["hits"] == 1
+        assert stats["prefixes"]["paths"]["misses"] == 1
+        [[key, reads]] = stats["hot_keys"]
+        assert key.startswith("paths:v1:")
+        assert reads == 2
+
+    def test_none_without_stats(self):
+        with patch("hyperx.client.HTTPClient"):
+            assert HyperX(api_key="hx_sk_test").cache_stats() is None
+            assert HyperX(api_key="hx_sk_test", cache=InMemoryCache()).cache_stats() is None
+
+    def test_async_client_unwraps_adapter(self):
+        cache = InMemoryCache(stats=True)
+        cache.get("paths:a")
+        with patch("hyperx.async_client.AsyncHTTPClient"):
+            db = AsyncHyperX(api_key="hx_sk_test", cache=as_async_cache(cache))
+
+        stats = db.cache_stats()
+        assert stats is not None
+        assert stats["total"]["misses"] == 1
@@ -0,0 +1,223 @@
+"""Tests for the two-tier L1/L2 cache with pub/sub invalidation."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("redis")
+
+from hyperx.cache import InMemoryCache, RedisCache, TieredCache  # noqa: E402
+
+
+class FakeListener:
+    def __init__(self, broker: FakeRedis, channel: str, handler: Any) -> None:
+        self.broker = broker
+        self.channel = channel
+        self.handler = handler
+
+    def stop(self) -> None:
+        self.broker.subscribers.remove(self)
+
+
+class FakePubSub:
+    def __init__(self, broker: FakeRedis) -> None:
+        self.broker = broker
+        self.handlers: dict[str, Any] = {}
+
+    def subscribe(self, **handlers: Any) -> None:
+        self.handlers.update(handlers)
+
+    def run_in_thread(self, **kwargs: Any) -> FakeListener:
+        ((channel, handler),) = self.handlers.items()
+        listener = FakeListener(self.broker, channel, handler)
+        self.broker.subscribers.append(listener)
+        return listener
+
+
+class FakePipeline:
+    def __init__(self, broker: FakeRedis) -> None:
+        self.broker = broker
+        self.calls: list[Any] = []
+
+    def __enter__(self) -> FakePipeline:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args: self.calls.append((name, args))
+
+    def execute(self) -> list[Any]:
+        self.broker.round_trips += 1
+        return [getattr(self.broker, name)(*args) for name, args in self.calls]
+
+
+class FakeRedis:
+    """Shared key space and synchronous pub/sub, standing in for a Redis server."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.subscribers: list[FakeListener] = []
+        self.gets = 0
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def get(self, key: str) -> bytes | None:
+        self.gets += 1
+        return self.data.get(key)
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.gets += 1
+        return [self.data.get(key) for key in keys]
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.data[key] = value
+
+    def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def scan(self, cursor: int, match: str) -> tuple[int, list[str]]:
+        prefix = match.rstrip("*")
+        return 0, [key for key in self.data if key.startswith(prefix)]
+
+    def pubsub(self, **kwargs: Any) -> FakePubSub:
+        return FakePubSub(self)
+
+    def publish(self, channel: str, message: str) -> int:
+        listeners = [s for s in self.subscribers if s.channel == channel]
+        for listener in listeners:
+            listener.handler({"type": "message", "channel": channel, "data": message.encode()})
+        return len(listeners)
+
+
+@pytest.fixture
+def server():
+    fake = FakeRedis()
+    with patch("redis.from_url", return_value=fake):
+        yield fake
+
+
+def pod(**kwargs: Any) -> TieredCache:
+    return TieredCache(RedisCache(prefix="app:"), **kwargs)
+
+
+class TestTieredCache:
+    """Tests for reads, writes and cross-process invalidation."""
+
+    def test_read_fills_l1_from_l2(self, server):
+        writer, reader = pod(), pod()
+        writer.set("key", {"data": 1})
+
+        assert reader.get("key") == {"data": 1}
+        assert reader.get("key") == {"data": 1}
+
+        assert reader.stats.l2_hits == 1
+        assert reader.stats.l1_hits == 1
+        assert server.gets == 1
+
+    def test_write_goes_to_both_tiers(self, server):
+        cache = pod()
+        cache.set("key", "value")
+
+        assert "key" in cache.l1
+        assert "app:key" in server.data
+        assert cache.get("key") == "value"
+        assert server.gets == 0
+
+    def test_miss(self, server):
+        cache = pod()
+        assert cache.get("missing") is None
+        assert cache.stats.misses == 1
+
+    def test_write_invalidates_other_pods(self, server):
+        a, b = pod(), pod()
+        a.set("key", "old")
+        assert b.get("key") == "old"
+
+        a.set("key", "new")
+
+        assert "key" not in b.l1
+        assert b.stats.invalidations == 2
+        assert b.get("key") == "new"
+        # The writer keeps its own fresh copy
+        assert "key" in a.l1
+        assert a.stats.invalidations == 0
+
+    def test_delete_invalidates_other_pods(self, server):
+        a, b = pod(), pod()
+        a.set("key", "value")
+        b.get("key")
+
+        assert a.delete("key") is True
+
+        assert b.get("key") is None
+        assert a.delete("key") is False
+
+    def test_clear_invalidates_other_pods(self, server):
+        a, b = pod(), pod()
+        a.set("k1", 1)
+        a.set("k2", 2)
+        b.get("k1")
+        b.get("k2")
+
+        a.clear()
+
+        assert len(b.l1) == 0
+        assert server.data == {}
+
+    def test_l1_ttl_caps_entry_lifetime(self, server):
+        cache = pod(l1=InMemoryCache(), l1_ttl=5)
+        with patch.object(cache.l1, "set", wraps=cache.l1.set) as l1_set:
+            cache.set("key", "value", ttl=600)
+            cache.set("short", "value", ttl=2)
+
+        assert [c.args[2] for c in l1_set.call_args_list] == [5, 2]
+
+    def test_listener_error_clears_l1(self, server):
+        cache = pod()
+        cache.set("key", "value")
+
+        with patch("hyperx.cache.tiered.time.sleep"):
+            cache._on_listener_error(ConnectionError("lost"), None, None)
+
+        assert len(cache.l1) == 0
+
+    def test_close_unsubscribes(self, server):
+        cache = pod()
+        cache.close()
+        assert server.subscribers == []
+
+    def test_without_listen(self, server):
+        cache = pod(listen=False)
+        cache.set("key", "value")
+        assert server.subscribers == []
+
+    async def test_async_l1_hit(self, server):
+        cache = pod()
+        await cache.aset("key", "value")
+
+        assert await cache.aget("key") == "value"
+        assert await cache.aget_many(["key", "missing"]) == {"key": "value"}
+        assert server.gets == 1  # Only "missing" reached L2
+        assert await cache.adelete("key") is True
+
+    def test_bulk_operations(self, server):
+        a, b = pod(), pod()
+        a.set_many({"k1": 1, "k2": 2})
+        assert server.round_trips == 2  # SETEX pipeline + PUBLISH pipeline
+
+        assert b.get_many(["k1", "k2", "k3"]) == {"k1": 1, "k2": 2}
+        assert server.gets == 1
+        assert (b.stats.l2_hits, b.stats.misses) == (2, 1)
+        assert b.get_many(["k1", "k2"]) == {"k1": 1, "k2": 2}
+        assert b.stats.l1_hits == 2
+
+        assert a.delete_many(["k1", "k3"]) == 1
+        assert "k1" not in b.l1
+        assert "k2" in b.l1
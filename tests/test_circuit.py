@@ -0,0 +1,286 @@
+"""Tests for the per-endpoint-family circuit breaker."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import (
+    AsyncHyperX,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitStateChange,
+    HyperX,
+    RateLimiter,
+)
+from hyperx.circuit import endpoint_family
+from hyperx.exceptions import NotFoundError, ServerError
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    # Replace the module reference only, so asyncio keeps the real clock
+    with patch("hyperx.circuit.time", SimpleNamespace(monotonic=fake)):
+        yield fake
+
+
+def fail(breaker: CircuitBreaker, path: str = "/v1/paths", times: int = 1) -> None:
+    for _ in range(times):
+        breaker.record(breaker.before(path), failed=True, duration=0.1)
+
+
+def succeed(breaker: CircuitBreaker, path: str = "/v1/paths", times: int = 1) -> None:
+    for _ in range(times):
+        breaker.record(breaker.before(path), failed=False, duration=0.1)
+
+
+class TestEndpointFamily:
+    """Tests for endpoint_family()."""
+
+    @pytest.mark.parametrize(
+        ("path", "family"),
+        [
+            ("/v1/paths", "paths"),
+            ("/v1/search/vector", "search"),
+            ("/v1/entities/e:123/history", "entities"),
+            ("/v1/entities/batch", "entities"),
+            ("/v1/batch", "batch"),
+            ("/health", "/health"),
+        ],
+    )
+    def test_family(self, path: str, family: str):
+        assert endpoint_family(path) == family
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_on_failure_rate(self, clock):
+        breaker = CircuitBreaker(minimum_calls=4, window_size=4)
+        succeed(breaker, times=2)
+        fail(breaker)
+        assert breaker.state("paths") == "closed"
+        fail(breaker)
+        assert breaker.state("paths") == "open"
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before("/v1/paths")
+        assert exc_info.value.family == "paths"
+        assert exc_info.value.retry_after == pytest.approx(30.0)
+
+    def test_needs_minimum_calls(self, clock):
+        breaker = CircuitBreaker(minimum_calls=5, window_size=10)
+        fail(breaker, times=4)
+        assert breaker.state("paths") == "closed"
+
+    def test_families_are_independent(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+        fail(breaker, "/v1/paths", times=2)
+
+        assert breaker.state("paths") == "open"
+        assert breaker.state("search") == "closed"
+        breaker.before("/v1/search")
+
+    def test_opens_on_slow_call_rate(self, clock):
+        breaker = CircuitBreaker(
+            minimum_calls=2, window_size=2, slow_call_threshold=1.0, slow_call_rate_threshold=1.0
+        )
+        for _ in range(2):
+            breaker.record(breaker.before("/v1/paths"), failed=False, duration=2.0)
+
+        assert breaker.state("paths") == "open"
+
+    def test_half_open_probe_success_closes(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2, open_duration=10)
+        fail(breaker, times=2)
+
+        clock.now += 10
+        permit = breaker.before("/v1/paths")
+        assert permit.probe
+        assert breaker.state("paths") == "half_open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before("/v1/paths")
+
+        breaker.record(permit, failed=False, duration=0.1)
+        assert breaker.state("paths") == "closed"
+
+    def test_half_open_probe_failure_reopens(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2, open_duration=10)
+        fail(breaker, times=2)
+
+        clock.now += 10
+        breaker.record(breaker.before("/v1/paths"), failed=True, duration=0.1)
+
+        assert breaker.state("paths") == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before("/v1/paths")
+
+    def test_abandoned_probe_frees_slot(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2, open_duration=10)
+        fail(breaker, times=2)
+
+        clock.now += 10
+        breaker.abandon(breaker.before("/v1/paths"))
+
+        assert breaker.before("/v1/paths").probe
+
+    def test_outcome_of_call_started_before_opening_is_ignored(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+        early = breaker.before("/v1/paths")
+        fail(breaker, times=2)
+
+        breaker.record(early, failed=False, duration=0.1)
+
+        assert breaker.state("paths") == "open"
+
+    def test_on_state_change(self, clock):
+        changes: list[CircuitStateChange] = []
+        breaker = CircuitBreaker(
+            minimum_calls=2, window_size=2, open_duration=5, on_state_change=changes.append
+        )
+        fail(breaker, times=2)
+        clock.now += 5
+        succeed(breaker)
+
+        assert [(c.family, c.previous, c.state) for c in changes] == [
+            ("paths", "closed", "open"),
+            ("paths", "open", "half_open"),
+            ("paths", "half_open", "closed"),
+        ]
+
+    def test_reset(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+        fail(breaker, times=2)
+
+        breaker.reset()
+
+        assert breaker.state("paths") == "closed"
+        breaker.before("/v1/paths")
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_rate_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(minimum_calls=20, window_size=10)
+
+
+class TestClientCircuitBreaker:
+    """Tests for the circuit breaker in the HTTP client."""
+
+    def test_server_errors_open_circuit(self, httpx_mock: HTTPXMock, clock):
+        httpx_mock.add_response(status_code=503, is_reusable=True)
+        breaker = CircuitBreaker(minimum_calls=3, window_size=3)
+
+        with HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, circuit_breaker=breaker
+        ) as db:
+            for _ in range(3):
+                with pytest.raises(ServerError):
+                    db.paths.find("e:a", "e:b")
+            with pytest.raises(CircuitOpenError):
+                db.paths.find("e:a", "e:b")
+
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_client_errors_do_not_open_circuit(self, httpx_mock: HTTPXMock, clock):
+        httpx_mock.add_response(status_code=404, json={"message": "nope"}, is_reusable=True)
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+
+        with HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, circuit_breaker=breaker
+        ) as db:
+            for _ in range(3):
+                with pytest.raises(NotFoundError):
+                    db.entities.get("e:missing")
+
+        assert breaker.state("entities") == "closed"
+
+    async def test_async_timeouts_open_circuit(self, httpx_mock: HTTPXMock, clock):
+        httpx_mock.add_exception(
+            httpx.ReadTimeout("slow"), url=f"{TEST_BASE_URL}/v1/search", is_reusable=True
+        )
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, circuit_breaker=breaker
+        ) as db:
+            for _ in range(2):
+                with pytest.raises(httpx.ReadTimeout):
+                    await db.search("react")
+            with pytest.raises(CircuitOpenError):
+                await db.search("react")
+            # Other families are unaffected
+            httpx_mock.add_response(url=f"{TEST_BASE_URL}/v1/entities/e:1", status_code=404)
+            with pytest.raises(NotFoundError):
+                await db.entities.get("e:1")
+
+    def test_rate_limiter_wait_is_not_latency(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json={"paths": []}, is_reusable=True)
+        breaker = CircuitBreaker(
+            minimum_calls=2, window_size=2, slow_call_threshold=0.1, slow_call_rate_threshold=1.0
+        )
+
+        # Every call after the first waits 0.2s for the limiter, then gets a fast response
+        with HyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            circuit_breaker=breaker,
+            rate_limiter=RateLimiter(rate=5, burst=1),
+        ) as db:
+            for _ in range(3):
+                db.paths.find("e:a", "e:b")
+
+        assert breaker.state("paths") == "closed"
+
+    async def test_async_rate_limiter_wait_is_not_latency(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json={"paths": []}, is_reusable=True)
+        breaker = CircuitBreaker(
+            minimum_calls=2, window_size=2, slow_call_threshold=0.1, slow_call_rate_threshold=1.0
+        )
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            circuit_breaker=breaker,
+            rate_limiter=RateLimiter(rate=5, burst=1),
+        ) as db:
+            for _ in range(3):
+                await db.paths.find("e:a", "e:b")
+
+        assert breaker.state("paths") == "closed"
+
+    def test_circuit_open_error_is_not_retried(self, httpx_mock: HTTPXMock, clock):
+        from hyperx import RetryPolicy
+
+        httpx_mock.add_response(status_code=503, is_reusable=True)
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+
+        with (
+            patch("hyperx.http.time.sleep"),
+            HyperX(
+                api_key=TEST_API_KEY,
+                base_url=TEST_BASE_URL,
+                circuit_breaker=breaker,
+                retry=RetryPolicy(max_retries=5, budget_min_per_second=100),
+            ) as db,
+            pytest.raises(CircuitOpenError),
+        ):
+            db.entities.get("e:1")
+
+        assert len(httpx_mock.get_requests()) == 2
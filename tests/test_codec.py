@@ -0,0 +1,141 @@
+"""Tests for pluggable JSON codecs."""
+
+import contextlib
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import HyperX
+from hyperx.codec import JSONCodec, MsgspecCodec, OrjsonCodec, StdlibCodec, get_codec
+from hyperx.exceptions import ServerError
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+PAYLOAD = {
+    "query": "react state",
+    "limit": 10,
+    "role_filter": {"subject": "e:react"},
+    "embedding": [0.25, -0.5, 1.0],
+    "name": "Zürich",
+}
+
+
+def available_codecs() -> list[JSONCodec]:
+    codecs: list[JSONCodec] = [StdlibCodec()]
+    for factory in (OrjsonCodec, MsgspecCodec):
+        with contextlib.suppress(ImportError):
+            codecs.append(factory())
+    return codecs
+
+
+@pytest.fixture(params=available_codecs(), ids=lambda c: c.name)
+def codec(request) -> JSONCodec:
+    return request.param
+
+
+class TestCodecs:
+    """Tests shared by every codec implementation."""
+
+    def test_implements_protocol(self, codec: JSONCodec):
+        assert isinstance(codec, JSONCodec)
+
+    def test_round_trip(self, codec: JSONCodec):
+        assert codec.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+
+    def test_dumps_returns_compact_utf8_bytes(self, codec: JSONCodec):
+        data = codec.dumps({"a": [1, 2], "name": "Zürich"})
+        assert isinstance(data, bytes)
+        assert data == '{"a":[1,2],"name":"Zürich"}'.encode()
+
+    def test_loads_accepts_str(self, codec: JSONCodec):
+        assert codec.loads('{"a": 1}') == {"a": 1}
+
+    def test_malformed_input_raises_value_error(self, codec: JSONCodec):
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_interoperable_with_stdlib(self, codec: JSONCodec):
+        assert json.loads(codec.dumps(PAYLOAD)) == PAYLOAD
+        assert codec.loads(json.dumps(PAYLOAD)) == PAYLOAD
+
+
+class TestGetCodec:
+    """Tests for codec selection."""
+
+    def test_explicit_stdlib(self):
+        assert get_codec("json").name == "json"
+
+    def test_auto_prefers_orjson(self):
+        pytest.importorskip("orjson")
+        assert get_codec().name == "orjson"
+
+    def test_auto_falls_back_to_stdlib(self):
+        with patch.dict("sys.modules", {"orjson": None, "msgspec": None}):
+            assert get_codec().name == "json"
+
+    def test_missing_library_raises(self):
+        with patch.dict("sys.modules", {"msgspec": None}), pytest.raises(ImportError):
+            get_codec("msgspec")
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="Unknown codec"):
+            get_codec("yaml")  # type: ignore[arg-type]
+
+
+class TestClientCodec:
+    """Tests for codec use by the HTTP client."""
+
+    def test_request_body_encoded_with_codec(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json={"entities": [], "hyperedges": []})
+        codec = MagicMock(wraps=StdlibCodec())
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, codec=codec) as db:
+            db.search("react", limit=5)
+
+        codec.dumps.assert_called_once_with({"query": "react", "limit": 5})
+        # Search responses are validated straight from the raw body by pydantic
+        codec.loads.assert_not_called()
+        request = httpx_mock.get_request()
+        assert json.loads(request.content) == {"query": "react", "limit": 5}
+        assert request.headers["Content-Type"] == "application/json"
+
+    def test_error_body_decoded_with_codec(self, httpx_mock: HTTPXMock, codec: JSONCodec):
+        httpx_mock.add_response(status_code=500, json={"message": "boom"})
+
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, codec=codec) as db,
+            pytest.raises(ServerError, match="boom") as exc_info,
+        ):
+            db.entities.get("e:1")
+
+        assert exc_info.value.response == {"message": "boom"}
+
+    def test_non_json_error_body(self, httpx_mock: HTTPXMock, codec: JSONCodec):
+        httpx_mock.add_response(status_code=502, text="Bad Gateway")
+
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, codec=codec) as db,
+            pytest.raises(ServerError, match="Bad Gateway"),
+        ):
+            db.entities.get("e:1")
+
+    def test_redis_cache_uses_codec(self):
+        pytest.importorskip("redis")
+
+        with patch("redis.from_url") as mock_from_url:
+            mock_client = MagicMock()
+            mock_from_url.return_value = mock_client
+
+            from hyperx.cache.redis import RedisCache
+
+            codec = MagicMock(wraps=StdlibCodec())
+            cache = RedisCache(codec=codec)
+            cache.set("k", {"a": 1})
+            mock_client.get.return_value = b'{"a":1}'
+
+            assert cache.get("k") == {"a": 1}
+            codec.dumps.assert_called_once_with({"a": 1})
+            codec.loads.assert_called_once_with(b'{"a":1}')
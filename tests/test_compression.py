@@ -0,0 +1,126 @@
+"""Tests for request body compression."""
+
+import gzip
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX, RequestCompression
+from hyperx.batch import EntityCreate
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+BATCH_RESPONSE = {"success": True, "total": 200, "succeeded": 200, "failed": 0, "results": []}
+
+
+def big_batch(n: int = 200) -> list[EntityCreate]:
+    return [
+        EntityCreate(name=f"Entity {i}", entity_type="concept", embedding=[0.125] * 64)
+        for i in range(n)
+    ]
+
+
+class TestRequestCompression:
+    """Tests for the compression policy."""
+
+    def test_small_body_not_compressed(self):
+        policy = RequestCompression(threshold=1024)
+        assert policy.compress(b"x" * 100) is None
+
+    def test_gzip_round_trip(self):
+        policy = RequestCompression(threshold=10)
+        body = b'{"data":"' + b"a" * 5000 + b'"}'
+        compressed = policy.compress(body)
+        assert compressed is not None
+        assert len(compressed) < len(body)
+        assert gzip.decompress(compressed) == body
+        assert policy.content_encoding == "gzip"
+
+    def test_zstd_round_trip(self):
+        zstandard = pytest.importorskip("zstandard")
+        policy = RequestCompression(algorithm="zstd", threshold=10)
+        body = b"b" * 5000
+        compressed = policy.compress(body)
+        assert zstandard.ZstdDecompressor().decompress(compressed) == body
+        assert policy.content_encoding == "zstd"
+
+    def test_zstd_missing_gives_install_hint(self):
+        with (
+            patch.dict("sys.modules", {"zstandard": None}),
+            pytest.raises(ImportError, match=r"hyperx\[zstd\]"),
+        ):
+            RequestCompression(algorithm="zstd")
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError, match="Unsupported"):
+            RequestCompression(algorithm="brotli")  # type: ignore[arg-type]
+
+
+class TestClientCompression:
+    """Tests for compression applied by the clients."""
+
+    def test_large_batch_is_compressed(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=BATCH_RESPONSE)
+        compression = RequestCompression(threshold=1024)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, compression=compression) as db:
+            result = db.batch.execute(big_batch())
+
+        assert result.succeeded == 200
+        request = httpx_mock.get_request()
+        assert request.headers["Content-Encoding"] == "gzip"
+        payload = json.loads(gzip.decompress(request.content))
+        assert len(payload["operations"]) == 200
+
+    def test_small_request_sent_uncompressed(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json={"entities": [], "hyperedges": []})
+        compression = RequestCompression(threshold=1024)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, compression=compression) as db:
+            db.search("react")
+
+        request = httpx_mock.get_request()
+        assert "Content-Encoding" not in request.headers
+        assert json.loads(request.content)["query"] == "react"
+
+    def test_disabled_by_default(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=BATCH_RESPONSE)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            db.batch.execute(big_batch())
+
+        assert "Content-Encoding" not in httpx_mock.get_request().headers
+
+    def test_accepts_compressed_responses(self, httpx_mock: HTTPXMock):
+        body = gzip.compress(json.dumps({"entities": [], "hyperedges": []}).encode())
+        httpx_mock.add_response(
+            stream=httpx.ByteStream(body), headers={"Content-Encoding": "gzip"}
+        )
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            result = db.search("react")
+
+        assert result.entities == []
+        assert "gzip" in httpx_mock.get_request().headers["Accept-Encoding"]
+
+    @pytest.mark.asyncio
+    async def test_async_create_many_is_compressed(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json={"entities": []})
+        compression = RequestCompression(threshold=1024)
+        entities = [
+            {"name": f"E{i}", "entity_type": "concept", "embedding": [0.5] * 64}
+            for i in range(100)
+        ]
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, compression=compression
+        ) as db:
+            await db.entities.create_many(entities)
+
+        request = httpx_mock.get_request()
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert len(json.loads(gzip.decompress(request.content))["entities"]) == 100
@@ -0,0 +1,119 @@
+"""Tests for connection pool, timeout and transport configuration."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX
+from hyperx.http import DEFAULT_LIMITS, AsyncSharedTransport, SharedTransport
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+
+def pool_of(client: httpx.Client | httpx.AsyncClient):
+    """Return the connection pool behind an httpx client's transport."""
+    transport = client._transport
+    if isinstance(transport, (SharedTransport, AsyncSharedTransport)):
+        transport = transport.transport
+    return transport._pool
+
+
+class TestPoolConfiguration:
+    """Tests for pool limits and timeouts."""
+
+    def test_default_limits(self):
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            pool = pool_of(db._http._client)
+            assert pool._max_connections == DEFAULT_LIMITS.max_connections
+            assert pool._max_keepalive_connections == DEFAULT_LIMITS.max_keepalive_connections
+
+    def test_custom_limits(self):
+        limits = httpx.Limits(
+            max_connections=200, max_keepalive_connections=50, keepalive_expiry=60.0
+        )
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, limits=limits) as db:
+            pool = pool_of(db._http._client)
+            assert pool._max_connections == 200
+            assert pool._max_keepalive_connections == 50
+            assert pool._keepalive_expiry == 60.0
+
+    def test_per_phase_timeouts(self):
+        timeout = httpx.Timeout(30.0, connect=2.0, pool=1.0)
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, timeout=timeout) as db:
+            assert db._http._client.timeout.connect == 2.0
+            assert db._http._client.timeout.read == 30.0
+            assert db._http._client.timeout.pool == 1.0
+
+    def test_async_custom_limits(self):
+        limits = httpx.Limits(max_connections=64)
+        db = AsyncHyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, limits=limits)
+        assert pool_of(db._http._client)._max_connections == 64
+
+
+class TestHTTP2:
+    """Tests for opt-in HTTP/2."""
+
+    def test_http2_enabled(self):
+        pytest.importorskip("h2")
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, http2=True) as db:
+            assert pool_of(db._http._client)._http2 is True
+
+    def test_http2_disabled_by_default(self):
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            assert pool_of(db._http._client)._http2 is False
+
+    def test_missing_h2_gives_install_hint(self):
+        with (
+            patch.dict("sys.modules", {"h2": None}),
+            pytest.raises(ImportError, match=r"hyperx\[http2\]"),
+        ):
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, http2=True)
+
+
+class TestSharedTransport:
+    """Tests for sharing one transport between clients."""
+
+    def test_clients_share_pool(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=[], is_reusable=True)
+        transport = httpx.HTTPTransport()
+
+        db1 = HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, transport=transport)
+        db2 = HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, transport=transport)
+        assert pool_of(db1._http._client) is pool_of(db2._http._client)
+
+        db1.entities.list()
+        db1.close()
+        # Closing one client must not close the shared transport
+        db2.entities.list()
+        db2.close()
+        transport.close()
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_transport_conflicts_with_pool_options(self):
+        with pytest.raises(ValueError, match="transport"):
+            HyperX(
+                api_key=TEST_API_KEY,
+                base_url=TEST_BASE_URL,
+                transport=httpx.HTTPTransport(),
+                limits=httpx.Limits(max_connections=5),
+            )
+
+    @pytest.mark.asyncio
+    async def test_async_clients_share_pool(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=[], is_reusable=True)
+        transport = httpx.AsyncHTTPTransport()
+
+        db1 = AsyncHyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, transport=transport)
+        db2 = AsyncHyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, transport=transport)
+
+        await db1.entities.list()
+        await db1.close()
+        await db2.entities.list()
+        await db2.close()
+        await transport.aclose()
+
+        assert len(httpx_mock.get_requests()) == 2
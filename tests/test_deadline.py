@@ -0,0 +1,228 @@
+"""Tests for deadlines and per-call timeouts."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, DeadlineExceededError, HyperX, RetryPolicy, deadline
+from hyperx.agents.tools import ExplorerTool
+from hyperx.deadline import check_deadline, expired, remaining
+from hyperx.exceptions import ServerError
+from hyperx.models import Entity, Hyperedge, PathResult, SearchResult
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+ENTITY = {
+    "id": "e:react",
+    "name": "React",
+    "entity_type": "library",
+    "attributes": {},
+    "confidence": 1.0,
+    "created_at": "2026-01-15T00:00:00Z",
+    "updated_at": "2026-01-15T00:00:00Z",
+}
+
+
+class TestDeadlineScope:
+    """Tests for the deadline() context manager."""
+
+    def test_no_deadline_by_default(self):
+        assert remaining() is None
+        assert not expired()
+        check_deadline()
+
+    def test_remaining_inside_scope(self):
+        with deadline(10.0):
+            assert 9.0 < remaining() <= 10.0
+        assert remaining() is None
+
+    def test_none_is_a_no_op(self):
+        with deadline(None):
+            assert remaining() is None
+
+    def test_nested_scope_cannot_extend(self):
+        with deadline(1.0), deadline(60.0):
+            assert remaining() <= 1.0
+
+    def test_nested_scope_can_shorten(self):
+        with deadline(60.0):
+            with deadline(1.0):
+                assert remaining() <= 1.0
+            assert remaining() > 1.0
+
+    def test_expired(self):
+        with deadline(0.0):
+            assert expired()
+            with pytest.raises(DeadlineExceededError):
+                check_deadline()
+
+    def test_deadline_exceeded_is_a_timeout_error(self):
+        assert issubclass(DeadlineExceededError, TimeoutError)
+
+    async def test_deadline_follows_into_tasks(self):
+        async def left() -> float | None:
+            return remaining()
+
+        with deadline(5.0):
+            value = await asyncio.create_task(left())
+        assert value is not None and value <= 5.0
+
+
+class TestClientDeadline:
+    """Tests for deadlines in the HTTP clients."""
+
+    def test_request_timeout_is_clamped(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=ENTITY)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, timeout=30.0) as db:
+            db.entities.get("e:react", timeout=2.0)
+
+        timeout = httpx_mock.get_request().extensions["timeout"]
+        assert 0 < timeout["read"] <= 2.0
+        assert 0 < timeout["connect"] <= 2.0
+
+    def test_client_timeout_kept_without_deadline(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=ENTITY)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, timeout=30.0) as db:
+            db.entities.get("e:react")
+
+        assert httpx_mock.get_request().extensions["timeout"]["read"] == 30.0
+
+    def test_expired_deadline_sends_nothing(self, httpx_mock: HTTPXMock):
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db,
+            deadline(0.0),
+            pytest.raises(DeadlineExceededError),
+        ):
+            db.entities.get("e:react")
+
+        assert httpx_mock.get_requests() == []
+
+    def test_timeout_raises_deadline_exceeded(self, httpx_mock: HTTPXMock):
+        def slow(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.05)
+            raise httpx.ReadTimeout("slow", request=request)
+
+        httpx_mock.add_callback(slow)
+
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db,
+            pytest.raises(DeadlineExceededError),
+        ):
+            db.paths.find("e:a", "e:b", timeout=0.01)
+
+    def test_no_retry_past_deadline(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=503, is_reusable=True)
+        retry = RetryPolicy(max_retries=5, backoff_base=1.0, jitter=False)
+
+        with (
+            patch("hyperx.http.time.sleep") as sleep,
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, retry=retry) as db,
+            pytest.raises(ServerError),
+        ):
+            db.entities.get("e:react", timeout=0.5)
+
+        sleep.assert_not_called()
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_async_request_timeout_is_clamped(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=ENTITY)
+
+        async with AsyncHyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            with deadline(3.0):
+                await db.entities.get("e:react")
+
+        assert 0 < httpx_mock.get_request().extensions["timeout"]["read"] <= 3.0
+
+    async def test_async_expired_deadline_sends_nothing(self, httpx_mock: HTTPXMock):
+        async with AsyncHyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            with deadline(0.0), pytest.raises(DeadlineExceededError):
+                await db.search("react")
+
+        assert httpx_mock.get_requests() == []
+
+
+class TestExplorerDeadline:
+    """Tests for early stopping in ExplorerTool."""
+
+    def test_stops_early_and_returns_partial_results(self):
+        client = MagicMock()
+        start = Entity(**ENTITY)
+        neighbor = Entity(**{**ENTITY, "id": "e:redux", "name": "Redux"})
+        client.entities.get.return_value = start
+        client.search.return_value = SearchResult(entities=[neighbor], hyperedges=[])
+
+        def slow_find(**kwargs):
+            time.sleep(0.05)
+            return [PathResult(hyperedges=["h:1"], bridges=[["e:bridge"]], cost=1.0)]
+
+        client.paths.find.side_effect = slow_find
+
+        result = ExplorerTool(client, timeout=0.01).run("e:react")
+
+        assert result.success
+        assert result.data["truncated"]
+        assert [n["id"] for n in result.data["neighbors"]] == ["e:redux"]
+        assert result.quality.should_retrieve_more
+        # The bridge entity found after the deadline is not fetched
+        assert client.entities.get.call_count == 1
+
+    def test_deadline_during_member_fetch_returns_partial_results(self):
+        client = MagicMock()
+        start = Entity(**ENTITY)
+        neighbor = Entity(**{**ENTITY, "id": "e:redux", "name": "Redux"})
+        hyperedge = Hyperedge(
+            id="h:1",
+            description="React provides Hooks",
+            members=[
+                {"entity_id": "e:hooks", "role": "object"},
+                {"entity_id": "e:jsx", "role": "object"},
+            ],
+            created_at="2026-01-15T00:00:00Z",
+            updated_at="2026-01-15T00:00:00Z",
+        )
+        client.entities.get.side_effect = [start, DeadlineExceededError("Deadline exceeded")]
+        client.search.return_value = SearchResult(entities=[neighbor], hyperedges=[hyperedge])
+
+        result = ExplorerTool(client, timeout=10).run("e:react")
+
+        assert result.success
+        assert result.data["truncated"]
+        assert [n["id"] for n in result.data["neighbors"]] == ["e:redux"]
+        assert result.quality.should_retrieve_more
+        # Stops at the first call that ran out of time
+        assert client.entities.get.call_count == 2
+        client.paths.find.assert_not_called()
+
+    def test_deadline_during_bridge_fetch_returns_partial_results(self):
+        client = MagicMock()
+        start = Entity(**ENTITY)
+        neighbor = Entity(**{**ENTITY, "id": "e:redux", "name": "Redux"})
+        client.entities.get.side_effect = [start, DeadlineExceededError("Deadline exceeded")]
+        client.search.return_value = SearchResult(entities=[neighbor], hyperedges=[])
+        client.paths.find.return_value = [
+            PathResult(hyperedges=["h:1"], bridges=[["e:bridge"]], cost=1.0)
+        ]
+
+        result = ExplorerTool(client, timeout=10).run("e:react", max_hops=2)
+
+        assert result.success
+        assert result.data["truncated"]
+        assert [n["id"] for n in result.data["neighbors"]] == ["e:redux"]
+        assert client.paths.find.call_count == 1
+
+    def test_not_truncated_without_timeout(self):
+        client = MagicMock()
+        client.entities.get.return_value = Entity(**ENTITY)
+        client.search.return_value = SearchResult(entities=[], hyperedges=[])
+
+        result = ExplorerTool(client).run("e:react")
+
+        assert result.success
+        assert result.data["truncated"] is False
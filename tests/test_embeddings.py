@@ -0,0 +1,214 @@
+"""Tests for embedding encoding."""
+
+import base64
+import json
+import struct
+from array import array
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX
+from hyperx.batch import EntityCreate
+from hyperx.embeddings import encode_embedding, float32_bytes, has_embedding, to_float_list
+
+np = pytest.importorskip("numpy")
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+VALUES = [0.25, -0.5, 1.0, 0.125]
+PACKED = struct.pack("<4f", *VALUES)
+
+ENTITY = {
+    "id": "e:test-uuid",
+    "name": "React",
+    "entity_type": "concept",
+    "attributes": {},
+    "confidence": 1.0,
+    "created_at": "2026-01-15T00:00:00Z",
+    "updated_at": "2026-01-15T00:00:00Z",
+}
+
+INPUTS = {
+    "list": lambda: list(VALUES),
+    "tuple": lambda: tuple(VALUES),
+    "array_f": lambda: array("f", VALUES),
+    "array_d": lambda: array("d", VALUES),
+    "memoryview": lambda: memoryview(array("f", VALUES)),
+    "numpy_f32": lambda: np.array(VALUES, dtype=np.float32),
+    "numpy_f64": lambda: np.array(VALUES, dtype=np.float64),
+}
+
+
+@pytest.fixture(params=list(INPUTS), ids=list(INPUTS))
+def embedding(request):
+    return INPUTS[request.param]()
+
+
+def decode(encoded: dict) -> bytes:
+    assert encoded["encoding"] == "base64"
+    return base64.b64decode(encoded["data"])
+
+
+class TestEncodeEmbedding:
+    """Tests for encode_embedding()."""
+
+    def test_json_returns_float_list(self, embedding):
+        assert encode_embedding(embedding) == VALUES
+
+    def test_json_list_is_not_copied(self):
+        values = list(VALUES)
+        assert encode_embedding(values) is values
+
+    def test_float32_little_endian(self, embedding):
+        encoded = encode_embedding(embedding, "float32")
+        assert encoded["dtype"] == "float32"
+        assert decode(encoded) == PACKED
+
+    def test_float16(self, embedding):
+        encoded = encode_embedding(embedding, "float16")
+        assert encoded["dtype"] == "float16"
+        assert list(struct.unpack("<4e", decode(encoded))) == VALUES
+
+    def test_int8_round_trip(self, embedding):
+        encoded = encode_embedding(embedding, "int8")
+        assert encoded["dtype"] == "int8"
+        assert encoded["scale"] == pytest.approx(1.0 / 127)
+        quantized = array("b", decode(encoded))
+        assert list(quantized) == [32, -64, 127, 16]
+        restored = [q * encoded["scale"] for q in quantized]
+        assert restored == pytest.approx(VALUES, abs=encoded["scale"])
+
+    def test_int8_all_zero(self):
+        encoded = encode_embedding([0.0, 0.0], "int8")
+        assert encoded["scale"] == 1.0
+        assert decode(encoded) == b"\x00\x00"
+
+    def test_float32_is_quarter_of_json_size(self):
+        values = np.random.default_rng(0).uniform(-1, 1, 1536).astype(np.float32)
+        binary = json.dumps(encode_embedding(values, "float32"))
+        text = json.dumps(encode_embedding(values))
+        assert len(binary) < len(text) / 2.5
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="Unknown embedding format"):
+            encode_embedding(VALUES, "float64")  # type: ignore[arg-type]
+
+
+class TestHelpers:
+    """Tests for the conversion helpers."""
+
+    def test_float32_bytes(self, embedding):
+        assert float32_bytes(embedding) == PACKED
+
+    def test_to_float_list(self, embedding):
+        assert to_float_list(embedding) == VALUES
+
+    def test_has_embedding(self):
+        assert has_embedding(np.array(VALUES))
+        assert not has_embedding(np.array([]))
+        assert not has_embedding([])
+        assert not has_embedding(None)
+
+
+class TestEntityCreate:
+    """Tests for EntityCreate embedding serialization."""
+
+    def test_default_json(self):
+        op = EntityCreate(name="React", entity_type="library", embedding=np.array(VALUES))
+        assert op.to_dict()["data"]["embedding"] == VALUES
+
+    def test_binary(self):
+        op = EntityCreate(name="React", entity_type="library", embedding=array("f", VALUES))
+        data = op.to_dict(embedding_format="float32")["data"]
+        assert decode(data["embedding"]) == PACKED
+
+
+class TestClientEmbeddingFormat:
+    """Tests for the client-level embedding_format option."""
+
+    def test_create_default_sends_float_list(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=ENTITY)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            db.entities.create("React", "concept", embedding=np.array(VALUES))
+
+        body = json.loads(httpx_mock.get_request().content)
+        assert body["embedding"] == VALUES
+
+    def test_create_binary(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=ENTITY)
+
+        with HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, embedding_format="float32"
+        ) as db:
+            db.entities.create("React", "concept", embedding=np.array(VALUES))
+
+        body = json.loads(httpx_mock.get_request().content)
+        assert decode(body["embedding"]) == PACKED
+
+    def test_create_empty_embedding_omitted(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=ENTITY)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            db.entities.create("React", "concept", embedding=np.array([]))
+
+        assert "embedding" not in json.loads(httpx_mock.get_request().content)
+
+    def test_create_many_binary(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json={"entities": [ENTITY, ENTITY]})
+
+        with HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, embedding_format="float32"
+        ) as db:
+            db.entities.create_many([
+                {"name": "React", "entity_type": "concept", "embedding": VALUES},
+                {"name": "Vue", "entity_type": "concept"},
+            ])
+
+        entities = json.loads(httpx_mock.get_request().content)["entities"]
+        assert decode(entities[0]["embedding"]) == PACKED
+        assert "embedding" not in entities[1]
+
+    def test_batch_binary(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(
+            json={"success": True, "total": 1, "succeeded": 1, "failed": 0, "results": []}
+        )
+
+        with HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, embedding_format="float16"
+        ) as db:
+            db.batch.execute([EntityCreate(name="React", entity_type="library", embedding=VALUES)])
+
+        operation = json.loads(httpx_mock.get_request().content)["operations"][0]
+        assert operation["data"]["embedding"]["dtype"] == "float16"
+
+    def test_vector_search_binary(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json={"entities": [], "hyperedges": []})
+
+        with HyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, embedding_format="float32"
+        ) as db:
+            db.search.vector(memoryview(array("f", VALUES)), limit=5)
+
+        body = json.loads(httpx_mock.get_request().content)
+        assert decode(body["embedding"]) == PACKED
+        assert body["limit"] == 5
+
+    async def test_async_vector_search_binary(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json={"entities": [], "hyperedges": []})
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, embedding_format="int8"
+        ) as db:
+            await db.search.vector(np.array(VALUES), limit=5)
+
+        body = json.loads(httpx_mock.get_request().content)
+        assert body["embedding"]["dtype"] == "int8"
+
+    def test_vector_cache_key_independent_of_input_type(self):
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            keys = {db.search._cache_key_vector(make(), {"limit": 10}) for make in INPUTS.values()}
+
+        assert len(keys) == 1
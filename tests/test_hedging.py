@@ -0,0 +1,225 @@
+"""Tests for tail-latency hedging."""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HedgingPolicy
+from hyperx.exceptions import NotFoundError
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+ENTITY = {
+    "id": "e:react",
+    "name": "React",
+    "entity_type": "library",
+    "attributes": {},
+    "confidence": 1.0,
+    "created_at": "2026-01-15T00:00:00Z",
+    "updated_at": "2026-01-15T00:00:00Z",
+}
+
+
+def delayed_responses(*delays: float, status_code: int = 200, json=ENTITY):
+    """Callback answering the n-th request after delays[n] seconds."""
+    calls = 0
+    cancelled = []
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        delay = delays[min(calls, len(delays) - 1)]
+        calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return httpx.Response(status_code, json=json)
+
+    return respond, cancelled
+
+
+class TestHedgingPolicy:
+    """Tests for delay computation and budget."""
+
+    def test_initial_delay_until_enough_samples(self):
+        policy = HedgingPolicy(initial_delay=0.3, min_samples=5, window_size=10)
+        for _ in range(4):
+            policy.observe("search", 0.05)
+        assert policy.delay("search") == 0.3
+
+    def test_percentile_delay(self):
+        policy = HedgingPolicy(percentile=90, min_samples=10, window_size=10)
+        for ms in range(1, 11):
+            policy.observe("search", ms / 100)
+        assert policy.delay("search") == pytest.approx(0.09)
+
+    def test_delay_is_clamped(self):
+        policy = HedgingPolicy(min_samples=1, window_size=1, min_delay=0.05, max_delay=1.0)
+        policy.observe("search", 0.001)
+        assert policy.delay("search") == 0.05
+        policy.observe("search", 30.0)
+        assert policy.delay("search") == 1.0
+
+    def test_families_tracked_separately(self):
+        policy = HedgingPolicy(min_samples=1, window_size=1, initial_delay=0.5)
+        policy.observe("paths", 2.0)
+        assert policy.delay("paths") == 2.0
+        assert policy.delay("search") == 0.5
+
+    def test_budget_limits_hedges(self):
+        policy = HedgingPolicy(max_hedge_ratio=0.1, min_hedges_per_second=0)
+        for _ in range(20):
+            policy.start()
+
+        assert [policy.try_hedge() for _ in range(3)] == [True, True, False]
+        assert policy.stats.hedged == 2
+        assert policy.stats.budget_exhausted == 1
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=100)
+        with pytest.raises(ValueError):
+            HedgingPolicy(min_delay=2, max_delay=1)
+
+
+class TestClientHedging:
+    """Tests for hedging in AsyncHTTPClient."""
+
+    async def test_slow_request_is_hedged(self, httpx_mock: HTTPXMock):
+        respond, cancelled = delayed_responses(1.0, 0.0)
+        httpx_mock.add_callback(respond, is_reusable=True)
+        policy = HedgingPolicy(initial_delay=0.02)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, hedging=policy
+        ) as db:
+            entity = await asyncio.wait_for(db.entities.get("e:react"), timeout=0.5)
+            await asyncio.sleep(0)
+
+        assert entity.id == "e:react"
+        assert len(httpx_mock.get_requests()) == 2
+        assert policy.stats.hedged == 1
+        assert policy.stats.hedge_wins == 1
+        assert cancelled == [1.0]
+
+    async def test_fast_request_is_not_hedged(self, httpx_mock: HTTPXMock):
+        respond, _ = delayed_responses(0.0)
+        httpx_mock.add_callback(respond, is_reusable=True)
+        policy = HedgingPolicy(initial_delay=0.5)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, hedging=policy
+        ) as db:
+            await db.search("react")
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert policy.stats.requests == 1
+        assert policy.stats.hedged == 0
+
+    async def test_original_wins_if_hedge_is_slower(self, httpx_mock: HTTPXMock):
+        respond, cancelled = delayed_responses(0.05, 1.0)
+        httpx_mock.add_callback(respond, is_reusable=True)
+        policy = HedgingPolicy(initial_delay=0.01)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, hedging=policy
+        ) as db:
+            await db.entities.get("e:react")
+            await asyncio.sleep(0)
+
+        assert policy.stats.hedged == 1
+        assert policy.stats.hedge_wins == 0
+        assert cancelled == [1.0]
+
+    async def test_exhausted_budget_waits_for_original(self, httpx_mock: HTTPXMock):
+        respond, _ = delayed_responses(0.05)
+        httpx_mock.add_callback(respond, is_reusable=True)
+        policy = HedgingPolicy(initial_delay=0.01, max_hedge_ratio=0, min_hedges_per_second=0)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, hedging=policy
+        ) as db:
+            await db.entities.get("e:react")
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert policy.stats.budget_exhausted == 1
+
+    async def test_writes_are_never_hedged(self, httpx_mock: HTTPXMock):
+        respond, _ = delayed_responses(0.05)
+        httpx_mock.add_callback(respond, is_reusable=True)
+        policy = HedgingPolicy(initial_delay=0.01)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, hedging=policy
+        ) as db:
+            await db.entities.create("React", "library")
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert policy.stats.requests == 0
+
+    async def test_error_response_is_returned(self, httpx_mock: HTTPXMock):
+        respond, _ = delayed_responses(0.0, status_code=404, json={"message": "nope"})
+        httpx_mock.add_callback(respond, is_reusable=True)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, hedging=HedgingPolicy()
+        ) as db:
+            with pytest.raises(NotFoundError):
+                await db.entities.get("e:missing")
+
+    async def test_falls_back_to_other_copy_on_transport_error(self, httpx_mock: HTTPXMock):
+        calls = 0
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(0.05)
+                raise httpx.ReadError("reset")
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, json=ENTITY)
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        policy = HedgingPolicy(initial_delay=0.01)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, hedging=policy
+        ) as db:
+            entity = await db.entities.get("e:react")
+
+        assert entity.id == "e:react"
+        assert policy.stats.hedge_wins == 1
+
+    async def test_both_copies_failing_raises(self, httpx_mock: HTTPXMock):
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.03)
+            raise httpx.ReadError("reset")
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            hedging=HedgingPolicy(initial_delay=0.01),
+        ) as db:
+            with pytest.raises(httpx.ReadError):
+                await db.entities.get("e:react")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_latencies_are_observed(self, httpx_mock: HTTPXMock):
+        respond, _ = delayed_responses(0.0)
+        httpx_mock.add_callback(respond, is_reusable=True)
+        policy = HedgingPolicy(min_samples=3, window_size=3, min_delay=0.0)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, hedging=policy
+        ) as db:
+            for _ in range(3):
+                await db.entities.get("e:react")
+
+        assert policy.delay("entities") < 0.5
@@ -0,0 +1,188 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX, RateLimiter
+from hyperx.exceptions import NotFoundError
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+
+class TestRateLimiterConfig:
+    """Tests for limiter configuration and weights."""
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError, match="rate"):
+            RateLimiter(rate=0)
+
+    def test_rejects_invalid_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrent"):
+            RateLimiter(rate=1, max_concurrent=0)
+
+    def test_default_weight_is_one(self):
+        limiter = RateLimiter(rate=10)
+        assert limiter.weight_for("GET", "/v1/entities/e:1") == 1.0
+
+    def test_path_pattern_weight(self):
+        limiter = RateLimiter(rate=10, weights={"/v1/search*": 2})
+        assert limiter.weight_for("POST", "/v1/search") == 2
+        assert limiter.weight_for("POST", "/v1/search/vector") == 2
+        assert limiter.weight_for("POST", "/v1/paths") == 1.0
+
+    def test_method_pattern_weight(self):
+        limiter = RateLimiter(rate=10, weights={"POST /v1/paths": 5, "GET /v1/entities/*": 0.5})
+        assert limiter.weight_for("POST", "/v1/paths") == 5
+        assert limiter.weight_for("GET", "/v1/entities/e:1") == 0.5
+        assert limiter.weight_for("DELETE", "/v1/entities/e:1") == 1.0
+
+
+class TestTokenBucket:
+    """Tests for throughput limiting."""
+
+    def test_burst_passes_without_waiting(self):
+        limiter = RateLimiter(rate=100, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire("GET", "/v1/entities")
+        assert time.monotonic() - start < 0.05
+
+    def test_blocks_when_bucket_empty(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        limiter.acquire("GET", "/v1/entities")
+        start = time.monotonic()
+        limiter.acquire("GET", "/v1/entities")
+        assert time.monotonic() - start >= 0.04
+
+    def test_heavy_endpoint_waits_longer(self):
+        limiter = RateLimiter(rate=50, burst=5, weights={"/v1/paths": 5})
+        limiter.acquire("POST", "/v1/paths")
+        start = time.monotonic()
+        limiter.acquire("POST", "/v1/paths")
+        assert time.monotonic() - start >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_async_waits_without_blocking_loop(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        await limiter.acquire_async("GET", "/v1/entities")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(3):
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        await asyncio.gather(limiter.acquire_async("GET", "/v1/entities"), ticker())
+        assert ticks == 3
+
+
+class TestConcurrencyLimit:
+    """Tests for in-flight request limiting."""
+
+    def test_threads_never_exceed_limit(self):
+        limiter = RateLimiter(rate=10_000, max_concurrent=2)
+        peak = 0
+        lock = threading.Lock()
+
+        def worker():
+            nonlocal peak
+            limiter.acquire("GET", "/v1/entities")
+            try:
+                with lock:
+                    peak = max(peak, limiter.in_flight)
+                time.sleep(0.01)
+            finally:
+                limiter.release()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak <= 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_tasks_never_exceed_limit(self):
+        limiter = RateLimiter(rate=10_000, max_concurrent=3)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            await limiter.acquire_async("GET", "/v1/entities")
+            try:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.005)
+            finally:
+                limiter.release()
+
+        await asyncio.gather(*(worker() for _ in range(10)))
+
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = RateLimiter(rate=10_000, max_concurrent=1)
+        await limiter.acquire_async("GET", "/v1/entities")
+
+        waiter = asyncio.create_task(limiter.acquire_async("GET", "/v1/entities"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        limiter.release()
+        await asyncio.sleep(0)
+
+        assert limiter.in_flight == 0
+
+
+class TestClientIntegration:
+    """Tests for limiter use by the clients."""
+
+    def test_shared_between_sync_clients(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=[], is_reusable=True)
+        limiter = RateLimiter(rate=20, burst=1)
+
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, rate_limiter=limiter) as db1,
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, rate_limiter=limiter) as db2,
+        ):
+            start = time.monotonic()
+            db1.entities.list()
+            db2.entities.list()
+            db1.entities.list()
+            elapsed = time.monotonic() - start
+
+        assert db1._http.rate_limiter is db2._http.rate_limiter
+        assert elapsed >= 0.08
+
+    def test_slot_released_after_error(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=404, json={"message": "missing"})
+        limiter = RateLimiter(rate=100, max_concurrent=1)
+
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, rate_limiter=limiter) as db,
+            pytest.raises(NotFoundError),
+        ):
+            db.entities.get("e:missing")
+
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_limiter(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=[], is_reusable=True)
+        limiter = RateLimiter(rate=100, max_concurrent=1)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, rate_limiter=limiter
+        ) as db:
+            await asyncio.gather(*(db.entities.list() for _ in range(4)))
+
+        assert limiter.in_flight == 0
+        assert len(httpx_mock.get_requests()) == 4
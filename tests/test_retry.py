@@ -0,0 +1,230 @@
+"""Tests for automatic retries in the HTTP layer."""
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX, RetryEvent, RetryPolicy
+from hyperx.exceptions import ServerError
+from hyperx.http import is_idempotent
+from hyperx.retry import RetryBudget, parse_retry_after
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+ENTITY = {
+    "id": "e:test",
+    "name": "Test",
+    "entity_type": "concept",
+    "attributes": {},
+    "confidence": 1.0,
+    "created_at": "2026-01-15T00:00:00Z",
+    "updated_at": "2026-01-15T00:00:00Z",
+}
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    """Retry policy without delays for tests."""
+    return RetryPolicy(backoff_base=0, respect_retry_after=False, **kwargs)
+
+
+class TestRetryPolicy:
+    """Tests for retry decisions and delays."""
+
+    def test_retries_server_error_for_idempotent(self):
+        policy = RetryPolicy()
+        assert policy.should_retry(idempotent=True, attempt=0, status_code=503)
+
+    def test_no_retry_server_error_for_non_idempotent(self):
+        policy = RetryPolicy()
+        assert not policy.should_retry(idempotent=False, attempt=0, status_code=500)
+
+    def test_retries_rate_limit_for_non_idempotent(self):
+        policy = RetryPolicy()
+        assert policy.should_retry(idempotent=False, attempt=0, status_code=429)
+
+    def test_no_retry_client_error(self):
+        policy = RetryPolicy()
+        assert not policy.should_retry(idempotent=True, attempt=0, status_code=404)
+
+    def test_stops_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+        assert not policy.should_retry(idempotent=True, attempt=2, status_code=503)
+
+    def test_connect_error_retried_for_non_idempotent(self):
+        policy = RetryPolicy()
+        error = httpx.ConnectError("refused")
+        assert policy.should_retry(idempotent=False, attempt=0, error=error)
+
+    def test_read_error_not_retried_for_non_idempotent(self):
+        policy = RetryPolicy()
+        error = httpx.ReadTimeout("slow")
+        assert not policy.should_retry(idempotent=False, attempt=0, error=error)
+        assert policy.should_retry(idempotent=True, attempt=0, error=error)
+
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False)
+        assert policy.compute_delay(1) == 1.0
+        assert policy.compute_delay(3) == 4.0
+        assert policy.compute_delay(10) == 5.0
+
+    def test_jittered_backoff_within_ceiling(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+        for _ in range(50):
+            assert 0 <= policy.compute_delay(3) <= 4.0
+
+    def test_retry_after_takes_precedence(self):
+        policy = RetryPolicy(backoff_base=1.0, max_retry_after=10.0)
+        response = httpx.Response(429, headers={"Retry-After": "7"})
+        assert policy.compute_delay(1, response) == 7.0
+
+        response = httpx.Response(429, headers={"Retry-After": "120"})
+        assert policy.compute_delay(1, response) == 10.0
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryBudget:
+    """Tests for the per-client retry budget."""
+
+    def test_budget_limits_retries(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0)
+        for _ in range(4):
+            budget.deposit()
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        assert budget.retries == 2
+        assert budget.exhausted == 1
+
+    def test_reserve_allows_retries_without_traffic(self):
+        budget = RetryBudget(ratio=0, min_per_second=0.1, window=10)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+
+class TestIdempotency:
+    """Tests for request idempotency classification."""
+
+    def test_reads_are_idempotent(self):
+        assert is_idempotent("GET", "/v1/entities/e:1")
+        assert is_idempotent("POST", "/v1/search")
+        assert is_idempotent("POST", "/v1/paths")
+
+    def test_creates_are_not_idempotent(self):
+        assert not is_idempotent("POST", "/v1/entities")
+        assert not is_idempotent("POST", "/v1/batch")
+
+
+class TestClientRetries:
+    """Tests for retries through the sync client."""
+
+    def test_no_retries_by_default(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=503, json={"message": "unavailable"})
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db, pytest.raises(ServerError):
+            db.entities.get("e:test")
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_retries_then_succeeds(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=503, json={"message": "unavailable"})
+        httpx_mock.add_response(status_code=429, json={"message": "slow down"})
+        httpx_mock.add_response(json=ENTITY)
+        events: list[RetryEvent] = []
+
+        policy = fast_policy(on_retry=events.append)
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, retry=policy) as db:
+            entity = db.entities.get("e:test")
+
+        assert entity.id == "e:test"
+        assert [e.attempt for e in events] == [1, 2]
+        assert [e.status_code for e in events] == [503, 429]
+        assert events[0].method == "GET"
+        assert events[0].path == "/v1/entities/e:test"
+
+    def test_gives_up_after_max_retries(self, httpx_mock: HTTPXMock):
+        for _ in range(3):
+            httpx_mock.add_response(status_code=500, json={"message": "boom"})
+
+        policy = fast_policy(max_retries=2)
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, retry=policy) as db,
+            pytest.raises(ServerError),
+        ):
+            db.entities.get("e:test")
+
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_create_not_retried_on_server_error(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=500, json={"message": "boom"})
+
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, retry=fast_policy()) as db,
+            pytest.raises(ServerError),
+        ):
+            db.entities.create(name="Test", entity_type="concept")
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_retries_connection_errors(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+        httpx_mock.add_response(json=ENTITY)
+
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, retry=fast_policy()) as db:
+            entity = db.entities.get("e:test")
+
+        assert entity.id == "e:test"
+
+    def test_connection_error_raised_when_exhausted(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+
+        policy = fast_policy(max_retries=1)
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, retry=policy) as db,
+            pytest.raises(httpx.ConnectError),
+        ):
+            db.entities.get("e:test")
+
+    def test_budget_stops_retry_storm(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=503, json={"message": "down"}, is_reusable=True)
+
+        policy = fast_policy(max_retries=5, budget_ratio=0, budget_min_per_second=0.1)
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, retry=policy) as db,
+            pytest.raises(ServerError),
+        ):
+            db.entities.get("e:test")
+
+        # One original request plus the single retry the reserve allows
+        assert len(httpx_mock.get_requests()) == 2
+
+
+class TestAsyncClientRetries:
+    """Tests for retries through the async client."""
+
+    @pytest.mark.asyncio
+    async def test_async_retries_then_succeeds(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(status_code=502, json={"message": "bad gateway"})
+        httpx_mock.add_response(json=ENTITY)
+        events: list[RetryEvent] = []
+
+        policy = fast_policy(on_retry=events.append)
+        async with AsyncHyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, retry=policy) as db:
+            entity = await db.entities.get("e:test")
+
+        assert entity.id == "e:test"
+        assert len(events) == 1
@@ -0,0 +1,247 @@
+"""Tests for request coalescing (single-flight)."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from hyperx import AsyncHyperX, HyperX, RetryPolicy, SingleFlight
+from hyperx.exceptions import NotFoundError
+
+TEST_API_KEY = "hx_sk_test_12345678"
+TEST_BASE_URL = "http://localhost:8080"
+
+ENTITY = {
+    "id": "e:react",
+    "name": "React",
+    "entity_type": "library",
+    "attributes": {},
+    "confidence": 1.0,
+    "created_at": "2026-01-15T00:00:00Z",
+    "updated_at": "2026-01-15T00:00:00Z",
+}
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight primitive."""
+
+    def test_concurrent_threads_share_one_call(self):
+        sf = SingleFlight()
+        release = threading.Event()
+        calls = 0
+
+        def fn():
+            nonlocal calls
+            calls += 1
+            release.wait(5)
+            return {"value": 42}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(sf.do, "key", fn) for _ in range(8)]
+            while sf.stats.executed + sf.stats.merged < 8:
+                threading.Event().wait(0.001)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert sf.stats.executed == 1
+        assert sf.stats.merged == 7
+        assert sf.in_flight == 0
+
+    def test_sequential_calls_are_not_merged(self):
+        sf = SingleFlight()
+        assert sf.do("key", lambda: 1) == 1
+        assert sf.do("key", lambda: 2) == 2
+        assert sf.stats.executed == 2
+        assert sf.stats.merged == 0
+
+    def test_exception_shared_by_followers(self):
+        sf = SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(sf.do, "key", fn) for _ in range(3)]
+            while sf.stats.executed + sf.stats.merged < 3:
+                threading.Event().wait(0.001)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+        assert sf.in_flight == 0
+
+    async def test_async_tasks_share_one_call(self):
+        sf = SingleFlight()
+        calls = 0
+
+        async def fn():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(sf.do_async("key", fn) for _ in range(5)))
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert sf.stats.executed == 1
+        assert sf.stats.merged == 4
+        assert sf.in_flight == 0
+
+    async def test_cancelling_leader_does_not_cancel_followers(self):
+        sf = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.02)
+            return "result"
+
+        leader = asyncio.ensure_future(sf.do_async("key", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(sf.do_async("key", fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "result"
+        assert leader.cancelled()
+
+    async def test_different_keys_not_merged(self):
+        sf = SingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            return "result"
+
+        await asyncio.gather(sf.do_async("a", fn), sf.do_async("b", fn))
+
+        assert sf.stats.executed == 2
+        assert sf.stats.merged == 0
+
+
+class TestClientSingleFlight:
+    """Tests for coalescing in the HTTP client."""
+
+    async def test_identical_gets_are_merged(self, httpx_mock: HTTPXMock):
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json=ENTITY)
+
+        httpx_mock.add_callback(respond)
+        sf = SingleFlight()
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, single_flight=sf
+        ) as db:
+            entities = await asyncio.gather(*(db.entities.get("e:react") for _ in range(10)))
+
+        assert [e.id for e in entities] == ["e:react"] * 10
+        assert len(httpx_mock.get_requests()) == 1
+        assert sf.stats.merged == 9
+
+    async def test_idempotent_posts_are_merged_by_body(self, httpx_mock: HTTPXMock):
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json={"entities": [], "hyperedges": []})
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        sf = SingleFlight()
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, single_flight=sf
+        ) as db:
+            await asyncio.gather(
+                db.search("react"), db.search("react"), db.search("vue"), db.search("vue")
+            )
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert sf.stats.executed == 2
+        assert sf.stats.merged == 2
+
+    async def test_writes_are_never_merged(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(json=ENTITY, is_reusable=True)
+        sf = SingleFlight()
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, single_flight=sf
+        ) as db:
+            await asyncio.gather(*(db.entities.create("React", "library") for _ in range(3)))
+
+        assert len(httpx_mock.get_requests()) == 3
+        assert sf.stats.executed == 0
+
+    async def test_errors_are_shared(self, httpx_mock: HTTPXMock):
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.02)
+            return httpx.Response(404, json={"message": "not found"})
+
+        httpx_mock.add_callback(respond)
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY, base_url=TEST_BASE_URL, single_flight=SingleFlight()
+        ) as db:
+            results = await asyncio.gather(
+                db.entities.get("e:missing"), db.entities.get("e:missing"), return_exceptions=True
+            )
+
+        assert all(isinstance(r, NotFoundError) for r in results)
+
+    async def test_callers_with_deadlines_are_not_merged(self, httpx_mock: HTTPXMock):
+        statuses = iter([503, 200, 200])
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.03)
+            return httpx.Response(next(statuses), json=ENTITY)
+
+        httpx_mock.add_callback(respond, is_reusable=True)
+        sf = SingleFlight()
+
+        async with AsyncHyperX(
+            api_key=TEST_API_KEY,
+            base_url=TEST_BASE_URL,
+            single_flight=sf,
+            retry=RetryPolicy(backoff_base=0.01, jitter=False),
+        ) as db:
+            # The bounded call gets the 503 and may run out of time to retry;
+            # the unbounded one must not share that outcome
+            _, unbounded = await asyncio.gather(
+                db.entities.get("e:react", timeout=0.05),
+                db.entities.get("e:react"),
+                return_exceptions=True,
+            )
+
+        assert unbounded.id == "e:react"
+        assert sf.stats.merged == 0
+
+    def test_sync_client_threads_are_merged(self, httpx_mock: HTTPXMock):
+        release = threading.Event()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            release.wait(5)
+            return httpx.Response(200, json=ENTITY)
+
+        httpx_mock.add_callback(respond)
+        sf = SingleFlight()
+
+        with (
+            HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL, single_flight=sf) as db,
+            ThreadPoolExecutor(max_workers=4) as pool,
+        ):
+            futures = [pool.submit(db.entities.get, "e:react") for _ in range(4)]
+            while sf.stats.executed + sf.stats.merged < 4:
+                threading.Event().wait(0.001)
+            release.set()
+            assert all(f.result().id == "e:react" for f in futures)
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert sf.stats.merged == 3
+
+    def test_disabled_by_default(self):
+        with HyperX(api_key=TEST_API_KEY, base_url=TEST_BASE_URL) as db:
+            assert db._http.single_flight is None